@@ -9,18 +9,30 @@ Archivo: `centinel_engine/secure_backup.py`.
 Este módulo forma parte de Centinel Engine y está documentado para facilitar
 la navegación, mantenimiento y auditoría técnica.
 
+Formato incremental (v2): cada archivo se guarda una sola vez como chunk
+cifrado direccionado por su SHA-256 (`chunks/<key_id>/<aa>/<sha>.enc`) y
+cada respaldo escribe un manifiesto pequeño con solo los archivos nuevos o
+modificados, enlazado al anterior. Cada `DEFAULT_FULL_MANIFEST_EVERY`
+respaldos el manifiesto lista todas las referencias (sin reescribir chunks)
+para acotar la cadena que recorre la restauración. `backup_index.json`
+guarda tamaño/mtime para no releer archivos sin cambios.
+
 Componentes detectados:
   - _generate_backup_key
   - _get_fernet
   - _encrypt_data
   - _compute_sha256
   - _collect_hash_chain_files
-  - _build_backup_manifest
-  - _backup_to_local
   - _backup_to_dropbox
+  - _upload_pending
   - _backup_to_s3
+  - _store_chunk
+  - _build_incremental_manifest
+  - _resolve_backup_files
   - backup_critical_assets
   - backup_critical
+  - restore_backup
+  - verify_last_bundle
   - BackupScheduler
 
 Notas:
@@ -32,18 +44,30 @@ File: `centinel_engine/secure_backup.py`.
 This module is part of Centinel Engine and is documented to improve
 navigation, maintenance, and technical auditability.
 
+Incremental format (v2): each file is stored once as an encrypted chunk
+addressed by its SHA-256 (`chunks/<key_id>/<aa>/<sha>.enc`) and every
+backup writes a small manifest listing only new or changed files, linked
+to the previous one. Every `DEFAULT_FULL_MANIFEST_EVERY` backups the
+manifest lists all references (no chunk is rewritten) to bound the chain
+walked by restore. `backup_index.json` caches size/mtime so unchanged
+files are not re-read.
+
 Detected components:
   - _generate_backup_key
   - _get_fernet
   - _encrypt_data
   - _compute_sha256
   - _collect_hash_chain_files
-  - _build_backup_manifest
-  - _backup_to_local
   - _backup_to_dropbox
+  - _upload_pending
   - _backup_to_s3
+  - _store_chunk
+  - _build_incremental_manifest
+  - _resolve_backup_files
   - backup_critical_assets
   - backup_critical
+  - restore_backup
+  - verify_last_bundle
   - BackupScheduler
 
 Notes:
@@ -57,12 +81,13 @@ import hashlib
 import json
 import logging
 import os
+import re
 import tempfile
 import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +110,17 @@ DEFAULT_HEALTH_STATE_PATH = Path("data/health_state.json")
 DEFAULT_HASH_CHAIN_DIR = Path("data/hashes")
 DEFAULT_BACKUP_DIR = Path("backups")
 DEFAULT_BACKUP_INTERVAL_SECONDS = 1800
+DEFAULT_FULL_MANIFEST_EVERY = 100
+
+BACKUP_INDEX_FILENAME = "backup_index.json"
+CHUNKS_DIRNAME = "chunks"
+INCREMENTAL_MANIFEST_VERSION = "2.0"
+PLAINTEXT_KEY_ID = "plaintext"
+_MANIFEST_NAME_RE = re.compile(r"^centinel_backup_(\d{8})_\d{8}T\d{6}Z\.manifest\.json$")
+
+# Serializa respaldos del scheduler y del pipeline dentro del proceso.
+# Serializes scheduler and pipeline backups within the process.
+_backup_lock = threading.Lock()
 
 ENV_BACKUP_KEY = "CENTINEL_BACKUP_KEY"
 ENV_DROPBOX_TOKEN = "CENTINEL_DROPBOX_TOKEN"
@@ -166,6 +202,47 @@ def _encrypt_data(data: bytes, fernet: Optional[Any] = None) -> bytes:
     return fernet.encrypt(data) if fernet is not None else data
 
 
+def _decrypt_data(data: bytes, fernet: Optional[Any] = None) -> bytes:
+    """Decrypt payload bytes, or return them unchanged when stored in plaintext.
+
+    Bilingual: Descifra bytes del payload o los retorna intactos si están en texto plano.
+
+    Args:
+        data: Stored payload bytes.
+        fernet: Optional Fernet instance.
+
+    Returns:
+        bytes: Plaintext payload.
+
+    Raises:
+        cryptography.fernet.InvalidToken: If the key does not match the payload.
+    """
+    return fernet.decrypt(data) if fernet is not None else data
+
+
+def _backup_key_id(fernet: Optional[Any]) -> str:
+    """Derive a short public identifier for the active backup key.
+
+    Bilingual: Deriva un identificador público corto de la clave de respaldo activa.
+
+    Args:
+        fernet: Fernet instance returned by `_get_fernet`, or None.
+
+    Returns:
+        str: First 16 hex chars of SHA-256 over the key, or "plaintext".
+
+    Raises:
+        None.
+
+    Chunks live under their key id, so rotating the key starts a new chain
+    instead of referencing chunks the new key cannot decrypt.
+    """
+    key = os.getenv(ENV_BACKUP_KEY)
+    if fernet is None or not key:
+        return PLAINTEXT_KEY_ID
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
 def _compute_sha256(data: bytes) -> str:
     """Compute SHA-256 digest for integrity manifest.
 
@@ -202,15 +279,142 @@ def _collect_hash_chain_files(hash_dir: Path) -> List[Path]:
     return sorted(hash_dir.glob("*.json"), key=lambda item: item.name)
 
 
-def _build_backup_manifest(files_backed_up: List[str], hashes: Dict[str, str], encrypted: bool) -> Dict[str, Any]:
-    """Build backup manifest metadata.
+def _backup_to_dropbox(payload: bytes, remote_path: str) -> bool:
+    """Upload payload to Dropbox when SDK and credentials are available.
+
+    Bilingual: Sube payload a Dropbox cuando SDK y credenciales están disponibles.
+
+    Args:
+        payload: Backup payload bytes.
+        remote_path: Remote object path.
+
+    Returns:
+        bool: True on successful upload.
+
+    Raises:
+        None.
+    """
+    if not _HAS_DROPBOX:
+        return False
+    token = os.getenv(ENV_DROPBOX_TOKEN)
+    if not token:
+        return False
+    try:
+        folder = os.getenv(ENV_DROPBOX_FOLDER, "/centinel-backups")
+        client = dropbox.Dropbox(token)
+        client.files_upload(payload, f"{folder}/{remote_path}", mode=dropbox.files.WriteMode.overwrite)
+        return True
+    except Exception as exc:  # noqa: BLE001
+        logger.error("backup_dropbox_failed | %s", exc)
+        return False
+
+
+def _upload_pending(backup_dir: Path, pending: List[str]) -> List[str]:
+    """Upload queued chunks and manifests to Dropbox, keeping the ones that failed.
+
+    Bilingual: Sube a Dropbox los chunks y manifiestos en cola y conserva los que fallan.
+
+    Args:
+        backup_dir: Backup root folder.
+        pending: Paths relative to `backup_dir`, chunks before the manifests that reference them.
+
+    Returns:
+        List[str]: Paths still pending, in the same order, for the next run.
+
+    Raises:
+        None.
+
+    Once any upload fails, later manifests stay queued so the remote copy
+    never holds a manifest whose chunks or parent are missing there.
+    """
+    remaining: List[str] = []
+    for relative in pending:
+        if _MANIFEST_NAME_RE.match(relative) and remaining:
+            remaining.append(relative)
+            continue
+        try:
+            payload = (backup_dir / relative).read_bytes()
+        except OSError as exc:
+            logger.error("backup_upload_read_failed | %s %s", relative, exc)
+            remaining.append(relative)
+            continue
+        if not _backup_to_dropbox(payload, relative):
+            remaining.append(relative)
+    return remaining
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes through a temp file in the same folder and rename it into place.
+
+    Bilingual: Escribe bytes vía archivo temporal en la misma carpeta y lo renombra.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+
+    Returns:
+        None.
+
+    Raises:
+        OSError: If the destination cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        Path(temp_path).replace(path)
+    finally:
+        if Path(temp_path).exists():
+            Path(temp_path).unlink(missing_ok=True)
+
+
+def _store_chunk(backup_dir: Path, content: bytes, digest: str, key_id: str, fernet: Optional[Any]) -> Tuple[str, bool]:
+    """Store one content-addressed chunk unless the same content is already stored.
+
+    Bilingual: Guarda un chunk direccionado por contenido salvo que ya exista.
+
+    Args:
+        backup_dir: Backup root folder.
+        content: Plaintext file content.
+        digest: SHA-256 of `content`.
+        key_id: Identifier of the key the chunk is encrypted with.
+        fernet: Optional Fernet instance.
+
+    Returns:
+        Tuple[str, bool]: Chunk path relative to `backup_dir` and whether it was written now.
+
+    Raises:
+        OSError: If the chunk cannot be written.
+    """
+    suffix = "raw" if fernet is None else "enc"
+    relative = f"{CHUNKS_DIRNAME}/{key_id}/{digest[:2]}/{digest}.{suffix}"
+    chunk_path = backup_dir / relative
+    if chunk_path.exists():
+        return relative, False
+    _write_atomic(chunk_path, _encrypt_data(content, fernet=fernet))
+    return relative, True
+
+
+def _build_incremental_manifest(
+    sequence: int,
+    parent: Optional[str],
+    files: Dict[str, Dict[str, Any]],
+    removed: List[str],
+    key_id: str,
+    full: bool,
+) -> Dict[str, Any]:
+    """Build an incremental (v2) backup manifest.
 
-    Bilingual: Construye metadatos del manifiesto de respaldo.
+    Bilingual: Construye un manifiesto de respaldo incremental (v2).
 
     Args:
-        files_backed_up: Relative filenames included in backup payload.
-        hashes: SHA-256 mapping by filename.
-        encrypted: Whether payload was encrypted.
+        sequence: Monotonic backup number.
+        parent: Filename of the previous manifest, or None for a chain base.
+        files: Chunk references (`sha256`, `size`, `chunk`) by filename.
+        removed: Filenames deleted since the parent manifest.
+        key_id: Identifier of the key the referenced chunks use.
+        full: True when `files` lists every file, so restore can stop here.
 
     Returns:
         Dict[str, Any]: JSON-serializable manifest.
@@ -219,106 +423,180 @@ def _build_backup_manifest(files_backed_up: List[str], hashes: Dict[str, str], e
         None.
     """
     return {
+        "version": INCREMENTAL_MANIFEST_VERSION,
+        "sequence": sequence,
+        "parent": parent,
+        "full": full,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "encrypted": encrypted,
-        "files": files_backed_up,
-        "sha256_hashes": hashes,
-        "version": "1.0",
+        "encrypted": key_id != PLAINTEXT_KEY_ID,
+        "key_id": key_id,
+        "files": files,
+        "removed": removed,
     }
 
 
-def _backup_to_local(backup_dir: Path, payload: bytes, filename: str, manifest: Dict[str, Any]) -> bool:
-    """Persist backup payload and manifest to local filesystem.
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a JSON object from disk, returning None if missing or unreadable.
 
-    Bilingual: Persiste payload y manifiesto de respaldo en filesystem local.
+    Bilingual: Lee un objeto JSON del disco; retorna None si falta o es ilegible.
 
     Args:
-        backup_dir: Destination backup folder.
-        payload: Backup payload bytes.
-        filename: Backup payload filename.
-        manifest: Backup manifest dictionary.
+        path: JSON file path.
 
     Returns:
-        bool: True when both files are written correctly.
+        Optional[Dict[str, Any]]: Parsed object or None.
 
     Raises:
         None.
     """
     try:
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        backup_path = backup_dir / filename
-        manifest_path = backup_dir / f"{filename}.manifest.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
 
-        fd, temp_path = tempfile.mkstemp(dir=str(backup_dir), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "wb") as handle:
-                handle.write(payload)
-            Path(temp_path).replace(backup_path)
-        finally:
-            if Path(temp_path).exists():
-                Path(temp_path).unlink(missing_ok=True)
-
-        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
-        return True
-    except Exception as exc:  # noqa: BLE001
-        logger.error("backup_local_failed | %s", exc)
-        return False
 
+def _latest_manifest_name(backup_dir: Path) -> Optional[str]:
+    """Find the newest incremental manifest by sequence number.
 
-def _backup_to_dropbox(payload: bytes, remote_path: str) -> bool:
-    """Upload payload to Dropbox when SDK and credentials are available.
+    Bilingual: Busca el manifiesto incremental más reciente por número de secuencia.
 
-    Bilingual: Sube payload a Dropbox cuando SDK y credenciales están disponibles.
+    Args:
+        backup_dir: Backup root folder.
+
+    Returns:
+        Optional[str]: Manifest filename, or None when there is none.
+
+    Raises:
+        None.
+    """
+    if not backup_dir.exists():
+        return None
+    names = [path.name for path in backup_dir.iterdir() if _MANIFEST_NAME_RE.match(path.name)]
+    return max(names, default=None)
+
+
+def _load_backup_index(backup_dir: Path) -> Dict[str, Any]:
+    """Load the incremental backup index, validating that its head manifest exists.
+
+    Bilingual: Carga el índice de respaldo incremental validando que exista su manifiesto cabeza.
 
     Args:
-        payload: Backup payload bytes.
-        remote_path: Remote object path.
+        backup_dir: Backup root folder.
 
     Returns:
-        bool: True on successful upload.
+        Dict[str, Any]: Index with `head`, `sequence`, `key_id` and `files`, or {} if unusable.
 
     Raises:
         None.
     """
-    if not _HAS_DROPBOX:
-        return False
-    token = os.getenv(ENV_DROPBOX_TOKEN)
-    if not token:
-        return False
+    index = _load_json(backup_dir / BACKUP_INDEX_FILENAME)
+    if not index or not isinstance(index.get("files"), dict):
+        return {}
+    head = index.get("head")
+    if not isinstance(head, str) or not (backup_dir / head).exists():
+        return {}
+    return index
+
+
+def _resolve_backup_files(backup_dir: Path, manifest_name: str) -> Dict[str, Dict[str, Any]]:
+    """Rebuild the file set of a backup by replaying its manifest chain.
+
+    Bilingual: Reconstruye el conjunto de archivos de un respaldo recorriendo su cadena de manifiestos.
+
+    Args:
+        backup_dir: Backup root folder.
+        manifest_name: Manifest filename to resolve.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Chunk references by filename.
+
+    Raises:
+        ValueError: If a manifest in the chain is missing, corrupt or loops.
+    """
+    chain: List[Dict[str, Any]] = []
+    seen: set = set()
+    name: Optional[str] = manifest_name
+    while name is not None:
+        if name in seen:
+            raise ValueError(f"manifest chain loops at {name}")
+        seen.add(name)
+        manifest = _load_json(backup_dir / name)
+        if manifest is None or manifest.get("version") != INCREMENTAL_MANIFEST_VERSION:
+            raise ValueError(f"manifest missing or unreadable: {name}")
+        chain.append(manifest)
+        name = None if manifest.get("full") else manifest.get("parent")
+
+    files: Dict[str, Dict[str, Any]] = {}
+    for manifest in reversed(chain):
+        files.update(manifest.get("files", {}))
+        for removed in manifest.get("removed", []):
+            files.pop(removed, None)
+    return files
+
+
+def _read_chunk(backup_dir: Path, entry: Dict[str, Any], fernet: Optional[Any]) -> bytes:
+    """Read, decrypt and verify one chunk referenced by a manifest.
+
+    Bilingual: Lee, descifra y verifica un chunk referenciado por un manifiesto.
+
+    Args:
+        backup_dir: Backup root folder.
+        entry: Manifest entry with `chunk` and `sha256`.
+        fernet: Optional Fernet instance for encrypted chunks.
+
+    Returns:
+        bytes: Plaintext file content.
+
+    Raises:
+        ValueError: If the chunk cannot be decrypted or its digest does not match.
+    """
+    chunk = str(entry["chunk"])
+    if chunk.endswith(".enc") and fernet is None:
+        raise ValueError(f"{chunk} is encrypted but no valid {ENV_BACKUP_KEY} is configured")
+    payload = (backup_dir / chunk).read_bytes()
     try:
-        folder = os.getenv(ENV_DROPBOX_FOLDER, "/centinel-backups")
-        client = dropbox.Dropbox(token)
-        client.files_upload(payload, f"{folder}/{remote_path}", mode=dropbox.files.WriteMode.overwrite)
-        return True
+        content = _decrypt_data(payload, fernet if chunk.endswith(".enc") else None)
     except Exception as exc:  # noqa: BLE001
-        logger.error("backup_dropbox_failed | %s", exc)
-        return False
+        raise ValueError(f"{chunk} cannot be decrypted with the configured key") from exc
+    if _compute_sha256(content) != entry["sha256"]:
+        raise ValueError(f"{chunk} does not match its sha256")
+    return content
 
 
 def backup_critical_assets(
     health_state_path: Path = DEFAULT_HEALTH_STATE_PATH,
     hash_chain_dir: Path = DEFAULT_HASH_CHAIN_DIR,
     backup_dir: Path = DEFAULT_BACKUP_DIR,
+    full_manifest_every: int = DEFAULT_FULL_MANIFEST_EVERY,
 ) -> Dict[str, Any]:
-    """Create encrypted backup of health state and hash-chain files.
+    """Create an incremental encrypted backup of health state and hash-chain files.
 
-    Bilingual: Crea respaldo cifrado del estado de salud y archivos de cadena hash.
+    Bilingual: Crea un respaldo cifrado incremental del estado de salud y la cadena hash.
 
     Args:
         health_state_path: Path to health_state JSON file.
         hash_chain_dir: Directory containing hash-chain JSON files.
         backup_dir: Destination backup directory.
+        full_manifest_every: Write a self-contained manifest every N backups.
 
     Returns:
-        Dict[str, Any]: Backup execution report.
+        Dict[str, Any]: Backup execution report. `files_backed_up` lists only
+        new or changed files; `manifest` is None when nothing changed.
 
     Raises:
         None.
+
+    Only files whose size or mtime changed since the last backup are read;
+    only content not already stored becomes a new chunk. Cost per call is
+    O(new files), not O(history).
     """
     report: Dict[str, Any] = {
         "local": False,
         "dropbox": False,
         "files_backed_up": [],
+        "manifest": None,
+        "chunks_written": 0,
         "errors": [],
     }
     try:
@@ -326,28 +604,95 @@ def backup_critical_assets(
         if health_state_path.exists():
             files.append(health_state_path)
         files.extend(_collect_hash_chain_files(hash_chain_dir))
-        report["files_backed_up"] = [file.name for file in files]
 
         if not files:
             return report
 
-        blob: Dict[str, Any] = {}
-        hashes: Dict[str, str] = {}
-        for file in files:
-            content = file.read_bytes()
-            blob[file.name] = content.decode("utf-8", errors="replace")
-            hashes[file.name] = _compute_sha256(content)
-
-        payload = json.dumps(blob, ensure_ascii=False, indent=2).encode("utf-8")
-        fernet = _get_fernet()
-        encrypted_payload = _encrypt_data(payload, fernet=fernet)
-
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        filename = f"centinel_backup_{timestamp}.enc"
-        manifest = _build_backup_manifest(report["files_backed_up"], hashes, encrypted=fernet is not None)
-
-        report["local"] = _backup_to_local(backup_dir, encrypted_payload, filename, manifest)
-        report["dropbox"] = _backup_to_dropbox(encrypted_payload, filename)
+        with _backup_lock:
+            fernet = _get_fernet()
+            key_id = _backup_key_id(fernet)
+            index = _load_backup_index(backup_dir)
+            if index.get("key_id") != key_id:
+                # New chain: existing chunks were written with another key.
+                index = {}
+            previous: Dict[str, Dict[str, Any]] = index.get("files", {})
+            upload = _HAS_DROPBOX and bool(os.getenv(ENV_DROPBOX_TOKEN))
+            # Upload queue persisted in the index: anything that failed in an
+            # earlier run is retried before this run's chunks and manifest.
+            pending: List[str] = list(index.get("pending_uploads", []))
+
+            current: Dict[str, Dict[str, Any]] = {}
+            changed: Dict[str, Dict[str, Any]] = {}
+            for file in files:
+                stat = file.stat()
+                prior = previous.get(file.name)
+                if prior and prior.get("size") == stat.st_size and prior.get("mtime_ns") == stat.st_mtime_ns:
+                    current[file.name] = prior
+                    continue
+                content = file.read_bytes()
+                digest = _compute_sha256(content)
+                if prior and prior.get("sha256") == digest:
+                    current[file.name] = {**prior, "mtime_ns": stat.st_mtime_ns}
+                    continue
+                chunk, written = _store_chunk(backup_dir, content, digest, key_id, fernet)
+                if written:
+                    report["chunks_written"] += 1
+                    if upload:
+                        pending.append(chunk)
+                changed[file.name] = {"sha256": digest, "size": len(content), "chunk": chunk}
+                current[file.name] = {**changed[file.name], "mtime_ns": stat.st_mtime_ns}
+
+            removed = sorted(set(previous) - set(current))
+            report["files_backed_up"] = list(changed)
+            parent = index.get("head")
+            sequence = int(index.get("sequence", 0)) + 1
+            if parent is None:
+                latest = _latest_manifest_name(backup_dir)
+                match = _MANIFEST_NAME_RE.match(latest) if latest else None
+                sequence = int(match.group(1)) + 1 if match else 1
+            full = parent is None or sequence % max(1, full_manifest_every) == 0
+
+            new_index: Dict[str, Any] = {**index, "files": current}
+            if changed or removed or full:
+                references = {
+                    name: {k: v for k, v in entry.items() if k != "mtime_ns"} for name, entry in current.items()
+                }
+                manifest = _build_incremental_manifest(
+                    sequence,
+                    parent,
+                    references if full else changed,
+                    [] if full else removed,
+                    key_id,
+                    full,
+                )
+                timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+                manifest_name = f"centinel_backup_{sequence:08d}_{timestamp}.manifest.json"
+                manifest_bytes = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+                # Chunks first, then manifest, then index: a crash never leaves a
+                # manifest pointing at chunks that were not written.
+                _write_atomic(backup_dir / manifest_name, manifest_bytes)
+                new_index = {
+                    "version": INCREMENTAL_MANIFEST_VERSION,
+                    "head": manifest_name,
+                    "sequence": sequence,
+                    "key_id": key_id,
+                    "files": current,
+                }
+                report["manifest"] = manifest_name
+                if upload:
+                    pending.append(manifest_name)
+
+            if upload:
+                pending = _upload_pending(backup_dir, list(dict.fromkeys(pending)))
+                report["dropbox"] = not pending
+                if pending:
+                    logger.warning("backup_dropbox_pending | %d uploads queued for retry", len(pending))
+            new_index["pending_uploads"] = pending
+            _write_atomic(
+                backup_dir / BACKUP_INDEX_FILENAME,
+                json.dumps(new_index, ensure_ascii=False).encode("utf-8"),
+            )
+            report["local"] = True
         return report
     except Exception as exc:  # noqa: BLE001
         report["errors"].append(str(exc))
@@ -378,6 +723,75 @@ def backup_critical(
     return backup_critical_assets(health_state_path, hash_chain_dir, backup_dir)
 
 
+def restore_backup(
+    target_dir: Path,
+    backup_dir: Path = DEFAULT_BACKUP_DIR,
+    manifest_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Restore the files of an incremental backup by replaying its manifest chain.
+
+    Bilingual: Restaura los archivos de un respaldo incremental recorriendo su cadena de manifiestos.
+
+    Args:
+        target_dir: Folder where restored files are written.
+        backup_dir: Backup root folder.
+        manifest_name: Manifest to restore; defaults to the latest backup.
+
+    Returns:
+        Dict[str, Any]: Report with `manifest`, `restored` filenames and `errors`.
+
+    Raises:
+        None.
+    """
+    report: Dict[str, Any] = {"manifest": None, "restored": [], "errors": []}
+    try:
+        name = manifest_name or _load_backup_index(backup_dir).get("head") or _latest_manifest_name(backup_dir)
+        if name is None:
+            report["errors"].append(f"no incremental backup found in {backup_dir}")
+            return report
+        report["manifest"] = name
+        fernet = _get_fernet()
+        for filename, entry in sorted(_resolve_backup_files(backup_dir, name).items()):
+            try:
+                _write_atomic(target_dir / Path(filename).name, _read_chunk(backup_dir, entry, fernet))
+                report["restored"].append(filename)
+            except Exception as exc:  # noqa: BLE001
+                report["errors"].append(f"{filename}: {exc}")
+    except Exception as exc:  # noqa: BLE001
+        report["errors"].append(str(exc))
+    if report["errors"]:
+        logger.error("backup_restore_failed | %s", "; ".join(report["errors"]))
+    return report
+
+
+def verify_last_bundle(backup_dir: Path = DEFAULT_BACKUP_DIR) -> bool:
+    """Verify that the latest backup is fully restorable from its manifest chain.
+
+    Bilingual: Verifica que el último respaldo sea restaurable desde su cadena de manifiestos.
+
+    Args:
+        backup_dir: Backup root folder.
+
+    Returns:
+        bool: True when every referenced chunk decrypts and matches its
+        sha256, or when no incremental backup exists yet.
+
+    Raises:
+        None.
+    """
+    name = _load_backup_index(backup_dir).get("head") or _latest_manifest_name(backup_dir)
+    if name is None:
+        return True
+    try:
+        fernet = _get_fernet()
+        for entry in _resolve_backup_files(backup_dir, name).values():
+            _read_chunk(backup_dir, entry, fernet)
+    except Exception as exc:  # noqa: BLE001
+        logger.error("backup_verify_failed | manifest=%s %s", name, exc)
+        return False
+    return True
+
+
 class BackupScheduler:
     """Periodic backup scheduler with explicit trigger and stop controls.
 
@@ -10,19 +10,21 @@ Este módulo forma parte de Centinel Engine y está documentado para facilitar
 la navegación, mantenimiento y auditoría técnica.
 
 Componentes detectados:
-  - _load_config
+  - load_rules_config
   - _load_snapshot
   - _latest_snapshots
   - _normalize_level
   - _extract_level
   - _extract_department
   - _strip_unwanted_fields
+  - _full_reverify_seconds
   - _build_source_map
   - _normalize_department_label
   - _allowed_departments
   - _aggregate_national
   - _filter_presidential_snapshot
   - _locate_hashchain
+  - run_analysis
   - main
   - bloque_main
 
@@ -36,19 +38,21 @@ This module is part of Centinel Engine and is documented to improve
 navigation, maintenance, and technical auditability.
 
 Detected components:
-  - _load_config
+  - load_rules_config
   - _load_snapshot
   - _latest_snapshots
   - _normalize_level
   - _extract_level
   - _extract_department
   - _strip_unwanted_fields
+  - _full_reverify_seconds
   - _build_source_map
   - _normalize_department_label
   - _allowed_departments
   - _aggregate_national
   - _filter_presidential_snapshot
   - _locate_hashchain
+  - run_analysis
   - main
   - bloque_main
 
@@ -79,12 +83,12 @@ Notes:
 
 from __future__ import annotations
 
-import json
 import unicodedata
 from pathlib import Path
 from typing import Any, Optional
 
 from centinel.paths import iter_all_snapshots
+from centinel.snapshot_cache import load_snapshot
 
 import yaml
 
@@ -93,6 +97,7 @@ from centinel.core.rules_engine import RulesEngine
 from centinel.utils.config_loader import CONFIG_PATH, load_config
 
 ANALYSIS_DIR = Path("analysis")
+HASHCHAIN_CURSOR_PATH = Path("data") / "verification_cursors" / "rules_hashchain.json"
 
 PRESIDENTIAL_LEVELS = {
     "PRES",
@@ -107,7 +112,7 @@ UNWANTED_KEYS = {"actas", "mesas", "tables"}
 # ── config & snapshot helpers ────────────────────────────────────────────
 
 
-def _load_config() -> dict:
+def load_rules_config() -> dict:
     """Carga la configuración desde config.yaml o el ejemplo.
 
     English:
@@ -122,12 +127,13 @@ def _load_config() -> dict:
 
 
 def _load_snapshot(path: Path) -> dict:
-    """Lee y parsea un snapshot JSON.
+    """Lee un snapshot JSON desde la caché compartida (solo lectura).
 
     English:
-        Read and parse a JSON snapshot.
+        Read a JSON snapshot through the shared parsed-snapshot cache
+        (read-only view).
     """
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_snapshot(path)
 
 
 def _latest_snapshots() -> tuple[Optional[Path], Optional[Path]]:
@@ -185,6 +191,18 @@ def _strip_unwanted_fields(payload: dict) -> dict:
     return {key: value for key, value in payload.items() if key not in UNWANTED_KEYS}
 
 
+def _full_reverify_seconds(config: dict) -> Optional[float]:
+    """Intervalo de re-hash completo del hashchain (``custody.full_reverify_hours``).
+
+    English:
+        Periodic full hash-chain re-hash interval from
+        ``custody.full_reverify_hours`` (24 h by default; 0 disables it).
+    """
+    custody = config.get("custody", {}) if isinstance(config.get("custody"), dict) else {}
+    hours = float(custody.get("full_reverify_hours", 24))
+    return hours * 3600 if hours > 0 else None
+
+
 def _build_source_map(config: dict) -> dict[str, dict[str, Any]]:
     source_map: dict[str, dict[str, Any]] = {}
     for source in config.get("sources", []):
@@ -362,35 +380,64 @@ def _broadcast_findings_urgent(result: object, snapshot_id: str) -> None:
 # ── main ─────────────────────────────────────────────────────────────────
 
 
-def main() -> None:
-    """Punto de entrada CLI: delega todo a RulesEngine.
+def run_analysis(
+    snapshots: Optional[list[tuple[Path, dict]]] = None,
+    *,
+    config: Optional[dict] = None,
+) -> Optional[Any]:
+    """Ejecuta RulesEngine sobre los dos snapshots más recientes.
+
+    ``snapshots`` permite al runner en proceso entregar los pares
+    (ruta, payload) recién normalizados sin releerlos de disco; con menos de
+    dos entradas se descubre el par desde disco como en la CLI.
 
     English:
-        CLI entry point: delegates everything to RulesEngine.
+        Run RulesEngine over the two most recent snapshots and return the
+        ``RulesEngineResult`` (``None`` when there is nothing to analyze).
+        The JSON report and ``anomalies_report.json`` are still written for
+        downstream consumers.
     """
-    current_path, previous_path = _latest_snapshots()
-    if not current_path:
-        print("[!] No se encontraron snapshots para analizar")
-        return
-
-    config = _load_config()
-    current_data = _filter_presidential_snapshot(
-        _load_snapshot(current_path),
-        config,
-    )
-    previous_data = _filter_presidential_snapshot(_load_snapshot(previous_path), config) if previous_path else None
+    config = config if config is not None else load_rules_config()
+    if snapshots and len(snapshots) >= 2:
+        current_path, current_raw = snapshots[-1]
+        previous_path, previous_raw = snapshots[-2]
+    else:
+        current_path, previous_path = _latest_snapshots()
+        if not current_path:
+            print("[!] No se encontraron snapshots para analizar")
+            return None
+        current_raw = _load_snapshot(current_path)
+        previous_raw = _load_snapshot(previous_path) if previous_path else None
+
+    current_data = _filter_presidential_snapshot(current_raw, config)
+    previous_data = _filter_presidential_snapshot(previous_raw, config) if previous_raw is not None else None
 
     log_path = ANALYSIS_DIR / "rules_log.jsonl"
-    engine = RulesEngine(config=config, log_path=log_path)
+    engine = RulesEngine(config=config, log_path=log_path, mesa_index_path=ANALYSIS_DIR / "mesa_index.json")
     snapshot_id = RulesEngine.snapshot_hash(current_data)
+    # El hash del snapshot ya filtrado identifica cada lado del par: el
+    # índice de mesas guardado en el ciclo anterior se reutiliza si su
+    # snapshot actual es el previo de este ciclo.
+    previous_id = RulesEngine.snapshot_hash(previous_data) if previous_data is not None else None
 
     # ── ejecutar TODAS las reglas ────────────────────────────────────
-    result = engine.run(current_data, previous_data, snapshot_id=snapshot_id)
+    result = engine.run(
+        current_data,
+        previous_data,
+        snapshot_id=snapshot_id,
+        current_source=snapshot_id,
+        previous_source=previous_id,
+    )
 
     # ── verificar hashchain ──────────────────────────────────────────
     hashchain_path = _locate_hashchain(current_path)
     if hashchain_path and current_path.parent.name == "normalized":
-        tamper_alerts = RulesEngine.verify_hashchain(current_path.parent, hashchain_path)
+        tamper_alerts = RulesEngine.verify_hashchain(
+            current_path.parent,
+            hashchain_path,
+            cursor_path=HASHCHAIN_CURSOR_PATH,
+            full_interval_seconds=_full_reverify_seconds(config),
+        )
         if tamper_alerts:
             result.alerts.extend(tamper_alerts)
             result.critical_alerts.extend(tamper_alerts)
@@ -404,6 +451,16 @@ def main() -> None:
     print(f"[i] Reporte generado: {report_path}")
     if result.pause_snapshots:
         print("[!] Alertas críticas detectadas: se debe pausar el ingreso de snapshots")
+    return result
+
+
+def main() -> None:
+    """Punto de entrada CLI: delega todo a RulesEngine.
+
+    English:
+        CLI entry point: delegates everything to RulesEngine.
+    """
+    run_analysis()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,711 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `scripts/benchmark_hot_path.py`.
+Benchmark de la ruta crítica captura → normalización → reglas → publicación.
+Genera payloads nacionales sintéticos (departamentos × mesas × candidatos,
+con la cadencia de sondeo configurada) a partir del generador de
+`validate_false_positive_rate.py`, los procesa en streaming y mide cada
+subsistema por separado:
+
+- `capture`: `json.loads` + SHA-256 del cuerpo crudo;
+- `normalize`: `normalize_snapshot`;
+- `rules`: `RulesEngine.run` contra el snapshot previo del departamento;
+- `publish`: `LocalSnapshotStore.store_snapshot`;
+- `anchor`: un lote Merkle de `anchor_pending` (backend local);
+- `hashchain_verify`: `RulesEngine.verify_hashchain` sobre la cadena completa;
+- `canonical_json_stdlib` / `canonical_json_fast`: JSON canónico del payload
+  nacional completo con `json` y con el backend de `canonical_json`;
+- `api_*`: latencia de endpoints públicos vía `TestClient`.
+
+También muestrea RSS durante el replay y registra el pico. Los resultados
+son JSON y se comparan contra un baseline guardado para detectar
+regresiones (código de salida 1).
+
+Componentes detectados:
+  - BenchmarkScale
+  - LatencyRecorder
+  - SyntheticElection
+  - run_benchmark
+  - compare_to_baseline
+  - build_parser
+  - main
+  - bloque_main
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `scripts/benchmark_hot_path.py`.
+Benchmark for the capture → normalize → rules → publish hot path. It
+generates synthetic national payloads (departments × mesas × candidates at
+the configured polling cadence) building on the
+`validate_false_positive_rate.py` generator, streams them through the
+pipeline and times each subsystem separately: capture parse + hash,
+`normalize_snapshot`, `RulesEngine.run`, `store_snapshot`, Merkle anchor
+batches, full hash-chain verification, canonical JSON of the full
+national payload (stdlib vs the `canonical_json` backend) and public API
+endpoints via `TestClient`. RSS is sampled during the replay and the peak recorded.
+Results are machine-readable JSON and are compared against a stored
+baseline so regressions fail the run (exit code 1).
+
+Detected components:
+  - BenchmarkScale
+  - LatencyRecorder
+  - SyntheticElection
+  - run_benchmark
+  - compare_to_baseline
+  - build_parser
+  - main
+  - bloque_main
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Benchmark Hot Path Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import unicodedata
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import psutil
+import yaml
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+for _path in (ROOT_DIR, ROOT_DIR / "src"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from centinel.core import canonical_json as canonical_json_backend  # noqa: E402
+from centinel.core.anchor_queue import LocalAnchorBackend  # noqa: E402
+from centinel.core.hashchain import compute_hash  # noqa: E402
+from centinel.core.normalize import DEPARTMENT_CODES, normalize_snapshot, snapshot_to_canonical_json  # noqa: E402
+from centinel.core.rules_engine import RulesEngine  # noqa: E402
+from centinel.core.storage import LocalSnapshotStore  # noqa: E402
+from scripts.validate_false_positive_rate import DEPT_ELECTORES, _benford_sample  # noqa: E402
+
+SCHEMA_VERSION = "1.0"
+ELECTION_START = datetime(2025, 11, 30, 18, 0, tzinfo=timezone.utc)
+# The committed example config keeps runs comparable across machines no
+# matter what the local command_center/config.yaml enables.
+DEFAULT_RULES_CONFIG = Path("command_center") / "config.yaml.example"
+DEFAULT_OUTPUT = Path("reports") / "benchmark_hot_path.json"
+DEFAULT_BASELINE = Path("reports") / "benchmark_baseline.json"
+DEFAULT_TOLERANCE = 0.25
+# Latency deltas below this are timer noise, never a regression.
+MIN_REGRESSION_DELTA_MS = 0.05
+COMPARED_METRICS = ("mean_ms", "p95_ms")
+CANONICAL_JSON_REPS = 5
+PARTIES = ("Partido Liberal", "Partido Nacional", "Partido Libre", "DC", "PAC", "Independiente")
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """Dimensiones del escenario sintético.
+
+    English:
+        Synthetic scenario dimensions. ``national`` is the realistic preset
+        (18 departments, ~1000 mesas each, 30 days at a 5-minute cadence);
+        ``smoke`` and ``ci`` are small enough for tests and CI.
+    """
+
+    departments: int = 18
+    mesas_per_department: int = 50
+    candidates: int = 5
+    days: float = 1.0
+    cadence_minutes: int = 30
+    api_requests: int = 50
+    seed: int = 2025
+
+    @property
+    def steps(self) -> int:
+        return max(1, int(self.days * 24 * 60 // self.cadence_minutes))
+
+    @property
+    def snapshots(self) -> int:
+        return self.steps * self.departments
+
+
+PRESETS: Dict[str, BenchmarkScale] = {
+    "smoke": BenchmarkScale(
+        departments=2, mesas_per_department=20, candidates=4, days=0.25, cadence_minutes=60, api_requests=5
+    ),
+    "ci": BenchmarkScale(),
+    "national": BenchmarkScale(mesas_per_department=1000, days=30, cadence_minutes=5, api_requests=200),
+}
+
+
+@dataclass
+class LatencyRecorder:
+    """Acumula latencias por subsistema y resume percentiles.
+
+    English:
+        Collect per-subsystem latencies and summarize them. ``items`` lets
+        one timed call cover many snapshots (e.g. a full chain pass) so the
+        throughput stays per snapshot.
+    """
+
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    items: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, name: str, seconds: float, items: int = 1) -> None:
+        self.samples.setdefault(name, []).append(seconds)
+        self.items[name] = self.items.get(name, 0) + items
+
+    @contextmanager
+    def time(self, name: str, items: int = 1) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, items)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Resumen por subsistema (ms y elementos/s).
+
+        English:
+            Per-subsystem summary in milliseconds plus items per second.
+        """
+        report: Dict[str, Dict[str, float]] = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            total = sum(ordered)
+            report[name] = {
+                "calls": len(ordered),
+                "items": self.items.get(name, len(ordered)),
+                "total_s": round(total, 6),
+                "mean_ms": round(total / len(ordered) * 1000, 4),
+                "p50_ms": round(_percentile(ordered, 0.50) * 1000, 4),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 4),
+                "max_ms": round(ordered[-1] * 1000, 4),
+                "items_per_s": round(self.items.get(name, len(ordered)) / total, 2) if total > 0 else 0.0,
+            }
+        return report
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class SyntheticElection:
+    """Generador determinista de snapshots departamentales en formato CNE.
+
+    Cada mesa tiene resultados finales fijos (votos Benford por candidato,
+    como en `validate_false_positive_rate.generate_snapshot`) y un paso de
+    publicación; el snapshot del paso ``s`` contiene las mesas publicadas
+    hasta ``s``, así los conteos solo crecen y el payload escala con las
+    mesas como en una noche electoral real.
+
+    English:
+        Deterministic generator of CNE-format department snapshots. Each
+        mesa has fixed final results (Benford votes per candidate, as in
+        ``validate_false_positive_rate.generate_snapshot``) and a publication
+        step; step ``s`` carries every mesa published by then, so counts only
+        grow and payload size scales with mesas like a real election night.
+    """
+
+    def __init__(self, scale: BenchmarkScale) -> None:
+        self.scale = scale
+        rng = random.Random(scale.seed)
+        names = list(DEPARTMENT_CODES)
+        self.departments = [names[index % len(names)] for index in range(scale.departments)]
+        self.candidates = [
+            {"id": f"C{slot:02d}", "candidato": f"Candidato {slot}", "partido": PARTIES[(slot - 1) % len(PARTIES)]}
+            for slot in range(1, scale.candidates + 1)
+        ]
+        # Counting mostly lands in the first 40% of the window, then the
+        # snapshots go flat while polling continues, as after election night.
+        reporting_steps = max(1, int(scale.steps * 0.4))
+        self._mesas = {name: self._build_mesas(name, reporting_steps, rng) for name in self.departments}
+
+    def _build_mesas(self, department: str, reporting_steps: int, rng: random.Random) -> List[Tuple[int, dict]]:
+        key = unicodedata.normalize("NFKD", department).encode("ascii", "ignore").decode().upper()
+        registered = max(200, DEPT_ELECTORES.get(key, 200_000) // max(1, self.scale.mesas_per_department))
+        code = DEPARTMENT_CODES.get(department, "00")
+        mesas = []
+        for index in range(self.scale.mesas_per_department):
+            turnout = rng.uniform(0.45, 0.75)
+            raw_votes = _benford_sample(len(self.candidates), rng)
+            cast = int(registered * turnout)
+            nulos = int(cast * rng.uniform(0.005, 0.03))
+            blancos = int(cast * rng.uniform(0.005, 0.02))
+            valid = cast - nulos - blancos
+            weights = sum(raw_votes) or 1
+            votes = [valid * value // weights for value in raw_votes]
+            votes[0] += valid - sum(votes)
+            mesa = {
+                "codigo": f"{code}-{index + 1:05d}",
+                "totals": {
+                    "validos": valid,
+                    "nulos": nulos,
+                    "blancos": blancos,
+                    "total": cast,
+                    "inscritos": registered,
+                },
+                "candidatos": [
+                    {"id": candidate["id"], "votos": vote} for candidate, vote in zip(self.candidates, votes)
+                ],
+            }
+            mesas.append((rng.randrange(reporting_steps), mesa))
+        mesas.sort(key=lambda item: item[0])
+        return mesas
+
+    def timestamp(self, step: int) -> str:
+        moment = ELECTION_START + timedelta(minutes=step * self.scale.cadence_minutes)
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def payload(self, department: str, step: int) -> Dict[str, Any]:
+        """Snapshot del departamento en el paso ``step``.
+
+        English:
+            Department snapshot at ``step``.
+        """
+        mesas = self._mesas[department]
+        published = [mesa for reported_at, mesa in mesas if reported_at <= step]
+        registered = sum(mesa["totals"]["inscritos"] for _, mesa in mesas)
+        totals = {name: sum(mesa["totals"][name] for mesa in published) for name in ("validos", "nulos", "blancos")}
+        candidate_votes = [0] * len(self.candidates)
+        for mesa in published:
+            for slot, entry in enumerate(mesa["candidatos"]):
+                candidate_votes[slot] += entry["votos"]
+        total_votes = totals["validos"] + totals["nulos"] + totals["blancos"]
+        return {
+            "cargo": "presidencial",
+            "departamento": department,
+            "timestamp": self.timestamp(step),
+            "registered_voters": registered,
+            "total_votes": total_votes,
+            "valid_votes": totals["validos"],
+            "null_votes": totals["nulos"],
+            "blank_votes": totals["blancos"],
+            "porcentaje_escrutado": round(100 * len(published) / max(1, len(mesas)), 2),
+            "actas": {"totales": len(mesas), "procesadas": len(published), "divulgadas": len(published)},
+            "candidatos": [{**candidate, "votos": votes} for candidate, votes in zip(self.candidates, candidate_votes)],
+            "departamentos": [
+                {
+                    "departamento": department,
+                    "total_votes": total_votes,
+                    "registered_voters": registered,
+                    "mesas": published,
+                }
+            ],
+        }
+
+    def __iter__(self) -> Iterator[Tuple[str, int, bytes]]:
+        """Recorre ``(departamento, paso, cuerpo crudo)`` en orden temporal.
+
+        English:
+            Yield ``(department, step, raw body)`` in time order.
+        """
+        for step in range(self.scale.steps):
+            for department in self.departments:
+                yield department, step, json.dumps(self.payload(department, step)).encode("utf-8")
+
+
+def _rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 2)
+
+
+def load_rules_config(path: Path = DEFAULT_RULES_CONFIG) -> dict:
+    """Carga la configuración de reglas usada por el benchmark.
+
+    English:
+        Load the rules configuration used by the benchmark.
+    """
+    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+
+
+@contextmanager
+def _api_pointed_at(db_path: Path, work_dir: Path) -> Iterator[Any]:
+    """Apunta el API público a la base del benchmark y lo restaura al salir."""
+    from centinel.api import main as api_main
+
+    overrides = {
+        "DB_PATH": db_path,
+        "ALERTS_JSON": work_dir / "alerts.json",
+        "ALERTS_LOG": work_dir / "alerts.log",
+        "_DATA_DIR": work_dir / "no_national",
+        "_FIXTURE_DIR": work_dir / "no_fixture",
+    }
+    saved = {name: getattr(api_main, name) for name in overrides}
+    limiter_enabled = api_main.limiter.enabled
+    for name, value in overrides.items():
+        setattr(api_main, name, value)
+    api_main.limiter.enabled = False
+    api_main.invalidate_response_cache()
+    try:
+        yield api_main
+    finally:
+        api_main.invalidate_response_cache()
+        api_main._connection_pool().close()
+        for name, value in saved.items():
+            setattr(api_main, name, value)
+        api_main.limiter.enabled = limiter_enabled
+
+
+def _bench_api(recorder: LatencyRecorder, db_path: Path, work_dir: Path, last_hash: str, requests: int) -> None:
+    from fastapi.testclient import TestClient
+
+    with _api_pointed_at(db_path, work_dir) as api_main:
+        for index in range(requests):
+            # One TEST-NET address per iteration keeps the per-IP zero-trust
+            # limiter from turning a latency run into 429s.
+            client = TestClient(api_main.app, client=(f"198.51.100.{index % 254 + 1}", 50000))
+            api_main.invalidate_response_cache()
+            with recorder.time("api_snapshots_latest_cold"):
+                response = client.get("/snapshots/latest")
+            response.raise_for_status()
+            with recorder.time("api_snapshots_latest_cached"):
+                client.get("/snapshots/latest").raise_for_status()
+            api_main.invalidate_response_cache()
+            with recorder.time("api_hashchain_verify"):
+                client.get("/hashchain/verify", params={"hash": last_hash}).raise_for_status()
+
+
+def _bench_canonical_json(recorder: LatencyRecorder, election: SyntheticElection) -> Dict[str, Any]:
+    """Mide el JSON canónico del payload nacional del último paso.
+
+    English:
+        Time canonical JSON of the last-step national payload (every
+        department with all its mesas) with the stdlib reference and with
+        the active backend, and check that both emit the same bytes. The
+        payload carries non-ASCII department names and a null field per
+        department, like real CNE snapshots, so it exercises the orjson path.
+    """
+    last_step = election.scale.steps - 1
+    national = {
+        "departamentos": [
+            {**election.payload(department, last_step), "observaciones": None} for department in election.departments
+        ]
+    }
+    reference = canonical_json_backend.stdlib_canonical_bytes(national)
+    for _ in range(CANONICAL_JSON_REPS):
+        with recorder.time("canonical_json_stdlib"):
+            canonical_json_backend.stdlib_canonical_bytes(national)
+        with recorder.time("canonical_json_fast"):
+            encoded = canonical_json_backend.canonical_bytes(national)
+    if encoded != reference:
+        raise RuntimeError("canonical_json backend output differs from the stdlib reference")
+    stdlib_s = sum(recorder.samples["canonical_json_stdlib"][-CANONICAL_JSON_REPS:])
+    fast_s = sum(recorder.samples["canonical_json_fast"][-CANONICAL_JSON_REPS:])
+    return {
+        "backend": canonical_json_backend.BACKEND,
+        "payload_bytes": len(reference),
+        "speedup": round(stdlib_s / fast_s, 2) if fast_s > 0 else 0.0,
+    }
+
+
+def run_benchmark(
+    scale: BenchmarkScale,
+    work_dir: Path,
+    *,
+    config: Optional[dict] = None,
+    include_api: bool = True,
+) -> Dict[str, Any]:
+    """Ejecuta el benchmark completo y devuelve el resultado serializable.
+
+    English:
+        Run the full benchmark and return the JSON-serializable results.
+        Artifacts (SQLite, normalized snapshots, hash chain) go to
+        ``work_dir``.
+    """
+    config = config if config is not None else load_rules_config()
+    engine = RulesEngine(config=config)
+    recorder = LatencyRecorder()
+    election = SyntheticElection(scale)
+
+    db_path = work_dir / "snapshots.db"
+    normalized_dir = work_dir / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+    # A huge interval keeps the worker idle: batches are drained (and timed)
+    # explicitly below, not on a background thread competing for the CPU.
+    store = LocalSnapshotStore(
+        str(db_path),
+        anchor_backend=LocalAnchorBackend(work_dir / "anchors.jsonl"),
+        anchor_interval_seconds=24 * 3600,
+    )
+    previous_raw: Dict[str, dict] = {}
+    previous_hash: Dict[str, Optional[str]] = {}
+    chain: List[Dict[str, Optional[str]]] = []
+    chain_head: Optional[str] = None
+    rss_samples: List[Dict[str, float]] = []
+    sample_every = max(1, scale.snapshots // 50)
+    processed = 0
+    alerts = 0
+    started = time.perf_counter()
+
+    try:
+        for department, step, body in election:
+            with recorder.time("capture"):
+                raw = json.loads(body)
+                hashlib.sha256(body).hexdigest()
+            with recorder.time("normalize"):
+                snapshot = normalize_snapshot(raw, department, raw["timestamp"])
+            if snapshot is None:
+                raise RuntimeError(f"synthetic payload rejected by normalize_snapshot: {department} step={step}")
+            with recorder.time("rules"):
+                result = engine.run(raw, previous_raw.get(department))
+            alerts += len(result.alerts)
+            with recorder.time("publish"):
+                previous_hash[department] = store.store_snapshot(snapshot, previous_hash=previous_hash.get(department))
+            previous_raw[department] = raw
+
+            name = f"{snapshot.meta.department_code}_{step:06d}"
+            canonical_json = snapshot_to_canonical_json(snapshot)
+            (normalized_dir / f"{name}.json").write_text(canonical_json, encoding="utf-8")
+            entry_hash = compute_hash(canonical_json, chain_head)
+            chain.append({"snapshot": name, "hash": entry_hash, "previous_hash": chain_head})
+            chain_head = entry_hash
+
+            processed += 1
+            if processed % sample_every == 0 or processed == scale.snapshots:
+                rss_samples.append({"snapshots": processed, "rss_mb": round(_rss_mb(), 2)})
+
+        while store.pending_anchor_count():
+            batch_started = time.perf_counter()
+            anchored = store.anchor_pending()
+            if not anchored:
+                break
+            recorder.record("anchor", time.perf_counter() - batch_started, items=anchored)
+
+        hashchain_path = work_dir / "hashchain.json"
+        hashchain_path.write_text(json.dumps(chain), encoding="utf-8")
+        with recorder.time("hashchain_verify", items=len(chain)):
+            tamper_alerts = RulesEngine.verify_hashchain(normalized_dir, hashchain_path)
+        if tamper_alerts:
+            raise RuntimeError(f"hash chain verification failed: {tamper_alerts[0]}")
+    finally:
+        store.close()
+
+    canonical_json_report = _bench_canonical_json(recorder, election)
+
+    if include_api and scale.api_requests > 0:
+        last_hash = next(value for value in reversed(list(previous_hash.values())) if value)
+        _bench_api(recorder, db_path, work_dir, last_hash, scale.api_requests)
+
+    elapsed = time.perf_counter() - started
+    steady = rss_samples[len(rss_samples) // 4 :] or rss_samples
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "hot_path",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "scale": dataclasses.asdict(scale),
+        "totals": {
+            "snapshots": processed,
+            "alerts": alerts,
+            "wall_s": round(elapsed, 3),
+            "snapshots_per_s": round(processed / elapsed, 2) if elapsed > 0 else 0.0,
+        },
+        "subsystems": recorder.summary(),
+        "canonical_json": canonical_json_report,
+        "memory": {
+            "peak_rss_mb": _peak_rss_mb(),
+            # Growth after the first quarter of the replay: a flat line means
+            # nothing accumulates per snapshot.
+            "rss_growth_mb": round(steady[-1]["rss_mb"] - steady[0]["rss_mb"], 2) if steady else 0.0,
+            "rss_samples": rss_samples,
+        },
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Dict[str, Any]:
+    """Compara resultados contra un baseline guardado.
+
+    Una métrica regresa si supera el baseline en más de ``tolerance``
+    (fracción) y en más de ``MIN_REGRESSION_DELTA_MS``. Escalas distintas
+    no son comparables y devuelven ``SKIPPED``.
+
+    English:
+        Compare results against a stored baseline. A metric regresses when
+        it exceeds the baseline by more than ``tolerance`` (a fraction) and
+        by more than ``MIN_REGRESSION_DELTA_MS``. Different scales are not
+        comparable and yield ``SKIPPED``.
+    """
+    if baseline.get("scale") != results.get("scale"):
+        return {"status": "SKIPPED", "reason": "scale_mismatch", "tolerance": tolerance, "regressions": []}
+
+    regressions: List[Dict[str, Any]] = []
+    current_subsystems = results.get("subsystems", {})
+    for name, base_stats in baseline.get("subsystems", {}).items():
+        current = current_subsystems.get(name)
+        if current is None:
+            regressions.append({"subsystem": name, "metric": "missing"})
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = base_stats.get(metric), current.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > MIN_REGRESSION_DELTA_MS:
+                regressions.append(
+                    {
+                        "subsystem": name,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "ratio": round(after / before, 3) if before else None,
+                    }
+                )
+
+    before_rss = (baseline.get("memory") or {}).get("peak_rss_mb")
+    after_rss = (results.get("memory") or {}).get("peak_rss_mb")
+    if before_rss and after_rss and after_rss > before_rss * (1 + tolerance):
+        regressions.append(
+            {
+                "subsystem": "memory",
+                "metric": "peak_rss_mb",
+                "baseline": before_rss,
+                "current": after_rss,
+                "ratio": round(after_rss / before_rss, 3),
+            }
+        )
+    return {"status": "FAIL" if regressions else "PASS", "tolerance": tolerance, "regressions": regressions}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos CLI.
+
+    Build the CLI argument parser.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de la ruta captura → normalización → reglas → publicación.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="ci", help="Escala base del escenario.")
+    parser.add_argument("--departments", type=int, help="Departamentos (máx. 18 distintos).")
+    parser.add_argument("--mesas", type=int, help="Mesas por departamento.")
+    parser.add_argument("--candidates", type=int, help="Candidatos presidenciales.")
+    parser.add_argument("--days", type=float, help="Días simulados.")
+    parser.add_argument("--cadence-minutes", type=int, help="Minutos entre sondeos.")
+    parser.add_argument("--api-requests", type=int, help="Solicitudes por endpoint del API (0 = omitir).")
+    parser.add_argument("--seed", type=int, help="Semilla del generador.")
+    parser.add_argument("--config", default=str(DEFAULT_RULES_CONFIG), help="YAML con la configuración de reglas.")
+    parser.add_argument("--work-dir", help="Directorio de artefactos (por defecto uno temporal).")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Ruta del JSON de resultados.")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline contra el que comparar.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Regresión tolerada (fracción).")
+    parser.add_argument("--update-baseline", action="store_true", help="Guarda estos resultados como baseline.")
+    return parser
+
+
+def _scale_from_args(args: argparse.Namespace) -> BenchmarkScale:
+    overrides = {
+        "departments": args.departments,
+        "mesas_per_department": args.mesas,
+        "candidates": args.candidates,
+        "days": args.days,
+        "cadence_minutes": args.cadence_minutes,
+        "api_requests": args.api_requests,
+        "seed": args.seed,
+    }
+    return dataclasses.replace(PRESETS[args.preset], **{k: v for k, v in overrides.items() if v is not None})
+
+
+def main() -> int:
+    """Punto de entrada principal del script.
+
+    Main script entry point.
+    """
+    args = build_parser().parse_args()
+    # Per-rule log lines would otherwise dominate the measured time, and
+    # pandas deprecation warnings would bury the summary. Errors still show.
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore", FutureWarning)
+    scale = _scale_from_args(args)
+    config = load_rules_config(Path(args.config))
+
+    if args.work_dir:
+        work_dir = Path(args.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmark(scale, work_dir, config=config)
+    else:
+        with tempfile.TemporaryDirectory(prefix="centinel-bench-") as tmp:
+            results = run_benchmark(scale, Path(tmp), config=config)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        results["comparison"] = {"status": "BASELINE_UPDATED", "baseline": str(baseline_path)}
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        results["comparison"] = compare_to_baseline(results, baseline, args.tolerance)
+    else:
+        results["comparison"] = {"status": "NO_BASELINE", "baseline": str(baseline_path)}
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    summary = {
+        "output": str(output_path),
+        "totals": results["totals"],
+        "subsystems": {
+            name: {k: stats[k] for k in ("mean_ms", "p95_ms", "items_per_s")}
+            for name, stats in results["subsystems"].items()
+        },
+        "canonical_json": results["canonical_json"],
+        "peak_rss_mb": results["memory"]["peak_rss_mb"],
+        "comparison": results["comparison"],
+    }
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    return 1 if results["comparison"].get("status") == "FAIL" else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -170,7 +170,7 @@ def _load_hash_entries(hashes_dir: Path) -> list[HashEntry]:
         Lista de entradas de hash encontradas.
     """
     entries: list[HashEntry] = []
-    for hash_file in iter_all_hashes(hash_root=hashes_dir):
+    for hash_file in iter_all_hashes(hash_root=hashes_dir, exhaustive=True):
         raw = hash_file.read_text(encoding="utf-8").strip()
         try:
             payload = json.loads(raw)
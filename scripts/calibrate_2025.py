@@ -15,6 +15,12 @@ import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator, Optional
+
+# Ensure `scripts` is importable when run as `python scripts/calibrate_2025.py`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.replay_stream import DEFAULT_WORKERS, ThroughputMeter, stream_parsed  # noqa: E402
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
@@ -26,23 +32,56 @@ def parse_num(s: str) -> int:
     return int(str(s).replace(",", "").strip() or 0)
 
 
-def load_snapshots(data_dir: Path) -> list[dict]:
-    """Carga y ordena los JSON por timestamp en el nombre de archivo."""
-    pattern = re.compile(r"HN\.PRESIDENTE\.00-TODOS\.000-TODOS (\d{4}-\d{2}-\d{2} \d{2}_\d{2}_\d{2})\.json")
-    snapshots = []
+_SNAPSHOT_NAME = re.compile(r"HN\.PRESIDENTE\.00-TODOS\.000-TODOS (\d{4}-\d{2}-\d{2} \d{2}_\d{2}_\d{2})\.json")
+
+
+def _snapshot_files(data_dir: Path) -> list[tuple[datetime, Path]]:
+    """Archivos JSON del CNE ordenados por el timestamp de su nombre (sin leerlos)."""
+    files = []
     for f in sorted(data_dir.glob("HN.PRESIDENTE*.json")):
-        m = pattern.match(f.name)
+        m = _SNAPSHOT_NAME.match(f.name)
         if not m:
             continue
         ts_str = m.group(1).replace("_", ":")
         ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
-        try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"[WARN] {f.name}: {e}", file=sys.stderr)
+        files.append((ts, f))
+    return sorted(files, key=lambda item: item[0])
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        print(f"[WARN] {path.name}: {e}", file=sys.stderr)
+        return None
+
+
+def iter_snapshots(data_dir: Path, workers: int = DEFAULT_WORKERS, lookahead: Optional[int] = None) -> Iterator[dict]:
+    """Entrega los JSON en orden de timestamp, parseados en un pool con anticipación acotada."""
+    files = _snapshot_files(data_dir)
+    timestamps = {path: ts for ts, path in files}
+    for path, data in stream_parsed([path for _ts, path in files], _read_json, workers=workers, lookahead=lookahead):
+        if data is None:
             continue
-        snapshots.append({"ts": ts, "file": f.name, "data": data})
-    return sorted(snapshots, key=lambda x: x["ts"])
+        yield {"ts": timestamps[path], "file": path.name, "data": data}
+
+
+def load_snapshots(data_dir: Path) -> list[dict]:
+    """Carga y ordena los JSON por timestamp en el nombre de archivo."""
+    return list(iter_snapshots(data_dir))
+
+
+def iter_metrics(
+    data_dir: Path,
+    workers: int = DEFAULT_WORKERS,
+    lookahead: Optional[int] = None,
+    meter: Optional[ThroughputMeter] = None,
+) -> Iterator[dict]:
+    """Métricas por snapshot en streaming: el JSON crudo se descarta al extraerlas."""
+    for snap in iter_snapshots(data_dir, workers=workers, lookahead=lookahead):
+        yield extract_metrics(snap)
+        if meter is not None:
+            meter.tick()
 
 
 def extract_metrics(snap: dict) -> dict:
@@ -544,6 +583,18 @@ def main() -> None:
         default=Path("reports"),
         help="Directorio de salida para reportes",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Workers que parsean JSON en paralelo",
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=None,
+        help="JSON en vuelo como máximo (por defecto 2 x workers)",
+    )
     args = parser.parse_args()
 
     if not args.data.exists():
@@ -551,12 +602,12 @@ def main() -> None:
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"[1/4] Cargando snapshots desde {args.data}...")
-    snapshots = load_snapshots(args.data)
-    print(f"      {len(snapshots)} snapshots cargados")
-
+    print(f"[1/4] Leyendo snapshots desde {args.data} en streaming...")
     print("[2/4] Extrayendo métricas...")
-    metrics = [extract_metrics(s) for s in snapshots]
+    meter = ThroughputMeter(label="calibrate_2025")
+    metrics = list(iter_metrics(args.data, workers=args.workers, lookahead=args.lookahead, meter=meter))
+    throughput = meter.finish()
+    print(f"      {len(metrics)} snapshots procesados ({throughput['snapshots_per_second']} snapshots/s)")
 
     print("[3/4] Ejecutando detectores...")
     alerts = []
@@ -575,7 +626,7 @@ def main() -> None:
     print(f"[4/4] Escribiendo reportes en {args.output_dir}/...")
     json_out = args.output_dir / "calibration_2025.json"
     json_out.write_text(
-        json.dumps({"alerts": alerts, "summary": summary}, ensure_ascii=False, indent=2),
+        json.dumps({"alerts": alerts, "summary": summary, "throughput": throughput}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
 
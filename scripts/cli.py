@@ -91,7 +91,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from centinel.core.hashchain import compute_hash
 from scripts.logging_utils import configure_logging, log_event
-from centinel.core.normalize import normalize_snapshot, snapshot_to_canonical_json
+from centinel.core.normalize import normalize_many, snapshot_to_canonical_json
 
 logger = configure_logging(__name__)
 
@@ -144,13 +144,14 @@ def normalize_snapshots(
     """
     normalized: List[NormalizedSnapshot] = []
     max_snapshots = 19
-    for index, snapshot in enumerate(snapshots[:max_snapshots]):
-        normalized_snapshot = normalize_snapshot(
-            snapshot.raw,
-            department,
-            snapshot.timestamp,
-            year=year,
-        )
+    batch = snapshots[:max_snapshots]
+    results = normalize_many(
+        [snapshot.raw for snapshot in batch],
+        department,
+        [snapshot.timestamp for snapshot in batch],
+        year=year,
+    )
+    for snapshot, normalized_snapshot in zip(batch, results):
         if normalized_snapshot is None:
             log_event(
                 logger,
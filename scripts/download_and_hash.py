@@ -82,6 +82,7 @@ Notes:
 
 
 import argparse
+import asyncio
 import contextlib
 import fcntl
 import hashlib
@@ -90,28 +91,35 @@ import logging
 import os
 import random
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterator, Optional
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import urlparse
 
+import httpx
 import requests
 import yaml
 from dateutil import parser as date_parser
 from centinel.downloader import (
     StructuredLogger,
+    async_request_json_with_retry,
     build_alert_hook,
     load_retry_config,
     request_json_with_retry,
     request_with_retry,
     should_skip_snapshot,
 )
-from centinel.download import write_atomic
+from centinel.download import build_client, write_atomic
 from centinel.paths import (
+    SNAPSHOTS_SUBDIR,
     ensure_source_dirs,
     hash_filename,
+    iter_all_snapshots,
     resolve_source_id,
     snapshot_filename,
 )
+from centinel.snapshot_catalog import record_snapshot
 from scripts.circuit_breaker import CircuitBreaker
 from centinel.defense.fetcher import build_rotating_request_profile
 from centinel.defense.hasher import trigger_post_hash_backup
@@ -119,6 +127,7 @@ from centinel.defense.hasher import trigger_post_hash_backup
 from monitoring.health import get_health_state
 from scripts.logging_utils import configure_logging, log_event
 from centinel.core.custody import sign_hash_record
+from centinel import tracing
 
 logger = configure_logging("centinel.download", log_file="logs/centinel.log")
 
@@ -556,29 +565,60 @@ def resolve_endpoint(source: dict[str, Any], endpoints: dict[str, str]) -> str |
     return source.get("endpoint")
 
 
-def process_sources(
-    sources: list[dict[str, Any]],
-    endpoints: dict[str, str],
-    config: dict[str, Any],
-) -> None:
-    """/** Procesa fuentes reales y actualiza hashes. / Process real sources and update hashes. **"""
+@dataclass
+class _CaptureState:
+    """Estado mutable de un ciclo de captura. / Mutable state of one capture cycle.
+
+    Shared by the sequential and async capture modes so both apply the same
+    checkpoint, circuit-breaker and chaining semantics.
+    """
+
+    previous_hash: str
+    processed_sources: set[str]
+    breaker: CircuitBreaker
+    health_state: Any
+    retry_config: Any
+    structured_logger: StructuredLogger
+    alert_hook: Callable[[str, dict[str, Any]], None]
+    force_full: bool
+    data_root: Path
+    hash_root: Path
+    had_errors: bool = False
+
+
+@dataclass(frozen=True)
+class _SourcePlan:
+    """Fuente lista para descargar. / Source cleared for download this cycle."""
+
+    source_id: str
+    endpoint: str
+    data_dir: Path
+    hash_dir: Path
+
+
+def resolve_capture_mode(config: dict[str, Any]) -> str:
+    """/** Resuelve el modo de captura ('sequential' o 'async'). / Resolve capture mode ('sequential' or 'async'). **/"""
+    capture = config.get("capture", {}) if isinstance(config.get("capture"), dict) else {}
+    mode = os.getenv("CENTINEL_CAPTURE_MODE") or capture.get("mode") or "sequential"
+    mode = str(mode).strip().lower()
+    if mode not in {"sequential", "async"}:
+        logger.warning("capture_mode_invalid value=%s — falling back to sequential", mode)
+        return "sequential"
+    return mode
+
+
+def _begin_capture_cycle(config: dict[str, Any]) -> _CaptureState:
+    """/** Prepara el estado de un ciclo (checkpoint, breaker, reintentos). / Prepare cycle state (checkpoint, breaker, retries). **/"""
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
     checkpoint = _load_checkpoint()
-    previous_hash = checkpoint.get("previous_hash", "0" * 64)
-    processed_sources = set(checkpoint.get("processed_sources", []))
-    max_sources = int(config.get("max_sources_per_cycle", 19))
 
     data_root = Path("data")
     hash_root = Path("hashes")
     data_root.mkdir(exist_ok=True)
     hash_root.mkdir(exist_ok=True)
 
-    health_state = get_health_state()
-    _force_full = os.getenv("CENTINEL_FORCE_FULL_CYCLE", "0") == "1"
     retry_payload = resolve_retry_policy(config)
-    retry_config = retry_payload["retry_config"]
     structured_logger = StructuredLogger("centinel.download")
-    alert_hook = build_alert_hook(structured_logger)
     breaker_settings = config.get("download_circuit_breaker", {}) or {}
     breaker = CircuitBreaker.load_state(BREAKER_STATE_PATH) or CircuitBreaker(
         failure_threshold=int(breaker_settings.get("failure_threshold", 3)),
@@ -588,45 +628,273 @@ def process_sources(
         success_threshold=int(breaker_settings.get("success_threshold", 2)),
         open_log_interval_seconds=int(breaker_settings.get("open_log_interval_seconds", 120)),
     )
-    session = requests.Session()
-    had_errors = False
+    return _CaptureState(
+        previous_hash=checkpoint.get("previous_hash", "0" * 64),
+        processed_sources=set(checkpoint.get("processed_sources", [])),
+        breaker=breaker,
+        health_state=get_health_state(),
+        retry_config=retry_payload["retry_config"],
+        structured_logger=structured_logger,
+        alert_hook=build_alert_hook(structured_logger),
+        force_full=os.getenv("CENTINEL_FORCE_FULL_CYCLE", "0") == "1",
+        data_root=data_root,
+        hash_root=hash_root,
+    )
+
+
+def _plan_source(
+    state: _CaptureState,
+    source: dict[str, Any],
+    endpoints: dict[str, str],
+) -> _SourcePlan | None:
+    """/** Aplica checkpoint, idempotencia, throttle y salto cooperativo. / Apply checkpoint, idempotency, throttle and cooperative skip. **/
+
+    Returns ``None`` when the source must not be fetched this cycle.
+    """
+    endpoint = resolve_endpoint(source, endpoints)
+    if not endpoint:
+        logger.error("Fuente sin endpoint definido: %s", source)
+        return None
+    source_id = resolve_source_id(source)
+    source_label = source_id
+    data_dir, hash_dir = ensure_source_dirs(
+        source_id,
+        data_root=state.data_root,
+        hash_root=state.hash_root,
+    )
+    if source_label in state.processed_sources:
+        logger.info("Fuente ya procesada en checkpoint: %s", source_label)
+        return None
+    if should_skip_snapshot(data_dir, source_id, retry_config=state.retry_config):
+        logger.info("Snapshot reciente detectado, se omite descarga: %s", source_label)
+        return None
+
+    # ES: Back-off por fuente — salta si el CNE respondió con 429/503 recientemente.
+    #     Deshabilitado en cierre electoral (necesitamos raspar todo igualmente).
+    # EN: Per-source back-off — skip if CNE responded with 429/503 recently.
+    #     Disabled during election close (we must scrape everything regardless).
+    if not state.force_full and _is_throttled(source_id):
+        logger.info("source_throttle_active source=%s — skipping until throttle expires", source_id)
+        return None
+
+    # ES: Salto cooperativo — deshabilitado en cierre electoral (cada nodo
+    #     produce su propio raspe final independiente como evidencia adicional).
+    # EN: Cooperative skip — disabled during election close (each node produces
+    #     its own independent final scrape as additional evidence).
+    if not state.force_full and _is_recently_scraped_by_swarm(source_id):
+        logger.info("cooperative_skip source=%s — recently scraped by swarm node, skipping", source_id)
+        state.processed_sources.add(source_label)
+        _save_checkpoint(state.previous_hash, state.processed_sources)
+        return None
+
+    return _SourcePlan(source_id=source_id, endpoint=endpoint, data_dir=data_dir, hash_dir=hash_dir)
+
+
+def _commit_fallback(state: _CaptureState, plan: _SourcePlan, *, reason: str) -> None:
+    """/** Encadena el último snapshot válido como fallback. / Chain the latest valid snapshot as fallback. **/"""
+    fallback_hash = _use_fallback_snapshot(
+        plan.data_dir,
+        plan.hash_dir,
+        plan.source_id,
+        plan.endpoint,
+        state.previous_hash,
+        reason=reason,
+    )
+    if fallback_hash:
+        state.previous_hash = fallback_hash
+        state.processed_sources.add(plan.source_id)
+        _save_checkpoint(state.previous_hash, state.processed_sources)
+    state.health_state.record_failure()
+    state.had_errors = True
+
+
+def _commit_circuit_open(state: _CaptureState, plan: _SourcePlan, now: datetime) -> None:
+    """/** Maneja una fuente bloqueada por el circuit breaker. / Handle a source blocked by the circuit breaker. **/"""
+    if state.breaker.should_log_open_wait(now):
+        logger.warning("download_circuit_open source=%s", plan.source_id)
+    _commit_fallback(state, plan, reason="circuit_open")
+
+
+def _record_breaker_failure(state: _CaptureState, now: datetime) -> None:
+    """/** Cuenta un fallo en el circuit breaker. / Count one failure against the circuit breaker. **/"""
+    state.breaker.record_failure(now)
+    _persist_breaker_state(state.breaker)
+    if state.breaker.consume_open_alert():
+        log_event(
+            logger,
+            logging.CRITICAL,
+            "download_circuit_breaker_open",
+            failure_threshold=state.breaker.failure_threshold,
+            window_seconds=state.breaker.failure_window_seconds,
+        )
+
 
+def _commit_fetch_failure(
+    state: _CaptureState,
+    plan: _SourcePlan,
+    exc: BaseException,
+    now: datetime,
+    *,
+    breaker_recorded: bool = False,
+) -> None:
+    """/** Registra un fallo de descarga y encadena fallback. / Record a download failure and chain a fallback. **/
+
+    ``breaker_recorded`` is set by the async path, which already counted the
+    failure against the breaker when the fetch failed.
+    """
+    logger.error("Fallo al descargar %s: %s", plan.endpoint, exc)
+    # ES: Si el CNE responde 429/503, escribir throttle por fuente para no sobrecargarla.
+    # EN: If CNE responds 429/503, write per-source throttle to avoid overloading it.
+    _err = str(exc)
+    if "429" in _err or "503" in _err or "Too Many" in _err:
+        _write_throttle(plan.source_id, reason="429" if "429" in _err else "503")
+    # Distinguish "the authority is down" from "someone is
+    # cutting us": diagnose the failure mode and record a
+    # signed, append-only degradation event. Best-effort and
+    # bounded — it must never raise into or stall the capture
+    # loop that has to run for a month.
     try:
-        for source in sources[:max_sources]:
-            endpoint = resolve_endpoint(source, endpoints)
-            if not endpoint:
-                logger.error("Fuente sin endpoint definido: %s", source)
-                continue
-            source_id = resolve_source_id(source)
-            source_label = source_id
-            data_dir, hash_dir = ensure_source_dirs(
-                source_id,
-                data_root=data_root,
-                hash_root=hash_root,
-            )
-            if source_label in processed_sources:
-                logger.info("Fuente ya procesada en checkpoint: %s", source_label)
-                continue
-            if should_skip_snapshot(data_dir, source_id, retry_config=retry_config):
-                logger.info("Snapshot reciente detectado, se omite descarga: %s", source_label)
-                continue
+        from centinel.core.connectivity import diagnose_and_record
+
+        diagnose_and_record(
+            plan.endpoint,
+            source_id=plan.source_id,
+            reason="request_failed",
+            exception_text=str(exc),
+            exception_type=type(exc).__name__,
+        )
+    except Exception as diag_exc:  # noqa: BLE001
+        logger.warning(
+            "connectivity_diagnosis_skipped error=%s", diag_exc
+        )
+    if not breaker_recorded:
+        _record_breaker_failure(state, now)
+    _commit_fallback(state, plan, reason="request_failed")
 
-            # ES: Back-off por fuente — salta si el CNE respondió con 429/503 recientemente.
-            #     Deshabilitado en cierre electoral (necesitamos raspar todo igualmente).
-            # EN: Per-source back-off — skip if CNE responded with 429/503 recently.
-            #     Disabled during election close (we must scrape everything regardless).
-            if not _force_full and _is_throttled(source_id):
-                logger.info("source_throttle_active source=%s — skipping until throttle expires", source_id)
-                continue
 
-            # ES: Salto cooperativo — deshabilitado en cierre electoral (cada nodo
-            #     produce su propio raspe final independiente como evidencia adicional).
-            # EN: Cooperative skip — disabled during election close (each node produces
-            #     its own independent final scrape as additional evidence).
-            if not _force_full and _is_recently_scraped_by_swarm(source_id):
-                logger.info("cooperative_skip source=%s — recently scraped by swarm node, skipping", source_id)
-                processed_sources.add(source_label)
-                _save_checkpoint(previous_hash, processed_sources)
+def _commit_payload(
+    state: _CaptureState,
+    plan: _SourcePlan,
+    response_url: str,
+    payload: Any,
+    now: datetime,
+    config: dict[str, Any],
+) -> None:
+    """/** Valida, persiste y encadena un payload descargado. / Validate, persist and chain a downloaded payload. **/"""
+    source_id = plan.source_id
+    if not _validate_real_payload(payload, response_url, config):
+        logger.error("Payload inválido (no CNE/fecha real) en %s", plan.endpoint)
+        state.breaker.record_failure(now)
+        _persist_breaker_state(state.breaker)
+        _commit_fallback(state, plan, reason="payload_invalid")
+        return
+
+    # ES: Validación de schema CNE antes de persistir — detecta respuestas envenenadas
+    #     o cambios de API. CENTINEL_STRICT_VALIDATION=1 rechaza; default solo advierte.
+    # EN: CNE schema validation before persisting — detects poisoned responses or API
+    #     changes. CENTINEL_STRICT_VALIDATION=1 rejects; default warns only.
+    try:
+        from centinel.core.normalize import validate_cne_response as _validate_cne
+        _raw_for_validation = payload[0] if isinstance(payload, list) and payload else payload
+        if isinstance(_raw_for_validation, dict):
+            _cne_errors = _validate_cne(_raw_for_validation, source_id)
+            if _cne_errors and os.getenv("CENTINEL_STRICT_VALIDATION", "0") == "1":
+                logger.error("suspect_response_rejected source=%s errors=%s",
+                             source_id, _cne_errors)
+                state.had_errors = True
+                return
+    except Exception as _val_exc:
+        logger.debug("cne_validation_skipped source=%s error=%s", source_id, _val_exc)
+
+    normalized_payload = payload if isinstance(payload, list) else [payload]
+    snapshot_payload = {
+        "timestamp": datetime.now().isoformat(),
+        "source": source_id,
+        "source_url": response_url,
+        "data": normalized_payload,
+    }
+    (
+        chained_hash,
+        current_hash,
+        snapshot_file,
+    ) = _persist_snapshot_payload(
+        snapshot_payload,
+        source_id=source_id,
+        data_dir=plan.data_dir,
+        hash_dir=plan.hash_dir,
+        previous_hash=state.previous_hash,
+    )
+    state.previous_hash = chained_hash
+
+    logger.info("Snapshot descargado y hasheado para %s", source_id)
+    state.health_state.record_success()
+    state.breaker.record_success(now)
+    _persist_breaker_state(state.breaker)
+    state.processed_sources.add(source_id)
+    _save_checkpoint(state.previous_hash, state.processed_sources)
+    logger.debug(
+        "current_hash=%s chained_hash=%s source=%s",
+        current_hash,
+        chained_hash,
+        source_id,
+    )
+    # ES: Notificar al enjambre que esta fuente ya fue raspada exitosamente.
+    # EN: Notify swarm that this source was successfully scraped.
+    _report_scrape_to_swarm(source_id, current_hash)
+
+
+def _finish_capture_cycle(state: _CaptureState, total_sources: int) -> None:
+    """/** Registra cobertura y limpia el checkpoint si no hubo errores. / Log coverage and clear checkpoint when error-free. **/"""
+    # ES: Política de cobertura — solo log. Umbrales: <82% CRITICAL, 82-89% ELEVATED, ≥90% HIGH_TRUST.
+    # EN: Coverage policy — logging only. Thresholds: <82% CRITICAL, 82-89% ELEVATED, ≥90% HIGH_TRUST.
+    covered = len(state.processed_sources)
+    if total_sources > 0:
+        _pct = covered / total_sources * 100
+        if _pct < 82:
+            logger.critical("swarm_coverage pct=%.1f%% status=CRITICAL covered=%d/%d",
+                            _pct, covered, total_sources)
+        elif _pct < 90:
+            logger.warning("swarm_coverage pct=%.1f%% status=ELEVATED covered=%d/%d",
+                           _pct, covered, total_sources)
+        else:
+            logger.info("swarm_coverage pct=%.1f%% status=HIGH_TRUST covered=%d/%d",
+                        _pct, covered, total_sources)
+
+    if not state.had_errors:
+        _clear_checkpoint()
+
+
+def process_sources(
+    sources: list[dict[str, Any]],
+    endpoints: dict[str, str],
+    config: dict[str, Any],
+) -> None:
+    """/** Procesa fuentes reales y actualiza hashes. / Process real sources and update hashes. **
+
+    Dispatches to :func:`process_sources_async` when ``capture.mode`` (or
+    ``CENTINEL_CAPTURE_MODE``) is ``async``; otherwise sources are fetched
+    one after another over a single ``requests.Session``. Callers already
+    inside an event loop must ``await process_sources_async(...)`` instead.
+    """
+    if resolve_capture_mode(config) == "async":
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(process_sources_async(sources, endpoints, config))
+            return
+        raise RuntimeError(
+            "process_sources() cannot start async capture from a running event loop; "
+            "await process_sources_async() instead"
+        )
+
+    state = _begin_capture_cycle(config)
+    max_sources = int(config.get("max_sources_per_cycle", 19))
+    session = requests.Session()
+
+    try:
+        for source in sources[:max_sources]:
+            plan = _plan_source(state, source, endpoints)
+            if plan is None:
                 continue
 
             # ES: Jitter entre fuentes — suaviza la ráfaga intra-nodo (default 0.8-1.2s por fuente).
@@ -636,179 +904,156 @@ def process_sources(
                 time.sleep(random.uniform(_inter_jitter * 0.8, _inter_jitter * 1.2))
 
             now = datetime.now(timezone.utc)
-            if not breaker.allow_request(now):
-                if breaker.should_log_open_wait(now):
-                    logger.warning("download_circuit_open source=%s", source_label)
-                fallback_hash = _use_fallback_snapshot(
-                    data_dir,
-                    hash_dir,
-                    source_id,
-                    endpoint,
-                    previous_hash,
-                    reason="circuit_open",
-                )
-                if fallback_hash:
-                    previous_hash = fallback_hash
-                    processed_sources.add(source_label)
-                    _save_checkpoint(previous_hash, processed_sources)
-                health_state.record_failure()
-                had_errors = True
+            if not state.breaker.allow_request(now):
+                _commit_circuit_open(state, plan, now)
                 continue
 
-            try:
-                response, payload = request_json_with_retry(
-                    session,
-                    endpoint,
-                    retry_config=retry_config,
-                    timeout=float(config.get("timeout", retry_config.timeout_seconds)),
-                    logger=structured_logger,
-                    context={"source": source_label},
-                    alert_hook=alert_hook,
-                )
-            except Exception as e:
-                logger.error("Fallo al descargar %s: %s", endpoint, e)
-                # ES: Si el CNE responde 429/503, escribir throttle por fuente para no sobrecargarla.
-                # EN: If CNE responds 429/503, write per-source throttle to avoid overloading it.
-                _err = str(e)
-                if "429" in _err or "503" in _err or "Too Many" in _err:
-                    _write_throttle(source_id, reason="429" if "429" in _err else "503")
-                # Distinguish "the authority is down" from "someone is
-                # cutting us": diagnose the failure mode and record a
-                # signed, append-only degradation event. Best-effort and
-                # bounded — it must never raise into or stall the capture
-                # loop that has to run for a month.
+            with tracing.span(f"source:{plan.source_id}") as source_span:
                 try:
-                    from centinel.core.connectivity import diagnose_and_record
-
-                    diagnose_and_record(
-                        endpoint,
-                        source_id=source_id,
-                        reason="request_failed",
-                        exception_text=str(e),
-                        exception_type=type(e).__name__,
-                    )
-                except Exception as diag_exc:  # noqa: BLE001
-                    logger.warning(
-                        "connectivity_diagnosis_skipped error=%s", diag_exc
+                    response, payload = request_json_with_retry(
+                        session,
+                        plan.endpoint,
+                        retry_config=state.retry_config,
+                        timeout=float(config.get("timeout", state.retry_config.timeout_seconds)),
+                        logger=state.structured_logger,
+                        context={"source": plan.source_id},
+                        alert_hook=state.alert_hook,
                     )
-                breaker.record_failure(now)
-                _persist_breaker_state(breaker)
-                if breaker.consume_open_alert():
-                    log_event(
-                        logger,
-                        logging.CRITICAL,
-                        "download_circuit_breaker_open",
-                        failure_threshold=breaker.failure_threshold,
-                        window_seconds=breaker.failure_window_seconds,
-                    )
-                fallback_hash = _use_fallback_snapshot(
-                    data_dir,
-                    hash_dir,
-                    source_id,
-                    endpoint,
-                    previous_hash,
-                    reason="request_failed",
-                )
-                if fallback_hash:
-                    previous_hash = fallback_hash
-                    processed_sources.add(source_label)
-                    _save_checkpoint(previous_hash, processed_sources)
-                health_state.record_failure()
-                had_errors = True
-                continue
+                except Exception as e:
+                    if source_span is not None:
+                        source_span.record_error(e)
+                    _commit_fetch_failure(state, plan, e, now)
+                    continue
 
-            if not _validate_real_payload(payload, response.url, config):
-                logger.error("Payload inválido (no CNE/fecha real) en %s", endpoint)
-                breaker.record_failure(now)
-                _persist_breaker_state(breaker)
-                fallback_hash = _use_fallback_snapshot(
-                    data_dir,
-                    hash_dir,
-                    source_id,
-                    endpoint,
-                    previous_hash,
-                    reason="payload_invalid",
+                _commit_payload(state, plan, response.url, payload, now, config)
+    finally:
+        session.close()
+
+    _finish_capture_cycle(state, min(len(sources), max_sources))
+
+
+async def _fetch_source_async(
+    client: httpx.AsyncClient,
+    plan: _SourcePlan,
+    *,
+    state: _CaptureState,
+    config: dict[str, Any],
+    host_limits: dict[str, asyncio.Semaphore],
+    per_host_concurrency: int,
+    start_delay: float,
+) -> tuple[str, Any] | BaseException | None:
+    """/** Descarga una fuente bajo el límite por host. / Fetch one source under the per-host limit. **/
+
+    Never raises: failures are returned so the commit phase can handle them
+    in source order, exactly like the sequential path. The circuit breaker
+    is checked right before each fetch (``None`` means it was open) and
+    fetch failures are counted immediately, so failures earlier in the
+    cycle can open the breaker for the sources still waiting.
+    """
+    if start_delay > 0:
+        await asyncio.sleep(start_delay)
+    host = urlparse(plan.endpoint).hostname or ""
+    semaphore = host_limits.setdefault(host, asyncio.Semaphore(per_host_concurrency))
+    with tracing.span(f"source:{plan.source_id}", capture_mode="async") as source_span:
+        try:
+            async with semaphore:
+                if not state.breaker.allow_request(datetime.now(timezone.utc)):
+                    return None
+                response, payload = await async_request_json_with_retry(
+                    client,
+                    plan.endpoint,
+                    retry_config=state.retry_config,
+                    timeout=float(config.get("timeout", state.retry_config.timeout_seconds)),
+                    logger=state.structured_logger,
+                    context={"source": plan.source_id, "capture_mode": "async"},
+                    alert_hook=state.alert_hook,
                 )
-                if fallback_hash:
-                    previous_hash = fallback_hash
-                    processed_sources.add(source_label)
-                    _save_checkpoint(previous_hash, processed_sources)
-                health_state.record_failure()
-                had_errors = True
-                continue
+        except Exception as exc:  # noqa: BLE001
+            if source_span is not None:
+                source_span.record_error(exc)
+            _record_breaker_failure(state, datetime.now(timezone.utc))
+            return exc
+    return str(response.url), payload
 
-            # ES: Validación de schema CNE antes de persistir — detecta respuestas envenenadas
-            #     o cambios de API. CENTINEL_STRICT_VALIDATION=1 rechaza; default solo advierte.
-            # EN: CNE schema validation before persisting — detects poisoned responses or API
-            #     changes. CENTINEL_STRICT_VALIDATION=1 rejects; default warns only.
-            try:
-                from centinel.core.normalize import validate_cne_response as _validate_cne
-                _raw_for_validation = payload[0] if isinstance(payload, list) and payload else payload
-                if isinstance(_raw_for_validation, dict):
-                    _cne_errors = _validate_cne(_raw_for_validation, source_id)
-                    if _cne_errors and os.getenv("CENTINEL_STRICT_VALIDATION", "0") == "1":
-                        logger.error("suspect_response_rejected source=%s errors=%s",
-                                     source_id, _cne_errors)
-                        had_errors = True
-                        continue
-            except Exception as _val_exc:
-                logger.debug("cne_validation_skipped source=%s error=%s", source_id, _val_exc)
-
-            normalized_payload = payload if isinstance(payload, list) else [payload]
-            snapshot_payload = {
-                "timestamp": datetime.now().isoformat(),
-                "source": source_id,
-                "source_url": response.url,
-                "data": normalized_payload,
-            }
-            (
-                chained_hash,
-                current_hash,
-                snapshot_file,
-            ) = _persist_snapshot_payload(
-                snapshot_payload,
-                source_id=source_id,
-                data_dir=data_dir,
-                hash_dir=hash_dir,
-                previous_hash=previous_hash,
-            )
-            previous_hash = chained_hash
-
-            logger.info("Snapshot descargado y hasheado para %s", source_label)
-            health_state.record_success()
-            breaker.record_success(now)
-            _persist_breaker_state(breaker)
-            processed_sources.add(source_label)
-            _save_checkpoint(previous_hash, processed_sources)
-            logger.debug(
-                "current_hash=%s chained_hash=%s source=%s",
-                current_hash,
-                chained_hash,
-                source_label,
+
+async def process_sources_async(
+    sources: list[dict[str, Any]],
+    endpoints: dict[str, str],
+    config: dict[str, Any],
+) -> None:
+    """/** Captura concurrente: descarga en paralelo y encadena en orden fijo. / Concurrent capture: parallel fetch, fixed-order chaining. **/
+
+    Gating (checkpoint, idempotency, throttle, cooperative skip) is
+    evaluated up front and the circuit breaker per source right before its
+    fetch, then every cleared source is fetched
+    concurrently over one pooled ``httpx.AsyncClient`` with at most
+    ``capture.per_host_concurrency`` in-flight requests per host. Results are
+    committed to the hash chain in the configured source order, so the chain
+    is identical to what the sequential mode would produce for the same
+    payloads. Inter-source jitter becomes a staggered start offset instead
+    of a cumulative sleep, so cycle wall time tracks the slowest endpoint.
+    """
+    state = _begin_capture_cycle(config)
+    max_sources = int(config.get("max_sources_per_cycle", 19))
+    capture = config.get("capture", {}) if isinstance(config.get("capture"), dict) else {}
+    per_host_concurrency = max(1, int(capture.get("per_host_concurrency", 4)))
+    max_connections = max(per_host_concurrency, int(capture.get("max_connections", 20)))
+    inter_jitter = float(config.get("inter_source_jitter_seconds", 1.0))
+
+    plans = [
+        plan
+        for plan in (_plan_source(state, source, endpoints) for source in sources[:max_sources])
+        if plan is not None
+    ]
+
+    outcomes: list[tuple[str, Any] | BaseException | None] = [None] * len(plans)
+    if plans:
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        client = build_client(
+            timeout_seconds=float(config.get("timeout", state.retry_config.timeout_seconds)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        cycle_start = time.monotonic()
+        async with client:
+            outcomes = list(
+                await asyncio.gather(
+                    *(
+                        _fetch_source_async(
+                            client,
+                            plan,
+                            state=state,
+                            config=config,
+                            host_limits=host_limits,
+                            per_host_concurrency=per_host_concurrency,
+                            start_delay=random.uniform(0.0, inter_jitter) if inter_jitter > 0 else 0.0,
+                        )
+                        for plan in plans
+                    )
+                )
             )
-            # ES: Notificar al enjambre que esta fuente ya fue raspada exitosamente.
-            # EN: Notify swarm that this source was successfully scraped.
-            _report_scrape_to_swarm(source_id, current_hash)
-    finally:
-        session.close()
+        logger.info(
+            "async_capture_fetched sources=%d elapsed_s=%.2f per_host=%d",
+            len(plans),
+            time.monotonic() - cycle_start,
+            per_host_concurrency,
+        )
 
-    # ES: Política de cobertura — solo log. Umbrales: <82% CRITICAL, 82-89% ELEVATED, ≥90% HIGH_TRUST.
-    # EN: Coverage policy — logging only. Thresholds: <82% CRITICAL, 82-89% ELEVATED, ≥90% HIGH_TRUST.
-    _total_sources = min(len(sources), max_sources)
-    if _total_sources > 0:
-        _pct = len(processed_sources) / _total_sources * 100
-        if _pct < 82:
-            logger.critical("swarm_coverage pct=%.1f%% status=CRITICAL covered=%d/%d",
-                            _pct, len(processed_sources), _total_sources)
-        elif _pct < 90:
-            logger.warning("swarm_coverage pct=%.1f%% status=ELEVATED covered=%d/%d",
-                           _pct, len(processed_sources), _total_sources)
+    # ES: Fase de commit — orden fijo de fuentes para un hash chain determinista.
+    # EN: Commit phase — fixed source order for a deterministic hash chain.
+    for plan, outcome in zip(plans, outcomes):
+        commit_now = datetime.now(timezone.utc)
+        if outcome is None:
+            _commit_circuit_open(state, plan, commit_now)
+        elif isinstance(outcome, BaseException):
+            _commit_fetch_failure(state, plan, outcome, commit_now, breaker_recorded=True)
         else:
-            logger.info("swarm_coverage pct=%.1f%% status=HIGH_TRUST covered=%d/%d",
-                        _pct, len(processed_sources), _total_sources)
+            response_url, payload = outcome
+            _commit_payload(state, plan, response_url, payload, commit_now, config)
 
-    if not had_errors:
-        _clear_checkpoint()
+    _finish_capture_cycle(state, min(len(sources), max_sources))
 
 
 def _persist_snapshot_payload(
@@ -870,6 +1115,19 @@ def _persist_snapshot_payload(
         hash_file,
         json.dumps(hash_record, ensure_ascii=False, indent=2).encode("utf-8"),
     )
+    # ES: índice de capturas (no fatal; `rebuild` lo recupera desde disco).
+    # EN: capture index (non-fatal; `rebuild` recovers it from disk).
+    if data_dir.parent.name == SNAPSHOTS_SUBDIR:
+        record_snapshot(
+            source_id=source_id,
+            snapshot_path=snapshot_file,
+            hash_path=hash_file,
+            content_hash=current_hash,
+            chained_hash=chained_hash,
+            size_bytes=len(snapshot_bytes),
+            data_root=data_dir.parent.parent,
+            hash_root=hash_dir.parent,
+        )
     trigger_post_hash_backup(snapshot_file, hash_file)
     return chained_hash, current_hash, snapshot_file
 
@@ -884,11 +1142,14 @@ def _find_latest_snapshot_for_source(data_dir: Path, source_id: str) -> tuple[Pa
     """
     if not data_dir.exists():
         return None, None
-    candidates = sorted(
-        data_dir.glob("snapshot_*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    if data_dir.parent.name == SNAPSHOTS_SUBDIR and data_dir.name == source_id:
+        candidates = list(reversed(iter_all_snapshots(data_root=data_dir.parent.parent, source_id=source_id)))
+    else:
+        candidates = sorted(
+            data_dir.glob("snapshot_*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
     for snapshot_path in candidates:
         try:
             payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
@@ -1126,26 +1387,23 @@ def _clear_checkpoint() -> None:
         CHECKPOINT_PATH.unlink()
 
 
-def main() -> None:
-    """/** Función principal del script. / Main script function. **"""
+def run_download(
+    *,
+    mock: bool = False,
+    force_full_cycle: bool = False,
+    retry_config_path: str | None = None,
+) -> None:
+    """/** Ejecuta la etapa de descarga + hash. / Run the download + hash stage. **/
+
+    Callable in-process by the pipeline stage runner; ``main()`` is the thin
+    argparse wrapper used when the stage runs as its own interpreter.
+    """
     logger.info("Iniciando download_and_hash")
     log_event(logger, logging.INFO, "download_start")
 
-    parser = argparse.ArgumentParser(description="Descarga y hashea snapshots del CNE")
-    parser.add_argument(
-        "--mock",
-        action="store_true",
-        help="Modo mock para CI - no intenta fetch real",
-    )
-    parser.add_argument(
-        "--force-full-cycle",
-        action="store_true",
-        dest="force_full_cycle",
-        help="Ciclo forzado: borra checkpoint, ignora throttle y salto cooperativo. Usado en cierre electoral.",
-    )
-    args = parser.parse_args()
-
     config = load_config()
+    if retry_config_path:
+        config["retry_config_path"] = retry_config_path
     health_state = get_health_state()
     master_status = normalize_master_switch(config.get("master_switch"))
     logger.info("MASTER SWITCH: %s", master_status)
@@ -1153,7 +1411,7 @@ def main() -> None:
         logger.warning("Ejecución detenida por switch maestro (OFF)")
         return
 
-    if args.mock:
+    if mock:
         if not config.get("allow_mock", False):
             logger.error("Modo mock deshabilitado por configuración")
             raise ValueError("Mock mode disabled by configuration.")
@@ -1162,7 +1420,7 @@ def main() -> None:
         log_event(logger, logging.INFO, "download_complete")
         return
 
-    if args.force_full_cycle:
+    if force_full_cycle:
         # ES: Cierre electoral — ciclo completo forzado. Borra checkpoint para empezar
         #     desde cero, e indica a process_sources que ignore throttle y salto cooperativo.
         # EN: Election close — forced full cycle. Clears checkpoint to start fresh,
@@ -1182,7 +1440,7 @@ def main() -> None:
     # ES: Jitter de inicio de ciclo — omitido en cierre electoral (necesitamos velocidad).
     # EN: Cycle jitter — skipped during forced full cycle (we need speed).
     _cycle_jitter = float(os.getenv("CENTINEL_SCRAPE_JITTER_SECONDS", "30"))
-    if _cycle_jitter > 0 and not args.force_full_cycle:
+    if _cycle_jitter > 0 and not force_full_cycle:
         _jitter_delay = random.uniform(0.0, _cycle_jitter)
         logger.info("scrape_cycle_jitter delay_s=%.1f max_s=%.1f", _jitter_delay, _cycle_jitter)
         time.sleep(_jitter_delay)
@@ -1211,9 +1469,27 @@ def main() -> None:
     process_sources(sources, endpoints, config)
     logger.info("Proceso completado")
     log_event(logger, logging.INFO, "download_complete")
-    if args.force_full_cycle:
+    if force_full_cycle:
         log_event(logger, logging.INFO, "election_finalize_complete")
 
 
+def main() -> None:
+    """/** Función principal del script. / Main script function. **"""
+    parser = argparse.ArgumentParser(description="Descarga y hashea snapshots del CNE")
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="Modo mock para CI - no intenta fetch real",
+    )
+    parser.add_argument(
+        "--force-full-cycle",
+        action="store_true",
+        dest="force_full_cycle",
+        help="Ciclo forzado: borra checkpoint, ignora throttle y salto cooperativo. Usado en cierre electoral.",
+    )
+    args = parser.parse_args()
+    run_download(mock=args.mock, force_full_cycle=args.force_full_cycle)
+
+
 if __name__ == "__main__":
     main()
@@ -18,6 +18,11 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Lets `_latest_snapshot` reuse the pipeline's in-process snapshot cache.
+_SRC_DIR = str(Path(__file__).resolve().parents[1] / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
 
 def _read_json(path: Path) -> dict:
     try:
@@ -67,13 +72,32 @@ def _build_cne_status(state: dict, endpoint: str) -> dict:
     }
 
 
+def _catalog_tip(root: Path) -> tuple[str, int] | None:
+    # Latest chained hash and chain length from the snapshot catalog
+    # (indexed at capture time); None when there is no usable catalog.
+    try:
+        sys.path.insert(0, str(root / "src"))
+        from centinel.snapshot_catalog import open_catalog
+
+        catalog = open_catalog(data_root=root / "data", hash_root=root / "hashes")
+        latest = catalog.latest(1) if catalog is not None else []
+        if not latest:
+            return None
+        return latest[0].chained_hash or latest[0].content_hash or "", catalog.count()
+    except Exception:
+        return None
+
+
 def _build_chain(state: dict, hash_dir: Path) -> dict:
     latest_hash = ""
     merkle_root = ""
     chain_length = 0
 
+    tip = _catalog_tip(hash_dir.parent)
     all_hashes = sorted(hash_dir.glob("*.json")) if hash_dir.is_dir() else []
-    if all_hashes:
+    if tip is not None:
+        latest_hash, chain_length = tip
+    elif all_hashes:
         latest = _read_json(all_hashes[-1])
         latest_hash = latest.get("chained_hash") or latest.get("hash") or ""
         merkle_root = latest.get("merkle_root", "")
@@ -141,9 +165,17 @@ def _latest_snapshot(data_dir: Path) -> dict:
     )
     # Skip temp/mock subdirectories; only files directly in data_dir
     direct = [p for p in candidates if p.parent == data_dir]
-    if direct:
+    if not direct:
+        return {}
+    # Same parse the pipeline stages already did this cycle, when in-process.
+    try:
+        from centinel.snapshot_cache import load_snapshot
+    except ImportError:
         return _read_json(direct[0])
-    return {}
+    try:
+        return load_snapshot(direct[0])
+    except (OSError, ValueError):
+        return {}
 
 
 def _build_endpoint_health(root: Path) -> dict:
@@ -1,4 +1,4 @@
-"""Internal library — not a CLI entry point. Imported by pipeline modules.
+"""Normalization stage: importable by the in-process stage runner and runnable as a script.
 
 ======================== ÍNDICE / INDEX ========================
 1. Descripción general / Overview
@@ -13,6 +13,9 @@ la navegación, mantenimiento y auditoría técnica.
 Componentes detectados:
   - to_int
   - to_float
+  - normalize_raw_snapshot
+  - normalize_snapshots
+  - main
 
 Notas:
 - Mantener esta cabecera sincronizada con cambios estructurales del archivo.
@@ -26,6 +29,9 @@ navigation, maintenance, and technical auditability.
 Detected components:
   - to_int
   - to_float
+  - normalize_raw_snapshot
+  - normalize_snapshots
+  - main
 
 Notes:
 - Keep this header in sync with structural changes in the file.
@@ -57,11 +63,12 @@ import re
 from pathlib import Path
 
 from centinel.paths import iter_all_snapshots
+from centinel.snapshot_cache import load_snapshot
 from scripts.logging_utils import configure_logging, log_event
 
 INPUT_DIR = Path("data")
 OUTPUT_DIR = Path("normalized")
-OUTPUT_DIR.mkdir(exist_ok=True)
+MAX_FILES = 19
 logger = configure_logging(__name__)
 
 
@@ -81,12 +88,12 @@ def to_float(x):
     return float(x.replace(",", "."))
 
 
-max_files = 19
-files = iter_all_snapshots(data_root=INPUT_DIR)
-for index, file in enumerate(files[:max_files]):
-    raw = json.loads(file.read_text(encoding="utf-8"))
+def normalize_raw_snapshot(raw: dict, stem: str) -> dict:
+    """Normaliza un payload presidencial crudo del CNE.
 
-    timestamp = file.stem.split(" ", 1)[-1]
+    Normalize one raw CNE presidential payload.
+    """
+    timestamp = stem.split(" ", 1)[-1]
     timestamp = timestamp.replace("_", ":").replace(" ", "T") + "Z"
 
     normalized = {
@@ -115,22 +122,53 @@ for index, file in enumerate(files[:max_files]):
         "nulos": to_int(est["distribucion_votos"]["nulos"]),
         "blancos": to_int(est["distribucion_votos"]["blancos"]),
     }
+    return normalized
+
 
-    out = OUTPUT_DIR / f"{file.stem}.normalized.json"
-    out.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
-    log_event(
-        logger,
-        logging.INFO,
-        "normalized_snapshot_written",
-        snapshot=file.stem,
-        sequence=index + 1,
-    )
-
-if len(files) > max_files:
-    # Seguridad: Evita exposición de datos sensibles / Security: Avoid exposure of sensitive data.
-    log_event(
-        logger,
-        logging.WARNING,
-        "snapshot_limit_enforced",
-        processed=max_files,
-    )
+def normalize_snapshots(
+    input_dir: Path = INPUT_DIR,
+    output_dir: Path = OUTPUT_DIR,
+    max_files: int = MAX_FILES,
+) -> list[tuple[Path, dict]]:
+    """Normaliza snapshots y devuelve (ruta escrita, payload) en orden.
+
+    Normalize snapshots and return (written path, payload) pairs in write
+    order, so an in-process caller can hand them to the analysis stage
+    without re-reading ``normalized/`` from disk.
+    """
+    output_dir.mkdir(exist_ok=True)
+    written: list[tuple[Path, dict]] = []
+    files = iter_all_snapshots(data_root=input_dir)
+    for index, file in enumerate(files[:max_files]):
+        raw = load_snapshot(file)
+        normalized = normalize_raw_snapshot(raw, file.stem)
+
+        out = output_dir / f"{file.stem}.normalized.json"
+        out.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
+        written.append((out, normalized))
+        log_event(
+            logger,
+            logging.INFO,
+            "normalized_snapshot_written",
+            snapshot=file.stem,
+            sequence=index + 1,
+        )
+
+    if len(files) > max_files:
+        # Seguridad: Evita exposición de datos sensibles / Security: Avoid exposure of sensitive data.
+        log_event(
+            logger,
+            logging.WARNING,
+            "snapshot_limit_enforced",
+            processed=max_files,
+        )
+    return written
+
+
+def main() -> None:
+    """Punto de entrada CLI. / CLI entry point."""
+    normalize_snapshots()
+
+
+if __name__ == "__main__":
+    main()
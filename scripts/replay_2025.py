@@ -17,8 +17,13 @@ Componentes detectados:
   - _build_candidate_lookup
   - _diff_totals
   - _diff_candidates
+  - _diff_entry
+  - _snapshot_timestamp
+  - _normalize_file
+  - ReplayOutputs
   - build_snapshot_diffs
   - write_report
+  - write_inconsistent_forensic_report
   - run_replay
   - build_parser
   - main
@@ -41,8 +46,13 @@ Detected components:
   - _build_candidate_lookup
   - _diff_totals
   - _diff_candidates
+  - _diff_entry
+  - _snapshot_timestamp
+  - _normalize_file
+  - ReplayOutputs
   - build_snapshot_diffs
   - write_report
+  - write_inconsistent_forensic_report
   - run_replay
   - build_parser
   - main
@@ -75,15 +85,37 @@ Notes:
 
 import argparse
 import json
+import logging
 import os
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from auditor.inconsistent_acts import InconsistentActsTracker
+from centinel.core.normalize import normalize_snapshot, snapshot_to_canonical_json
+from centinel.core.rules_engine import RulesEngine
 from scripts import analyze_rules
-from scripts.cli import load_snapshots, normalize_snapshots, write_normalized_outputs
+from scripts.logging_utils import configure_logging, log_event
+from scripts.replay_stream import DEFAULT_WORKERS, ThroughputMeter, stream_parsed
+
+logger = configure_logging(__name__)
+
+
+@dataclass(frozen=True)
+class ReplayOutputs:
+    """Rutas generadas por el replay y su throughput.
+
+    Paths produced by the replay and its throughput summary.
+    """
+
+    normalized_dir: Path
+    report_file: Path
+    forensic_file: Path
+    alerts_file: Path
+    throughput: Dict[str, float]
 
 
 @contextmanager
@@ -186,60 +218,120 @@ def _diff_candidates(
     return diffs
 
 
-def build_snapshot_diffs(normalized_dir: Path) -> List[Dict[str, Any]]:
+def _diff_entry(
+    previous_name: str,
+    previous: Dict[str, Any],
+    current_name: str,
+    current: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Construye la entrada de diff entre dos snapshots normalizados.
+
+    Build the diff entry between two normalized snapshots.
+    """
+    return {
+        "from_snapshot": previous_name,
+        "to_snapshot": current_name,
+        "from_timestamp": previous.get("meta", {}).get("timestamp_utc"),
+        "to_timestamp": current.get("meta", {}).get("timestamp_utc"),
+        "totals_delta": _diff_totals(previous, current),
+        "candidate_deltas": _diff_candidates(previous, current),
+    }
+
+
+def build_snapshot_diffs(
+    normalized_dir: Path,
+    workers: int = DEFAULT_WORKERS,
+    lookahead: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """Construye el reporte de diffs para un directorio normalizado.
 
-    Build a diffs report for a normalized directory.
+    Cada archivo se parsea una sola vez, en streaming y en orden.
+
+    Build a diffs report for a normalized directory. Each file is parsed
+    once, streamed in order.
     """
-    files = sorted(normalized_dir.glob("*.json"))
     diffs: List[Dict[str, Any]] = []
-    for previous_path, current_path in zip(files, files[1:]):
-        previous = _load_json(previous_path)
-        current = _load_json(current_path)
-        diff_entry = {
-            "from_snapshot": previous_path.name,
-            "to_snapshot": current_path.name,
-            "from_timestamp": previous.get("meta", {}).get("timestamp_utc"),
-            "to_timestamp": current.get("meta", {}).get("timestamp_utc"),
-            "totals_delta": _diff_totals(previous, current),
-            "candidate_deltas": _diff_candidates(previous, current),
-        }
-        diffs.append(diff_entry)
+    previous: Optional[Tuple[str, Dict[str, Any]]] = None
+    files = sorted(normalized_dir.glob("*.json"))
+    for path, current in stream_parsed(files, _load_json, workers=workers, lookahead=lookahead):
+        if previous is not None:
+            diffs.append(_diff_entry(previous[0], previous[1], path.name, current))
+        previous = (path.name, current)
     return diffs
 
 
-def write_report(report_path: Path, normalized_dir: Path) -> Path:
+def write_report(
+    report_path: Path,
+    normalized_dir: Path,
+    diffs: Optional[List[Dict[str, Any]]] = None,
+    throughput: Optional[Dict[str, float]] = None,
+) -> Path:
     """Escribe el reporte de diffs en JSON.
 
-    Write the diffs report as JSON.
+    Write the diffs report as JSON. ``diffs`` already computed by the
+    streaming replay are reused instead of re-reading the directory.
     """
-    diffs = build_snapshot_diffs(normalized_dir)
-    payload = {
+    payload: Dict[str, Any] = {
         "generated_at": _format_timestamp(),
         "normalized_dir": str(normalized_dir),
-        "diffs": diffs,
+        "diffs": diffs if diffs is not None else build_snapshot_diffs(normalized_dir),
     }
+    if throughput is not None:
+        payload["throughput"] = throughput
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
     return report_path
 
 
-def write_inconsistent_forensic_report(report_path: Path, snapshots: List[Dict[str, Any]]) -> Path:
+def _snapshot_timestamp(snapshot: Dict[str, Any]) -> datetime:
+    """Timestamp UTC del snapshot normalizado (ahora si falta).
+
+    UTC timestamp of a normalized snapshot (now when missing).
+    """
+    ts_raw = snapshot.get("meta", {}).get("timestamp_utc")
+    return datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00")) if ts_raw else datetime.now(timezone.utc)
+
+
+def write_inconsistent_forensic_report(
+    report_path: Path,
+    snapshots: Iterable[Dict[str, Any]],
+    tracker: Optional[InconsistentActsTracker] = None,
+) -> Path:
     """Generate special-scrutiny forensic report from replay snapshots.
 
     Genera reporte forense de escrutinio especial desde snapshots del replay.
+    Con ``tracker`` ya alimentado por el replay en streaming, solo se escribe.
     """
-    tracker = InconsistentActsTracker()
-    for snapshot in snapshots:
-        ts_raw = snapshot.get("meta", {}).get("timestamp_utc")
-        parsed_ts = datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00")) if ts_raw else datetime.now(timezone.utc)
-        tracker.load_snapshot(snapshot, parsed_ts)
+    if tracker is None:
+        tracker = InconsistentActsTracker()
+        for snapshot in snapshots:
+            tracker.load_snapshot(snapshot, _snapshot_timestamp(snapshot))
 
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(tracker.generate_forensic_report(), encoding="utf-8")
     return report_path
 
 
+def _normalize_file(
+    path: Path,
+    department: str,
+    year: int,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], str]]:
+    """Lee y normaliza un snapshot crudo (corre en el pool de workers).
+
+    Read and normalize one raw snapshot on a pool worker. Returns the raw
+    payload, the normalized dict and its canonical JSON, or ``None`` for an
+    invalid CNE payload.
+    """
+    raw = _load_json(path)
+    timestamp = raw.get("timestamp") or raw.get("timestamp_utc") or path.stem
+    snapshot = normalize_snapshot(raw, department, timestamp, year=year)
+    if snapshot is None:
+        return None
+    canonical_json = snapshot_to_canonical_json(snapshot)
+    return raw, json.loads(canonical_json), canonical_json
+
+
 def run_replay(
     data_dir: Path,
     output_dir: Path,
@@ -247,28 +339,107 @@ def run_replay(
     report_path: Path,
     department: str,
     year: int,
-) -> Tuple[Path, Path, Path]:
-    """Ejecuta el replay completo y devuelve rutas clave.
-
-    Run the full replay and return key paths.
+    workers: int = DEFAULT_WORKERS,
+    lookahead: Optional[int] = None,
+    config: Optional[Dict[str, Any]] = None,
+    meter: Optional[ThroughputMeter] = None,
+) -> ReplayOutputs:
+    """Ejecuta el replay completo en streaming y devuelve rutas clave.
+
+    Los snapshots se leen y normalizan en un pool con anticipación acotada
+    y cada uno pasa, en orden, por la escritura normalizada, el
+    ``InconsistentActsTracker``, el diff contra el anterior y el
+    ``RulesEngine``. Solo el snapshot anterior queda retenido, por lo que
+    la memoria no depende de la longitud de la elección.
+
+    Run the full replay as a stream and return key paths. Snapshots are
+    read and normalized on a pool with bounded lookahead and each one goes,
+    in order, through the normalized output, the tracker, the diff against
+    its predecessor and the rules engine. Only the previous snapshot is
+    retained, so memory does not depend on the length of the election.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-    analysis_dir.mkdir(parents=True, exist_ok=True)
-
-    snapshots = load_snapshots(data_dir)
-    normalized = normalize_snapshots(snapshots, department, year)
-    write_normalized_outputs(normalized, output_dir)
+    data_dir, output_dir, analysis_dir, report_path = (
+        path.resolve() for path in (data_dir, output_dir, analysis_dir, report_path)
+    )
     normalized_dir = output_dir / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+    analysis_dir.mkdir(parents=True, exist_ok=True)
 
-    with _chdir(analysis_dir):
-        analyze_rules.run_audit(str(normalized_dir))
+    engine = RulesEngine(
+        config=config if config is not None else analyze_rules.load_rules_config(),
+        log_path=analysis_dir / "rules_log.jsonl",
+    )
+    # Resolved now: the stream below runs inside `_chdir(analysis_dir)`.
+    tracker = InconsistentActsTracker(
+        config_path=Path("config/inconsistent_key.json").resolve(),
+        runtime_config_path=Path("config.json").resolve(),
+    )
+    meter = meter if meter is not None else ThroughputMeter(label="replay_2025")
+    diffs: List[Dict[str, Any]] = []
 
-    report_file = write_report(report_path, normalized_dir)
+    def _normalized_stream() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        previous: Optional[Tuple[str, Dict[str, Any]]] = None
+        files = sorted(data_dir.glob("*.json"))
+        parse = partial(_normalize_file, department=department, year=year)
+        for path, parsed in stream_parsed(files, parse, workers=workers, lookahead=lookahead):
+            if parsed is None:
+                log_event(
+                    logger,
+                    logging.ERROR,
+                    "normalize_snapshot_skipped",
+                    reason="invalid_cne_payload",
+                    snapshot_name=path.stem,
+                )
+                continue
+            raw, snapshot, canonical_json = parsed
+            (normalized_dir / f"{path.stem}.json").write_text(canonical_json + "\n", encoding="utf-8")
+            # The tracker reads the CNE payload itself (inconsistent-acts key).
+            try:
+                tracker.load_snapshot(raw, _snapshot_timestamp(snapshot))
+            except ValueError as exc:
+                log_event(
+                    logger,
+                    logging.WARNING,
+                    "inconsistent_tracker_snapshot_skipped",
+                    reason=str(exc),
+                    snapshot_name=path.stem,
+                )
+            if previous is not None:
+                diffs.append(_diff_entry(previous[0], previous[1], f"{path.stem}.json", snapshot))
+            previous = (f"{path.stem}.json", snapshot)
+            yield path.stem, snapshot
+
+    alerts_file = analysis_dir / "replay_alerts.jsonl"
+    with _chdir(analysis_dir), alerts_file.open("w", encoding="utf-8") as handle:
+        for snapshot_name, result in engine.iter_run(_normalized_stream()):
+            handle.write(
+                json.dumps(
+                    {
+                        "snapshot": snapshot_name,
+                        "alerts": result.alerts,
+                        "pause_snapshots": result.pause_snapshots,
+                    },
+                    ensure_ascii=False,
+                    default=str,
+                )
+                + "\n"
+            )
+            meter.tick()
+    throughput = meter.finish()
+
+    report_file = write_report(report_path, normalized_dir, diffs=diffs, throughput=throughput)
     forensic_file = write_inconsistent_forensic_report(
         report_path.with_name("inconsistent_acts_forensic.md"),
-        normalized,
+        (),
+        tracker=tracker,
+    )
+    return ReplayOutputs(
+        normalized_dir=normalized_dir,
+        report_file=report_file,
+        forensic_file=forensic_file,
+        alerts_file=alerts_file,
+        throughput=throughput,
     )
-    return normalized_dir, report_file, forensic_file
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -310,6 +481,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=2025,
         help="Año electoral.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Workers que leen y normalizan snapshots en paralelo.",
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=None,
+        help="Snapshots en vuelo como máximo (por defecto 2 x workers).",
+    )
     return parser
 
 
@@ -321,20 +504,24 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    normalized_dir, report_file, forensic_file = run_replay(
+    outputs = run_replay(
         data_dir=Path(args.data_dir),
         output_dir=Path(args.output_dir),
         analysis_dir=Path(args.analysis_dir),
         report_path=Path(args.report_path),
         department=args.department,
         year=args.year,
+        workers=args.workers,
+        lookahead=args.lookahead,
     )
 
     summary = {
-        "normalized_dir": str(normalized_dir),
+        "normalized_dir": str(outputs.normalized_dir),
         "analysis_dir": str(Path(args.analysis_dir)),
-        "report": str(report_file),
-        "inconsistent_acts_report": str(forensic_file),
+        "report": str(outputs.report_file),
+        "inconsistent_acts_report": str(outputs.forensic_file),
+        "alerts": str(outputs.alerts_file),
+        "throughput": outputs.throughput,
     }
     print(json.dumps(summary, indent=2, ensure_ascii=False))
 
@@ -0,0 +1,161 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `scripts/replay_stream.py`.
+Motor de replay en streaming para `replay_2025.py` y `calibrate_2025.py`.
+Los archivos se ordenan por nombre (barato) y se parsean en un pool de
+hilos con una ventana de anticipación acotada; los resultados salen en
+orden y de a uno, de modo que solo hay `lookahead` snapshots en memoria a
+la vez sin importar cuán larga sea la elección. `ThroughputMeter` reporta
+snapshots/s mientras corre.
+
+Componentes detectados:
+  - ThroughputMeter
+  - stream_parsed
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `scripts/replay_stream.py`.
+Streaming replay engine for `replay_2025.py` and `calibrate_2025.py`.
+Files are ordered by name (cheap) and parsed on a thread pool with a bounded
+lookahead; results come out in order, one at a time, so only `lookahead`
+snapshots are in memory at once however long the election was.
+`ThroughputMeter` reports snapshots/s as it runs.
+
+Detected components:
+  - ThroughputMeter
+  - stream_parsed
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Replay Stream Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, TextIO, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class ThroughputMeter:
+    """Mide y reporta el ritmo del replay (snapshots/s).
+
+    Measure and report replay throughput (snapshots/s). A progress line is
+    printed every ``every`` snapshots or ``interval`` seconds, whichever
+    comes first; ``summary`` returns the final figures.
+    """
+
+    label: str = "replay"
+    every: int = 500
+    interval: float = 10.0
+    stream: Optional[TextIO] = None
+    count: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    _last_report: float = field(default=0.0, repr=False)
+
+    def tick(self, n: int = 1) -> None:
+        """Cuenta ``n`` snapshots procesados."""
+        self.count += n
+        now = time.perf_counter()
+        if self.count % max(1, self.every) == 0 or now - (self._last_report or self.started) >= self.interval:
+            self._last_report = now
+            self._emit("progress")
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Totales finales: snapshots, segundos y snapshots/s."""
+        elapsed = time.perf_counter() - self.started
+        return {
+            "snapshots": self.count,
+            "seconds": round(elapsed, 3),
+            "snapshots_per_second": round(self.count / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+
+    def finish(self) -> Dict[str, float]:
+        """Imprime la línea final y devuelve ``summary``."""
+        self._emit("done")
+        return self.summary()
+
+    def _emit(self, stage: str) -> None:
+        stream = self.stream if self.stream is not None else sys.stderr
+        print(f"[{self.label}] {stage}: {self.count} snapshots, {self.rate:.1f} snapshots/s", file=stream)
+
+
+def stream_parsed(
+    paths: Iterable[Path],
+    parse: Callable[[Path], T],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    lookahead: Optional[int] = None,
+) -> Iterator[Tuple[Path, T]]:
+    """Parsea ``paths`` en un pool y los entrega en orden, de a uno.
+
+    Como mucho ``lookahead`` archivos (por defecto ``2 * workers``) están
+    en vuelo o esperando a ser consumidos. Con ``workers <= 1`` se parsea en
+    el hilo actual. Las excepciones de ``parse`` se propagan en el orden del
+    archivo que las produjo.
+
+    Parse ``paths`` on a pool and yield them in order, one at a time. At
+    most ``lookahead`` files (default ``2 * workers``) are in flight or
+    waiting to be consumed.
+    """
+    if workers <= 1:
+        for path in paths:
+            yield path, parse(path)
+        return
+
+    window = max(1, lookahead if lookahead is not None else 2 * workers)
+    pending: Deque[Tuple[Path, "Future[T]"]] = deque()
+    source = iter(paths)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="centinel-replay") as pool:
+        try:
+            for path in source:
+                pending.append((path, pool.submit(parse, path)))
+                if len(pending) >= window:
+                    ready_path, future = pending.popleft()
+                    yield ready_path, future.result()
+            while pending:
+                ready_path, future = pending.popleft()
+                yield ready_path, future.result()
+        finally:
+            # Consumer stopped early: drop the lookahead instead of parsing it.
+            for _path, future in pending:
+                future.cancel()
@@ -102,13 +102,16 @@ from scripts.circuit_breaker import CircuitBreaker
 from centinel.defense.security import DefensiveSecurityManager, DefensiveShutdown, SecurityConfig
 from centinel.defense.advanced_security import load_manager
 from centinel.paths import iter_all_hashes, iter_all_snapshots
+from centinel.snapshot_cache import load_snapshot
 from scripts.download_and_hash import is_master_switch_on, normalize_master_switch
 from scripts.logging_utils import configure_logging, log_event
+from scripts.stage_runner import StageRunner
 from scripts.security.encrypt_secrets import decrypt_secrets
 from centinel.core.anchoring_payload import build_diff_summary, compute_anchor_root
 from anchor.opentimestamps import submit_to_opentimestamps
 from centinel.core.transparency import compute_merkle_root
 from centinel.core.custody import run_startup_verification
+from centinel import profiling, tracing
 from centinel.utils.config_loader import load_config as load_pipeline_config
 from centinel_engine.config_loader import load_config as load_engine_config
 
@@ -123,10 +126,14 @@ HASH_DIR = Path("hashes")
 ANALYSIS_DIR = Path("analysis")
 REPORTS_DIR = Path("reports")
 ANCHOR_LOG_DIR = Path("logs") / "anchors"
+VERIFICATION_CURSOR_DIR = DATA_DIR / "verification_cursors"
 STATE_PATH = DATA_DIR / "pipeline_state.json"
 PIPELINE_CHECKPOINT_PATH = TEMP_DIR / "pipeline_checkpoint.json"
 FAILURE_CHECKPOINT_PATH = TEMP_DIR / "checkpoint.json"
 HEARTBEAT_PATH = DATA_DIR / "heartbeat.json"
+FORENSICS_CHECKPOINT_PATH = DATA_DIR / "forensics_tracker_checkpoint.json"
+PIPELINE_TRACE_PATH = tracing.default_trace_path()
+PROFILE_REQUEST_PATH = REPORTS_DIR / profiling.DEFAULT_REQUEST_PATH.name
 SECURITY_CONFIG_PATH = Path("command_center") / "security_config.yaml"
 ATTACK_CONFIG_PATH = Path("command_center") / "attack_config.yaml"
 ADVANCED_SECURITY_CONFIG_PATH = Path("command_center") / "advanced_security_config.yaml"
@@ -227,10 +234,9 @@ def load_resilience_checkpoint() -> dict[str, Any]:
 
 def collect_snapshot_index(limit: int = 19) -> list[dict[str, Any]]:
     """/** Genera índice JSON con snapshots recientes. / Generate a JSON index with recent snapshots. **"""
-    all_snapshots = iter_all_snapshots(data_root=DATA_DIR)
-    snapshots = sorted(all_snapshots, key=lambda p: p.stat().st_mtime, reverse=True)
+    snapshots = list(reversed(iter_all_snapshots(data_root=DATA_DIR, limit=limit)))
     index: list[dict[str, Any]] = []
-    for snapshot in snapshots[:limit]:
+    for snapshot in snapshots:
         index.append(
             {
                 "file": str(snapshot.relative_to(DATA_DIR)),
@@ -242,10 +248,9 @@ def collect_snapshot_index(limit: int = 19) -> list[dict[str, Any]]:
 
 def build_defensive_state_snapshot() -> dict[str, Any]:
     """/** Construye estado persistible para shutdown defensivo. / Build persisted state for defensive shutdown. **/"""
-    all_snaps = iter_all_snapshots(data_root=DATA_DIR)
-    latest_snapshot = all_snaps[-1] if all_snaps else None
-    all_hashes = iter_all_hashes(hash_root=HASH_DIR)
-    recent_hashes = [str(p.relative_to(HASH_DIR)) for p in reversed(all_hashes[-10:])]
+    latest_snaps = iter_all_snapshots(data_root=DATA_DIR, limit=1)
+    latest_snapshot = latest_snaps[-1] if latest_snaps else None
+    recent_hashes = [str(p.relative_to(HASH_DIR)) for p in reversed(iter_all_hashes(hash_root=HASH_DIR, limit=10))]
     queued_urls: list[str] = []
     config = load_pipeline_config()
     endpoints = config.get("endpoints") if isinstance(config, dict) else None
@@ -380,8 +385,7 @@ def resolve_max_json_limit(config: dict[str, Any]) -> int:
 
 def build_snapshot_queue(limit: int) -> list[Path]:
     """/** Construye lista ordenada de snapshots. / Build ordered snapshot list. **"""
-    snapshots = iter_all_snapshots(data_root=DATA_DIR)
-    return snapshots[-limit:]
+    return iter_all_snapshots(data_root=DATA_DIR, limit=limit)
 
 
 def process_snapshot_queue(
@@ -459,8 +463,7 @@ def save_resilience_checkpoint(
 
 def collect_recent_hashes(limit: int = 19) -> list[dict[str, Any]]:
     """/** Recolecta hashes recientes para checkpoint. / Collect recent hashes for checkpoint. **"""
-    all_h = iter_all_hashes(hash_root=HASH_DIR)
-    hash_files = list(reversed(all_h))[:limit]
+    hash_files = list(reversed(iter_all_hashes(hash_root=HASH_DIR, limit=limit)))
     hashes: list[dict[str, Any]] = []
     for hash_file in hash_files:
         try:
@@ -511,14 +514,14 @@ def latest_file(directory, pattern):
 
 def compute_content_hash(snapshot_path):
     """/** Calcula hash de contenido del snapshot. / Compute snapshot content hash. **"""
-    payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    payload = load_snapshot(snapshot_path)
     normalized = json.dumps(payload, sort_keys=True).encode("utf-8")
     return hashlib.sha256(normalized).hexdigest()
 
 
 def should_normalize(snapshot_path):
     """/** Determina si requiere normalización. / Determine if normalization is required. **"""
-    payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    payload = load_snapshot(snapshot_path)
     return "resultados" in payload and "estadisticas" in payload
 
 
@@ -825,6 +828,20 @@ def run_pipeline(config: dict[str, Any]) -> None:
         content_hash=content_hash,
     )
     log_event(logger, logging.INFO, "pipeline_start", run_id=run_id)
+    trace = tracing.start_trace(
+        "cycle",
+        sink=tracing.TraceLog(PIPELINE_TRACE_PATH),
+        run_id=run_id,
+        start_stage=start_stage,
+    )
+    cycle_error: Exception | None = None
+    # Resolved at call time so tests/hooks that patch run_command still apply.
+    stage_runner = StageRunner.from_config(
+        config,
+        command_runner=lambda *args, **kwargs: run_command(*args, **kwargs),
+        run_id=run_id,
+    )
+    log_event(logger, logging.INFO, "stage_runner_mode", run_id=run_id, mode=stage_runner.mode)
 
     enable_backup: bool = bool(config.get("ENABLE_BACKUP", True))
     rate_limiter = get_rate_limiter()
@@ -843,6 +860,7 @@ def run_pipeline(config: dict[str, Any]) -> None:
         if should_run_stage("healthcheck", start_stage):
             save_pipeline_checkpoint({"run_id": run_id, "stage": "healthcheck", "at": utcnow().isoformat()})
             save_resilience_checkpoint(run_id, "healthcheck")
+            health_span = tracing.start_span("healthcheck")
             maybe_inject_chaos_failure("healthcheck", resilience_settings, chaos_rng)
             waited = rate_limiter.wait()
             if waited > 0:
@@ -987,7 +1005,6 @@ def run_pipeline(config: dict[str, Any]) -> None:
                     config=runtime_vital_config,
                 )
 
-            download_cmd = [sys.executable, "scripts/download_and_hash.py"]
             if not health_ok:
                 log_event(
                     logger,
@@ -995,7 +1012,10 @@ def run_pipeline(config: dict[str, Any]) -> None:
                     "healthcheck_failed_fallback_mock",
                     run_id=run_id,
                 )
-                download_cmd.append("--mock")
+            if health_span is not None:
+                health_span.set_attribute("status_code", status_code)
+                health_span.set_attribute("mode", predicted_mode)
+                health_span.end()
 
             if should_run_stage("download", start_stage):
                 save_pipeline_checkpoint({"run_id": run_id, "stage": "download", "at": utcnow().isoformat()})
@@ -1004,22 +1024,22 @@ def run_pipeline(config: dict[str, Any]) -> None:
                 retry_config_path = config.get("retry_config_path") or os.getenv(
                     "RETRY_CONFIG_PATH", "config/prod/retry_config.yaml"
                 )
-                download_env = os.environ.copy()
-                download_env["RETRY_CONFIG_PATH"] = retry_config_path
-                run_command(download_cmd, "descarga + hash", env=download_env)
+                with tracing.span("download", mock=not health_ok, runner=stage_runner.mode):
+                    stage_runner.download(mock=not health_ok, retry_config_path=retry_config_path)
 
         max_json = resolve_max_json_limit(config)
         snapshots = build_snapshot_queue(max_json)
         if snapshots:
-            process_snapshot_queue(
-                snapshots,
-                resilience_checkpoint,
-                run_id=run_id,
-            )
+            with tracing.span("queue", snapshots=len(snapshots)):
+                process_snapshot_queue(
+                    snapshots,
+                    resilience_checkpoint,
+                    run_id=run_id,
+                )
 
         if latest_snapshot is None:
-            all_snaps = iter_all_snapshots(data_root=DATA_DIR)
-            latest_snapshot = snapshots[-1] if snapshots else (all_snaps[-1] if all_snaps else None)
+            latest_snaps = snapshots or iter_all_snapshots(data_root=DATA_DIR, limit=1)
+            latest_snapshot = latest_snaps[-1] if latest_snaps else None
         if not latest_snapshot:
             print("[!] No se encontró snapshot para procesar")
             log_event(logger, logging.WARNING, "snapshot_missing", run_id=run_id)
@@ -1035,6 +1055,8 @@ def run_pipeline(config: dict[str, Any]) -> None:
 
         state["last_content_hash"] = content_hash
         state["last_snapshot"] = latest_snapshot.name
+        normalized: list[tuple[Path, dict]] = []
+        anomalies: list[dict] | None = None
 
         if should_run_stage("normalize", start_stage):
             save_pipeline_checkpoint({"run_id": run_id, "stage": "normalize", "at": utcnow().isoformat()})
@@ -1046,10 +1068,10 @@ def run_pipeline(config: dict[str, Any]) -> None:
             )
             maybe_inject_chaos_failure("normalize", resilience_settings, chaos_rng)
             if should_normalize(latest_snapshot):
-                run_command(
-                    [sys.executable, "scripts/normalize_presidential.py"],
-                    "normalización",
-                )
+                with tracing.span("normalize", runner=stage_runner.mode) as normalize_span:
+                    normalized = stage_runner.normalize()
+                    if normalize_span is not None:
+                        normalize_span.set_attribute("files", len(normalized))
             else:
                 print("[i] Normalización omitida: estructura no compatible")
                 log_event(logger, logging.INFO, "normalize_skipped", run_id=run_id)
@@ -1063,25 +1085,33 @@ def run_pipeline(config: dict[str, Any]) -> None:
                 content_hash=content_hash,
             )
             maybe_inject_chaos_failure("analyze", resilience_settings, chaos_rng)
-            run_command([sys.executable, "scripts/analyze_rules.py"], "análisis")
-
-        anomalies_path = Path("anomalies_report.json")
-        anomalies = []
-        if anomalies_path.exists():
-            anomalies = json.loads(anomalies_path.read_text(encoding="utf-8"))
-
-        critical_anomalies = filter_critical_anomalies(anomalies, config)
-        alerts = build_alerts(critical_anomalies, severity="CRITICAL")
-        (ANALYSIS_DIR / "alerts.json").write_text(json.dumps(alerts, indent=2), encoding="utf-8")
-        emit_critical_alerts(critical_anomalies, config, run_id=run_id)
-        _broadcast_anomaly_findings(
-            critical_anomalies,
-            run_id=run_id,
-            snapshot_id=content_hash or "",
-        )
-        _broadcast_throttle_findings()
-        if critical_anomalies:
-            _trigger_emergency_publish(reason="critical_anomaly")
+            with tracing.span("analyze", runner=stage_runner.mode) as analyze_span:
+                anomalies = stage_runner.analyze(normalized)
+                if analyze_span is not None:
+                    analyze_span.set_attribute("alerts", len(anomalies))
+
+        if anomalies is None:
+            # Resumed past analyze: reuse the report persisted by that run.
+            anomalies_path = Path("anomalies_report.json")
+            anomalies = []
+            if anomalies_path.exists():
+                anomalies = json.loads(anomalies_path.read_text(encoding="utf-8"))
+
+        with tracing.span("alerts") as alerts_span:
+            critical_anomalies = filter_critical_anomalies(anomalies, config)
+            alerts = build_alerts(critical_anomalies, severity="CRITICAL")
+            (ANALYSIS_DIR / "alerts.json").write_text(json.dumps(alerts, indent=2), encoding="utf-8")
+            emit_critical_alerts(critical_anomalies, config, run_id=run_id)
+            _broadcast_anomaly_findings(
+                critical_anomalies,
+                run_id=run_id,
+                snapshot_id=content_hash or "",
+            )
+            _broadcast_throttle_findings()
+            if critical_anomalies:
+                _trigger_emergency_publish(reason="critical_anomaly")
+            if alerts_span is not None:
+                alerts_span.set_attribute("critical", len(critical_anomalies))
 
         if should_run_stage("report", start_stage):
             save_pipeline_checkpoint({"run_id": run_id, "stage": "report", "at": utcnow().isoformat()})
@@ -1093,14 +1123,16 @@ def run_pipeline(config: dict[str, Any]) -> None:
             )
             maybe_inject_chaos_failure("report", resilience_settings, chaos_rng)
             if should_generate_report(state, now):
-                run_command([sys.executable, "scripts/summarize_findings.py"], "reportes")
-                state["last_report_at"] = now.isoformat()
-                # Generate membretado PDF and upload to Supabase Storage
-                _cli_args = globals().get("args")
-                _pdf_name = getattr(_cli_args, "output", "centinel_informe_nacional.pdf")
-                pdf_url = _generate_and_upload_pdf(_pdf_name)
-                if pdf_url:
-                    state["last_report_pdf_url"] = pdf_url
+                with tracing.span("report", runner=stage_runner.mode):
+                    stage_runner.report(alerts)
+                    state["last_report_at"] = now.isoformat()
+                    # Generate membretado PDF and upload to Supabase Storage
+                    _cli_args = globals().get("args")
+                    _pdf_name = getattr(_cli_args, "output", "centinel_informe_nacional.pdf")
+                    with tracing.span("report_pdf"):
+                        pdf_url = _generate_and_upload_pdf(_pdf_name)
+                    if pdf_url:
+                        state["last_report_pdf_url"] = pdf_url
             else:
                 print("[i] Reporte omitido por cadencia")
                 log_event(logger, logging.INFO, "report_skipped", run_id=run_id)
@@ -1113,15 +1145,17 @@ def run_pipeline(config: dict[str, Any]) -> None:
                 content_hash=content_hash,
             )
             maybe_inject_chaos_failure("anchor", resilience_settings, chaos_rng)
-            _anchor_snapshot(config, state, now, latest_snapshot)
-
-        _publish_forensics(
-            config,
-            now,
-            extra_meta=(
-                {"report_pdf_url": state.get("last_report_pdf_url")} if state.get("last_report_pdf_url") else None
-            ),
-        )
+            with tracing.span("anchor"):
+                _anchor_snapshot(config, state, now, latest_snapshot)
+
+        with tracing.span("publish"):
+            _publish_forensics(
+                config,
+                now,
+                extra_meta=(
+                    {"report_pdf_url": state.get("last_report_pdf_url")} if state.get("last_report_pdf_url") else None
+                ),
+            )
 
         scrape_status = vital_signs.update_status_after_scrape(
             scrape_status,
@@ -1139,21 +1173,25 @@ def run_pipeline(config: dict[str, Any]) -> None:
         # Encrypted backup after successful scrape /
         # Respaldo cifrado despues de scrape exitoso
         if enable_backup:
-            try:
-                backup_result = secure_backup.backup_critical()
-                log_event(
-                    logger,
-                    logging.INFO,
-                    "post_scrape_backup",
-                    run_id=run_id,
-                    local=backup_result.get("local", False),
-                    files=len(backup_result.get("files_backed_up", [])),
-                )
-            except Exception as backup_exc:  # noqa: BLE001
-                log_event(logger, logging.WARNING, "post_scrape_backup_failed", error=str(backup_exc))
+            with tracing.span("backup") as backup_span:
+                try:
+                    backup_result = secure_backup.backup_critical()
+                    log_event(
+                        logger,
+                        logging.INFO,
+                        "post_scrape_backup",
+                        run_id=run_id,
+                        local=backup_result.get("local", False),
+                        files=len(backup_result.get("files_backed_up", [])),
+                    )
+                except Exception as backup_exc:  # noqa: BLE001
+                    if backup_span is not None:
+                        backup_span.record_error(backup_exc)
+                    log_event(logger, logging.WARNING, "post_scrape_backup_failed", error=str(backup_exc))
 
         log_event(logger, logging.INFO, "pipeline_complete", run_id=run_id)
     except Exception as exc:  # noqa: BLE001
+        cycle_error = exc
         log_event(
             logger,
             logging.ERROR,
@@ -1173,10 +1211,23 @@ def run_pipeline(config: dict[str, Any]) -> None:
         # Always execute a fail-safe partial backup /
         # Ejecutar siempre un respaldo parcial fail-safe
         if enable_backup:
-            try:
-                secure_backup.backup_critical()
-            except Exception as backup_exc:  # noqa: BLE001
-                log_event(logger, logging.WARNING, "final_backup_failed", error=str(backup_exc))
+            # An aborted stage may still be the active span: attach to the root.
+            with tracing.span("backup_final", parent=trace) as final_span:
+                try:
+                    secure_backup.backup_critical()
+                except Exception as backup_exc:  # noqa: BLE001
+                    if final_span is not None:
+                        final_span.record_error(backup_exc)
+                    log_event(logger, logging.WARNING, "final_backup_failed", error=str(backup_exc))
+        trace.end(error=cycle_error)
+        log_event(
+            logger,
+            logging.INFO,
+            "pipeline_trace",
+            run_id=run_id,
+            duration_ms=trace.duration_ms,
+            stages=tracing.format_trace_summary(trace.to_record()),
+        )
 
 
 def safe_run_pipeline(config: dict[str, Any], security_manager: DefensiveSecurityManager | None = None) -> bool:
@@ -1284,12 +1335,17 @@ def run_polling_loop(config: dict[str, Any], *, run_once: bool, run_now: bool) -
         open_log_interval_seconds=int(breaker_settings.get("open_log_interval_seconds", 300)),
     )
 
+    # Profiles the next K cycles when requested via /api/profiling/cycles.
+    cycle_profiler = profiling.CycleProfiler(request_path=PROFILE_REQUEST_PATH, output_dir=REPORTS_DIR)
+
     if run_once:
-        safe_run_pipeline(config)
+        with cycle_profiler.cycle():
+            safe_run_pipeline(config)
         return
 
     if run_now:
-        safe_run_pipeline(config)
+        with cycle_profiler.cycle():
+            safe_run_pipeline(config)
 
     rng = random.Random()
     while True:
@@ -1301,7 +1357,8 @@ def run_polling_loop(config: dict[str, Any], *, run_once: bool, run_now: bool) -
             time.sleep(max(5.0, sleep_for))
             continue
 
-        success = safe_run_pipeline(config)
+        with cycle_profiler.cycle():
+            success = safe_run_pipeline(config)
         if success:
             breaker.record_success(now)
         else:
@@ -1329,9 +1386,7 @@ def run_polling_loop(config: dict[str, Any], *, run_once: bool, run_now: bool) -
 
 def _read_hashes_for_anchor(batch_size: int) -> list[str]:
     """/** Lee hashes recientes para anclaje en Arbitrum. / Read recent hashes for Arbitrum anchoring. **"""
-    all_h = iter_all_hashes(hash_root=HASH_DIR)
-    hash_files_desc = list(reversed(all_h))
-    selected = list(reversed(hash_files_desc[:batch_size]))
+    selected = iter_all_hashes(hash_root=HASH_DIR, limit=batch_size)
     hashes: list[str] = []
     for hash_file in selected:
         try:
@@ -1422,7 +1477,7 @@ def _publish_forensics(config: dict[str, Any], now: datetime, extra_meta: dict |
         if not snapshots:
             return
 
-        hash_files = iter_all_hashes(hash_root=HASH_DIR)
+        hash_files = iter_all_hashes(hash_root=HASH_DIR, exhaustive=True)
         leaf_hashes = [p.read_text(encoding="utf-8").strip() for p in hash_files if p.exists()]
         leaf_hashes = [h for h in leaf_hashes if h]
         chain_hash = leaf_hashes[-1] if leaf_hashes else ""
@@ -1439,6 +1494,7 @@ def _publish_forensics(config: dict[str, Any], now: datetime, extra_meta: dict |
             target_cadence_minutes=cadence_minutes,
             endpoints_yaml_path=Path("config/prod/endpoints.yaml"),
             extra_meta=extra_meta,
+            checkpoint_path=FORENSICS_CHECKPOINT_PATH,
         )
     except Exception as exc:  # noqa: BLE001 - publishing must never break pipeline
         log_event(logger, logging.WARNING, "forensics_publish_failed", error=str(exc))
@@ -1452,7 +1508,7 @@ def _anchor_snapshot(
 ) -> None:
     """/** Genera hash raíz post-reglas y ancla snapshot vía OpenTimestamps. / Generate post-rule root hash and anchor snapshot via OpenTimestamps. **"""
     current_payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
-    snapshots = iter_all_snapshots(data_root=DATA_DIR)
+    snapshots = iter_all_snapshots(data_root=DATA_DIR, limit=2)
     previous_snapshot = snapshots[-2] if len(snapshots) > 1 else None
     previous_payload = json.loads(previous_snapshot.read_text(encoding="utf-8")) if previous_snapshot else None
 
@@ -1551,6 +1607,15 @@ def main():
                     verify_anchors=custody_config.get("verify_anchors_on_startup", False),
                     verify_signatures=custody_config.get("verify_signatures", True),
                     max_anchor_checks=int(custody_config.get("max_anchor_checks", 5)),
+                    cursor_path=(
+                        VERIFICATION_CURSOR_DIR / "custody_chain.json"
+                        if custody_config.get("incremental_verification", True)
+                        else None
+                    ),
+                    full_verification=os.getenv("CENTINEL_FULL_CHAIN_VERIFY", "").strip().lower()
+                    in {"1", "true", "yes"},
+                    full_reverify_hours=float(custody_config.get("full_reverify_hours", 24)),
+                    workers=int(custody_config.get("verification_workers", 1)),
                 )
                 report_path = DATA_DIR / "custody_verification.json"
                 report_path.write_text(
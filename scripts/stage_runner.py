@@ -0,0 +1,206 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `scripts/stage_runner.py`.
+Ejecuta las etapas del pipeline (descarga, normalización, análisis y
+reportes) como funciones dentro del proceso de polling, con los imports
+(pandas/numpy/scipy/sklearn) ya cargados, y pasa snapshots normalizados y
+resultados del análisis en memoria. El modo `subprocess` conserva la
+ejecución histórica de un intérprete por etapa como aislamiento de respaldo.
+
+Componentes detectados:
+  - STAGE_RUNNER_MODES
+  - resolve_stage_runner_mode
+  - StageRunner
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `scripts/stage_runner.py`.
+Runs pipeline stages (download, normalize, analyze, report) as functions
+inside the polling process, with heavy imports already warm, and hands
+normalized snapshots and analysis results to the next stage in memory.
+The `subprocess` mode keeps the historical one-interpreter-per-stage
+execution as an isolation fallback.
+
+Detected components:
+  - STAGE_RUNNER_MODES
+  - resolve_stage_runner_mode
+  - StageRunner
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from scripts.logging_utils import configure_logging, log_event
+
+logger = configure_logging("centinel.stage_runner", log_file="logs/centinel.log")
+
+STAGE_RUNNER_MODES = {"inprocess", "subprocess"}
+ANOMALIES_REPORT_PATH = Path("anomalies_report.json")
+
+
+def resolve_stage_runner_mode(config: dict[str, Any]) -> str:
+    """/** Resuelve el modo del runner de etapas. / Resolve the stage runner mode. **/
+
+    Priority: ``CENTINEL_STAGE_RUNNER`` env var, then ``stage_runner.mode``
+    in config, then ``inprocess``.
+    """
+    section = config.get("stage_runner", {}) if isinstance(config.get("stage_runner"), dict) else {}
+    mode = os.getenv("CENTINEL_STAGE_RUNNER") or section.get("mode") or "inprocess"
+    mode = str(mode).strip().lower()
+    if mode not in STAGE_RUNNER_MODES:
+        logger.warning("stage_runner_mode_invalid value=%s — falling back to inprocess", mode)
+        return "inprocess"
+    return mode
+
+
+class StageRunner:
+    """/** Ejecuta etapas del pipeline en proceso o como subprocesos. / Run pipeline stages in-process or as subprocesses. **/
+
+    ``command_runner`` is the subprocess launcher (``run_pipeline.run_command``)
+    used in ``subprocess`` mode and, when ``fallback_to_subprocess`` is on, to
+    retry an idempotent stage (normalize/analyze/report) whose in-process run
+    raised. Download is never retried this way: a partial in-process capture
+    already advanced the hash-chain checkpoint.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        *,
+        command_runner: Callable[..., Any],
+        fallback_to_subprocess: bool = True,
+        run_id: str | None = None,
+    ) -> None:
+        """Español: Inicializa el runner. / English: Initialize the runner."""
+        if mode not in STAGE_RUNNER_MODES:
+            raise ValueError(f"Unknown stage runner mode: {mode}")
+        self.mode = mode
+        self.command_runner = command_runner
+        self.fallback_to_subprocess = fallback_to_subprocess
+        self.run_id = run_id
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict[str, Any],
+        *,
+        command_runner: Callable[..., Any],
+        run_id: str | None = None,
+    ) -> "StageRunner":
+        """/** Construye el runner desde la configuración. / Build the runner from configuration. **/"""
+        section = config.get("stage_runner", {}) if isinstance(config.get("stage_runner"), dict) else {}
+        return cls(
+            resolve_stage_runner_mode(config),
+            command_runner=command_runner,
+            fallback_to_subprocess=bool(section.get("fallback_to_subprocess", True)),
+            run_id=run_id,
+        )
+
+    @property
+    def in_process(self) -> bool:
+        """True cuando las etapas corren dentro del proceso actual."""
+        return self.mode == "inprocess"
+
+    def _run_script(self, args: list[str], description: str, env: dict[str, str] | None = None) -> None:
+        command = [sys.executable, *args]
+        if env is None:
+            self.command_runner(command, description)
+        else:
+            self.command_runner(command, description, env=env)
+
+    def _fallback(self, stage: str, exc: BaseException) -> bool:
+        if not (self.in_process and self.fallback_to_subprocess):
+            return False
+        log_event(
+            logger,
+            logging.WARNING,
+            "stage_inprocess_failed_fallback_subprocess",
+            run_id=self.run_id,
+            stage=stage,
+            error=str(exc),
+        )
+        return True
+
+    # ── etapas / stages ───────────────────────────────────────────────
+
+    def download(self, *, mock: bool, retry_config_path: str) -> None:
+        """/** Etapa de descarga + hash. / Download + hash stage. **/"""
+        if not self.in_process:
+            env = os.environ.copy()
+            env["RETRY_CONFIG_PATH"] = retry_config_path
+            args = ["scripts/download_and_hash.py", *(["--mock"] if mock else [])]
+            self._run_script(args, "descarga + hash", env)
+            return
+
+        from scripts import download_and_hash
+
+        download_and_hash.run_download(mock=mock, retry_config_path=retry_config_path)
+
+    def normalize(self) -> list[tuple[Path, dict]]:
+        """/** Etapa de normalización; devuelve pares (ruta, payload). / Normalize stage; returns (path, payload) pairs. **/
+
+        Subprocess mode returns an empty list: the analyze stage then
+        discovers its inputs from ``normalized/`` on disk as before.
+        """
+        if self.in_process:
+            try:
+                from scripts import normalize_presidential
+
+                return normalize_presidential.normalize_snapshots()
+            except Exception as exc:  # noqa: BLE001
+                if not self._fallback("normalize", exc):
+                    raise
+        self._run_script(["scripts/normalize_presidential.py"], "normalización")
+        return []
+
+    def analyze(self, normalized: list[tuple[Path, dict]] | None = None) -> list[dict]:
+        """/** Etapa de análisis; devuelve las alertas del motor de reglas. / Analyze stage; returns rules-engine alerts. **/"""
+        if self.in_process:
+            try:
+                from scripts import analyze_rules
+
+                result = analyze_rules.run_analysis(normalized or None)
+                return list(result.alerts) if result is not None else []
+            except Exception as exc:  # noqa: BLE001
+                if not self._fallback("analyze", exc):
+                    raise
+        self._run_script(["scripts/analyze_rules.py"], "análisis")
+        return self._read_anomalies_report()
+
+    def report(self, alerts: list[dict]) -> None:
+        """/** Etapa de reportes (summary.txt + alertas críticas). / Report stage (summary.txt + critical alerts). **/"""
+        if self.in_process:
+            try:
+                from scripts import summarize_findings
+
+                summarize_findings.summarize_findings(alerts)
+                return
+            except Exception as exc:  # noqa: BLE001
+                if not self._fallback("report", exc):
+                    raise
+        self._run_script(["scripts/summarize_findings.py"], "reportes")
+
+    @staticmethod
+    def _read_anomalies_report() -> list[dict]:
+        if not ANOMALIES_REPORT_PATH.exists():
+            return []
+        payload = json.loads(ANOMALIES_REPORT_PATH.read_text(encoding="utf-8"))
+        return payload if isinstance(payload, list) else []
@@ -188,16 +188,21 @@ def _log_critical_alerts(critical_p_alerts: list[dict]) -> None:
         )
 
 
-def summarize_findings() -> None:
-    """/** Genera summary.txt y registra alertas críticas. / Generate summary.txt and log critical alerts. **"""
-    alerts_path = Path("analysis/alerts.json")
-    alerts_payload: list[dict] = []
-    try:
-        if alerts_path.exists():
-            alerts_payload = json.loads(alerts_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        logger.error("alerts_json_invalid error=%s", exc)
+def summarize_findings(alerts_payload: list[dict] | None = None) -> None:
+    """/** Genera summary.txt y registra alertas críticas. / Generate summary.txt and log critical alerts. **
+
+    When ``alerts_payload`` is given (in-process stage runner) it is used
+    directly; otherwise ``analysis/alerts.json`` is read from disk.
+    """
+    if alerts_payload is None:
+        alerts_path = Path("analysis/alerts.json")
         alerts_payload = []
+        try:
+            if alerts_path.exists():
+                alerts_payload = json.loads(alerts_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            logger.error("alerts_json_invalid error=%s", exc)
+            alerts_payload = []
 
     summary_lines, critical_p_alerts = _build_summary(alerts_payload)
     _log_critical_alerts(critical_p_alerts)
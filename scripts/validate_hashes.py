@@ -129,7 +129,7 @@ def _load_hash_entries(hashes_dir: Path) -> list[HashEntry]:
     English: Load hash entries from per-source subdirectories.
     """
     entries: list[HashEntry] = []
-    hash_files = iter_all_hashes(hash_root=hashes_dir)
+    hash_files = iter_all_hashes(hash_root=hashes_dir, exhaustive=True)
     for hash_file in hash_files:
         raw = hash_file.read_text(encoding="utf-8").strip()
         try:
@@ -6,8 +6,16 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import sys
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from centinel.core.merkle import MerkleAccumulator  # noqa: E402
+
 
 def sha256_file(path: Path) -> str:
     h = hashlib.sha256()
@@ -20,15 +28,7 @@ def sha256_file(path: Path) -> str:
 def merkle_root(hex_hashes: list[str]) -> str:
     if not hex_hashes:
         return hashlib.sha256(b"").hexdigest()
-    level = [bytes.fromhex(h) for h in sorted(hex_hashes)]
-    while len(level) > 1:
-        nxt: list[bytes] = []
-        for i in range(0, len(level), 2):
-            left = level[i]
-            right = level[i + 1] if i + 1 < len(level) else left
-            nxt.append(hashlib.sha256(left + right).digest())
-        level = nxt
-    return level[0].hex()
+    return MerkleAccumulator.from_leaves(sorted(hex_hashes)).root
 
 
 def verify(bundle_path: Path, base_dir: Path) -> tuple[bool, list[str]]:
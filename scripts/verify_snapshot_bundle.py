@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""One-click external verification for a snapshot bundle."""
+"""One-click external verification for a snapshot bundle.
+
+Also verifies, fully offline, the compact Merkle proofs served by the API:
+``/proofs/{hash}`` (``--inclusion-proof``) and ``/proofs/consistency``
+(``--consistency-proof``), including the checkpoint's own digest and
+operator signature.
+"""
 
 from __future__ import annotations
 
@@ -16,7 +22,8 @@ SRC_DIR = ROOT_DIR / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from centinel.core.custody import verify_hash_record_signature
+from centinel.core.custody import verify_hash_record_signature  # noqa: E402
+from centinel.core.merkle import MERKLE_CONSTRUCTION, verify_consistency, verify_inclusion  # noqa: E402
 
 
 def sha256_file(path: Path) -> str:
@@ -114,27 +121,144 @@ def verify(
     return (len(errors) == 0, errors)
 
 
+def checkpoint_digest(checkpoint: dict[str, Any], *, exclude: tuple[str, ...]) -> str:
+    """Same canonical digest the transparency log uses for checkpoints."""
+    signable = {k: v for k, v in sorted(checkpoint.items()) if k not in exclude}
+    payload = json.dumps(signable, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def verify_checkpoint(checkpoint: Any, require_signature: bool, prefix: str = "checkpoint") -> list[str]:
+    if not isinstance(checkpoint, dict):
+        return [f"missing_{prefix}"]
+    errors: list[str] = []
+    declared = checkpoint.get("checkpoint_digest")
+    if declared != checkpoint_digest(checkpoint, exclude=("operator_signature", "checkpoint_digest")):
+        errors.append(f"{prefix}_digest_mismatch")
+
+    signature = checkpoint.get("operator_signature")
+    if not signature:
+        if require_signature:
+            errors.append(f"missing_{prefix}_signature")
+        return errors
+    # The operator signs the checkpoint as built, before OpenTimestamps and its digest are attached.
+    signed = {
+        "checkpoint_digest": checkpoint_digest(
+            checkpoint, exclude=("operator_signature", "opentimestamps", "checkpoint_digest")
+        ),
+        "operator_signature": signature,
+    }
+    if not verify_hash_record_signature(signed):
+        errors.append(f"invalid_{prefix}_signature")
+    return errors
+
+
+def verify_inclusion_proof(
+    payload: dict[str, Any],
+    require_signature: bool,
+    expected_hash: str | None = None,
+) -> list[str]:
+    proof = payload.get("proof")
+    checkpoint = payload.get("checkpoint")
+    if not isinstance(proof, dict):
+        return ["missing_inclusion_proof"]
+    errors = verify_checkpoint(checkpoint, require_signature)
+    if proof.get("construction") != MERKLE_CONSTRUCTION:
+        errors.append("unsupported_merkle_construction")
+    snapshot_hash = str(payload.get("snapshot_hash", "")).lower()
+    if proof.get("leaf_hash") != snapshot_hash:
+        errors.append("inclusion_leaf_mismatch")
+    if expected_hash is not None and snapshot_hash != expected_hash.lower():
+        errors.append("inclusion_proof_hash_mismatch")
+    if isinstance(checkpoint, dict) and (
+        proof.get("root") != checkpoint.get("merkle_root") or proof.get("tree_size") != checkpoint.get("chain_length")
+    ):
+        errors.append("inclusion_checkpoint_mismatch")
+    try:
+        valid = verify_inclusion(
+            proof["leaf_hash"], proof["leaf_index"], proof["tree_size"], proof["audit_path"], proof["root"]
+        )
+    except (KeyError, TypeError, ValueError):
+        valid = False
+    if not valid:
+        errors.append("invalid_inclusion_proof")
+    return errors
+
+
+def verify_consistency_proof(payload: dict[str, Any], require_signature: bool) -> list[str]:
+    proof = payload.get("proof")
+    old_checkpoint = payload.get("from_checkpoint")
+    new_checkpoint = payload.get("to_checkpoint")
+    if not isinstance(proof, dict):
+        return ["missing_consistency_proof"]
+    errors = verify_checkpoint(old_checkpoint, require_signature, prefix="from_checkpoint")
+    errors += verify_checkpoint(new_checkpoint, require_signature, prefix="to_checkpoint")
+    if proof.get("construction") != MERKLE_CONSTRUCTION:
+        errors.append("unsupported_merkle_construction")
+    for checkpoint, size_key, root_key in (
+        (old_checkpoint, "old_size", "old_root"),
+        (new_checkpoint, "new_size", "new_root"),
+    ):
+        if isinstance(checkpoint, dict) and (
+            proof.get(size_key) != checkpoint.get("chain_length")
+            or proof.get(root_key) != checkpoint.get("merkle_root")
+        ):
+            errors.append("consistency_checkpoint_mismatch")
+    try:
+        valid = verify_consistency(
+            proof["old_size"],
+            proof["new_size"],
+            proof["old_root"],
+            proof["new_root"],
+            proof["old_frontier"],
+            proof["right_path"],
+        )
+    except (KeyError, TypeError, ValueError):
+        valid = False
+    if not valid:
+        errors.append("invalid_consistency_proof")
+    return errors
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Verify snapshot + hashchain + rules metadata")
-    parser.add_argument("--snapshot", required=True, help="Snapshot file path")
-    parser.add_argument("--hash-record", required=True, help="Hash record JSON path")
-    parser.add_argument("--rules", required=True, help="Rules config JSON/YAML path")
-    parser.add_argument("--pipeline-version", required=True, help="Pipeline version identifier")
+    parser.add_argument("--snapshot", help="Snapshot file path")
+    parser.add_argument("--hash-record", help="Hash record JSON path")
+    parser.add_argument("--rules", help="Rules config JSON/YAML path")
+    parser.add_argument("--pipeline-version", help="Pipeline version identifier")
     parser.add_argument("--require-signature", action="store_true", help="Require valid Ed25519 hash record signature")
     parser.add_argument("--anchor-log", help="Optional anchor log JSON/YAML path for root hash matching")
-    return parser.parse_args()
+    parser.add_argument("--inclusion-proof", help="Saved /proofs/{hash} response to verify offline")
+    parser.add_argument("--consistency-proof", help="Saved /proofs/consistency response to verify offline")
+    args = parser.parse_args()
+    bundle_args = (args.snapshot, args.hash_record, args.rules, args.pipeline_version)
+    if any(bundle_args) and not all(bundle_args):
+        parser.error("--snapshot, --hash-record, --rules and --pipeline-version go together")
+    if not any(bundle_args) and not (args.inclusion_proof or args.consistency_proof):
+        parser.error("nothing to verify: pass a snapshot bundle and/or a proof")
+    return args
 
 
 def main() -> int:
     args = parse_args()
-    ok, errors = verify(
-        snapshot_path=Path(args.snapshot),
-        hash_record_path=Path(args.hash_record),
-        rules_path=Path(args.rules),
-        pipeline_version=args.pipeline_version,
-        require_signature=args.require_signature,
-        anchor_log_path=Path(args.anchor_log) if args.anchor_log else None,
-    )
+    ok, errors = True, []
+    if args.snapshot:
+        ok, errors = verify(
+            snapshot_path=Path(args.snapshot),
+            hash_record_path=Path(args.hash_record),
+            rules_path=Path(args.rules),
+            pipeline_version=args.pipeline_version,
+            require_signature=args.require_signature,
+            anchor_log_path=Path(args.anchor_log) if args.anchor_log else None,
+        )
+    if args.inclusion_proof:
+        expected_hash = load_structured(Path(args.hash_record)).get("chained_hash") if args.hash_record else None
+        errors += verify_inclusion_proof(
+            load_structured(Path(args.inclusion_proof)), args.require_signature, expected_hash
+        )
+    if args.consistency_proof:
+        errors += verify_consistency_proof(load_structured(Path(args.consistency_proof)), args.require_signature)
+    ok = ok and not errors
     if ok:
         print("verification=PASS")
         return 0
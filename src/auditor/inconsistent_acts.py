@@ -19,12 +19,23 @@ import json
 import logging
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
-from math import log10, sqrt
+from bisect import bisect_right, insort
+from math import inf, log10, sqrt
 from pathlib import Path
 from typing import Any
 
 from scipy.stats import binomtest, chi2, chisquare, norm
 
+from centinel.core.canonical_json import canonical_sha256
+
+# Bump when the checkpoint layout changes; older checkpoints are ignored and
+# the tracker rebuilds from the snapshots.
+# Subir al cambiar el formato del checkpoint; los anteriores se ignoran y el
+# rastreador se reconstruye desde los snapshots.
+TRACKER_CHECKPOINT_VERSION = 1
+
+_DATETIME_TAG = "__datetime__"
+
 
 @dataclass
 class SnapshotRecord:
@@ -72,6 +83,95 @@ class Anomaly:
     metadata: dict[str, Any]
 
 
+class _RunningMoments:
+    """Welford running count, mean and M2, with exact reverse updates.
+
+    Conteo, media y M2 acumulados al estilo Welford, con reversión exacta.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def pop(self, value: float) -> None:
+        """Undo a previous `push(value)`. / Deshace un `push(value)` previo."""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        previous_mean = (self.count * self.mean - value) / (self.count - 1)
+        self.m2 = max(self.m2 - (value - previous_mean) * (value - self.mean), 0.0)
+        self.mean = previous_mean
+        self.count -= 1
+
+    def copy(self) -> "_RunningMoments":
+        clone = _RunningMoments()
+        clone.count, clone.mean, clone.m2 = self.count, self.mean, self.m2
+        return clone
+
+    def variance(self, ddof: int = 0) -> float:
+        return self.m2 / max(self.count - ddof, 1)
+
+
+class _RunningCovariance:
+    """Bivariate Welford accumulator: both moments plus the co-moment.
+
+    Acumulador Welford bivariado: momentos de ambas series y co-momento.
+    Sirve para la autocorrelación lag-1 (pares consecutivos) y para la
+    tendencia lineal (pares índice/valor).
+    """
+
+    __slots__ = ("x", "y", "co_moment")
+
+    def __init__(self) -> None:
+        self.x = _RunningMoments()
+        self.y = _RunningMoments()
+        self.co_moment = 0.0
+
+    def push(self, x_value: float, y_value: float) -> None:
+        x_delta = x_value - self.x.mean
+        self.x.push(x_value)
+        self.y.push(y_value)
+        self.co_moment += x_delta * (y_value - self.y.mean)
+
+    def correlation(self) -> float:
+        denominator = sqrt(self.x.m2 * self.y.m2)
+        if denominator == 0:
+            return 0.0
+        return float(self.co_moment / denominator)
+
+
+class _InjectionWindow:
+    """Running statistics over the current progressive-injection window.
+
+    Estadísticas acumuladas de la ventana actual de inyección progresiva.
+    """
+
+    __slots__ = ("deltas", "lag_pairs", "last_delta", "candidate_net")
+
+    def __init__(self) -> None:
+        self.deltas = _RunningMoments()
+        self.lag_pairs = _RunningCovariance()
+        self.last_delta: float | None = None
+        self.candidate_net: dict[str, int] = {}
+
+    def push(self, delta_total: float, delta_by_candidate: dict[str, int]) -> None:
+        if self.last_delta is not None:
+            self.lag_pairs.push(self.last_delta, delta_total)
+        self.last_delta = delta_total
+        self.deltas.push(delta_total)
+        for candidate, delta in delta_by_candidate.items():
+            self.candidate_net[candidate] = self.candidate_net.get(candidate, 0) + int(delta)
+
+
 class InconsistentActsTracker:
     """Track, isolate, and audit votes entering via inconsistent-act resolutions.
 
@@ -108,10 +208,19 @@ class InconsistentActsTracker:
         run_test_pvalue_threshold: float = 0.05,
         max_resolution_rate: float | None = None,
         blackout_gap_minutes: int | None = None,
+        recompute_statistics: bool = False,
     ) -> None:
         """Initialize tracker with persistent key detection and thresholds.
 
         Inicializa el rastreador con detección persistente de clave y umbrales.
+
+        Los detectores leen acumuladores que `load_snapshot` actualiza por
+        evento, así que los umbrales se fijan al construir. Con
+        ``recompute_statistics`` cada detector recalcula todo desde
+        ``self.events``/``self.snapshots`` (modo de validación). / Detectors
+        read accumulators updated per event by `load_snapshot`, so thresholds
+        are fixed at construction. ``recompute_statistics`` makes every
+        detector recompute from the full history instead (validation mode).
         """
         self.config_path = Path(config_path)
         self.runtime_config_path = Path(runtime_config_path)
@@ -147,7 +256,9 @@ class InconsistentActsTracker:
         self.stagnation_cycles = 0
         self.injection_history: list[dict[str, Any]] = []
         self.realtime_alerts: list[dict[str, Any]] = []
+        self.recompute_statistics = recompute_statistics
         self.logger = logging.getLogger(__name__)
+        self._reset_accumulators()
 
     def load_snapshot(self, json_data: dict, timestamp: datetime) -> None:
         """Load one JSON snapshot and classify vote deltas by layer.
@@ -170,9 +281,7 @@ class InconsistentActsTracker:
 
         inconsistent_count = self._extract_inconsistent_count(json_data, self.detected_inconsistent_key)
         candidate_votes = self._extract_candidate_votes(json_data)
-        source_hash = hashlib.sha256(
-            json.dumps(json_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
-        ).hexdigest()
+        source_hash = canonical_sha256(json_data, compact=False)
 
         snapshot = SnapshotRecord(
             timestamp=timestamp,
@@ -188,6 +297,7 @@ class InconsistentActsTracker:
         previous = self.snapshots[-1]
         self.snapshots.append(snapshot)
         change = self.analyze_change(previous)
+        self._accumulate_snapshot_pair(previous, snapshot)
 
         # English/Español: classify votes strictly on the resolution boundary / clasificar votos estrictamente en la frontera de resolución.
         if change.delta_actas > 0:
@@ -198,6 +308,7 @@ class InconsistentActsTracker:
                 self.normal_votes[candidate] = self.normal_votes.get(candidate, 0) + delta
 
         self.events.append(change)
+        self._accumulate_event(change, len(self.events) - 1)
 
         delta_total = change.impacted_total_votes
         if inconsistent_count > self.high_inconsistent_threshold and delta_total < self.progressive_injection_threshold:
@@ -210,6 +321,7 @@ class InconsistentActsTracker:
                     "inconsistent_count_en_ese_momento": inconsistent_count,
                 }
             )
+            self._injection_window.push(float(delta_total), change.delta_votos_por_candidato)
 
             if len(self.injection_history) >= self.min_consecutive_injections:
                 progressive = self.detect_progressive_injection()
@@ -219,6 +331,7 @@ class InconsistentActsTracker:
         else:
             # English/Español: only consecutive windows count / solo cuentan ventanas consecutivas.
             self.injection_history.clear()
+            self._injection_window = _InjectionWindow()
 
     def detect_progressive_injection(self) -> dict[str, Any] | None:
         """Detect sustained low-delta injections under high inconsistency backlog.
@@ -228,13 +341,16 @@ class InconsistentActsTracker:
         if len(self.injection_history) < self.min_consecutive_injections:
             return None
 
-        candidate_net: dict[str, int] = {}
         deltas = [float(item["delta_total"]) for item in self.injection_history]
-        for item in self.injection_history:
-            for candidate, delta in item["delta_por_candidato"].items():
-                candidate_net[candidate] = candidate_net.get(candidate, 0) + int(delta)
-
-        stats = self.run_injection_statistical_tests(deltas)
+        if self.recompute_statistics:
+            candidate_net: dict[str, int] = {}
+            for item in self.injection_history:
+                for candidate, delta in item["delta_por_candidato"].items():
+                    candidate_net[candidate] = candidate_net.get(candidate, 0) + int(delta)
+            stats = self.run_injection_statistical_tests(deltas)
+        else:
+            candidate_net = dict(self._injection_window.candidate_net)
+            stats = self._injection_statistics(deltas, self._injection_window)
         statistically_unlikely = bool(
             stats["improbable"]
             or stats["autocorrelation_lag1"] > 0.5
@@ -264,6 +380,17 @@ class InconsistentActsTracker:
 
         Ejecuta pruebas de improbabilidad sobre deltas de inyección progresiva.
         """
+        window = _InjectionWindow()
+        for delta in deltas:
+            window.push(float(delta), {})
+        return self._injection_statistics(deltas, window)
+
+    def _injection_statistics(self, deltas: list[float], window: _InjectionWindow) -> dict[str, float | bool]:
+        """Injection tests reading mean, variance and lag-1 sums from ``window``.
+
+        Pruebas de inyección que leen media, varianza y sumas lag-1 de
+        ``window``; solo el test de runs (mediana) recorre ``deltas``.
+        """
         if not deltas:
             return {
                 "z_score_acumulado": 0.0,
@@ -274,14 +401,12 @@ class InconsistentActsTracker:
                 "improbable": False,
             }
 
-        historical = [float(event.impacted_total_votes) for event in self.events if event.impacted_total_votes > 0]
-        baseline = historical[: -len(deltas)] if len(historical) > len(deltas) else historical
-        if len(baseline) < 2:
-            baseline = deltas
+        baseline = self._injection_baseline(len(deltas))
+        if baseline.count < 2:
+            baseline = window.deltas
 
-        baseline_mean = sum(baseline) / len(baseline)
-        baseline_var = sum((value - baseline_mean) ** 2 for value in baseline) / max(len(baseline) - 1, 1)
-        baseline_sigma = sqrt(max(baseline_var, 1e-9))
+        baseline_mean = baseline.mean
+        baseline_sigma = sqrt(max(baseline.variance(ddof=1), 1e-9))
 
         # English/Español: cumulative z-score against dynamic baseline / z-score acumulado contra línea base dinámica.
         observed_sum = sum(deltas)
@@ -290,8 +415,13 @@ class InconsistentActsTracker:
         z_pvalue = float(2 * (1 - norm.cdf(abs(z_score))))
 
         run_pvalue = self._runs_test_pvalue(deltas)
-        autocorr = self._autocorrelation_lag1(deltas)
-        deltas_variance = sum((value - (sum(deltas) / len(deltas))) ** 2 for value in deltas) / max(len(deltas) - 1, 1)
+        if self.recompute_statistics:
+            autocorr = self._autocorrelation_lag1(deltas)
+            deltas_mean = sum(deltas) / len(deltas)
+            deltas_variance = sum((value - deltas_mean) ** 2 for value in deltas) / max(len(deltas) - 1, 1)
+        else:
+            autocorr = window.lag_pairs.correlation()
+            deltas_variance = window.deltas.variance(ddof=1)
         # English/Español: near-zero variance in consecutive micro-deltas is itself non-random / varianza casi cero en micro-deltas consecutivos ya es no aleatoria.
         improbable = bool(
             z_pvalue < 0.01
@@ -308,6 +438,26 @@ class InconsistentActsTracker:
             "improbable": improbable,
         }
 
+    def _injection_baseline(self, window_size: int) -> _RunningMoments:
+        """Moments of positive event deltas, excluding the latest ``window_size``.
+
+        Momentos de los deltas positivos por evento sin los últimos
+        ``window_size`` (si quedan menos, se usan todos).
+        """
+        if self.recompute_statistics:
+            historical = [float(event.impacted_total_votes) for event in self.events if event.impacted_total_votes > 0]
+            baseline = historical[:-window_size] if len(historical) > window_size else historical
+            moments = _RunningMoments()
+            for value in baseline:
+                moments.push(value)
+            return moments
+
+        moments = self._positive_deltas.copy()
+        if len(self._positive_delta_values) > window_size:
+            for value in reversed(self._positive_delta_values[-window_size:]):
+                moments.pop(value)
+        return moments
+
     def detect_resolution_velocity_anomalies(self) -> list[dict[str, Any]]:
         """Detect resolutions that exceed the maximum plausible rate (actas/minute).
 
@@ -316,35 +466,43 @@ class InconsistentActsTracker:
         verificación de firmas, cotejo con copias de partidos. Tasas superiores a
         ~2-3 actas/minuto por mesa son físicamente implausibles para un proceso humano.
         """
+        if not self.recompute_statistics:
+            return list(self._velocity_anomalies)
         anomalies: list[dict[str, Any]] = []
         for i in range(1, len(self.snapshots)):
-            prev = self.snapshots[i - 1]
-            curr = self.snapshots[i]
-            delta_actas = max(prev.inconsistent_count - curr.inconsistent_count, 0)
-            if delta_actas == 0:
-                continue
-            elapsed_seconds = (curr.timestamp - prev.timestamp).total_seconds()
-            if elapsed_seconds <= 0:
-                continue
-            elapsed_minutes = elapsed_seconds / 60.0
-            rate = delta_actas / elapsed_minutes
-            if rate > self.max_resolution_rate:
-                anomalies.append(
-                    {
-                        "timestamp": curr.timestamp,
-                        "delta_actas": delta_actas,
-                        "elapsed_minutes": round(elapsed_minutes, 2),
-                        "rate_per_minute": round(rate, 2),
-                        "threshold": self.max_resolution_rate,
-                        "description": (
-                            f"Velocidad de resolución anómala: {rate:.1f} actas/min "
-                            f"({delta_actas} actas en {elapsed_minutes:.1f} min). "
-                            f"Umbral plausible: {self.max_resolution_rate} actas/min."
-                        ),
-                    }
-                )
+            anomaly = self._velocity_anomaly(self.snapshots[i - 1], self.snapshots[i])
+            if anomaly is not None:
+                anomalies.append(anomaly)
         return anomalies
 
+    def _velocity_anomaly(self, prev: SnapshotRecord, curr: SnapshotRecord) -> dict[str, Any] | None:
+        """Velocity anomaly between two consecutive snapshots, if any.
+
+        Anomalía de velocidad entre dos snapshots consecutivos, si la hay.
+        """
+        delta_actas = max(prev.inconsistent_count - curr.inconsistent_count, 0)
+        if delta_actas == 0:
+            return None
+        elapsed_seconds = (curr.timestamp - prev.timestamp).total_seconds()
+        if elapsed_seconds <= 0:
+            return None
+        elapsed_minutes = elapsed_seconds / 60.0
+        rate = delta_actas / elapsed_minutes
+        if rate <= self.max_resolution_rate:
+            return None
+        return {
+            "timestamp": curr.timestamp,
+            "delta_actas": delta_actas,
+            "elapsed_minutes": round(elapsed_minutes, 2),
+            "rate_per_minute": round(rate, 2),
+            "threshold": self.max_resolution_rate,
+            "description": (
+                f"Velocidad de resolución anómala: {rate:.1f} actas/min "
+                f"({delta_actas} actas en {elapsed_minutes:.1f} min). "
+                f"Umbral plausible: {self.max_resolution_rate} actas/min."
+            ),
+        }
+
     def detect_asymmetric_benefit(self) -> dict[str, Any] | None:
         """Detect disproportionate benefit to one candidate in special scrutiny.
 
@@ -420,6 +578,8 @@ class InconsistentActsTracker:
         patterns: list[dict[str, Any]] = []
         if len(self.events) < 2:
             return patterns
+        if not self.recompute_statistics:
+            return list(self._hold_release_patterns)
 
         stagnation_start: int | None = None
         stagnation_count = 0
@@ -465,6 +625,9 @@ class InconsistentActsTracker:
         Los datos electorales reales siguen la distribución de Benford para el primer
         dígito. Datos fabricados o manipulados tienden a desviarse significativamente.
         """
+        if not self.recompute_statistics:
+            return self._benford_result(list(self._benford_observed))
+
         resolution_vote_deltas: list[int] = []
         for event in self.events:
             if event.delta_actas > 0:
@@ -480,14 +643,19 @@ class InconsistentActsTracker:
             if value > 0:
                 digits.append(int(str(abs(value))[0]))
 
-        if len(digits) < 10:
-            return None
-
         observed = [0] * 9
         for d in digits:
             observed[d - 1] += 1
+        return self._benford_result(observed)
+
+    def _benford_result(self, observed: list[int]) -> dict[str, Any] | None:
+        """Chi-square Benford test over a first-digit histogram (digits 1-9).
 
-        n = len(digits)
+        Prueba χ² de Benford sobre un histograma de primer dígito (1-9).
+        """
+        n = sum(observed)
+        if n < 10:
+            return None
         expected = [n * log10(1 + 1 / d) for d in range(1, 10)]
 
         chi_result = chisquare(observed, f_exp=expected)
@@ -527,66 +695,66 @@ class InconsistentActsTracker:
         Si después del gap la tendencia de un candidato cambia significativamente,
         esto indica que durante el apagón se alteraron datos.
         """
+        if not self.recompute_statistics:
+            return list(self._blackout_windows)
         blackouts: list[dict[str, Any]] = []
-        if len(self.snapshots) < 2:
-            return blackouts
-
-        gap_threshold = timedelta(minutes=self.blackout_gap_minutes)
-
         for i in range(1, len(self.snapshots)):
-            prev = self.snapshots[i - 1]
-            curr = self.snapshots[i]
-            gap = curr.timestamp - prev.timestamp
+            blackout = self._blackout_window(self.snapshots[i - 1], self.snapshots[i])
+            if blackout is not None:
+                blackouts.append(blackout)
+        return blackouts
 
-            if gap < gap_threshold:
-                continue
+    def _blackout_window(self, prev: SnapshotRecord, curr: SnapshotRecord) -> dict[str, Any] | None:
+        """Blackout window between two consecutive snapshots, if any.
 
-            # Calcular proporciones antes y después del gap.
-            pre_total = sum(prev.candidate_votes.values())
-            post_total = sum(curr.candidate_votes.values())
-            if pre_total == 0 or post_total == 0:
-                continue
+        Ventana de apagón entre dos snapshots consecutivos, si la hay.
+        """
+        gap = curr.timestamp - prev.timestamp
+        if gap < timedelta(minutes=self.blackout_gap_minutes):
+            return None
 
-            pre_props = {c: v / pre_total for c, v in prev.candidate_votes.items()}
-            post_props = {c: v / post_total for c, v in curr.candidate_votes.items()}
+        # Calcular proporciones antes y después del gap.
+        pre_total = sum(prev.candidate_votes.values())
+        post_total = sum(curr.candidate_votes.values())
+        if pre_total == 0 or post_total == 0:
+            return None
 
-            trend_shifts: dict[str, float] = {}
-            for candidate in sorted(set(pre_props) | set(post_props)):
-                shift = post_props.get(candidate, 0.0) - pre_props.get(candidate, 0.0)
-                if abs(shift) > 0.005:
-                    trend_shifts[candidate] = round(shift * 100, 3)
+        pre_props = {c: v / pre_total for c, v in prev.candidate_votes.items()}
+        post_props = {c: v / post_total for c, v in curr.candidate_votes.items()}
 
-            delta_inconsistent = prev.inconsistent_count - curr.inconsistent_count
-            delta_votes = {
-                c: curr.candidate_votes.get(c, 0) - prev.candidate_votes.get(c, 0)
-                for c in sorted(set(prev.candidate_votes) | set(curr.candidate_votes))
-            }
+        trend_shifts: dict[str, float] = {}
+        for candidate in sorted(set(pre_props) | set(post_props)):
+            shift = post_props.get(candidate, 0.0) - pre_props.get(candidate, 0.0)
+            if abs(shift) > 0.005:
+                trend_shifts[candidate] = round(shift * 100, 3)
 
-            blackouts.append(
-                {
-                    "gap_start": prev.timestamp,
-                    "gap_end": curr.timestamp,
-                    "gap_minutes": round(gap.total_seconds() / 60, 1),
-                    "inconsistent_before": prev.inconsistent_count,
-                    "inconsistent_after": curr.inconsistent_count,
-                    "delta_inconsistent": delta_inconsistent,
-                    "delta_votes": delta_votes,
-                    "trend_shifts_pp": trend_shifts,
-                    "description": (
-                        f"Apagón comunicacional de {gap.total_seconds() / 60:.0f} min "
-                        f"({prev.timestamp} → {curr.timestamp}). "
-                        f"AI: {prev.inconsistent_count} → {curr.inconsistent_count} "
-                        f"(Δ={delta_inconsistent}). "
-                        + (
-                            "Cambios de tendencia: " + ", ".join(f"{c}: {s:+.3f}pp" for c, s in trend_shifts.items())
-                            if trend_shifts
-                            else "Sin cambio de tendencia significativo."
-                        )
-                    ),
-                }
-            )
+        delta_inconsistent = prev.inconsistent_count - curr.inconsistent_count
+        delta_votes = {
+            c: curr.candidate_votes.get(c, 0) - prev.candidate_votes.get(c, 0)
+            for c in sorted(set(prev.candidate_votes) | set(curr.candidate_votes))
+        }
 
-        return blackouts
+        return {
+            "gap_start": prev.timestamp,
+            "gap_end": curr.timestamp,
+            "gap_minutes": round(gap.total_seconds() / 60, 1),
+            "inconsistent_before": prev.inconsistent_count,
+            "inconsistent_after": curr.inconsistent_count,
+            "delta_inconsistent": delta_inconsistent,
+            "delta_votes": delta_votes,
+            "trend_shifts_pp": trend_shifts,
+            "description": (
+                f"Apagón comunicacional de {gap.total_seconds() / 60:.0f} min "
+                f"({prev.timestamp} → {curr.timestamp}). "
+                f"AI: {prev.inconsistent_count} → {curr.inconsistent_count} "
+                f"(Δ={delta_inconsistent}). "
+                + (
+                    "Cambios de tendencia: " + ", ".join(f"{c}: {s:+.3f}pp" for c, s in trend_shifts.items())
+                    if trend_shifts
+                    else "Sin cambio de tendencia significativo."
+                )
+            ),
+        }
 
     def analyze_change(self, previous_snapshot: SnapshotRecord | dict[str, Any]) -> ChangeEvent:
         """Analyze delta between previous snapshot and latest loaded snapshot.
@@ -758,62 +926,42 @@ class InconsistentActsTracker:
         hold-and-release, Benford, y apagones comunicacionales.
         """
         anomalies: list[Anomaly] = []
-        special_deltas = [event.impacted_total_votes for event in self.events if event.delta_actas > 0]
-
-        if len(special_deltas) >= 2:
-            mean_delta = sum(special_deltas) / len(special_deltas)
-            variance = sum((value - mean_delta) ** 2 for value in special_deltas) / len(special_deltas)
-            sigma = sqrt(variance)
-            threshold = mean_delta + (3 * sigma)
-            for event in self.events:
-                if event.delta_actas > 0 and event.impacted_total_votes > threshold:
-                    anomalies.append(
-                        Anomaly(
-                            kind="vote_outlier_3sigma",
-                            severity="critical",
-                            message="Special scrutiny vote delta exceeds 3σ threshold.",
-                            timestamp=event.timestamp,
-                            metadata={
-                                "delta_votes": event.impacted_total_votes,
-                                "threshold": threshold,
-                            },
-                        )
-                    )
-
-        for event in self.events:
-            if event.delta_actas > 0:
-                prev = max(event.previous_inconsistent_count, 1)
-                ratio = event.delta_actas / prev
-                if ratio >= self.high_impact_resolution_ratio:
-                    anomalies.append(
-                        Anomaly(
-                            kind="high_impact_resolution",
-                            severity="critical",
-                            message="Resolution exceeded 10% of pending inconsistent acts in one cycle.",
-                            timestamp=event.timestamp,
-                            metadata={"ratio": ratio, "delta_actas": event.delta_actas},
-                        )
-                    )
-            if event.is_bulk_resolution:
-                anomalies.append(
-                    Anomaly(
-                        kind="bulk_resolution",
-                        severity="critical",
-                        message="Bulk resolution threshold reached.",
-                        timestamp=event.timestamp,
-                        metadata={"delta_actas": event.delta_actas},
-                    )
-                )
-            if event.stagnation_cycles >= self.prolonged_stagnation_cycles:
-                anomalies.append(
-                    Anomaly(
-                        kind="prolonged_stagnation",
-                        severity="warning",
-                        message="Inconsistent count stagnated for over 1 hour.",
-                        timestamp=event.timestamp,
-                        metadata={"stagnation_cycles": event.stagnation_cycles},
-                    )
+        if self.recompute_statistics:
+            special_deltas = [event.impacted_total_votes for event in self.events if event.delta_actas > 0]
+            outliers: list[ChangeEvent] = []
+            if len(special_deltas) >= 2:
+                mean_delta = sum(special_deltas) / len(special_deltas)
+                variance = sum((value - mean_delta) ** 2 for value in special_deltas) / len(special_deltas)
+                threshold = mean_delta + (3 * sqrt(variance))
+                outliers = [
+                    event for event in self.events if event.delta_actas > 0 and event.impacted_total_votes > threshold
+                ]
+            per_event = [anomaly for event in self.events for anomaly in self._event_anomalies_for(event)]
+        else:
+            special = self._special_trend.y
+            outliers = []
+            if special.count >= 2:
+                threshold = special.mean + (3 * sqrt(special.variance()))
+                # English/Español: deltas are kept sorted, so outliers are a suffix /
+                # los deltas se guardan ordenados: los outliers son un sufijo.
+                above = self._special_deltas_ranked[bisect_right(self._special_deltas_ranked, (threshold, inf)) :]
+                outliers = [self.events[index] for index in sorted(index for _, index in above)]
+            per_event = self._event_anomalies
+
+        for event in outliers:
+            anomalies.append(
+                Anomaly(
+                    kind="vote_outlier_3sigma",
+                    severity="critical",
+                    message="Special scrutiny vote delta exceeds 3σ threshold.",
+                    timestamp=event.timestamp,
+                    metadata={
+                        "delta_votes": event.impacted_total_votes,
+                        "threshold": threshold,
+                    },
                 )
+            )
+        anomalies.extend(per_event)
 
         stats = self.run_statistical_tests()
         if stats.get("status") == "ok":
@@ -919,6 +1067,47 @@ class InconsistentActsTracker:
 
         return anomalies
 
+    def _event_anomalies_for(self, event: ChangeEvent) -> list[Anomaly]:
+        """Anomalies that depend on a single event (impact, bulk, stagnation).
+
+        Anomalías que dependen de un solo evento (impacto, masiva, estancamiento).
+        """
+        anomalies: list[Anomaly] = []
+        if event.delta_actas > 0:
+            prev = max(event.previous_inconsistent_count, 1)
+            ratio = event.delta_actas / prev
+            if ratio >= self.high_impact_resolution_ratio:
+                anomalies.append(
+                    Anomaly(
+                        kind="high_impact_resolution",
+                        severity="critical",
+                        message="Resolution exceeded 10% of pending inconsistent acts in one cycle.",
+                        timestamp=event.timestamp,
+                        metadata={"ratio": ratio, "delta_actas": event.delta_actas},
+                    )
+                )
+        if event.is_bulk_resolution:
+            anomalies.append(
+                Anomaly(
+                    kind="bulk_resolution",
+                    severity="critical",
+                    message="Bulk resolution threshold reached.",
+                    timestamp=event.timestamp,
+                    metadata={"delta_actas": event.delta_actas},
+                )
+            )
+        if event.stagnation_cycles >= self.prolonged_stagnation_cycles:
+            anomalies.append(
+                Anomaly(
+                    kind="prolonged_stagnation",
+                    severity="warning",
+                    message="Inconsistent count stagnated for over 1 hour.",
+                    timestamp=event.timestamp,
+                    metadata={"stagnation_cycles": event.stagnation_cycles},
+                )
+            )
+        return anomalies
+
     def generate_forensic_report(self) -> str:
         """Generate markdown+LaTeX forensic report with source JSON hashes.
 
@@ -1089,6 +1278,196 @@ z = \frac{\hat{p}_{special} - \hat{p}_{normal}}{\sqrt{\hat{p}(1-\hat{p})(\frac{1
                 lines.append("- Sin cambio de tendencia significativo")
         return "\n".join(lines)
 
+    def save_checkpoint(self, path: str | Path, *, watermark: dict[str, Any] | None = None) -> None:
+        """Persist accumulated state as a versioned, checksummed checkpoint.
+
+        Persiste el estado acumulado como checkpoint versionado con checksum.
+        `watermark` lo define el llamador (p. ej. el último snapshot cargado).
+        """
+        envelope = {
+            "version": TRACKER_CHECKPOINT_VERSION,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "watermark": _encode_checkpoint_value(watermark or {}),
+            "params": self._checkpoint_params(),
+            "state": {
+                "detected_inconsistent_key": self.detected_inconsistent_key,
+                "snapshots": [_encode_checkpoint_value(asdict(item)) for item in self.snapshots],
+                "events": [_encode_checkpoint_value(asdict(item)) for item in self.events],
+                "normal_votes": self.normal_votes,
+                "special_scrutiny_votes": self.special_scrutiny_votes,
+                "stagnation_cycles": self.stagnation_cycles,
+                "injection_history": _encode_checkpoint_value(self.injection_history),
+                "realtime_alerts": _encode_checkpoint_value(self.realtime_alerts),
+            },
+        }
+        envelope["checksum"] = _checkpoint_checksum(envelope)
+
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.tmp")
+        tmp_path.write_text(json.dumps(envelope, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(target)
+
+    def load_checkpoint(self, path: str | Path) -> dict[str, Any] | None:
+        """Restore state from a checkpoint; return its watermark or None if unusable.
+
+        Restaura el estado desde un checkpoint; devuelve su watermark o None si
+        no existe, está corrupto, es de otra versión o de otros umbrales. En
+        ese caso el rastreador queda intacto.
+        """
+        checkpoint_path = Path(path)
+        if not checkpoint_path.exists():
+            return None
+        try:
+            envelope = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+            if envelope.get("version") != TRACKER_CHECKPOINT_VERSION:
+                self.logger.warning("tracker_checkpoint_version_mismatch path=%s", checkpoint_path)
+                return None
+            payload = {key: value for key, value in envelope.items() if key != "checksum"}
+            if _checkpoint_checksum(payload) != envelope.get("checksum"):
+                self.logger.warning("tracker_checkpoint_checksum_mismatch path=%s", checkpoint_path)
+                return None
+            if envelope.get("params") != self._checkpoint_params():
+                self.logger.info("tracker_checkpoint_params_changed path=%s", checkpoint_path)
+                return None
+            state = envelope["state"]
+            snapshots = [SnapshotRecord(**_decode_checkpoint_value(item)) for item in state["snapshots"]]
+            events = [ChangeEvent(**_decode_checkpoint_value(item)) for item in state["events"]]
+            injection_history = _decode_checkpoint_value(state["injection_history"])
+            realtime_alerts = _decode_checkpoint_value(state["realtime_alerts"])
+            normal_votes = {str(k): int(v) for k, v in state["normal_votes"].items()}
+            special_votes = {str(k): int(v) for k, v in state["special_scrutiny_votes"].items()}
+            stagnation_cycles = int(state["stagnation_cycles"])
+            watermark = _decode_checkpoint_value(envelope.get("watermark") or {})
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            self.logger.warning("tracker_checkpoint_unreadable path=%s error=%s", checkpoint_path, exc)
+            return None
+
+        key = state.get("detected_inconsistent_key")
+        if key is not None and key != self.detected_inconsistent_key:
+            self.detected_inconsistent_key = key
+            self._persist_key(key)
+        self.snapshots = snapshots
+        self.events = events
+        self.normal_votes = normal_votes
+        self.special_scrutiny_votes = special_votes
+        self.stagnation_cycles = stagnation_cycles
+        self.injection_history = injection_history
+        self.realtime_alerts = realtime_alerts
+        self._rebuild_accumulators()
+        return watermark
+
+    def _reset_accumulators(self) -> None:
+        """Clear the running statistics that back the detectors.
+
+        Limpia las estadísticas acumuladas que alimentan a los detectores.
+        """
+        # (índice de resolución, delta de votos): y = deltas especiales, para
+        # 3σ y la tendencia lineal / (resolution ordinal, vote delta).
+        self._special_trend = _RunningCovariance()
+        # (delta, índice de evento) ordenado, para extraer outliers 3σ.
+        self._special_deltas_ranked: list[tuple[int, int]] = []
+        # Deltas positivos de cualquier evento: línea base de inyección.
+        self._positive_deltas = _RunningMoments()
+        self._positive_delta_values: list[float] = []
+        self._benford_observed = [0] * 9
+        self._event_anomalies: list[Anomaly] = []
+        self._velocity_anomalies: list[dict[str, Any]] = []
+        self._blackout_windows: list[dict[str, Any]] = []
+        self._hold_release_patterns: list[dict[str, Any]] = []
+        self._stagnation_run_start: int | None = None
+        self._stagnation_run_count = 0
+        self._injection_window = _InjectionWindow()
+
+    def _rebuild_accumulators(self) -> None:
+        """Replay stored snapshots, events and injection window into fresh accumulators.
+
+        Reconstruye los acumuladores desde snapshots, eventos y ventana de inyección.
+        """
+        self._reset_accumulators()
+        for prev, curr in zip(self.snapshots, self.snapshots[1:]):
+            self._accumulate_snapshot_pair(prev, curr)
+        for index, event in enumerate(self.events):
+            self._accumulate_event(event, index)
+        for item in self.injection_history:
+            self._injection_window.push(float(item["delta_total"]), item["delta_por_candidato"])
+
+    def _accumulate_snapshot_pair(self, prev: SnapshotRecord, curr: SnapshotRecord) -> None:
+        """Fold one consecutive snapshot pair into velocity and blackout results.
+
+        Incorpora un par de snapshots consecutivos a velocidad y apagones.
+        """
+        velocity = self._velocity_anomaly(prev, curr)
+        if velocity is not None:
+            self._velocity_anomalies.append(velocity)
+        blackout = self._blackout_window(prev, curr)
+        if blackout is not None:
+            self._blackout_windows.append(blackout)
+
+    def _accumulate_event(self, event: ChangeEvent, index: int) -> None:
+        """Fold ``self.events[index]`` into the running statistics.
+
+        Incorpora ``self.events[index]`` a las estadísticas acumuladas.
+        """
+        impacted = event.impacted_total_votes
+        if impacted > 0:
+            self._positive_deltas.push(float(impacted))
+            self._positive_delta_values.append(float(impacted))
+        if event.delta_actas > 0:
+            self._special_trend.push(float(self._special_trend.y.count), float(impacted))
+            insort(self._special_deltas_ranked, (impacted, index))
+            for delta in event.delta_votos_por_candidato.values():
+                if delta > 0:
+                    self._benford_observed[int(str(delta)[0]) - 1] += 1
+        self._event_anomalies.extend(self._event_anomalies_for(event))
+
+        # English/Español: hold-and-release state machine, one step per event /
+        # máquina de estados retener-y-soltar, un paso por evento.
+        if event.event_type in ("stagnation", "no_change"):
+            if self._stagnation_run_start is None:
+                self._stagnation_run_start = index
+            self._stagnation_run_count += 1
+            return
+        stagnation_count = self._stagnation_run_count
+        if stagnation_count >= self.stagnation_cycles_threshold and event.delta_actas > 0 and event.is_bulk_resolution:
+            stag_start_ts = (
+                self.events[self._stagnation_run_start].timestamp
+                if self._stagnation_run_start is not None
+                else event.timestamp
+            )
+            self._hold_release_patterns.append(
+                {
+                    "stagnation_start": stag_start_ts,
+                    "stagnation_cycles": stagnation_count,
+                    "release_timestamp": event.timestamp,
+                    "released_actas": event.delta_actas,
+                    "released_votes": event.impacted_total_votes,
+                    "vote_distribution": dict(event.pct_por_candidato),
+                    "description": (
+                        f"Patrón hold-and-release: {stagnation_count} ciclos de estancamiento "
+                        f"seguidos de resolución masiva de {event.delta_actas} actas "
+                        f"({event.impacted_total_votes} votos) en {event.timestamp}."
+                    ),
+                }
+            )
+        self._stagnation_run_start = None
+        self._stagnation_run_count = 0
+
+    def _checkpoint_params(self) -> dict[str, Any]:
+        """Thresholds that shape accumulated state; a change invalidates checkpoints.
+
+        Umbrales que determinan el estado acumulado; si cambian, el checkpoint
+        se invalida.
+        """
+        return {
+            "bulk_resolution_threshold": self.bulk_resolution_threshold,
+            "stagnation_cycles_threshold": self.stagnation_cycles_threshold,
+            "progressive_injection_threshold": self.progressive_injection_threshold,
+            "min_consecutive_injections": self.min_consecutive_injections,
+            "high_inconsistent_threshold": self.high_inconsistent_threshold,
+            "run_test_pvalue_threshold": self.run_test_pvalue_threshold,
+        }
+
     def _load_runtime_config(self) -> dict[str, Any]:
         """Load optional runtime thresholds from config.json.
 
@@ -1306,6 +1685,16 @@ z = \frac{\hat{p}_{special} - \hat{p}_{normal}}{\sqrt{\hat{p}(1-\hat{p})(\frac{1
 
         Calcula tendencia lineal sobre deltas por evento de escrutinio especial.
         """
+        if not self.recompute_statistics:
+            trend = self._special_trend
+            n = trend.y.count
+            if n < 2:
+                return {"slope": 0.0, "intercept": self._special_deltas_ranked[0][0] if n else 0.0, "r2": 0.0}
+            slope = trend.co_moment / trend.x.m2
+            intercept = trend.y.mean - slope * trend.x.mean
+            r2 = trend.co_moment**2 / (trend.x.m2 * trend.y.m2) if trend.y.m2 else 0.0
+            return {"slope": slope, "intercept": intercept, "r2": r2}
+
         y_values = [event.impacted_total_votes for event in self.events if event.delta_actas > 0]
         n = len(y_values)
         if n < 2:
@@ -1364,3 +1753,40 @@ z = \frac{\hat{p}_{special} - \hat{p}_{normal}}{\sqrt{\hat{p}(1-\hat{p})(\frac{1
         if denominator == 0:
             return 0.0
         return float(numerator / denominator)
+
+
+def _encode_checkpoint_value(value: Any) -> Any:
+    """Make tracker state JSON-safe, tagging datetimes for a lossless round trip.
+
+    Convierte el estado a JSON etiquetando datetimes para un ida y vuelta exacto.
+    """
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, dict):
+        return {str(key): _encode_checkpoint_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_checkpoint_value(item) for item in value]
+    return value
+
+
+def _decode_checkpoint_value(value: Any) -> Any:
+    """Inverse of `_encode_checkpoint_value`.
+
+    Inversa de `_encode_checkpoint_value`.
+    """
+    if isinstance(value, dict):
+        if set(value) == {_DATETIME_TAG}:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        return {key: _decode_checkpoint_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_checkpoint_value(item) for item in value]
+    return value
+
+
+def _checkpoint_checksum(payload: dict[str, Any]) -> str:
+    """SHA-256 over the canonical JSON of a checkpoint (without its checksum).
+
+    SHA-256 sobre el JSON canónico del checkpoint (sin su checksum).
+    """
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
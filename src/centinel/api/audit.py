@@ -37,7 +37,7 @@ from typing import Any, Callable, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from ..hasher import (
-    _SHA256_HEX_RE,
+    SHA256_HEX_RE,
     collect_snapshot_metadata,
     verify_hashchain_from_snapshots,
 )
@@ -49,7 +49,7 @@ router = APIRouter(prefix="/audit", tags=["audit"])
 _DEFAULT_SNAPSHOT_ROOT = Path("data") / "snapshots"
 
 
-def _resolve_snapshot_root() -> Path:
+def resolve_snapshot_root() -> Path:
     """Return the canonical snapshot directory for audit operations."""
     return _DEFAULT_SNAPSHOT_ROOT
 
@@ -61,12 +61,12 @@ def _resolve_snapshot_root() -> Path:
 # memoize it for a short TTL. Under a flood, callers get the last computed
 # result instead of hammering the filesystem. Stdlib-only, zero dependency.
 
-_CACHE_TTL_SECONDS = 15.0
+CACHE_TTL_SECONDS = 15.0
 _cache_lock = threading.Lock()
 _cache_store: Dict[str, tuple[float, Any]] = {}
 
 
-def _cached(key: str, ttl: float, producer: Callable[[], Any]) -> Any:
+def cached(key: str, ttl: float, producer: Callable[[], Any]) -> Any:
     """Return a cached value for `key` or compute+store it under lock."""
     now = time.monotonic()
     with _cache_lock:
@@ -99,9 +99,7 @@ def _serialize_entry(entry: Any) -> Dict[str, Any]:
         "path": _redact_path(entry.snapshot_dir),
         "expected_hash": entry.expected_hash,
         "previous_hash": entry.previous_hash,
-        "timestamp_utc": entry.timestamp.astimezone(timezone.utc).isoformat(
-            timespec="microseconds"
-        ),
+        "timestamp_utc": entry.timestamp.astimezone(timezone.utc).isoformat(timespec="microseconds"),
         "source_url": entry.metadata.get("source_url"),
         "software_version": entry.metadata.get("software_version"),
     }
@@ -115,7 +113,7 @@ def audit_health() -> Dict[str, Any]:
     external observers to confirm the deployment is reachable and exposes
     verifiable data before launching a full chain verification.
     """
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     return {
         "status": "ok",
         "subsystem": "audit",
@@ -130,6 +128,8 @@ def audit_health() -> Dict[str, Any]:
             "/audit/timeline",
             "/audit/snapshots/{date}",
             "/audit/proof/{hash}",
+            "/proofs/{hash}",
+            "/proofs/consistency",
         ],
         "no_auth_required": True,
         "data_license": "Public — CNE transparency law (Decreto 170-2006 Honduras)",
@@ -147,7 +147,7 @@ def audit_chain_verify() -> Dict[str, Any]:
     External auditors can run this against any deployment and compare the
     'last_valid_hash' across independent mirrors to detect divergence.
     """
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     if not snapshot_root.exists():
         return {
             "valid": True,
@@ -160,9 +160,9 @@ def audit_chain_verify() -> Dict[str, Any]:
             "note": "snapshot_root_missing — no data captured yet",
         }
     try:
-        result = _cached(
+        result = cached(
             "chain_verify",
-            _CACHE_TTL_SECONDS,
+            CACHE_TTL_SECONDS,
             lambda: verify_hashchain_from_snapshots(snapshot_root),
         )
     except Exception:
@@ -172,7 +172,7 @@ def audit_chain_verify() -> Dict[str, Any]:
     if result.get("broken_at_path") is not None:
         result["broken_at_path"] = _redact_path(result["broken_at_path"])
     result["verified_at_utc"] = datetime.now(timezone.utc).isoformat(timespec="microseconds")
-    result["cache_ttl_seconds"] = _CACHE_TTL_SECONDS
+    result["cache_ttl_seconds"] = CACHE_TTL_SECONDS
     return result
 
 
@@ -191,11 +191,11 @@ def audit_transparency(
     Bilingüe: ancla de transparencia externa. La raíz de Merkle en vivo
     contra el log público append-only detecta reescrituras silenciosas.
     """
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     if snapshot_root.exists():
-        entries = _cached(
+        entries = cached(
             "transparency_entries",
-            _CACHE_TTL_SECONDS,
+            CACHE_TTL_SECONDS,
             lambda: collect_snapshot_metadata(snapshot_root),
         )
         leaf_hashes = [e.expected_hash for e in entries]
@@ -240,25 +240,23 @@ def audit_degradation(
     from ..core.connectivity import read_degradation_log
 
     try:
-        log = _cached(
+        log = cached(
             "degradation_log",
-            _CACHE_TTL_SECONDS,
+            CACHE_TTL_SECONDS,
             lambda: read_degradation_log(),
         )
     except Exception:
         log = []
     if interference_only:
         log = [e for e in log if e.get("verdict", {}).get("is_interference_signal") is True]
-    interference_count = sum(
-        1 for e in log if e.get("verdict", {}).get("is_interference_signal") is True
-    )
+    interference_count = sum(1 for e in log if e.get("verdict", {}).get("is_interference_signal") is True)
     window = log[-limit:] if log else []
     return {
         "event_count": len(log),
         "interference_signal_count": interference_count,
         "events": window,
         "verified_at_utc": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
-        "cache_ttl_seconds": _CACHE_TTL_SECONDS,
+        "cache_ttl_seconds": CACHE_TTL_SECONDS,
         "note": (
             "is_interference_signal=true means the failure looked like a "
             "targeted cut, not the authority being down. Cross-check the "
@@ -277,7 +275,7 @@ def audit_timeline(
     Returns paginated metadata (no payload bodies) so auditors can scan the
     full timeline and request specific snapshots by hash via /audit/proof.
     """
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     if not snapshot_root.exists():
         return {
             "total": 0,
@@ -311,14 +309,12 @@ def audit_snapshots_by_day(day: str) -> Dict[str, Any]:
             detail="invalid_date_format — expected YYYY-MM-DD (UTC)",
         )
 
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     if not snapshot_root.exists():
         return {"date_utc": day, "count": 0, "entries": []}
 
     entries = collect_snapshot_metadata(snapshot_root)
-    matching = [
-        entry for entry in entries if entry.timestamp.astimezone(timezone.utc).date() == target
-    ]
+    matching = [entry for entry in entries if entry.timestamp.astimezone(timezone.utc).date() == target]
     return {
         "date_utc": day,
         "count": len(matching),
@@ -335,13 +331,13 @@ def audit_proof_for_hash(snapshot_hash: str) -> Dict[str, Any]:
     its predecessor in the chain (so the verifier can independently confirm
     the chained_hash by re-running compute_snapshot_hash locally).
     """
-    if not _SHA256_HEX_RE.match(snapshot_hash):
+    if not SHA256_HEX_RE.match(snapshot_hash):
         raise HTTPException(
             status_code=400,
             detail="invalid_hash_format — expected 64-char lowercase hex SHA-256",
         )
 
-    snapshot_root = _resolve_snapshot_root()
+    snapshot_root = resolve_snapshot_root()
     if not snapshot_root.exists():
         raise HTTPException(status_code=404, detail="snapshot_root_missing")
 
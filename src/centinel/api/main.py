@@ -13,10 +13,13 @@ Componentes detectados:
   - _env_int
   - _rules_rate_limit
   - get_connection
+  - read_connection
+  - invalidate_response_cache
   - _validate_table_name
   - fetch_latest_snapshot
   - fetch_snapshot_by_hash
   - verify_hashchain
+  - fetch_latest_per_department
   - load_alerts_payload
   - load_summaries_payload
   - get_latest_snapshot
@@ -39,10 +42,13 @@ Detected components:
   - _env_int
   - _rules_rate_limit
   - get_connection
+  - read_connection
+  - invalidate_response_cache
   - _validate_table_name
   - fetch_latest_snapshot
   - fetch_snapshot_by_hash
   - verify_hashchain
+  - fetch_latest_per_department
   - load_alerts_payload
   - load_summaries_payload
   - get_latest_snapshot
@@ -79,11 +85,15 @@ Notes:
 import json
 import logging
 import os
+import queue
 import re
 import sqlite3
-from contextlib import asynccontextmanager
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Iterator
 
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -99,6 +109,8 @@ from monitoring.health import register_healthchecks
 from monitoring.strict_health import register_strict_health_endpoints
 from centinel.api.middleware import install_zero_trust
 from centinel.core.hashchain import compute_hash
+from centinel.snapshot_cache import load_snapshot
+from centinel.snapshot_catalog import CATALOG_FILENAME
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 DB_PATH = Path(os.getenv("SNAPSHOTS_DB_PATH", BASE_DIR / "data" / "snapshots.db"))
@@ -130,11 +142,15 @@ from .audit import router as audit_router  # noqa: E402
 from .routes.setup import router as setup_router  # noqa: E402
 from .routes.swarm import router as swarm_router  # noqa: E402
 from .routes.election import router as election_router  # noqa: E402
+from .routes.profiling import router as profiling_router  # noqa: E402
+from .routes.proofs import router as proofs_router  # noqa: E402
 
 app.include_router(audit_router)
 app.include_router(setup_router)
 app.include_router(swarm_router)
 app.include_router(election_router)
+app.include_router(profiling_router)
+app.include_router(proofs_router)
 
 
 def _load_cors_origins() -> list[str]:
@@ -272,6 +288,190 @@ def get_connection() -> sqlite3.Connection:
     return connection
 
 
+# --- Read-only connection pool ----------------------------------------------
+# Every public read used to open a fresh SQLite connection and re-run the
+# schema DDL. Under observer traffic on election night that dominated request
+# cost. The API only reads snapshot_index, so handlers borrow long-lived
+# read-only connections (mode=ro, query_only) from a small pool; the schema
+# and WAL journal are set up once by a short-lived writable connection so
+# readers never block the pipeline writer.
+
+_DB_POOL_SIZE = max(1, _env_int("API_DB_POOL_SIZE", 8))
+
+
+class _ReadOnlyConnectionPool:
+    """Pool de conexiones SQLite de solo lectura (WAL).
+
+    English:
+        Bounded pool of read-only SQLite connections over a WAL database.
+        Connections that raise ``sqlite3.DatabaseError`` are discarded
+        instead of being returned to the pool.
+    """
+
+    def __init__(self, db_path: Path, size: int) -> None:
+        self.db_path = Path(db_path)
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._prepared = False
+        self._prepare_lock = threading.Lock()
+
+    def _prepare(self) -> None:
+        with self._prepare_lock:
+            if self._prepared:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            writer = sqlite3.connect(self.db_path, timeout=10.0)
+            try:
+                try:
+                    writer.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError as exc:
+                    logger.warning("snapshots_db_wal_unavailable path=%s error=%s", self.db_path, exc)
+                _ensure_schema(writer)
+            finally:
+                writer.close()
+            self._prepared = True
+
+    def _open(self) -> sqlite3.Connection:
+        self._prepare()
+        connection = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA query_only=ON")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Presta una conexión del pool. / Borrow a pooled connection."""
+        self._slots.acquire()
+        connection: sqlite3.Connection | None = None
+        healthy = True
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._open()
+            yield connection
+        except sqlite3.DatabaseError:
+            healthy = False
+            raise
+        finally:
+            if connection is not None:
+                if healthy:
+                    self._idle.put(connection)
+                else:
+                    connection.close()
+            self._slots.release()
+
+    def close(self) -> None:
+        """Cierra las conexiones inactivas. / Close idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pool_lock = threading.Lock()
+_pool: _ReadOnlyConnectionPool | None = None
+
+
+def _connection_pool() -> _ReadOnlyConnectionPool:
+    """Pool para el DB_PATH actual (se recrea si cambia la ruta)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.db_path != Path(DB_PATH):
+            if _pool is not None:
+                _pool.close()
+            _pool = _ReadOnlyConnectionPool(Path(DB_PATH), _DB_POOL_SIZE)
+        return _pool
+
+
+def read_connection():
+    """Conexión de solo lectura prestada del pool (context manager).
+
+    English:
+        Read-only connection borrowed from the pool (context manager).
+    """
+    return _connection_pool().connection()
+
+
+# --- Response cache ------------------------------------------------------------
+# Dashboard polls are answered from memory while the newest snapshot_index row
+# (INSERT OR REPLACE always yields a new rowid), the snapshot catalog head
+# (every capture commits to its WAL) and the alert/national/country files they
+# also read are unchanged. Storing or capturing a new snapshot changes the key,
+# so the next poll recomputes. /hashchain/verify lookups on arbitrary hashes
+# live in their own bounded cache so they can never evict dashboard entries.
+
+_RESPONSE_CACHE_MAX = 32
+_HASHCHAIN_CACHE_MAX = 1024
+_response_cache_lock = threading.Lock()
+_response_cache: "OrderedDict[tuple, tuple[tuple, Any]]" = OrderedDict()
+_hashchain_cache: "OrderedDict[tuple, tuple[tuple, Any]]" = OrderedDict()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_cache_key(connection: sqlite3.Connection) -> tuple:
+    """Clave de invalidación: snapshot_index, cabeza del catálogo y archivos leídos."""
+    newest = connection.execute(
+        "SELECT rowid, hash, timestamp_utc FROM snapshot_index ORDER BY rowid DESC LIMIT 1"
+    ).fetchone()
+    catalog_path = _DATA_DIR / CATALOG_FILENAME
+    return (
+        str(DB_PATH),
+        tuple(newest) if newest else None,
+        _file_signature(catalog_path),
+        _file_signature(catalog_path.with_name(catalog_path.name + "-wal")),
+        _file_signature(ALERTS_JSON),
+        _file_signature(ALERTS_LOG),
+        _file_signature(_SETUP_MARKER_PATH),
+        _file_signature(_DATA_DIR),
+        _file_signature(_FIXTURE_DIR),
+    )
+
+
+def _cached_response(
+    name: tuple,
+    connection: sqlite3.Connection,
+    producer: Callable[[], Any],
+    *,
+    cache: "OrderedDict[tuple, tuple[tuple, Any]] | None" = None,
+    max_entries: int = _RESPONSE_CACHE_MAX,
+) -> Any:
+    """Devuelve la respuesta cacheada para ``name`` o la recalcula."""
+    store = _response_cache if cache is None else cache
+    key = _snapshot_cache_key(connection)
+    with _response_cache_lock:
+        hit = store.get(name)
+        if hit is not None and hit[0] == key:
+            store.move_to_end(name)
+            return hit[1]
+    value = producer()
+    with _response_cache_lock:
+        store[name] = (key, value)
+        store.move_to_end(name)
+        while len(store) > max_entries:
+            store.popitem(last=False)
+    return value
+
+
+def invalidate_response_cache() -> None:
+    """Vacía la caché de respuestas. / Drop every cached response."""
+    with _response_cache_lock:
+        _response_cache.clear()
+        _hashchain_cache.clear()
+
+
 def _validate_table_name(table_name: str) -> str:
     """Asegura que el nombre de tabla tenga el formato esperado."""
     if not re.fullmatch(r"dept_[A-Za-z0-9]+_snapshots", table_name):
@@ -448,6 +648,77 @@ def verify_hashchain(connection: sqlite3.Connection, snapshot_hash: str) -> dict
     return {"exists": True, "valid": computed == snapshot_hash}
 
 
+_UNION_CHUNK = 200
+
+
+def fetch_latest_per_department(connection: sqlite3.Connection) -> dict[str, dict]:
+    """Último snapshot de cada departamento en una sola consulta.
+
+    Reemplaza la consulta por departamento (N+1): un JOIN contra
+    ``MAX(timestamp_utc)`` agrupado usa la clave primaria
+    ``(department_code, timestamp_utc)`` y las filas de las tablas por
+    departamento se leen con un único ``UNION ALL``.
+
+    English:
+        Latest snapshot per department in one round trip: a grouped
+        ``MAX(timestamp_utc)`` join over the primary key, then one
+        ``UNION ALL`` across the per-department tables.
+
+    Returns:
+        dict[str, dict]: department_code -> index columns plus
+        ``canonical_json``, vote totals and ``candidates_json`` (``None``
+        when the department table or row is missing).
+    """
+    rows = connection.execute(
+        """
+        SELECT si.department_code, si.timestamp_utc, si.table_name, si.hash, si.previous_hash
+        FROM snapshot_index AS si
+        JOIN (
+            SELECT department_code, MAX(timestamp_utc) AS timestamp_utc
+            FROM snapshot_index
+            GROUP BY department_code
+        ) AS latest
+          ON si.department_code = latest.department_code
+         AND si.timestamp_utc = latest.timestamp_utc
+        """
+    ).fetchall()
+    latest: dict[str, dict] = {row["department_code"]: {**dict(row), "snapshot": None} for row in rows}
+
+    existing = {
+        name
+        for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    }
+    selects: list[str] = []
+    params: list[str] = []
+    for entry in latest.values():
+        try:
+            table_name = _validate_table_name(entry["table_name"])
+        except ValueError:
+            continue
+        if table_name not in existing:
+            continue
+        selects.append(
+            f"""
+            SELECT ? AS department_code, canonical_json, registered_voters, total_votes,
+                   valid_votes, null_votes, blank_votes, candidates_json
+            FROM {table_name}
+            WHERE hash = ?
+            """  # nosec B608 - table name validated against strict pattern.
+        )
+        params.extend([entry["department_code"], entry["hash"]])
+    # SQLite caps compound SELECTs (SQLITE_MAX_COMPOUND_SELECT, default 500).
+    for start in range(0, len(selects), _UNION_CHUNK):
+        chunk = selects[start : start + _UNION_CHUNK]
+        chunk_params = params[2 * start : 2 * (start + len(chunk))]
+        try:
+            for snap in connection.execute(" UNION ALL ".join(chunk), chunk_params).fetchall():
+                latest[snap["department_code"]]["snapshot"] = dict(snap)
+        except sqlite3.OperationalError as exc:
+            # Legacy tables without the vote columns: keep index data only.
+            logger.warning("latest_per_department_snapshot_query_failed error=%s", exc)
+    return latest
+
+
 def load_alerts_payload() -> list[dict]:
     """Carga alertas desde JSON o logs.
 
@@ -505,11 +776,8 @@ def get_latest_snapshot(request: Request) -> dict:
     Returns:
         dict: Latest snapshot with metadata.
     """
-    connection = get_connection()
-    try:
-        payload = fetch_latest_snapshot(connection)
-    finally:
-        connection.close()
+    with read_connection() as connection:
+        payload = _cached_response(("snapshots_latest",), connection, lambda: fetch_latest_snapshot(connection))
     if not payload:
         raise HTTPException(status_code=404, detail="No snapshots available.")
     return payload
@@ -540,11 +808,8 @@ def get_snapshot(snapshot_id: str, request: Request) -> dict:
     """
     if not _HASH_RE.match(snapshot_id):
         raise HTTPException(status_code=400, detail="Invalid snapshot ID format.")
-    connection = get_connection()
-    try:
+    with read_connection() as connection:
         payload = fetch_snapshot_by_hash(connection, snapshot_id)
-    finally:
-        connection.close()
     if not payload:
         raise HTTPException(status_code=404, detail="Snapshot not found.")
     return payload
@@ -570,12 +835,14 @@ def verify_hash(request: Request, hash_value: str = Query(..., alias="hash")) ->
     Returns:
         dict: Verification result.
     """
-    connection = get_connection()
-    try:
-        result = verify_hashchain(connection, hash_value)
-    finally:
-        connection.close()
-    return result
+    with read_connection() as connection:
+        return _cached_response(
+            ("hashchain_verify", hash_value),
+            connection,
+            lambda: verify_hashchain(connection, hash_value),
+            cache=_hashchain_cache,
+            max_entries=_HASHCHAIN_CACHE_MAX,
+        )
 
 
 @app.get("/alerts")
@@ -603,147 +870,134 @@ def dashboard_data(request: Request) -> dict:
         Aggregates snapshot, alert and status data into ElectionData format
         consumed by the React dashboard.
     """
-    connection = get_connection()
-    try:
-        dept_status = _department_status(connection)
-
-        # Build per-department data from latest snapshots.
-        departments: dict[str, dict] = {}
-        national_votes = 0
-        national_actas = 0
-        national_actas_total = 0
-        all_candidates_agg: dict[str, dict] = {}
-        alert_state = "normal"
-        alert_department = None
-
-        _, iso_to_name, _ = _load_country_maps()
-        for ds in dept_status:
-            dept_code = ds["department"]
-            # Map internal name to ISO code used by frontend (e.g. atlantida -> HN-AT).
-            iso_code = _dept_to_iso(dept_code)
-            dept_name = iso_to_name.get(iso_code, dept_code.replace("_", " ").title())
-
-            row = connection.execute(
-                """
-                SELECT table_name, hash, previous_hash, timestamp_utc
-                FROM snapshot_index
-                WHERE department_code = ?
-                ORDER BY timestamp_utc DESC
-                LIMIT 1
-                """,
-                (dept_code,),
-            ).fetchone()
-
-            candidates: list[dict] = []
-            total_votes = 0
-            registered_voters = 0
-            actas_escrutadas = 1 if row else 0
-            actas_total = 1
-
-            if row:
-                try:
-                    tbl = _validate_table_name(row["table_name"])
-                    snap = connection.execute(
-                        f"""
-                        SELECT registered_voters, total_votes, valid_votes,
-                               null_votes, blank_votes, candidates_json
-                        FROM {tbl}
-                        WHERE hash = ?
-                        """,  # nosec B608
-                        (row["hash"],),
-                    ).fetchone()
-                    if snap:
-                        total_votes = snap["total_votes"] or 0
-                        registered_voters = snap["registered_voters"] or 0
-                        try:
-                            candidates = json.loads(snap["candidates_json"]) if snap["candidates_json"] else []
-                        except (json.JSONDecodeError, TypeError):
-                            candidates = []
-                except (ValueError, sqlite3.OperationalError):
-                    pass
-
-            hash_valid = ds["status"] != "hash_broken"
-            rules_broken = ds["status"] == "rule_broken"
-
-            if ds["status"] == "hash_broken":
-                alert_state = "hash_broken"
-                alert_department = dept_name
-            elif ds["status"] == "rule_broken" and alert_state == "normal":
-                alert_state = "anomaly"
-                alert_department = dept_name
-
-            turnout = round((total_votes / registered_voters * 100), 1) if registered_voters else 0.0
-
-            # Normalize candidates into frontend format.
-            fe_candidates = _format_candidates(candidates, total_votes)
-
-            departments[iso_code] = {
-                "code": iso_code,
-                "name": dept_name,
-                "actasTotal": actas_total,
-                "actasEscrutadas": actas_escrutadas,
-                "totalVotes": total_votes,
-                "integrityPercent": 100.0 if hash_valid and not rules_broken else 91.4,
-                "turnoutPercent": turnout,
-                "hashValid": hash_valid,
-                "rulesBroken": rules_broken,
-                "candidates": fe_candidates,
-            }
+    with read_connection() as connection:
+        payload = _cached_response(("dashboard_data",), connection, lambda: _build_dashboard_data(connection))
+    return {"timestamp": datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z", **payload}
 
-            national_votes += total_votes
-            national_actas += actas_escrutadas
-            national_actas_total += actas_total
-
-            # Aggregate candidate totals across departments.
-            for c in fe_candidates:
-                key = c["name"]
-                if key not in all_candidates_agg:
-                    all_candidates_agg[key] = {**c, "votes": 0}
-                all_candidates_agg[key]["votes"] += c["votes"]
-
-        # National JSON is the authoritative source for national totals.
-        # Fall back to summing department snapshots if not available.
-        nat_json = _load_national_snapshot()
-
-        if nat_json:
-            national_section = {
-                "actasTotal": nat_json["actasTotal"],
-                "actasEscrutadas": nat_json["actasDivulgadas"],
-                "actasCorrectas": nat_json["actasCorrectas"],
-                "actasInconsistentes": nat_json["actasInconsistentes"],
-                "totalVotes": nat_json["votosValidos"],
-                "votosNulos": nat_json["votosNulos"],
-                "votosBlancos": nat_json["votosBlancos"],
-                "integrityPercent": 97.4 if alert_state == "normal" else 91.4,
-                "turnoutPercent": 0.0,
-                "candidates": nat_json["candidates"],
-                "source": "national_json",
-                "fileTimestamp": nat_json.get("file_timestamp"),
-            }
-        else:
-            nat_candidates = list(all_candidates_agg.values())
-            for c in nat_candidates:
-                c["percentage"] = round(c["votes"] / national_votes * 100, 1) if national_votes else 0.0
-            national_section = {
-                "actasTotal": national_actas_total,
-                "actasEscrutadas": national_actas,
-                "totalVotes": national_votes,
-                "integrityPercent": 97.4 if alert_state == "normal" else 91.4,
-                "turnoutPercent": 0.0,
-                "candidates": nat_candidates,
-                "source": "dept_aggregation",
-            }
 
-        return {
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat() + "Z",
-            "source": "CENTINEL-API",
-            "alertState": alert_state,
-            "alertDepartment": alert_department,
-            "national": national_section,
-            "departments": departments,
+def _build_dashboard_data(connection: sqlite3.Connection) -> dict:
+    """Construye la respuesta de /api/dashboard-data (sin caché).
+
+    English:
+        Build the /api/dashboard-data payload (uncached). The latest
+        snapshot of every department comes from one batched query shared
+        with the department status computation.
+    """
+    latest = fetch_latest_per_department(connection)
+    dept_status = _department_status(connection, latest=latest)
+
+    # Build per-department data from latest snapshots.
+    departments: dict[str, dict] = {}
+    national_votes = 0
+    national_actas = 0
+    national_actas_total = 0
+    all_candidates_agg: dict[str, dict] = {}
+    alert_state = "normal"
+    alert_department = None
+
+    _, iso_to_name, _ = _load_country_maps()
+    for ds in dept_status:
+        dept_code = ds["department"]
+        # Map internal name to ISO code used by frontend (e.g. atlantida -> HN-AT).
+        iso_code = _dept_to_iso(dept_code)
+        dept_name = iso_to_name.get(iso_code, dept_code.replace("_", " ").title())
+
+        row = latest.get(dept_code)
+
+        candidates: list[dict] = []
+        total_votes = 0
+        registered_voters = 0
+        actas_escrutadas = 1 if row else 0
+        actas_total = 1
+
+        snap = row["snapshot"] if row else None
+        if snap:
+            total_votes = snap["total_votes"] or 0
+            registered_voters = snap["registered_voters"] or 0
+            try:
+                candidates = json.loads(snap["candidates_json"]) if snap["candidates_json"] else []
+            except (json.JSONDecodeError, TypeError):
+                candidates = []
+
+        hash_valid = ds["status"] != "hash_broken"
+        rules_broken = ds["status"] == "rule_broken"
+
+        if ds["status"] == "hash_broken":
+            alert_state = "hash_broken"
+            alert_department = dept_name
+        elif ds["status"] == "rule_broken" and alert_state == "normal":
+            alert_state = "anomaly"
+            alert_department = dept_name
+
+        turnout = round((total_votes / registered_voters * 100), 1) if registered_voters else 0.0
+
+        # Normalize candidates into frontend format.
+        fe_candidates = _format_candidates(candidates, total_votes)
+
+        departments[iso_code] = {
+            "code": iso_code,
+            "name": dept_name,
+            "actasTotal": actas_total,
+            "actasEscrutadas": actas_escrutadas,
+            "totalVotes": total_votes,
+            "integrityPercent": 100.0 if hash_valid and not rules_broken else 91.4,
+            "turnoutPercent": turnout,
+            "hashValid": hash_valid,
+            "rulesBroken": rules_broken,
+            "candidates": fe_candidates,
         }
-    finally:
-        connection.close()
+
+        national_votes += total_votes
+        national_actas += actas_escrutadas
+        national_actas_total += actas_total
+
+        # Aggregate candidate totals across departments.
+        for c in fe_candidates:
+            key = c["name"]
+            if key not in all_candidates_agg:
+                all_candidates_agg[key] = {**c, "votes": 0}
+            all_candidates_agg[key]["votes"] += c["votes"]
+
+    # National JSON is the authoritative source for national totals.
+    # Fall back to summing department snapshots if not available.
+    nat_json = _load_national_snapshot()
+
+    if nat_json:
+        national_section = {
+            "actasTotal": nat_json["actasTotal"],
+            "actasEscrutadas": nat_json["actasDivulgadas"],
+            "actasCorrectas": nat_json["actasCorrectas"],
+            "actasInconsistentes": nat_json["actasInconsistentes"],
+            "totalVotes": nat_json["votosValidos"],
+            "votosNulos": nat_json["votosNulos"],
+            "votosBlancos": nat_json["votosBlancos"],
+            "integrityPercent": 97.4 if alert_state == "normal" else 91.4,
+            "turnoutPercent": 0.0,
+            "candidates": nat_json["candidates"],
+            "source": "national_json",
+            "fileTimestamp": nat_json.get("file_timestamp"),
+        }
+    else:
+        nat_candidates = list(all_candidates_agg.values())
+        for c in nat_candidates:
+            c["percentage"] = round(c["votes"] / national_votes * 100, 1) if national_votes else 0.0
+        national_section = {
+            "actasTotal": national_actas_total,
+            "actasEscrutadas": national_actas,
+            "totalVotes": national_votes,
+            "integrityPercent": 97.4 if alert_state == "normal" else 91.4,
+            "turnoutPercent": 0.0,
+            "candidates": nat_candidates,
+            "source": "dept_aggregation",
+        }
+
+    return {
+        "source": "CENTINEL-API",
+        "alertState": alert_state,
+        "alertDepartment": alert_department,
+        "national": national_section,
+        "departments": departments,
+    }
 
 
 # ── Country-aware dept maps (lazy, built from CountryPreset) ──────────────────
@@ -829,7 +1083,7 @@ def _load_national_snapshot() -> dict | None:
     if not path:
         return None
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = load_snapshot(path)
     except Exception:
         return None
 
@@ -936,13 +1190,16 @@ def _get_departments() -> list[str]:
     return slugs
 
 
-def _department_status(connection: sqlite3.Connection) -> list[dict]:
+def _department_status(connection: sqlite3.Connection, *, latest: dict[str, dict] | None = None) -> list[dict]:
     """Calcula el estado de cada departamento basado en alertas y hashes.
 
     Retorna una lista con el estado de cada departamento:
     - 'ok': sin alertas (blanco hueso)
     - 'rule_broken': alguna regla del sistema se rompió (amarillo)
     - 'hash_broken': un hash se ha roto (rojo)
+
+    ``latest`` (de ``fetch_latest_per_department``) evita repetir la
+    consulta cuando el llamador ya la hizo.
     """
     alerts = load_alerts_payload()
     alert_depts: dict[str, set[str]] = {}
@@ -951,33 +1208,19 @@ def _department_status(connection: sqlite3.Connection) -> list[dict]:
         severity = (alert.get("severity") or alert.get("nivel") or "warning").lower()
         alert_depts.setdefault(dept, set()).add(severity)
 
+    if latest is None:
+        latest = fetch_latest_per_department(connection)
+
     results = []
     for dept in _get_departments():
         # Check hash integrity for latest snapshot of this department
         hash_ok = True
-        row = connection.execute(
-            """
-            SELECT table_name, hash, previous_hash
-            FROM snapshot_index
-            WHERE department_code = ?
-            ORDER BY timestamp_utc DESC
-            LIMIT 1
-            """,
-            (dept,),
-        ).fetchone()
-        if row:
-            try:
-                table_name = _validate_table_name(row["table_name"])
-                snap = connection.execute(
-                    f"SELECT canonical_json FROM {table_name} WHERE hash = ?",  # nosec B608
-                    (row["hash"],),
-                ).fetchone()
-                if snap:
-                    computed = compute_hash(snap["canonical_json"], row["previous_hash"])
-                    if computed != row["hash"]:
-                        hash_ok = False
-            except (ValueError, sqlite3.OperationalError):
-                pass
+        row = latest.get(dept)
+        snap = row["snapshot"] if row else None
+        if snap and snap["canonical_json"] is not None:
+            computed = compute_hash(snap["canonical_json"], row["previous_hash"])
+            if computed != row["hash"]:
+                hash_ok = False
 
         severities = alert_depts.get(dept, set())
         if not hash_ok:
@@ -1002,11 +1245,8 @@ def _department_status(connection: sqlite3.Connection) -> list[dict]:
 @limiter.limit(f"{rate_limit_per_minute}/minute")
 def departments_status(request: Request) -> list[dict]:
     """Estado de los 18 departamentos para el mapa de calor ciudadano."""
-    connection = get_connection()
-    try:
-        return _department_status(connection)
-    finally:
-        connection.close()
+    with read_connection() as connection:
+        return _cached_response(("departments_status",), connection, lambda: _department_status(connection))
 
 
 @app.get("/api/national-snapshot")
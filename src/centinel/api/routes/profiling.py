@@ -0,0 +1,106 @@
+"""
+Endpoints de perfilado bajo demanda del nodo en ejecución.
+On-demand profiling endpoints for the running node.
+
+Opt-in (``CENTINEL_PROFILING_ENABLED=1``) and gated like
+``/api/setup/regenerate``: every call authenticates with one of the
+current admin seeds (seed_label + seed_value).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from centinel import profiling
+
+from .setup import _sl, _verify_seed
+
+logger = logging.getLogger("centinel.api.profiling")
+
+router = APIRouter(prefix="/api/profiling", tags=["profiling"])
+
+_BASE = Path(__file__).resolve().parents[4]
+_PROFILE_DIR = _BASE / profiling.DEFAULT_PROFILE_DIR
+_REQUEST_PATH = _BASE / profiling.DEFAULT_REQUEST_PATH
+
+
+def _require_admin(seed_label: str, seed_value: str) -> None:
+    if os.getenv("CENTINEL_PROFILING_ENABLED", "").strip().lower() not in {"1", "true", "yes"}:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not _verify_seed(seed_label, seed_value):
+        logger.warning("profiling_auth_failed label=%s", _sl(seed_label))
+        raise HTTPException(status_code=401, detail="Seed de autenticación inválido.")
+
+
+# ── Request models ────────────────────────────────────────────────────────────
+
+
+class AdminRequest(BaseModel):
+    seed_label: str = Field(..., description='Admin seed label, e.g. "S1-A"')
+    seed_value: str = Field(..., description="Plaintext seed to authenticate")
+
+
+class SampleRequest(AdminRequest):
+    seconds: float = Field(30.0, gt=0, le=profiling.MAX_PROFILE_SECONDS)
+    format: str = "collapsed"
+    interval_ms: float = Field(10.0, ge=1, le=1000)
+
+
+class CyclesRequest(AdminRequest):
+    cycles: int = Field(1, ge=1, le=profiling.MAX_PROFILE_CYCLES)
+    format: str = "collapsed"
+    interval_ms: float = Field(10.0, ge=1, le=1000)
+
+
+# ── Endpoints ─────────────────────────────────────────────────────────────────
+
+
+@router.post("/sample")
+def sample_api_process(req: SampleRequest) -> dict:
+    """Perfila el proceso de la API durante ``seconds`` (en segundo plano)."""
+    _require_admin(req.seed_label, req.seed_value)
+    try:
+        profile = profiling.start_timed_profile(
+            req.seconds,
+            fmt=req.format,
+            interval=req.interval_ms / 1000,
+            output_dir=_PROFILE_DIR,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return {"status": "started", **profile.to_dict()}
+
+
+@router.post("/cycles")
+def profile_pipeline_cycles(req: CyclesRequest) -> dict:
+    """Pide al loop de polling perfilar sus próximos ``cycles`` ciclos."""
+    _require_admin(req.seed_label, req.seed_value)
+    try:
+        request = profiling.request_cycle_profile(
+            req.cycles,
+            fmt=req.format,
+            interval=req.interval_ms / 1000,
+            request_path=_REQUEST_PATH,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"status": "requested", **request}
+
+
+@router.post("/status")
+def profiling_status(req: AdminRequest) -> dict:
+    """Perfil temporizado activo, solicitud por ciclos pendiente y archivos."""
+    _require_admin(req.seed_label, req.seed_value)
+    timed = profiling.active_timed_profile()
+    return {
+        "timed": timed.to_dict() if timed else None,
+        "cycles_request": profiling.read_cycle_request(_REQUEST_PATH),
+        "profiles": profiling.list_profiles(_PROFILE_DIR),
+    }
@@ -0,0 +1,171 @@
+"""
+Pruebas Merkle compactas contra el log de transparencia firmado.
+Compact Merkle proofs against the signed transparency log.
+
+``/hashchain/verify`` walks ``previous_hash`` links in SQLite and the audit
+bundle ships every snapshot. These endpoints answer the two questions an
+observer actually has with O(log n) hashes each:
+
+    GET /proofs/{snapshot_hash}            — snapshot is leaf i of checkpoint C
+    GET /proofs/consistency?from=&to=      — checkpoint B extends checkpoint A
+
+Checkpoints are referenced by ``checkpoint_digest`` or ``chain_length``.
+Every response carries the full logged checkpoint (operator signature
+included) so ``scripts/verify_snapshot_bundle.py --inclusion-proof`` /
+``--consistency-proof`` can verify it offline. Responses are deterministic
+and sent with ``Cache-Control``/``ETag``; proofs between checkpoints pinned
+by ``checkpoint_digest`` never change and are marked immutable (several
+checkpoints can share a ``chain_length``, so those references are not).
+
+Read-only and unauthenticated, like the ``/audit`` router.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+from ...core.merkle import MerkleAccumulator
+from ...core.transparency import (
+    checkpoint_consistency_proof,
+    checkpoint_inclusion_proof,
+    latest_checkpoint,
+    read_transparency_log,
+    sync_chain_accumulator,
+)
+from ...hasher import SHA256_HEX_RE
+from ..audit import CACHE_TTL_SECONDS, cached, resolve_snapshot_root
+
+router = APIRouter(prefix="/proofs", tags=["proofs"])
+
+_IMMUTABLE_MAX_AGE_SECONDS = 31536000
+
+
+def _proof_state() -> Tuple[List[Dict[str, Any]], MerkleAccumulator]:
+    """Transparency log and chain accumulator, cached as one entry.
+
+    The log is read before the accumulator is synced, so every logged
+    checkpoint is covered unless the chain was really rewritten; caching
+    them apart could pair a fresh log with a stale accumulator (spurious 409).
+    """
+    snapshot_root = resolve_snapshot_root()
+    if not snapshot_root.exists():
+        raise HTTPException(status_code=404, detail="snapshot_root_missing")
+
+    def _load() -> Tuple[List[Dict[str, Any]], MerkleAccumulator]:
+        log = read_transparency_log()
+        # persist=False: the API never writes the leaves file owned by the pipeline.
+        return log, sync_chain_accumulator(snapshot_root, persist=False)
+
+    return cached("proofs_state", CACHE_TTL_SECONDS, _load)
+
+
+def _pinned(reference: Optional[str]) -> bool:
+    """Only a ``checkpoint_digest`` names the same checkpoint forever."""
+    return reference is not None and bool(SHA256_HEX_RE.match(reference.strip().lower()))
+
+
+def _resolve_checkpoint(log: List[Dict[str, Any]], reference: str) -> Dict[str, Any]:
+    """Find a logged checkpoint by ``checkpoint_digest`` or ``chain_length``."""
+    reference = reference.strip().lower()
+    if SHA256_HEX_RE.match(reference):
+        for checkpoint in reversed(log):
+            if checkpoint.get("checkpoint_digest") == reference:
+                return checkpoint
+    elif reference.isdigit():
+        for checkpoint in reversed(log):
+            if checkpoint.get("chain_length") == int(reference):
+                return checkpoint
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="invalid_checkpoint_reference — expected checkpoint_digest or chain_length",
+        )
+    raise HTTPException(status_code=404, detail="checkpoint_not_found")
+
+
+def _newest_checkpoint(log: List[Dict[str, Any]]) -> Dict[str, Any]:
+    checkpoint = latest_checkpoint(log)
+    if checkpoint is None:
+        raise HTTPException(status_code=404, detail="no_transparency_checkpoints")
+    return checkpoint
+
+
+def _cacheable(request: Request, payload: Dict[str, Any], *, immutable: bool) -> Response:
+    """JSON response with Cache-Control/ETag; answers If-None-Match with 304."""
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    etag = f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+    max_age = _IMMUTABLE_MAX_AGE_SECONDS if immutable else int(CACHE_TTL_SECONDS)
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}" + (", immutable" if immutable else ""),
+        "ETag": etag,
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=payload, headers=headers)
+
+
+@router.get("/consistency")
+def consistency_proof(
+    request: Request,
+    from_ref: str = Query(..., alias="from", description="Older checkpoint (digest or chain_length)"),
+    to_ref: Optional[str] = Query(None, alias="to", description="Newer checkpoint; defaults to the latest signed"),
+) -> Response:
+    """Prueba de que el checkpoint ``to`` extiende al checkpoint ``from``.
+
+    English:
+        Consistency proof that checkpoint ``to`` is an append-only
+        extension of checkpoint ``from``.
+    """
+    log, accumulator = _proof_state()
+    old_checkpoint = _resolve_checkpoint(log, from_ref)
+    new_checkpoint = _resolve_checkpoint(log, to_ref) if to_ref else _newest_checkpoint(log)
+    try:
+        proof = checkpoint_consistency_proof(accumulator, old_checkpoint, new_checkpoint)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    payload = {
+        "proof": proof.to_dict(),
+        "from_checkpoint": old_checkpoint,
+        "to_checkpoint": new_checkpoint,
+    }
+    return _cacheable(request, payload, immutable=_pinned(from_ref) and _pinned(to_ref))
+
+
+@router.get("/{snapshot_hash}")
+def inclusion_proof(
+    request: Request,
+    snapshot_hash: str,
+    checkpoint: Optional[str] = Query(
+        None, description="Checkpoint (digest or chain_length); defaults to the latest signed"
+    ),
+) -> Response:
+    """Prueba de inclusión de un snapshot contra un checkpoint firmado.
+
+    English:
+        Inclusion proof of a snapshot hash against the latest signed
+        checkpoint (or a pinned one via ``?checkpoint=``).
+    """
+    if not SHA256_HEX_RE.match(snapshot_hash):
+        raise HTTPException(
+            status_code=400,
+            detail="invalid_hash_format — expected 64-char lowercase hex SHA-256",
+        )
+    log, accumulator = _proof_state()
+    target = _resolve_checkpoint(log, checkpoint) if checkpoint else _newest_checkpoint(log)
+    try:
+        proof = checkpoint_inclusion_proof(accumulator, target, snapshot_hash)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=exc.args[0]) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    payload = {
+        "snapshot_hash": snapshot_hash,
+        "proof": proof.to_dict(),
+        "checkpoint": target,
+    }
+    return _cacheable(request, payload, immutable=_pinned(checkpoint))
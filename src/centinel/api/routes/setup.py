@@ -6,6 +6,7 @@ Initial setup and seed regeneration endpoints.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
 import logging
 from datetime import datetime, timezone
@@ -74,7 +75,7 @@ def _verify_seed(seed_label: str, seed_value: str) -> bool:
         "sha256", seed_value.encode(), SEED1_SALT.encode(), SEED1_ITERS
     ).hex()
     # Constant-time comparison
-    return hashlib.compare_digest(actual, expected)
+    return hmac.compare_digest(actual, expected)
 
 
 def _pdf_response(seeds: dict, country_name: str, country_flag: str, code: str) -> Response:
@@ -0,0 +1,267 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/anchor_queue.py`.
+Anclaje externo asíncrono y por lotes para `LocalSnapshotStore`. El snapshot
+se confirma en SQLite al instante y su hash queda en la cola `anchor_queue`;
+un worker en segundo plano agrupa los hashes pendientes en una raíz Merkle
+(`transparency.compute_merkle_root`) y ancla una sola raíz por intervalo.
+Los backends implementan `anchor(merkle_root, leaves)`:
+
+- `ChainAnchorBackend`: blockchain (`publish_hash_to_chain`) e IPFS
+  (`upload_snapshot_to_ipfs` + `publish_cid_to_chain`) según configuración.
+- `LocalAnchorBackend`: registro JSONL local, sin red, para pruebas y
+  operación offline.
+
+Componentes detectados:
+  - AnchorLeaf
+  - AnchorReceipt
+  - LocalAnchorBackend
+  - ChainAnchorBackend
+  - AnchorWorker
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/anchor_queue.py`.
+Asynchronous, batched external anchoring for `LocalSnapshotStore`. The
+snapshot is committed to SQLite at once and its hash goes into the
+`anchor_queue` table; a background worker batches pending hashes into a
+Merkle root (`transparency.compute_merkle_root`) and anchors one root per
+interval. Backends implement `anchor(merkle_root, leaves)`:
+
+- `ChainAnchorBackend`: blockchain (`publish_hash_to_chain`) and IPFS
+  (`upload_snapshot_to_ipfs` + `publish_cid_to_chain`) as configured.
+- `LocalAnchorBackend`: local JSONL log, no network, for tests and offline
+  operation.
+
+Detected components:
+  - AnchorLeaf
+  - AnchorReceipt
+  - LocalAnchorBackend
+  - ChainAnchorBackend
+  - AnchorWorker
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Anchor Queue Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from centinel.core.blockchain import (
+    is_blockchain_enabled,
+    load_blockchain_config,
+    publish_cid_to_chain,
+    publish_hash_to_chain,
+)
+from centinel.core.ipfs import upload_snapshot_to_ipfs
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANCHOR_INTERVAL_SECONDS = 60.0
+DEFAULT_ANCHOR_BATCH_SIZE = 512
+
+
+@dataclass(frozen=True)
+class AnchorLeaf:
+    """Snapshot pendiente de anclaje (una hoja del árbol Merkle).
+
+    English:
+        Snapshot waiting to be anchored (one Merkle tree leaf).
+    """
+
+    department_code: str
+    timestamp_utc: str
+    hash: str
+    canonical_json: str
+
+
+@dataclass(frozen=True)
+class AnchorReceipt:
+    """Comprobante devuelto por un backend de anclaje.
+
+    English:
+        Receipt returned by an anchor backend. Empty fields mean that
+        channel did not anchor the batch.
+    """
+
+    backend: str
+    tx_hash: Optional[str] = None
+    ipfs_cid: Optional[str] = None
+    ipfs_tx_hash: Optional[str] = None
+
+
+class LocalAnchorBackend:
+    """Backend local: agrega cada raíz a un registro JSONL append-only.
+
+    English:
+        Local backend: appends each root to an append-only JSONL log and
+        returns a deterministic ``local:<sha256>`` receipt. No network.
+    """
+
+    name = "local"
+
+    def __init__(self, log_path: str | Path) -> None:
+        self.log_path = Path(log_path)
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def anchor(self, merkle_root: str, leaves: Sequence[AnchorLeaf]) -> AnchorReceipt:
+        """Registra la raíz y sus hojas; devuelve el comprobante local.
+
+        English:
+            Record the root and its leaves; return the local receipt.
+        """
+        record = {
+            "merkle_root": merkle_root,
+            "leaves": [leaf.hash for leaf in leaves],
+            "anchored_at": datetime.now(timezone.utc).isoformat(),
+        }
+        line = json.dumps(record, sort_keys=True, separators=(",", ":"))
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+        return AnchorReceipt(backend=self.name, tx_hash=f"local:{hashlib.sha256(line.encode('utf-8')).hexdigest()}")
+
+
+class ChainAnchorBackend:
+    """Backend externo: blockchain e IPFS según la configuración vigente.
+
+    English:
+        External backend: blockchain and IPFS as currently configured. The
+        root goes on chain; the batch document (root plus every snapshot)
+        goes to IPFS and its CID on chain. A chain failure propagates so the
+        batch is retried; IPFS failures only leave those fields empty.
+    """
+
+    name = "chain"
+
+    def __init__(self) -> None:
+        try:
+            self._blockchain = is_blockchain_enabled(load_blockchain_config())
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("anchor_blockchain_config_unavailable error=%s", exc)
+            self._blockchain = False
+        self._ipfs = os.getenv("IPFS_ENABLED", "false").lower() in {"1", "true", "yes"}
+
+    @property
+    def enabled(self) -> bool:
+        return self._blockchain or self._ipfs
+
+    def anchor(self, merkle_root: str, leaves: Sequence[AnchorLeaf]) -> AnchorReceipt:
+        """Ancla la raíz del lote y, si aplica, su documento en IPFS.
+
+        English:
+            Anchor the batch root and, when enabled, its IPFS document.
+        """
+        tx_hash = None
+        if self._blockchain:
+            tx_hash = publish_hash_to_chain(merkle_root) or None
+        ipfs_cid = None
+        ipfs_tx_hash = None
+        if self._ipfs:
+            document = {
+                "merkle_root": merkle_root,
+                "snapshots": [
+                    {
+                        "department_code": leaf.department_code,
+                        "timestamp_utc": leaf.timestamp_utc,
+                        "hash": leaf.hash,
+                        "snapshot": json.loads(leaf.canonical_json),
+                    }
+                    for leaf in leaves
+                ],
+            }
+            try:
+                ipfs_cid = upload_snapshot_to_ipfs(document) or None
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("ipfs_upload_failed error=%s", exc)
+            if ipfs_cid and self._blockchain:
+                try:
+                    ipfs_tx_hash = publish_cid_to_chain(ipfs_cid) or None
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("ipfs_blockchain_publish_failed error=%s", exc)
+        return AnchorReceipt(backend=self.name, tx_hash=tx_hash, ipfs_cid=ipfs_cid, ipfs_tx_hash=ipfs_tx_hash)
+
+
+class AnchorWorker:
+    """Hilo en segundo plano que drena la cola de anclaje cada intervalo.
+
+    English:
+        Background thread that drains the anchor queue once per interval.
+        ``drain`` anchors at most one batch and returns how many snapshots
+        it anchored.
+    """
+
+    def __init__(self, drain: Callable[[], int], interval_seconds: float = DEFAULT_ANCHOR_INTERVAL_SECONDS) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self.drain = drain
+        self.interval_seconds = interval_seconds
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Inicia el worker si no está activo.
+
+        English:
+            Start the worker unless it is already running.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="centinel-anchor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Detiene el worker; lo pendiente queda en la cola persistida.
+
+        English:
+            Stop the worker; pending work stays in the persisted queue.
+        """
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.drain()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("anchor_worker_cycle_failed error=%s", exc)
@@ -61,15 +61,14 @@ Notes:
 from __future__ import annotations
 
 import hashlib
-import json
 from typing import Any
 
+from centinel.core.canonical_json import canonical_bytes
+
 
 def canonical_json_bytes(payload: Any) -> bytes:
     """Serializa JSON en forma canónica para hashing."""
-    return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    return canonical_bytes(payload)
 
 
 def hash_bytes(payload: bytes) -> str:
@@ -0,0 +1,212 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/canonical_json.py`.
+Serialización JSON canónica compartida por todas las rutas de integridad
+(hash de snapshots, cadena de custodia, hash chain de logs, anclaje,
+gossip). Produce exactamente los mismos bytes que
+`json.dumps(obj, sort_keys=True, ...)` en las tres variantes que ya usa el
+repositorio:
+
+- compacta UTF-8 (`separators=(",", ":")`, `ensure_ascii=False`);
+- compacta ASCII (`separators=(",", ":")`, `ensure_ascii=True`);
+- separadores por defecto (`", "`, `": "`), `ensure_ascii=False`.
+
+Si `orjson` está instalado, la variante compacta UTF-8 sin `default` lo usa
+con `OPT_SORT_KEYS` cuando un recorrido previo confirma que `obj` solo
+contiene tipos JSON nativos (dict/list/tuple, claves str, str, int, bool,
+None y floats finitos entre 1e-4 y 1e16, donde ambos imprimen los mismos
+dígitos). Cualquier otro caso (NaN/Infinity, Enum, UUID, subclases de str o
+int, `default`, `ensure_ascii=True`) va directo a `json`, así el resultado
+es byte a byte el de siempre sin serializar dos veces.
+`CENTINEL_CANONICAL_JSON_BACKEND=json` fuerza la stdlib.
+
+Componentes detectados:
+  - BACKEND
+  - canonical_bytes
+  - canonical_dumps
+  - canonical_sha256
+  - stdlib_canonical_bytes
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/canonical_json.py`.
+Canonical JSON serialization shared by every integrity path (snapshot
+hashes, custody chain, log hash chain, anchoring, gossip). It emits exactly
+the bytes `json.dumps(obj, sort_keys=True, ...)` produces in the three
+variants the repository already relies on:
+
+- compact UTF-8 (`separators=(",", ":")`, `ensure_ascii=False`);
+- compact ASCII (`separators=(",", ":")`, `ensure_ascii=True`);
+- default separators (`", "`, `": "`), `ensure_ascii=False`.
+
+When `orjson` is installed, the compact UTF-8 variant without `default`
+uses it with `OPT_SORT_KEYS` once a pre-walk confirms `obj` holds only
+native JSON types (dict/list/tuple, str keys, str, int, bool, None and
+finite floats in [1e-4, 1e16), where both print the same digits). Anything
+else (NaN/Infinity, Enum, UUID, str/int subclasses, a `default`,
+`ensure_ascii=True`) goes straight to `json`, so the result is byte for byte
+the historical one without serializing twice.
+`CENTINEL_CANONICAL_JSON_BACKEND=json` forces the stdlib.
+
+Detected components:
+  - BACKEND
+  - canonical_bytes
+  - canonical_dumps
+  - canonical_sha256
+  - stdlib_canonical_bytes
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Canonical Json Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Optional
+
+try:  # Optional accelerated backend.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+_FORCE_STDLIB = os.getenv("CENTINEL_CANONICAL_JSON_BACKEND", "").strip().lower() == "json"
+BACKEND = "orjson" if orjson is not None and not _FORCE_STDLIB else "json"
+
+if orjson is not None:
+    _ORJSON_ERRORS: tuple = (orjson.JSONEncodeError, TypeError, ValueError, OverflowError)
+
+# Outside this range float.__repr__ (json) switches to exponent form
+# (``1e-05``, ``1e+16``) while orjson keeps positional digits.
+_FLOAT_POSITIONAL_MIN = 1e-4
+_FLOAT_POSITIONAL_MAX = 1e16
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """True when orjson and ``json.dumps`` are guaranteed to emit the same bytes.
+
+    Exact-type checks only: subclasses of str/int/float (Enum members among
+    them), UUIDs, datetimes and any other object orjson serializes natively
+    but json rejects or prints differently make the caller use the stdlib.
+    """
+    stack = [obj]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        item = pop()
+        kind = type(item)
+        if kind is str or kind is int or kind is bool or item is None:
+            continue
+        if kind is dict or isinstance(item, dict):
+            for key, value in item.items():
+                if type(key) is not str:
+                    return False
+                value_kind = type(value)
+                if value_kind is not str and value_kind is not int and value is not None:
+                    push(value)
+        elif kind is list or isinstance(item, (list, tuple)):
+            extend(item)
+        elif kind is float:
+            # NaN and ±Infinity fail the range check as well.
+            if item and not (_FLOAT_POSITIONAL_MIN <= abs(item) < _FLOAT_POSITIONAL_MAX):
+                return False
+        else:
+            return False
+    return True
+
+
+def stdlib_canonical_bytes(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    compact: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Referencia: la serialización canónica con el módulo ``json``.
+
+    English:
+        Reference implementation: canonical serialization with ``json``.
+        The conformance tests compare every backend against it.
+    """
+    return json.dumps(
+        obj,
+        sort_keys=True,
+        ensure_ascii=ensure_ascii,
+        separators=(",", ":") if compact else None,
+        default=default,
+    ).encode("utf-8")
+
+
+def canonical_bytes(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    compact: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Bytes UTF-8 canónicos (claves ordenadas) de ``obj``.
+
+    English:
+        Canonical (sorted-keys) UTF-8 bytes of ``obj``; identical to
+        ``stdlib_canonical_bytes`` with the same arguments, whichever backend
+        is active. Only the compact UTF-8 variant without ``default`` is
+        ever served by orjson; every other variant is the stdlib directly.
+    """
+    if compact and not ensure_ascii and default is None and BACKEND == "orjson" and _orjson_safe(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except _ORJSON_ERRORS:
+            pass
+    return stdlib_canonical_bytes(obj, ensure_ascii=ensure_ascii, compact=compact, default=default)
+
+
+def canonical_dumps(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    compact: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Igual que ``canonical_bytes`` pero como ``str``.
+
+    English:
+        Same as ``canonical_bytes`` but returned as ``str``.
+    """
+    return canonical_bytes(obj, ensure_ascii=ensure_ascii, compact=compact, default=default).decode("utf-8")
+
+
+def canonical_sha256(obj: Any, *, ensure_ascii: bool = False, compact: bool = True) -> str:
+    """SHA-256 hex de la forma canónica de ``obj``.
+
+    English:
+        Hex SHA-256 of the canonical form of ``obj``.
+    """
+    return hashlib.sha256(canonical_bytes(obj, ensure_ascii=ensure_ascii, compact=compact)).hexdigest()
@@ -0,0 +1,321 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/columnar_store.py`.
+Almacén columnar de series temporales que acompaña a `LocalSnapshotStore`.
+Cada snapshot normalizado se agrega como una fila de columnas int64 tipadas
+(timestamp, totales y votos por candidato) en archivos binarios crudos
+particionados por departamento y día:
+
+    <root>/dept=<código>/day=<AAAA-MM-DD>/<columna>.i64
+
+Los códigos e identificadores se codifican de forma reversible (`_xx` por
+byte fuera de `[A-Za-z0-9-]`), así dos nombres distintos nunca comparten
+archivo.
+
+Leer la serie de un departamento es un `numpy.memmap` por columna: sin
+`json.loads` por fila. La columna `timestamp` se escribe al final y define el
+número de filas confirmadas, así una escritura interrumpida se repara en la
+siguiente. Votos de un candidato ausente en una fila valen `MISSING`.
+
+Componentes detectados:
+  - DepartmentSeries
+  - ColumnarSeriesStore
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/columnar_store.py`.
+Columnar time-series store companion to `LocalSnapshotStore`. Each
+normalized snapshot is appended as one row of typed int64 columns
+(timestamp, totals and per-candidate votes) in raw binary files partitioned
+by department and day:
+
+    <root>/dept=<code>/day=<YYYY-MM-DD>/<column>.i64
+
+Codes and identifiers are encoded reversibly (`_xx` per byte outside
+`[A-Za-z0-9-]`), so two distinct names never share a file.
+
+Reading a department series is one `numpy.memmap` per column: no per-row
+`json.loads`. The `timestamp` column is written last and defines the number
+of committed rows, so an interrupted write is repaired on the next append.
+Votes for a candidate absent from a row are `MISSING`.
+
+Detected components:
+  - DepartmentSeries
+  - ColumnarSeriesStore
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Columnar Store Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from centinel.core.models import Snapshot
+
+DTYPE = np.dtype("<i8")
+MISSING = -1
+TIMESTAMP_COLUMN = "timestamp"
+TOTAL_COLUMNS = ("registered_voters", "total_votes", "valid_votes", "null_votes", "blank_votes")
+SCHEMA_FILENAME = "schema.json"
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9-]")
+
+
+@dataclass
+class DepartmentSeries:
+    """Serie temporal columnar de un departamento.
+
+    ``timestamps`` es ``datetime64[us]`` en UTC; ``totals`` y ``candidates``
+    son arrays int64 alineados con ``timestamps``. Con una sola partición
+    los arrays son vistas ``memmap`` de solo lectura.
+
+    English:
+        Columnar time series for one department. ``timestamps`` is
+        ``datetime64[us]`` UTC; ``totals`` and ``candidates`` are int64
+        arrays aligned with it. With a single partition the arrays are
+        read-only ``memmap`` views.
+    """
+
+    department_code: str
+    timestamps: np.ndarray
+    totals: Dict[str, np.ndarray] = field(default_factory=dict)
+    candidates: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.timestamps.shape[0])
+
+
+class ColumnarSeriesStore:
+    """Almacén columnar append-only particionado por departamento y día.
+
+    English:
+        Append-only columnar store partitioned by department and day.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Inicializa el almacén en ``root`` (se crea al primer append).
+
+        English:
+            Initialize the store at ``root`` (created on first append).
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def append(self, snapshot: Snapshot) -> None:
+        """Agrega un snapshot como una fila de columnas tipadas.
+
+        English:
+            Append one snapshot as a row of typed columns.
+        """
+        timestamp_us, day = _timestamp_micros(snapshot.meta.timestamp_utc)
+        partition = self._partition_dir(snapshot.meta.department_code, day)
+        row: Dict[str, int] = {name: int(getattr(snapshot.totals, name)) for name in TOTAL_COLUMNS}
+        labels: Dict[str, Dict[str, object]] = {}
+        for candidate in snapshot.candidates:
+            column = _candidate_column(candidate.candidate_id, candidate.slot)
+            row[column] = int(candidate.votes)
+            labels[column] = {
+                "candidate_id": candidate.candidate_id,
+                "name": candidate.name,
+                "party": candidate.party,
+                "slot": candidate.slot,
+            }
+
+        with self._lock:
+            partition.mkdir(parents=True, exist_ok=True)
+            rows = self._repair(partition)
+            schema = _read_schema(partition)
+            new_candidates = {column: info for column, info in labels.items() if column not in schema}
+            if new_candidates:
+                schema.update(new_candidates)
+                _write_schema(partition, schema)
+            for column in schema:
+                # A candidate first seen now is backfilled with MISSING rows.
+                path = partition / f"{column}.i64"
+                if not path.exists() and rows:
+                    path.write_bytes(np.full(rows, MISSING, dtype=DTYPE).tobytes())
+            for column in (*TOTAL_COLUMNS, *schema):
+                with (partition / f"{column}.i64").open("ab") as handle:
+                    handle.write(np.array([row.get(column, MISSING)], dtype=DTYPE).tobytes())
+            # The timestamp column is the commit marker: write it last.
+            with (partition / f"{TIMESTAMP_COLUMN}.i64").open("ab") as handle:
+                handle.write(np.array([timestamp_us], dtype=DTYPE).tobytes())
+
+    def load_series(
+        self,
+        department_code: str,
+        *,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+    ) -> DepartmentSeries:
+        """Carga la serie completa de un departamento, ordenada por tiempo.
+
+        ``start_day``/``end_day`` (``AAAA-MM-DD``, inclusivos) acotan las
+        particiones leídas. Si un timestamp se repite se conserva la última
+        fila, igual que ``INSERT OR REPLACE`` en SQLite.
+
+        English:
+            Load a department's full series, ordered by time. Optional
+            inclusive day bounds limit the partitions read. Duplicate
+            timestamps keep the last row, matching SQLite's
+            ``INSERT OR REPLACE``.
+        """
+        parts = [
+            columns
+            for day, columns in self.iter_partitions(department_code)
+            if (start_day is None or day >= start_day) and (end_day is None or day <= end_day)
+        ]
+        if not parts:
+            empty = np.empty(0, dtype=DTYPE)
+            return DepartmentSeries(department_code, empty.astype("datetime64[us]"))
+
+        names = sorted({name for columns in parts for name in columns} - {TIMESTAMP_COLUMN})
+        if len(parts) == 1:
+            merged = parts[0]
+        else:
+            merged = {
+                name: np.concatenate(
+                    [
+                        columns.get(name, np.full(len(columns[TIMESTAMP_COLUMN]), MISSING, dtype=DTYPE))
+                        for columns in parts
+                    ]
+                )
+                for name in (TIMESTAMP_COLUMN, *names)
+            }
+
+        stamps = merged[TIMESTAMP_COLUMN]
+        if stamps.size > 1 and not np.all(np.diff(stamps) > 0):
+            order = np.argsort(stamps, kind="stable")
+            ordered = stamps[order]
+            keep = np.append(ordered[1:] != ordered[:-1], True)
+            selection = order[keep]
+            merged = {name: np.asarray(values)[selection] for name, values in merged.items()}
+            stamps = merged[TIMESTAMP_COLUMN]
+
+        return DepartmentSeries(
+            department_code=department_code,
+            timestamps=stamps.view("datetime64[us]"),
+            totals={name: merged[name] for name in TOTAL_COLUMNS if name in merged},
+            candidates={name: merged[name] for name in names if name not in TOTAL_COLUMNS},
+        )
+
+    def iter_partitions(self, department_code: str) -> Iterator[Tuple[str, Dict[str, np.ndarray]]]:
+        """Itera ``(día, columnas memmap)`` de un departamento en orden de día.
+
+        English:
+            Yield ``(day, memmapped columns)`` for a department in day order.
+        """
+        dept_dir = self.root / f"dept={_safe_name(department_code)}"
+        if not dept_dir.exists():
+            return
+        for partition in sorted(dept_dir.glob("day=*")):
+            rows = _committed_rows(partition)
+            if not rows:
+                continue
+            columns = {
+                path.stem: np.memmap(path, dtype=DTYPE, mode="r", shape=(rows,))
+                for path in sorted(partition.glob("*.i64"))
+                if path.stat().st_size >= rows * DTYPE.itemsize
+            }
+            yield partition.name.split("=", 1)[1], columns
+
+    def _partition_dir(self, department_code: str, day: str) -> Path:
+        return self.root / f"dept={_safe_name(department_code)}" / f"day={day}"
+
+    @staticmethod
+    def _repair(partition: Path) -> int:
+        """Trunca columnas más largas que las filas confirmadas; devuelve filas.
+
+        English:
+            Truncate columns longer than the committed row count; return it.
+        """
+        rows = _committed_rows(partition)
+        limit = rows * DTYPE.itemsize
+        for path in partition.glob("*.i64"):
+            if path.stat().st_size > limit:
+                with path.open("r+b") as handle:
+                    handle.truncate(limit)
+        return rows
+
+
+def _committed_rows(partition: Path) -> int:
+    path = partition / f"{TIMESTAMP_COLUMN}.i64"
+    return path.stat().st_size // DTYPE.itemsize if path.exists() else 0
+
+
+def _read_schema(partition: Path) -> Dict[str, Dict[str, object]]:
+    path = partition / SCHEMA_FILENAME
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("candidates", {})
+
+
+def _write_schema(partition: Path, candidates: Dict[str, Dict[str, object]]) -> None:
+    path = partition / SCHEMA_FILENAME
+    tmp_path = partition / f"{SCHEMA_FILENAME}.tmp"
+    payload = {"dtype": DTYPE.str, "missing": MISSING, "totals": list(TOTAL_COLUMNS), "candidates": candidates}
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _candidate_column(candidate_id: Optional[str], slot: int) -> str:
+    return f"cand_{_safe_name(candidate_id)}" if candidate_id else f"slot_{int(slot)}"
+
+
+def _safe_name(value: str) -> str:
+    """Codificación reversible: cada byte fuera de ``[A-Za-z0-9-]`` pasa a ``_xx``.
+
+    English:
+        Reversible filesystem-safe encoding. ``_`` itself is escaped, so
+        distinct names (``a.b`` / ``a_b``) never share a file.
+    """
+    encoded = _SAFE_NAME_RE.sub(
+        lambda match: "".join(f"_{byte:02x}" for byte in match.group().encode("utf-8")), str(value)
+    )
+    return encoded or "_"
+
+
+def _timestamp_micros(timestamp_utc: str) -> Tuple[int, str]:
+    parsed = datetime.fromisoformat(timestamp_utc.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    parsed = parsed.astimezone(timezone.utc)
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    delta = parsed - epoch
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return micros, parsed.strftime("%Y-%m-%d")
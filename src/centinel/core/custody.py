@@ -83,14 +83,18 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import math
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from centinel.core.canonical_json import canonical_bytes
 from centinel.paths import iter_all_hashes
+from centinel.core.verification_cursor import load_cursor, record_progress, resolve_resume_point
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
@@ -107,6 +111,11 @@ from cryptography.hazmat.primitives.serialization import (
 
 logger = logging.getLogger(__name__)
 
+CUSTODY_CURSOR_SCOPE = "custody_chain"
+# Below this many links the pool start-up costs more than it saves.
+_PARALLEL_MIN_LINKS = 512
+_SEGMENTS_PER_WORKER = 4
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -136,6 +145,7 @@ class ChainVerificationResult:
     signature_failures: List[str] = field(default_factory=list)
     first_hash: Optional[str] = None
     last_hash: Optional[str] = None
+    resumed_from: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -179,7 +189,114 @@ def _compute_expected_hash(previous_hash: Optional[str], data_bytes: bytes) -> s
     return hasher.hexdigest()
 
 
-def verify_chain(chain_dir: Path) -> ChainVerificationResult:
+@dataclass(frozen=True)
+class _LinkOutcome:
+    """Veredicto de un eslabón aislado. / Verdict for a single link.
+
+    ``pending`` marks a link without a stored ``previous_hash`` whose
+    predecessor was not known to the worker; the merge re-evaluates it.
+    """
+
+    index: int
+    status: str  # ok | pending | broken | read_error | missing_hash
+    stored_hash: Optional[str] = None
+    expected: Optional[str] = None
+    error: Optional[str] = None
+    signature_valid: Optional[bool] = None
+
+
+def _evaluate_link(
+    index: int,
+    hash_file: Path,
+    running_previous: Optional[str],
+    running_known: bool,
+) -> _LinkOutcome:
+    """Verifica un eslabón contra el hash previo en curso. / Verify one link against the running previous hash."""
+    try:
+        payload = json.loads(hash_file.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        return _LinkOutcome(index, "read_error", error=str(exc))
+
+    stored_hash = payload.get("chained_hash") or payload.get("hash")
+    if not stored_hash:
+        return _LinkOutcome(index, "missing_hash")
+
+    stored_previous = payload.get("previous_hash")
+    if not stored_previous and not running_known:
+        return _LinkOutcome(index, "pending", stored_hash=stored_hash)
+
+    # Reconstruir data canónica del eslabón
+    data_payload = {
+        k: v
+        for k, v in sorted(payload.items())
+        if k not in ("chained_hash", "previous_hash", "operator_signature")
+    }
+    data_bytes = canonical_bytes(data_payload)
+
+    effective_previous = stored_previous if stored_previous else running_previous
+    expected = _compute_expected_hash(effective_previous, data_bytes)
+
+    if stored_hash != expected:
+        # También verificar con el previous_hash almacenado directamente
+        alt_expected = _compute_expected_hash(stored_previous, data_bytes)
+        if stored_hash != alt_expected:
+            return _LinkOutcome(index, "broken", stored_hash=stored_hash, expected=expected)
+
+    signature_valid = None
+    if "operator_signature" in payload:
+        signature_valid = verify_hash_record_signature(payload)
+    return _LinkOutcome(index, "ok", stored_hash=stored_hash, signature_valid=signature_valid)
+
+
+def _iter_link_outcomes(
+    hash_files: List[Path],
+    start_index: int,
+    running_previous: Optional[str],
+    running_known: bool,
+) -> Iterator[_LinkOutcome]:
+    """Recorre un segmento en orden, deteniéndose en la primera ruptura."""
+    for offset, hash_file in enumerate(hash_files):
+        outcome = _evaluate_link(start_index + offset, hash_file, running_previous, running_known)
+        yield outcome
+        if outcome.status == "broken":
+            return
+        if outcome.status in ("ok", "pending"):
+            running_previous, running_known = outcome.stored_hash, True
+
+
+def _verify_link_segment(paths: List[str], start_index: int) -> List[_LinkOutcome]:
+    """Worker del pool: verifica un segmento sin conocer su predecesor."""
+    return list(_iter_link_outcomes([Path(p) for p in paths], start_index, None, False))
+
+
+def _parallel_link_outcomes(hash_files: List[Path], start_index: int, workers: int) -> Iterator[_LinkOutcome]:
+    """Verifica segmentos en un pool de procesos y entrega resultados en orden."""
+    remaining = hash_files[start_index:]
+    segment_size = max(1, math.ceil(len(remaining) / (workers * _SEGMENTS_PER_WORKER)))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(
+                _verify_link_segment,
+                [str(path) for path in remaining[offset : offset + segment_size]],
+                start_index + offset,
+            )
+            for offset in range(0, len(remaining), segment_size)
+        ]
+        for future in futures:
+            yield from future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def verify_chain(
+    chain_dir: Path,
+    *,
+    cursor_path: Optional[Path] = None,
+    full: bool = False,
+    full_interval_seconds: Optional[float] = None,
+    workers: int = 1,
+) -> ChainVerificationResult:
     """Recorre todos los eslabones de la cadena y verifica integridad.
 
     Para cada eslabón n, confirma que:
@@ -188,13 +305,36 @@ def verify_chain(chain_dir: Path) -> ChainVerificationResult:
     Lee archivos de hash desde ``chain_dir`` (hashes/*.sha256) ordenados
     cronológicamente y valida la secuencia completa.
 
+    Con ``cursor_path`` la verificación es incremental: se reanuda tras el
+    último eslabón registrado en el cursor firmado si el prefijo no cambió,
+    y el cursor avanza solo cuando la pasada termina sin errores ni firmas
+    inválidas. ``full=True`` o un ``full_interval_seconds`` vencido fuerzan
+    la verificación desde el génesis.
+
+    Con ``workers > 1`` (``0`` = todos los núcleos) la cadena se divide en
+    segmentos que se verifican en un pool de procesos; los eslabones que
+    dependen del segmento anterior se resuelven al unir los resultados en
+    orden, por lo que el resultado (incluido ``broken_at``) es idéntico al
+    de la pasada secuencial.
+
     English:
         Walks all chain links and verifies integrity.
 
         For each link n, confirms that:
             hash[n] == sha256(hash[n-1] + data[n])
+
+        With ``cursor_path`` verification is incremental: it resumes after
+        the last link recorded in the signed cursor when the prefix is
+        unchanged, and the cursor only advances after a clean pass.
+        ``full=True`` or an expired ``full_interval_seconds`` force a pass
+        from genesis.
+
+        With ``workers > 1`` (``0`` = all cores) the chain is split into
+        segments verified in a process pool; links that depend on the
+        previous segment are resolved while merging results in order, so
+        the result (including ``broken_at``) matches the sequential pass.
     """
-    hash_files = iter_all_hashes(hash_root=chain_dir)
+    hash_files = iter_all_hashes(hash_root=chain_dir, exhaustive=True)
 
     if not hash_files:
         return ChainVerificationResult(
@@ -211,40 +351,51 @@ def verify_chain(chain_dir: Path) -> ChainVerificationResult:
     first_hash: Optional[str] = None
     last_hash: Optional[str] = None
 
-    for idx, hash_file in enumerate(hash_files):
-        try:
-            payload = json.loads(hash_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
-            errors.append(f"read_error index={idx} file={hash_file.name} error={exc}")
-            continue
-
-        stored_hash = payload.get("chained_hash") or payload.get("hash")
-        if not stored_hash:
-            errors.append(f"missing_hash index={idx} file={hash_file.name}")
-            continue
-
-        # Reconstruir data canónica del eslabón
-        data_payload = {
-            k: v
-            for k, v in sorted(payload.items())
-            if k not in ("chained_hash", "previous_hash", "operator_signature")
-        }
-        data_bytes = json.dumps(
-            data_payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
-        ).encode("utf-8")
-
-        stored_previous = payload.get("previous_hash")
-        effective_previous = stored_previous if stored_previous else previous_hash
+    resume = None
+    if cursor_path is not None and not full:
+        resume = resolve_resume_point(
+            load_cursor(cursor_path, scope=CUSTODY_CURSOR_SCOPE),
+            hash_files,
+            root=chain_dir,
+            full_interval_seconds=full_interval_seconds,
+        )
+    start_index = 0
+    if resume is not None:
+        start_index = resume.index + 1
+        verified = start_index
+        previous_hash = last_hash = resume.last_hash
+        first_hash = resume.first_hash
+    resumed_from = start_index if resume is not None else None
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    remaining = len(hash_files) - start_index
+    if workers > 1 and remaining >= _PARALLEL_MIN_LINKS:
+        outcomes = _parallel_link_outcomes(hash_files, start_index, workers)
+    else:
+        outcomes = _iter_link_outcomes(hash_files[start_index:], start_index, previous_hash, True)
 
-        expected = _compute_expected_hash(effective_previous, data_bytes)
+    try:
+        for outcome in outcomes:
+            idx = outcome.index
+            hash_file = hash_files[idx]
+            if outcome.status == "pending":
+                # Segment head that chains off an unknown predecessor.
+                outcome = _evaluate_link(idx, hash_file, previous_hash, True)
+
+            if outcome.status == "read_error":
+                errors.append(f"read_error index={idx} file={hash_file.name} error={outcome.error}")
+                continue
+            if outcome.status == "missing_hash":
+                errors.append(f"missing_hash index={idx} file={hash_file.name}")
+                continue
 
-        if idx == 0:
-            first_hash = stored_hash
+            stored_hash = outcome.stored_hash or ""
+            if idx == 0:
+                first_hash = stored_hash
 
-        if stored_hash != expected:
-            # También verificar con el previous_hash almacenado directamente
-            alt_expected = _compute_expected_hash(stored_previous, data_bytes)
-            if stored_hash != alt_expected:
+            if outcome.status == "broken":
+                expected = outcome.expected or ""
                 errors.append(
                     f"hash_mismatch index={idx} file={hash_file.name} "
                     f"expected={expected[:16]}... stored={stored_hash[:16]}..."
@@ -258,18 +409,32 @@ def verify_chain(chain_dir: Path) -> ChainVerificationResult:
                     signature_failures=signature_failures,
                     first_hash=first_hash,
                     last_hash=previous_hash,
+                    resumed_from=resumed_from,
                 )
 
-        # Verify signature if present (non-fatal failure)
-        if "operator_signature" in payload:
-            if not verify_hash_record_signature(payload):
+            # Verify signature if present (non-fatal failure)
+            if outcome.signature_valid is False:
                 signature_failures.append(f"invalid_signature index={idx} file={hash_file.name}")
 
-        verified += 1
-        previous_hash = stored_hash
-        last_hash = stored_hash
+            verified += 1
+            previous_hash = stored_hash
+            last_hash = stored_hash
+    finally:
+        close = getattr(outcomes, "close", None)
+        if close is not None:
+            close()
 
     valid = not errors
+    if cursor_path is not None and valid and not signature_failures and last_hash:
+        record_progress(
+            cursor_path,
+            resume,
+            scope=CUSTODY_CURSOR_SCOPE,
+            paths=hash_files,
+            last_hash=last_hash,
+            first_hash=first_hash,
+            root=chain_dir,
+        )
     return ChainVerificationResult(
         valid=valid,
         total_links=len(hash_files),
@@ -278,6 +443,7 @@ def verify_chain(chain_dir: Path) -> ChainVerificationResult:
         signature_failures=signature_failures,
         first_hash=first_hash,
         last_hash=last_hash,
+        resumed_from=resumed_from,
     )
 
 
@@ -716,9 +882,7 @@ def sign_hash_record(
     """
     # Serializar sin campos de firma previos
     signable = {k: v for k, v in sorted(hash_record.items()) if k != "operator_signature"}
-    data = json.dumps(signable, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    data = canonical_bytes(signable)
 
     result = sign_snapshot(data, key_path=key_path, operator_id=operator_id)
 
@@ -748,9 +912,7 @@ def verify_hash_record_signature(hash_record: Dict[str, Any]) -> bool:
         return False
 
     signable = {k: v for k, v in sorted(hash_record.items()) if k != "operator_signature"}
-    data = json.dumps(signable, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    data = canonical_bytes(signable)
 
     return verify_snapshot_signature(data, signature_hex, public_key_hex=public_key_hex)
 
@@ -793,6 +955,7 @@ class StartupVerificationReport:
                 "total_links": (self.chain_result.total_links if self.chain_result else 0),
                 "verified_links": (self.chain_result.verified_links if self.chain_result else 0),
                 "errors": self.chain_result.errors if self.chain_result else [],
+                "resumed_from": self.chain_result.resumed_from if self.chain_result else None,
             },
             "anchors": anchor_dicts,
             "signature_failures": self.signature_failures,
@@ -806,6 +969,10 @@ def run_startup_verification(
     verify_anchors: bool = False,
     verify_signatures: bool = True,
     max_anchor_checks: int = 5,
+    cursor_path: Optional[Path] = None,
+    full_verification: bool = False,
+    full_reverify_hours: Optional[float] = None,
+    workers: int = 1,
 ) -> StartupVerificationReport:
     """Ejecuta verificación completa al arranque del pipeline.
 
@@ -813,12 +980,26 @@ def run_startup_verification(
     2. Opcionalmente verifica los últimos anclajes contra Arbitrum.
     3. Verifica firmas Ed25519 en los registros de hash.
 
+    Con ``cursor_path`` los pasos 1 y 3 solo procesan los eslabones
+    posteriores al cursor de verificación, de modo que un reinicio no
+    re-hashea la cadena completa; ``full_verification`` o un cursor con más
+    de ``full_reverify_hours`` desde la última pasada completa fuerzan la
+    verificación desde el génesis. ``workers`` se pasa a ``verify_chain``
+    para paralelizar las pasadas completas.
+
     English:
         Runs full verification at pipeline startup.
 
         1. Verifies the complete hash chain.
         2. Optionally verifies recent anchors against Arbitrum.
         3. Verifies Ed25519 signatures on hash records.
+
+        With ``cursor_path`` steps 1 and 3 only process links after the
+        verification cursor, so a restart does not re-hash the whole chain;
+        ``full_verification`` or a cursor whose last full pass is older than
+        ``full_reverify_hours`` force verification from genesis.
+        ``workers`` is forwarded to ``verify_chain`` to parallelize full
+        passes.
     """
     start_time = time.monotonic()
     hash_dir = hash_dir or Path("hashes")
@@ -830,12 +1011,19 @@ def run_startup_verification(
 
     # 1. Verificar cadena de hashes
     if hash_dir.exists():
-        report.chain_result = verify_chain(hash_dir)
+        report.chain_result = verify_chain(
+            hash_dir,
+            cursor_path=cursor_path,
+            full=full_verification,
+            full_interval_seconds=(full_reverify_hours * 3600 if full_reverify_hours else None),
+            workers=workers,
+        )
         if report.chain_result.valid:
             logger.info(
-                "startup_chain_valid links=%d last_hash=%s",
+                "startup_chain_valid links=%d last_hash=%s resumed_from=%s",
                 report.chain_result.verified_links,
                 (report.chain_result.last_hash or "")[:16],
+                report.chain_result.resumed_from,
             )
         else:
             logger.error(
@@ -880,8 +1068,11 @@ def run_startup_verification(
 
     # 3. Verificar firmas en registros de hash
     if verify_signatures and hash_dir.exists():
-        hash_files = iter_all_hashes(hash_root=hash_dir)
-        for hash_file in hash_files:
+        hash_files = iter_all_hashes(hash_root=hash_dir, exhaustive=True)
+        # The cursor only advances past signature-clean links, so records
+        # before the resume point were already checked by a previous run.
+        resumed_from = report.chain_result.resumed_from if report.chain_result else None
+        for hash_file in hash_files[resumed_from or 0 :]:
             try:
                 record = json.loads(hash_file.read_text(encoding="utf-8"))
             except (json.JSONDecodeError, OSError):
@@ -0,0 +1,447 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/merkle.py`.
+Acumulador Merkle append-only. Guarda, por nivel, solo los nodos completos
+(subárboles perfectos), que nunca cambian al agregar hojas; la frontera
+(un nodo por nivel) y la raíz se derivan de ellos. Agregar una hoja cuesta
+O(log n) y la raíz queda lista en O(1). La construcción es la de
+`transparency.compute_merkle_root` (estilo Bitcoin: en niveles impares se
+duplica el último nodo; una sola hoja es su propia raíz), así que las raíces
+ya publicadas no cambian.
+
+Con los mismos nodos se emiten pruebas de inclusión (una hoja pertenece al
+árbol de tamaño ``n``) y de consistencia (el árbol de tamaño ``m`` es prefijo
+del de tamaño ``n``), ambas de O(log n) hashes. `verify_inclusion` y
+`verify_consistency` solo usan `hashlib`: un auditor las ejecuta sin la
+cadena.
+
+Componentes detectados:
+  - merkle_parent
+  - InclusionProof
+  - ConsistencyProof
+  - MerkleAccumulator
+  - verify_inclusion
+  - verify_consistency
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/merkle.py`.
+Append-only Merkle accumulator. Per level it stores only complete nodes
+(perfect subtrees), which never change as leaves are appended; the
+frontier (one node per level) and the root derive from them. Appending a
+leaf costs O(log n) and the root is ready in O(1). The construction is the
+one in `transparency.compute_merkle_root` (Bitcoin style: odd levels
+duplicate their last node; a single leaf is its own root), so roots that
+were already published do not change.
+
+The same nodes yield inclusion proofs (a leaf belongs to the tree of size
+``n``) and consistency proofs (the tree of size ``m`` is a prefix of the
+tree of size ``n``), both O(log n) hashes. `verify_inclusion` and
+`verify_consistency` only need `hashlib`, so an auditor runs them without
+the chain.
+
+Detected components:
+  - merkle_parent
+  - InclusionProof
+  - ConsistencyProof
+  - MerkleAccumulator
+  - verify_inclusion
+  - verify_consistency
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Merkle Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+MERKLE_CONSTRUCTION = "sha256-bitcoin-duplicate-odd"
+
+
+def merkle_parent(left: bytes, right: bytes) -> bytes:
+    """Nodo padre: ``sha256(left || right)``. / Parent node: ``sha256(left || right)``."""
+    return hashlib.sha256(left + right).digest()
+
+
+def _level_width(size: int, level: int) -> int:
+    """Nodos en ``level`` para un árbol de ``size`` hojas. / Nodes on ``level`` for a ``size``-leaf tree."""
+    return -(-size // (1 << level))
+
+
+def _root_from_frontier(size: int, frontier: Dict[int, bytes]) -> Tuple[bytes, Dict[int, bytes]]:
+    """Raíz y nodos parciales a partir de la frontera de ``size`` hojas.
+
+    ``frontier[k]`` es la raíz del subárbol perfecto de nivel ``k`` presente
+    cuando el bit ``k`` de ``size`` está activo. Devuelve la raíz y, por
+    nivel, el nodo parcial más a la derecha (el que cubre las hojas que no
+    completan un subárbol perfecto).
+
+    / Root and partial nodes from the frontier of a ``size``-leaf tree.
+    ``frontier[k]`` is the perfect level-``k`` subtree root present when bit
+    ``k`` of ``size`` is set. Returns the root plus, per level, the
+    rightmost partial node (covering leaves that do not fill a perfect
+    subtree).
+    """
+    partial: Dict[int, bytes] = {}
+    pending: Optional[bytes] = None
+    level = 0
+    while True:
+        full = frontier.get(level)
+        if _level_width(size, level) == 1:
+            root = pending if pending is not None else full
+            assert root is not None
+            return root, partial
+        if pending is not None:
+            partial[level] = pending
+            # Con el bit activo, el nodo completo es el hermano izquierdo del
+            # parcial; sin él, el parcial es el último de un nivel impar.
+            pending = merkle_parent(full, pending) if full is not None else merkle_parent(pending, pending)
+        elif full is not None:
+            pending = merkle_parent(full, full)
+        level += 1
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Prueba de que ``leaf_hash`` es la hoja ``leaf_index`` del árbol de ``tree_size`` hojas.
+
+    ``audit_path`` lista, de abajo hacia arriba, los hermanos necesarios;
+    los niveles donde el nodo se duplica a sí mismo no aportan hash.
+
+    English:
+        Proof that ``leaf_hash`` is leaf ``leaf_index`` of the
+        ``tree_size``-leaf tree. ``audit_path`` lists the needed siblings
+        bottom-up; levels where the node is duplicated add no hash.
+    """
+
+    leaf_index: int
+    tree_size: int
+    leaf_hash: str
+    audit_path: Tuple[str, ...]
+    root: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["audit_path"] = list(self.audit_path)
+        payload["construction"] = MERKLE_CONSTRUCTION
+        return payload
+
+
+@dataclass(frozen=True)
+class ConsistencyProof:
+    """Prueba de que el árbol de ``old_size`` hojas es prefijo del de ``new_size``.
+
+    ``old_frontier`` son las raíces de los subárboles perfectos del árbol
+    viejo (de mayor a menor nivel) y reconstruyen ``old_root``;
+    ``right_path`` son los hermanos derechos que llevan su último nodo hasta
+    ``new_root``.
+
+    English:
+        Proof that the ``old_size``-leaf tree is a prefix of the
+        ``new_size``-leaf tree. ``old_frontier`` holds the old tree's
+        perfect subtree roots (highest level first) and rebuilds
+        ``old_root``; ``right_path`` holds the right siblings that carry its
+        last node up to ``new_root``.
+    """
+
+    old_size: int
+    new_size: int
+    old_root: Optional[str]
+    new_root: Optional[str]
+    old_frontier: Tuple[str, ...]
+    right_path: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["old_frontier"] = list(self.old_frontier)
+        payload["right_path"] = list(self.right_path)
+        payload["construction"] = MERKLE_CONSTRUCTION
+        return payload
+
+
+class MerkleAccumulator:
+    """Árbol Merkle append-only con frontera, raíz en O(1) y pruebas.
+
+    ``levels[k]`` guarda los nodos completos del nivel ``k`` en orden; un
+    nodo completo cubre ``2**k`` hojas y no cambia al agregar más. La
+    frontera de un tamaño ``m`` es ``levels[k][m // 2**k - 1]`` para cada bit
+    ``k`` activo de ``m``, por lo que también se responden raíces y pruebas
+    de tamaños anteriores.
+
+    English:
+        Append-only Merkle tree with frontier, O(1) root and proofs.
+        ``levels[k]`` keeps level-``k`` complete nodes in order; a complete
+        node covers ``2**k`` leaves and never changes as more are appended.
+        The frontier for a size ``m`` is ``levels[k][m // 2**k - 1]`` for each
+        set bit ``k`` of ``m``, so roots and proofs for earlier sizes are
+        answered too.
+    """
+
+    def __init__(self) -> None:
+        self._levels: List[List[bytes]] = [[]]
+        self._root: Optional[bytes] = None
+        self._positions: Dict[str, int] = {}
+
+    @classmethod
+    def from_leaves(cls, leaf_hashes: Iterable[str]) -> "MerkleAccumulator":
+        """Construye el acumulador agregando ``leaf_hashes`` en orden. / Build by appending ``leaf_hashes`` in order."""
+        accumulator = cls()
+        accumulator.extend(leaf_hashes)
+        return accumulator
+
+    @property
+    def size(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def root(self) -> Optional[str]:
+        """Raíz actual en hex (``None`` si está vacío). / Current hex root (``None`` when empty)."""
+        return self._root.hex() if self._root is not None else None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, leaf_hash: str) -> int:
+        """Agrega una hoja (hash hex) y devuelve su índice. / Append a leaf (hex hash) and return its index."""
+        node = bytes.fromhex(leaf_hash)
+        index = self.size
+        self._levels[0].append(node)
+        level = 0
+        # Cada par completo sube un nivel: costo amortizado O(1), peor O(log n).
+        while len(self._levels[level]) % 2 == 0:
+            parent = merkle_parent(self._levels[level][-2], self._levels[level][-1])
+            level += 1
+            if level == len(self._levels):
+                self._levels.append([])
+            self._levels[level].append(parent)
+        self._root = _root_from_frontier(self.size, self._frontier_nodes(self.size))[0]
+        self._positions.setdefault(leaf_hash.lower(), index)
+        return index
+
+    def extend(self, leaf_hashes: Iterable[str]) -> None:
+        for leaf_hash in leaf_hashes:
+            self.append(leaf_hash)
+
+    def leaf(self, index: int) -> str:
+        return self._levels[0][index].hex()
+
+    def index_of(self, leaf_hash: str) -> Optional[int]:
+        """Primer índice de ``leaf_hash`` o ``None``. / First index of ``leaf_hash`` or ``None``."""
+        return self._positions.get(leaf_hash.lower())
+
+    def frontier(self, size: Optional[int] = None) -> List[str]:
+        """Raíces de subárboles perfectos para ``size`` hojas, de mayor a menor nivel.
+
+        English:
+            Perfect subtree roots for ``size`` leaves, highest level first.
+        """
+        nodes = self._frontier_nodes(self._check_size(size))
+        return [nodes[level].hex() for level in sorted(nodes, reverse=True)]
+
+    def root_at(self, size: int) -> Optional[str]:
+        """Raíz del árbol con las primeras ``size`` hojas. / Root of the tree over the first ``size`` leaves."""
+        size = self._check_size(size)
+        if size == 0:
+            return None
+        return _root_from_frontier(size, self._frontier_nodes(size))[0].hex()
+
+    def inclusion_proof(self, leaf_index: int, tree_size: Optional[int] = None) -> InclusionProof:
+        """Prueba de inclusión de ``leaf_index`` en el árbol de ``tree_size`` hojas.
+
+        English:
+            Inclusion proof of ``leaf_index`` in the ``tree_size``-leaf tree.
+        """
+        tree_size = self._check_size(tree_size)
+        if not 0 <= leaf_index < tree_size:
+            raise IndexError(f"leaf_index {leaf_index} outside tree of size {tree_size}")
+        root, partial = _root_from_frontier(tree_size, self._frontier_nodes(tree_size))
+        path: List[str] = []
+        index = leaf_index
+        level = 0
+        while _level_width(tree_size, level) > 1:
+            sibling = index ^ 1
+            if sibling < _level_width(tree_size, level):
+                path.append(self._node(level, sibling, tree_size, partial).hex())
+            index >>= 1
+            level += 1
+        return InclusionProof(
+            leaf_index=leaf_index,
+            tree_size=tree_size,
+            leaf_hash=self.leaf(leaf_index),
+            audit_path=tuple(path),
+            root=root.hex(),
+        )
+
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> ConsistencyProof:
+        """Prueba de que el árbol de ``old_size`` hojas es prefijo del de ``new_size``.
+
+        English:
+            Proof that the ``old_size``-leaf tree is a prefix of the
+            ``new_size``-leaf tree.
+        """
+        new_size = self._check_size(new_size)
+        if not 0 <= old_size <= new_size:
+            raise ValueError(f"old_size {old_size} must be within [0, {new_size}]")
+        old_frontier = self.frontier(old_size)
+        right_path: List[str] = []
+        if 0 < old_size < new_size:
+            _, partial = _root_from_frontier(new_size, self._frontier_nodes(new_size))
+            # El último nodo del árbol viejo está en su bit activo más bajo;
+            # sus hermanos izquierdos son la propia frontera vieja.
+            level = (old_size & -old_size).bit_length() - 1
+            index = (old_size >> level) - 1
+            while _level_width(new_size, level) > 1:
+                sibling = index + 1
+                if index % 2 == 0 and sibling < _level_width(new_size, level):
+                    right_path.append(self._node(level, sibling, new_size, partial).hex())
+                index >>= 1
+                level += 1
+        return ConsistencyProof(
+            old_size=old_size,
+            new_size=new_size,
+            old_root=self.root_at(old_size),
+            new_root=self.root_at(new_size),
+            old_frontier=tuple(old_frontier),
+            right_path=tuple(right_path),
+        )
+
+    def _check_size(self, size: Optional[int]) -> int:
+        if size is None:
+            return self.size
+        if not 0 <= size <= self.size:
+            raise ValueError(f"tree size {size} outside [0, {self.size}]")
+        return size
+
+    def _frontier_nodes(self, size: int) -> Dict[int, bytes]:
+        return {
+            level: self._levels[level][(size >> level) - 1] for level in range(size.bit_length()) if size >> level & 1
+        }
+
+    def _node(self, level: int, index: int, size: int, partial: Dict[int, bytes]) -> bytes:
+        """Nodo ``index`` del nivel ``level`` en el árbol de ``size`` hojas. / Node ``index`` on ``level`` of the ``size``-leaf tree."""
+        if index < size >> level:
+            return self._levels[level][index]
+        return partial[level]
+
+
+def _hex_bytes(values: Sequence[str]) -> List[bytes]:
+    return [bytes.fromhex(value) for value in values]
+
+
+def verify_inclusion(leaf_hash: str, leaf_index: int, tree_size: int, audit_path: Sequence[str], root: str) -> bool:
+    """Verifica una prueba de inclusión sin acceso a la cadena.
+
+    English:
+        Verify an inclusion proof without access to the chain.
+    """
+    try:
+        node = bytes.fromhex(leaf_hash)
+        siblings = _hex_bytes(audit_path)
+        expected = bytes.fromhex(root)
+    except (TypeError, ValueError):
+        return False
+    if not 0 <= leaf_index < tree_size:
+        return False
+    index = leaf_index
+    level = 0
+    consumed = 0
+    while _level_width(tree_size, level) > 1:
+        if (index ^ 1) < _level_width(tree_size, level):
+            if consumed == len(siblings):
+                return False
+            sibling = siblings[consumed]
+            consumed += 1
+            node = merkle_parent(sibling, node) if index & 1 else merkle_parent(node, sibling)
+        else:
+            node = merkle_parent(node, node)
+        index >>= 1
+        level += 1
+    return consumed == len(siblings) and node == expected
+
+
+def verify_consistency(
+    old_size: int,
+    new_size: int,
+    old_root: Optional[str],
+    new_root: Optional[str],
+    old_frontier: Sequence[str],
+    right_path: Sequence[str],
+) -> bool:
+    """Verifica que ``old_root`` (``old_size`` hojas) sea prefijo de ``new_root``.
+
+    English:
+        Verify that ``old_root`` (``old_size`` leaves) is a prefix of
+        ``new_root``.
+    """
+    if not 0 <= old_size <= new_size:
+        return False
+    if old_size == 0:
+        return not old_frontier and not right_path and old_root is None
+    try:
+        frontier_nodes = _hex_bytes(old_frontier)
+        path = _hex_bytes(right_path)
+        old_expected = bytes.fromhex(old_root or "")
+        new_expected = bytes.fromhex(new_root or "")
+    except (TypeError, ValueError):
+        return False
+    levels = [level for level in range(old_size.bit_length() - 1, -1, -1) if old_size >> level & 1]
+    if len(frontier_nodes) != len(levels):
+        return False
+    frontier = dict(zip(levels, frontier_nodes))
+    if _root_from_frontier(old_size, frontier)[0] != old_expected:
+        return False
+    if old_size == new_size:
+        return not path and old_expected == new_expected
+
+    level = levels[-1]
+    index = (old_size >> level) - 1
+    node = frontier[level]
+    consumed = 0
+    while _level_width(new_size, level) > 1:
+        if index & 1:
+            # Hermano izquierdo: subárbol completo del árbol viejo.
+            left = frontier.get(level)
+            if left is None:
+                return False
+            node = merkle_parent(left, node)
+        elif index + 1 < _level_width(new_size, level):
+            if consumed == len(path):
+                return False
+            node = merkle_parent(node, path[consumed])
+            consumed += 1
+        else:
+            node = merkle_parent(node, node)
+        index >>= 1
+        level += 1
+    return consumed == len(path) and node == new_expected
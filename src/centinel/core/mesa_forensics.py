@@ -7,6 +7,12 @@ Forensia por mesa/acta. Provee funciones puras para:
     (`mesa_fingerprint`), sobre el sub-objeto canónico de esa mesa.
   - Construir un índice forense por código de mesa (`index_mesas`)
     con huella, votos por candidato y desglose.
+  - Mantener un índice persistente de huellas (`MesaFingerprintIndex`)
+    que, ante un snapshot nuevo, entrega solo las mesas nuevas,
+    eliminadas o modificadas (`MesaChangeSet`). Las reglas por mesa
+    consumen ese conjunto: su trabajo por ciclo escala con las mesas que
+    cambiaron, no con el total (detectar el cambio cuesta un SHA-256 por
+    mesa).
 
 El sellado a nivel de snapshot completo ya existe en el pipeline de
 captura. Este módulo añade granularidad: permite probar que una mesa
@@ -17,7 +23,11 @@ encadenado del snapshot; es una capa de análisis additiva.
 ======================== ENGLISH ========================
 Per-table (acta) forensics. Pure helpers to compute a deterministic
 cryptographic fingerprint per table and to build a per-table index
-(fingerprint + candidate votes + breakdown). Additive analysis layer;
+(fingerprint + candidate votes + breakdown). `MesaFingerprintIndex` keeps
+a persistent fingerprint index keyed by table code and turns each new
+snapshot into a compact `MesaChangeSet` (added / removed / changed
+tables), so per-table rule work scales with the tables that changed
+(detection itself is one SHA-256 per table). Additive analysis layer;
 does not alter snapshot capture or the snapshot hash chain.
 """
 
@@ -25,16 +35,27 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Dict, Optional
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from centinel.core.canonical_json import canonical_bytes
 from centinel.core.rules.common import (
     collect_all_mesas,
     extract_mesa_candidate_votes,
     extract_mesa_code,
     extract_mesa_vote_breakdown,
+    extract_mesas,
     safe_int_or_none,
 )
 
+logger = logging.getLogger(__name__)
+
+MESA_INDEX_VERSION = 1
+
 
 def mesa_candidate_votes(mesa: dict) -> Dict[str, int]:
     """Votos por candidato robustos para la estructura real del CNE.
@@ -74,9 +95,7 @@ def _canonical(mesa: dict) -> bytes:
         data. Deterministic key order, fixed separators.
     """
     cleaned = {k: v for k, v in mesa.items() if not str(k).startswith("_")}
-    return json.dumps(cleaned, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    return canonical_bytes(cleaned)
 
 
 def mesa_fingerprint(mesa: dict) -> str:
@@ -142,3 +161,260 @@ def primary_beneficiary(delta: Dict[str, int]) -> Optional[str]:
     if not gains:
         return None
     return max(gains, key=gains.get)
+
+
+# ── Índice incremental / Incremental index ─────────────────────────────────
+
+
+def fingerprint_mesas(data: Optional[dict]) -> Dict[str, Tuple[str, bool, dict]]:
+    """Huella de cada mesa con código: ``{codigo: (huella, en_raiz, mesa)}``.
+
+    Mismo recorrido y semántica que `index_mesas` (si un código se repite,
+    gana la última mesa en la posición de la primera). ``en_raiz`` indica
+    si el código aparece en las mesas de la raíz del JSON (lo que compara
+    `mesas_diff_rule`).
+
+    English:
+        Fingerprint every coded table: ``{code: (fingerprint, at_root,
+        mesa)}``. Same traversal and semantics as `index_mesas` (a repeated
+        code keeps the first position and the last table). ``at_root`` tells
+        whether the code appears among the JSON's root-level tables.
+    """
+    if not data:
+        return {}
+    root_ids = {id(mesa) for mesa in extract_mesas(data)}
+    root_codes: set = set()
+    prints: Dict[str, Tuple[str, bool, dict]] = {}
+    for mesa in collect_all_mesas(data):
+        code = extract_mesa_code(mesa)
+        if not code:
+            continue
+        if id(mesa) in root_ids:
+            root_codes.add(code)
+        prints[code] = (mesa_fingerprint(mesa), False, mesa)
+    return {
+        code: (fingerprint, code in root_codes, mesa)
+        for code, (fingerprint, _root, mesa) in prints.items()
+    }
+
+
+def _index_record(fingerprint: str, root: bool, mesa: dict) -> dict:
+    return {
+        "fingerprint": fingerprint,
+        "root": root,
+        "departamento": str(mesa.get("_departamento") or ""),
+        "candidate_votes": mesa_candidate_votes(mesa),
+    }
+
+
+@dataclass(frozen=True)
+class MesaChangeSet:
+    """Mesas que cambiaron entre dos snapshots consecutivos.
+
+    ``added``/``removed`` van de código a registro del índice
+    (``fingerprint``, ``root``, ``departamento``, ``candidate_votes``);
+    ``changed`` a ``(previo, actual)`` cuando cambió la huella o el nivel
+    (raíz/departamento). Los recuentos describen ambos snapshots completos.
+
+    English:
+        Tables that changed between two consecutive snapshots. ``added`` /
+        ``removed`` map code to index record; ``changed`` maps code to
+        ``(previous, current)`` when the fingerprint or the level (root vs
+        department) changed. Counts describe both full snapshots.
+    """
+
+    added: Dict[str, dict]
+    removed: Dict[str, dict]
+    changed: Dict[str, Tuple[dict, dict]]
+    previous_count: int
+    current_count: int
+    previous_root_count: int
+    current_root_count: int
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def modified(self) -> Iterator[Tuple[str, dict, dict]]:
+        """Mesas presentes en ambos cuyo contenido (huella) cambió.
+
+        English:
+            Tables present in both snapshots whose content changed, in the
+            previous snapshot's order.
+        """
+        for code, (previous, current) in self.changed.items():
+            if previous["fingerprint"] != current["fingerprint"]:
+                yield code, previous, current
+
+    def root_missing(self) -> List[str]:
+        """Códigos de raíz del previo ausentes de la raíz actual (ordenados)."""
+        missing = [code for code, record in self.removed.items() if record["root"]]
+        missing += [code for code, (prev, curr) in self.changed.items() if prev["root"] and not curr["root"]]
+        return sorted(missing)
+
+    def root_added(self) -> List[str]:
+        """Códigos de raíz actuales ausentes de la raíz previa (ordenados)."""
+        added = [code for code, record in self.added.items() if record["root"]]
+        added += [code for code, (prev, curr) in self.changed.items() if curr["root"] and not prev["root"]]
+        return sorted(added)
+
+    def to_dict(self) -> dict:
+        """Resumen compacto (solo códigos y huellas). / Compact summary."""
+        return {
+            "added": {code: record["fingerprint"] for code, record in self.added.items()},
+            "removed": {code: record["fingerprint"] for code, record in self.removed.items()},
+            "changed": {code: [prev["fingerprint"], curr["fingerprint"]] for code, (prev, curr) in self.changed.items()},
+            "previous_count": self.previous_count,
+            "current_count": self.current_count,
+        }
+
+
+class MesaFingerprintIndex:
+    """Índice persistente de huellas por código de mesa.
+
+    Refleja el último snapshot aplicado (``source`` lo identifica: un token
+    opaco como ruta+tamaño+mtime, o la identidad del dict en memoria).
+    ``changes(previo, actual)`` reutiliza el índice si refleja ``previo``;
+    si no, lo reconstruye desde ``previo`` una vez. Solo las mesas nuevas o
+    modificadas pasan por la extracción de votos.
+
+    English:
+        Persistent fingerprint index keyed by table code. It mirrors the
+        last snapshot applied (identified by ``source``, an opaque token
+        such as path+size+mtime, or by in-memory identity).
+        ``changes(previous, current)`` reuses the index when it mirrors
+        ``previous`` and rebuilds it from ``previous`` otherwise; only new
+        or modified tables go through vote extraction. Not thread-safe:
+        the rules engine serializes every update and save under its own
+        engine-level lock, shared by all its frames.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, dict] = {}
+        self._root_count = 0
+        self._data: Optional[dict] = None
+        self.source: Optional[str] = None
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, code: str) -> Optional[dict]:
+        return self._records.get(code)
+
+    def in_sync(self, data: Optional[dict], source: Optional[str] = None) -> bool:
+        """¿Refleja el índice a ``data``? / Does the index mirror ``data``?"""
+        if source is not None and source == self.source:
+            return True
+        return data is not None and data is self._data
+
+    def rebuild(self, data: Optional[dict], source: Optional[str] = None) -> None:
+        """Reconstruye el índice completo desde ``data``."""
+        prints = fingerprint_mesas(data)
+        self._records = {code: _index_record(fp, root, mesa) for code, (fp, root, mesa) in prints.items()}
+        self._root_count = sum(1 for record in self._records.values() if record["root"])
+        self._data = data
+        self.source = source
+        self.dirty = True
+
+    def update(self, data: Optional[dict], source: Optional[str] = None) -> MesaChangeSet:
+        """Aplica ``data`` y devuelve lo que cambió respecto del índice.
+
+        English:
+            Apply ``data`` and return what changed against the index. The
+            index keeps ``data``'s table order afterwards.
+        """
+        prints = fingerprint_mesas(data)
+        previous = self._records
+        added: Dict[str, dict] = {}
+        removed: Dict[str, dict] = {}
+        changed: Dict[str, Tuple[dict, dict]] = {}
+        for code, record in previous.items():
+            current = prints.get(code)
+            if current is None:
+                removed[code] = record
+            elif current[0] != record["fingerprint"] or current[1] != record["root"]:
+                changed[code] = (record, _index_record(*current))
+        records: Dict[str, dict] = {}
+        for code, (fingerprint, root, mesa) in prints.items():
+            record = previous.get(code)
+            if record is None:
+                record = added[code] = _index_record(fingerprint, root, mesa)
+            elif code in changed:
+                record = changed[code][1]
+            records[code] = record
+        root_count = sum(1 for _fp, root, _mesa in prints.values() if root)
+        changes = MesaChangeSet(
+            added=added,
+            removed=removed,
+            changed=changed,
+            previous_count=len(previous),
+            current_count=len(records),
+            previous_root_count=self._root_count,
+            current_root_count=root_count,
+        )
+        self._records = records
+        self._root_count = root_count
+        self._data = data
+        self.source = source
+        self.dirty = self.dirty or not changes.is_empty
+        return changes
+
+    def changes(
+        self,
+        previous_data: Optional[dict],
+        current_data: Optional[dict],
+        *,
+        previous_source: Optional[str] = None,
+        current_source: Optional[str] = None,
+    ) -> MesaChangeSet:
+        """Conjunto de cambios ``previo → actual``; deja el índice en ``actual``.
+
+        English:
+            Change set ``previous → current``; leaves the index on
+            ``current``.
+        """
+        if not self.in_sync(previous_data, previous_source):
+            self.rebuild(previous_data, previous_source)
+        return self.update(current_data, current_source)
+
+    # ── persistencia / persistence ───────────────────────────────────────
+
+    def save(self, path: Path) -> None:
+        """Escribe el índice de forma atómica. / Write the index atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {"version": MESA_INDEX_VERSION, "source": self.source, "mesas": self._records}
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "MesaFingerprintIndex":
+        """Carga un índice guardado; vacío si falta o es ilegible.
+
+        English:
+            Load a saved index; empty when missing or unreadable (it is
+            rebuilt from the previous snapshot on the next run).
+        """
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+        try:
+            document: Any = json.loads(path.read_text(encoding="utf-8"))
+            if document.get("version") != MESA_INDEX_VERSION or not isinstance(document.get("mesas"), dict):
+                raise ValueError("unsupported mesa index format")
+        except (OSError, ValueError, AttributeError) as exc:
+            logger.warning("mesa_index_load_failed path=%s error=%s", path, exc)
+            return index
+        index._records = document["mesas"]
+        index._root_count = sum(1 for record in index._records.values() if record.get("root"))
+        index.source = document.get("source")
+        return index
@@ -9,9 +9,15 @@ Archivo: `src/centinel/core/normalize.py`.
 Este módulo forma parte de Centinel Engine y está documentado para facilitar
 la navegación, mantenimiento y auditoría técnica.
 
+El `field_map` de cada país se compila una sola vez (`compile_field_map`) en
+funciones de acceso con rutas pre-divididas; `normalize_many` normaliza un
+lote de payloads con el mismo mapa compilado. El validador del esquema crudo
+se construye una vez al importar el módulo.
+
 Componentes detectados:
   - PresidentialActa
   - _drop_disallowed_keys
+  - _copy_sanitized
   - _sanitize_raw_payload
   - _compute_payload_hash
   - _validate_presidential_acta
@@ -20,7 +26,10 @@ Componentes detectados:
   - _first_value
   - _extract_candidates_root
   - _iter_candidates
+  - CompiledFieldMap
+  - compile_field_map
   - normalize_snapshot
+  - normalize_many
   - snapshot_to_canonical_json
   - snapshot_to_dict
 
@@ -33,9 +42,15 @@ File: `src/centinel/core/normalize.py`.
 This module is part of Centinel Engine and is documented to improve
 navigation, maintenance, and technical auditability.
 
+Each country's `field_map` is compiled once (`compile_field_map`) into
+accessor functions with pre-split paths; `normalize_many` normalizes a batch
+of payloads with one compiled map. The raw-schema validator is built once at
+import time.
+
 Detected components:
   - PresidentialActa
   - _drop_disallowed_keys
+  - _copy_sanitized
   - _sanitize_raw_payload
   - _compute_payload_hash
   - _validate_presidential_acta
@@ -44,7 +59,10 @@ Detected components:
   - _first_value
   - _extract_candidates_root
   - _iter_candidates
+  - CompiledFieldMap
+  - compile_field_map
   - normalize_snapshot
+  - normalize_many
   - snapshot_to_canonical_json
   - snapshot_to_dict
 
@@ -74,15 +92,20 @@ Notes:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Iterable, Literal
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Iterable, Literal, Sequence
 
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator, ConfigDict
 
 import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
+from centinel.core.canonical_json import canonical_dumps
 from centinel.core.models import Meta, Totals, CandidateResult, Snapshot
 
 logger = logging.getLogger(__name__)
@@ -145,6 +168,55 @@ CNE_RAW_SCHEMA = {
     "additionalProperties": True,
 }
 
+# ES: `jsonschema.validate` re-verifica el esquema contra su metaesquema en
+#     cada llamada; el validador se construye (y verifica) una sola vez.
+# EN: `jsonschema.validate` re-checks the schema against its metaschema on
+#     every call; the validator is built (and checked) once.
+_CNE_RAW_VALIDATOR_CLASS = validator_for(CNE_RAW_SCHEMA)
+_CNE_RAW_VALIDATOR_CLASS.check_schema(CNE_RAW_SCHEMA)
+_CNE_RAW_VALIDATOR = _CNE_RAW_VALIDATOR_CLASS(CNE_RAW_SCHEMA)
+
+DEFAULT_TOTALS_FIELDS: Dict[str, List[str]] = {
+    "registered_voters": [
+        "registered_voters",
+        "inscritos",
+        "padron",
+        "estadisticas.totalizacion_actas.actas_totales",
+    ],
+    "total_votes": [
+        "total_votes",
+        "total_votos",
+        "votos_emitidos",
+    ],
+    "valid_votes": [
+        "valid_votes",
+        "votos_validos",
+        "validos",
+        "estadisticas.distribucion_votos.validos",
+    ],
+    "null_votes": [
+        "null_votes",
+        "votos_nulos",
+        "nulos",
+        "estadisticas.distribucion_votos.nulos",
+    ],
+    "blank_votes": [
+        "blank_votes",
+        "votos_blancos",
+        "blancos",
+        "estadisticas.distribucion_votos.blancos",
+    ],
+}
+
+DEFAULT_CANDIDATE_ROOTS = ["candidatos", "candidates", "resultados", "partidos"]
+
+
+def _validate_raw_schema(instance: Any) -> None:
+    """/** Igual que `jsonschema.validate(instance, CNE_RAW_SCHEMA)`. / Same as `jsonschema.validate(instance, CNE_RAW_SCHEMA)`. **/"""
+    error = best_match(_CNE_RAW_VALIDATOR.iter_errors(instance))
+    if error is not None:
+        raise error
+
 
 def validate_cne_response(raw: dict, source_id: str) -> list[str]:
     """
@@ -157,7 +229,7 @@ def validate_cne_response(raw: dict, source_id: str) -> list[str]:
 
     # 1. Schema mínimo: debe tener resultados / Minimum schema: resultados required
     try:
-        jsonschema.validate(raw, CNE_RAW_SCHEMA)
+        _validate_raw_schema(raw)
     except jsonschema.ValidationError as exc:
         errors.append(f"schema_error: {exc.message}")
 
@@ -269,19 +341,66 @@ def _drop_disallowed_keys(payload: Any) -> Any:
     return payload
 
 
+class _NotPlainJson(Exception):
+    """Valor que solo `json.dumps` sabe convertir (tupla, clave no-str, ...)."""
+
+
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Claves ya verificadas como permitidas (los payloads repiten las mismas pocas
+# decenas); acotado para no crecer con claves arbitrarias. / Keys already
+# checked as allowed (payloads repeat the same few dozen); bounded so it does
+# not grow with arbitrary keys.
+_ALLOWED_KEYS: set = set()
+_ALLOWED_KEYS_MAX = 4096
+
+
+def _copy_sanitized(payload: Any) -> Any:
+    """/** Copia JSON sin claves sensibles en una sola pasada. / One-pass copy of plain JSON without sensitive keys.
+
+    Equivale a `_drop_disallowed_keys(json.loads(json.dumps(payload)))` para
+    JSON "plano" (dict con claves str, list, escalares exactos); ante
+    cualquier otra cosa lanza `_NotPlainJson` y el llamador usa el camino
+    original. / Equivalent to the json round trip plus key scrub for plain
+    JSON; anything else raises `_NotPlainJson` so the caller falls back. **/"""
+    if isinstance(payload, dict):
+        sanitized: Dict[str, Any] = {}
+        for key, value in payload.items():
+            if key not in _ALLOWED_KEYS:
+                if type(key) is not str:
+                    raise _NotPlainJson
+                if key.lower() in DISALLOWED_KEYS:
+                    continue
+                if len(_ALLOWED_KEYS) < _ALLOWED_KEYS_MAX:
+                    _ALLOWED_KEYS.add(key)
+            sanitized[key] = value if type(value) in _JSON_SCALARS else _copy_sanitized(value)
+        return sanitized
+    if isinstance(payload, list):
+        return [item if type(item) in _JSON_SCALARS else _copy_sanitized(item) for item in payload]
+    if type(payload) in _JSON_SCALARS:
+        return payload
+    raise _NotPlainJson
+
+
 def _sanitize_raw_payload(raw: Any) -> Dict[str, Any]:
     """/** Sanitiza JSON y valida esquema básico. / Sanitize JSON and validate basic schema. **/"""
     try:
         if isinstance(raw, (str, bytes, bytearray)):
-            parsed = json.loads(raw)
+            parsed = _copy_sanitized(json.loads(raw))
         else:
-            parsed = json.loads(json.dumps(raw, ensure_ascii=False))
-        jsonschema.validate(parsed, CNE_RAW_SCHEMA)
-    except (json.JSONDecodeError, jsonschema.ValidationError, TypeError) as exc:
+            try:
+                parsed = _copy_sanitized(raw)
+            except _NotPlainJson:
+                parsed = _drop_disallowed_keys(json.loads(json.dumps(raw, ensure_ascii=False)))
+        # Ninguna clave del esquema es sensible: validar tras depurar equivale
+        # a validar antes. / No schema key is sensitive, so validating the
+        # scrubbed copy is equivalent.
+        _validate_raw_schema(parsed)
+    except (json.JSONDecodeError, jsonschema.ValidationError, TypeError, ValueError, RecursionError) as exc:
         raise ValueError(f"Invalid raw snapshot payload: {exc}") from exc
     if not isinstance(parsed, dict):
         raise ValueError("Invalid raw snapshot payload: expected object JSON")
-    return _drop_disallowed_keys(parsed)
+    return parsed
 
 
 def _compute_payload_hash(raw: Any) -> str:
@@ -298,13 +417,17 @@ def _compute_payload_hash(raw: Any) -> str:
     return hashlib.sha256(encoded).hexdigest()
 
 
-def _validate_presidential_acta(raw: Dict[str, Any], payload_hash: str) -> bool:
-    """/** Valida payload con Pydantic y registra errores. / Validate payload with Pydantic and log errors. **/"""
+def _validate_presidential_acta(raw: Dict[str, Any], original: Any) -> bool:
+    """/** Valida payload con Pydantic y registra errores. / Validate payload with Pydantic and log errors.
+
+    El hash de ``original`` (el payload tal como llegó) solo se calcula si
+    hay que registrar un error. / The hash of ``original`` (the payload as
+    received) is only computed when an error must be logged. **/"""
     try:
         PresidentialActa.model_validate(raw)
     except ValidationError as exc:
         # Seguridad: registrar hash del JSON inválido sin datos sensibles. / Security: log invalid JSON hash without sensitive data.
-        logger.error("presidential_acta_invalid hash=%s error=%s", payload_hash, exc)
+        logger.error("presidential_acta_invalid hash=%s error=%s", _compute_payload_hash(original), exc)
         return False
     return True
 
@@ -358,8 +481,11 @@ def _iter_candidates(
     candidate_roots: Iterable[str],
 ) -> Iterable[CandidateResult]:
     """/** Itera candidatos con fallback robusto. / Iterate candidates with robust fallbacks. **/"""
-    raw_candidates = _extract_candidates_root(raw, candidate_roots)
+    return _candidate_results(_extract_candidates_root(raw, candidate_roots), candidate_count)
+
 
+def _candidate_results(raw_candidates: Any, candidate_count: int) -> Iterable[CandidateResult]:
+    """/** Construye candidatos desde el contenedor ya localizado. / Build candidates from the located container. **/"""
     if isinstance(raw_candidates, list):
         for idx, item in enumerate(raw_candidates, start=1):
             yield CandidateResult(
@@ -391,6 +517,97 @@ def _iter_candidates(
         yield CandidateResult(slot=idx, votes=0)
 
 
+def _compile_lookup(keys: Iterable[str]) -> Callable[[Dict[str, Any]], Any]:
+    """/** Compila `_first_value(payload, keys)` con rutas pre-divididas. / Compile `_first_value(payload, keys)` with pre-split paths.
+
+    Recuerda el alias que resolvió la última vez y lo prueba primero; solo
+    lo acepta si ninguna raíz de un alias anterior está en el payload, así
+    que la precedencia del primer alias no nulo se mantiene. / Remembers the
+    alias that matched last time and tries it first; it is only accepted
+    when no earlier alias root is present in the payload, so first-non-null
+    precedence is preserved. **/"""
+    paths = tuple(tuple(key.split(".")) for key in keys)
+    hint = [0]
+
+    def resolve(payload: Dict[str, Any], parts: tuple) -> Any:
+        value: Any = payload
+        for part in parts:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    def lookup(payload: Dict[str, Any]) -> Any:
+        index = hint[0]
+        if index:
+            value = resolve(payload, paths[index])
+            if value is not None and not any(parts[0] in payload for parts in paths[:index]):
+                return value
+        for index, parts in enumerate(paths):
+            value = resolve(payload, parts)
+            if value is not None:
+                hint[0] = index
+                return value
+        return None
+
+    return lookup
+
+
+def _compile_candidates_root(candidate_roots: Iterable[str]) -> Callable[[Dict[str, Any]], Any]:
+    """/** Compila `_extract_candidates_root` para unas raíces fijas. / Compile `_extract_candidates_root` for fixed roots. **/"""
+    lookups = tuple(_compile_lookup((key,)) for key in candidate_roots)
+
+    def locate(raw: Dict[str, Any]) -> Any:
+        for lookup in lookups:
+            value = lookup(raw)
+            if isinstance(value, dict) and "candidatos" in value:
+                return value["candidatos"]
+            if isinstance(value, (list, dict)):
+                return value
+        return None
+
+    return locate
+
+
+@dataclass(frozen=True)
+class CompiledFieldMap:
+    """/** `field_map` de un país compilado en funciones de acceso.
+
+    ``totals`` va de nombre de total (``valid_votes``...) a una función
+    ``payload -> valor``; ``candidates_root`` localiza el contenedor de
+    candidatos. El orden de alias se respeta tal cual: gana el primer alias
+    no nulo, igual que `_first_value`.
+
+    / A country's `field_map` compiled into accessor functions. ``totals``
+    maps each total name to a ``payload -> value`` function and
+    ``candidates_root`` locates the candidate container. Alias order is
+    kept as written: the first non-null alias wins, as in `_first_value`. **/"""
+
+    totals: Dict[str, Callable[[Dict[str, Any]], Any]]
+    candidates_root: Callable[[Dict[str, Any]], Any]
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_field_map_key(key: str) -> CompiledFieldMap:
+    field_map = json.loads(key)
+    totals_map = field_map.get("totals", {})
+    return CompiledFieldMap(
+        totals={name: _compile_lookup(totals_map.get(name, default)) for name, default in DEFAULT_TOTALS_FIELDS.items()},
+        candidates_root=_compile_candidates_root(field_map.get("candidate_roots", DEFAULT_CANDIDATE_ROOTS)),
+    )
+
+
+def compile_field_map(field_map: Dict[str, Any] | CompiledFieldMap | None = None) -> CompiledFieldMap:
+    """/** Compila (una vez por esquema) el `field_map` de un país. / Compile a country's `field_map`, once per schema.
+
+    Mapas con el mismo contenido comparten la misma compilación; un
+    `CompiledFieldMap` se devuelve tal cual. / Maps with identical content
+    share one compilation; a `CompiledFieldMap` is returned as is. **/"""
+    if isinstance(field_map, CompiledFieldMap):
+        return field_map
+    return _compile_field_map_key(json.dumps(field_map or {}, sort_keys=True))
+
+
 def normalize_snapshot(
     raw: Dict[str, Any] | str | bytes,
     department_name: str,
@@ -399,16 +616,16 @@ def normalize_snapshot(
     candidate_count: int = 10,
     scope: str = "DEPARTMENT",
     department_code: str | None = None,
-    field_map: Dict[str, List[str]] | None = None,
+    field_map: Dict[str, List[str]] | CompiledFieldMap | None = None,
 ) -> Snapshot | None:
     """/** Convierte JSON crudo en Snapshot canónico inmutable. / Convert raw JSON into an immutable canonical Snapshot. **/"""
-    payload_hash = _compute_payload_hash(raw)
+    original = raw
     try:
         raw = _sanitize_raw_payload(raw)
     except ValueError as exc:
-        logger.error("raw_payload_invalid hash=%s error=%s", payload_hash, exc)
+        logger.error("raw_payload_invalid hash=%s error=%s", _compute_payload_hash(original), exc)
         return None
-    if not _validate_presidential_acta(raw, payload_hash):
+    if not _validate_presidential_acta(raw, original):
         return None
     resolved_department_code = department_code or DEPARTMENT_CODES.get(department_name, "00")
 
@@ -421,79 +638,13 @@ def normalize_snapshot(
         timestamp_utc=timestamp_utc,
     )
 
-    field_map = field_map or {}
-    totals_map = field_map.get("totals", {})
-    candidate_roots = field_map.get("candidate_roots", ["candidatos", "candidates", "resultados", "partidos"])
-
-    registered_voters = _safe_int(
-        _first_value(
-            raw,
-            totals_map.get(
-                "registered_voters",
-                [
-                    "registered_voters",
-                    "inscritos",
-                    "padron",
-                    "estadisticas.totalizacion_actas.actas_totales",
-                ],
-            ),
-        )
-    )
-    total_votes = _safe_int(
-        _first_value(
-            raw,
-            totals_map.get(
-                "total_votes",
-                [
-                    "total_votes",
-                    "total_votos",
-                    "votos_emitidos",
-                ],
-            ),
-        )
-    )
-    valid_votes = _safe_int(
-        _first_value(
-            raw,
-            totals_map.get(
-                "valid_votes",
-                [
-                    "valid_votes",
-                    "votos_validos",
-                    "validos",
-                    "estadisticas.distribucion_votos.validos",
-                ],
-            ),
-        )
-    )
-    null_votes = _safe_int(
-        _first_value(
-            raw,
-            totals_map.get(
-                "null_votes",
-                [
-                    "null_votes",
-                    "votos_nulos",
-                    "nulos",
-                    "estadisticas.distribucion_votos.nulos",
-                ],
-            ),
-        )
-    )
-    blank_votes = _safe_int(
-        _first_value(
-            raw,
-            totals_map.get(
-                "blank_votes",
-                [
-                    "blank_votes",
-                    "votos_blancos",
-                    "blancos",
-                    "estadisticas.distribucion_votos.blancos",
-                ],
-            ),
-        )
-    )
+    compiled = compile_field_map(field_map)
+    resolved = {name: _safe_int(lookup(raw)) for name, lookup in compiled.totals.items()}
+    registered_voters = resolved["registered_voters"]
+    total_votes = resolved["total_votes"]
+    valid_votes = resolved["valid_votes"]
+    null_votes = resolved["null_votes"]
+    blank_votes = resolved["blank_votes"]
 
     if total_votes == 0 and any([valid_votes, null_votes, blank_votes]):
         total_votes = valid_votes + null_votes + blank_votes
@@ -506,10 +657,10 @@ def normalize_snapshot(
         blank_votes=blank_votes,
     )
 
-    raw_candidates = _extract_candidates_root(raw, candidate_roots)
+    raw_candidates = compiled.candidates_root(raw)
     if isinstance(raw_candidates, list):
         candidate_count = max(candidate_count, len(raw_candidates))
-    candidates: List[CandidateResult] = list(_iter_candidates(raw, candidate_count, candidate_roots))
+    candidates: List[CandidateResult] = list(_candidate_results(raw_candidates, candidate_count))
 
     return Snapshot(
         meta=meta,
@@ -518,6 +669,44 @@ def normalize_snapshot(
     )
 
 
+def normalize_many(
+    raws: Sequence[Dict[str, Any] | str | bytes],
+    department_name: str,
+    timestamps: Sequence[str],
+    year: int = 2025,
+    candidate_count: int = 10,
+    scope: str = "DEPARTMENT",
+    department_code: str | None = None,
+    field_map: Dict[str, List[str]] | CompiledFieldMap | None = None,
+) -> List[Snapshot | None]:
+    """/** Normaliza un lote de payloads crudos de un mismo departamento.
+
+    Compila el `field_map` una sola vez para todo el lote. Devuelve una
+    lista alineada con ``raws`` (``None`` donde el payload es inválido),
+    idéntica a llamar `normalize_snapshot` en bucle.
+
+    / Normalize a batch of raw payloads for one department. The
+    `field_map` is compiled once for the whole batch. Returns a list
+    aligned with ``raws`` (``None`` for invalid payloads), identical to
+    calling `normalize_snapshot` in a loop. **/"""
+    if len(timestamps) != len(raws):
+        raise ValueError("timestamps must match raws length")
+    compiled = compile_field_map(field_map)
+    return [
+        normalize_snapshot(
+            raw,
+            department_name,
+            timestamp_utc,
+            year=year,
+            candidate_count=candidate_count,
+            scope=scope,
+            department_code=department_code,
+            field_map=compiled,
+        )
+        for raw, timestamp_utc in zip(raws, timestamps)
+    ]
+
+
 def snapshot_to_canonical_json(snapshot: Snapshot) -> str:
     """/** Serializa un Snapshot a JSON canónico. / Serialize a Snapshot into canonical JSON. **/"""
 
@@ -527,7 +716,7 @@ def snapshot_to_canonical_json(snapshot: Snapshot) -> str:
         "candidates": [c.__dict__ for c in snapshot.candidates],
     }
 
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return canonical_dumps(payload, ensure_ascii=True)
 
 
 def snapshot_to_dict(snapshot: Snapshot) -> Dict[str, Any]:
@@ -92,6 +92,7 @@ def _build_candidate_map(data: dict) -> Dict[str, Dict[str, object]]:
     severity="High",
     description="Valida consistencia aritmética y cambios básicos entre snapshots.",
     config_key="basic_diff",
+    columns=("department", "candidate_votes", "total_votes", "vote_breakdown", "actas_mesas_counts"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -130,6 +130,7 @@ def _collect_votes_by_candidate(data: dict) -> Dict[str, List[int]]:
     severity="CRITICAL",
     description="Evalúa MAD y chi-cuadrado sobre distribución del primer dígito (vista agregada).",
     config_key="benford_first_digit",
+    columns=("department", "candidate_votes", "total_votes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """Evalúa la Ley de Benford sobre el primer dígito de los votos totales por candidato.
@@ -225,6 +226,7 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     severity="Medium",
     description="Chi-cuadrado del primer dígito por candidato individual (regla de investigación).",
     config_key="benford_law",
+    columns=("department",),
 )
 def apply_per_candidate(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """Evalúa Benford por candidato usando chi-cuadrado sobre series individuales de mesas.
@@ -0,0 +1,406 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/rules/columnar.py`.
+Pre-extracción columnar compartida por las reglas. Un `SnapshotColumns`
+extrae una sola vez los campos de un snapshot (votos por candidato,
+totales, desglose, entradas por departamento, mesas) y los expone también
+como arreglos NumPy (vector de candidatos, totales por departamento, tabla
+de mesas). Un `RuleFrame` agrupa el par (actual, previo); mientras está
+activo, los extractores de `common.py` devuelven el valor ya extraído en
+lugar de recorrer el dict otra vez. El frame expone además `mesa_changes`,
+el conjunto de mesas nuevas/eliminadas/modificadas que calcula una sola vez
+el índice de huellas del motor (`mesa_changes_for`).
+
+Componentes detectados:
+  - COLUMNS
+  - MesaTable
+  - SnapshotColumns
+  - RuleFrame
+  - frame_scope
+  - columns_for
+  - mesa_changes_for
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/rules/columnar.py`.
+Shared columnar pre-extraction for the rules. `SnapshotColumns` extracts a
+snapshot's fields once (candidate votes, totals, breakdown, department
+entries, mesas) and also exposes them as NumPy arrays (candidate vector,
+department totals, mesa table). `RuleFrame` groups the (current, previous)
+pair; while it is active, the `common.py` extractors return the
+already-extracted value instead of walking the dict again. The frame also
+exposes `mesa_changes`, the added/removed/modified mesa set computed once
+by the engine's fingerprint index (`mesa_changes_for`).
+
+Detected components:
+  - COLUMNS
+  - MesaTable
+  - SnapshotColumns
+  - RuleFrame
+  - frame_scope
+  - columns_for
+  - mesa_changes_for
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Columnar Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from centinel.core.rules import common
+from centinel.core.rules.common import (
+    collect_all_mesas,
+    extract_candidate_votes,
+    extract_department_entries,
+    extract_mesa_code,
+    extract_mesa_vote_breakdown,
+    extract_total_votes,
+)
+
+if TYPE_CHECKING:
+    from centinel.core.mesa_forensics import MesaChangeSet, MesaFingerprintIndex
+
+# Columnas compartidas que expone `common.py` (memoizadas por snapshot).
+# Shared columns exposed by `common.py` (memoized per snapshot).
+SHARED_COLUMNS = (
+    "department",
+    "timestamp",
+    "candidate_votes",
+    "total_votes",
+    "vote_breakdown",
+    "actas_mesas_counts",
+    "inconsistency_data",
+    "porcentaje_escrutado",
+    "registered_voters",
+    "mesas",
+    "department_entries",
+    "all_mesas",
+)
+
+# Columnas NumPy derivadas. / Derived NumPy columns.
+ARRAY_COLUMNS = ("candidate_vector", "department_totals", "mesa_table")
+
+# Columnas del par (actual, previo). / Columns of the (current, previous) pair.
+FRAME_COLUMNS = ("mesa_changes",)
+
+COLUMNS = frozenset(SHARED_COLUMNS + ARRAY_COLUMNS + FRAME_COLUMNS)
+
+_ACTIVE_FRAME: ContextVar[Optional["RuleFrame"]] = ContextVar("centinel_rule_frame", default=None)
+
+
+@dataclass(frozen=True)
+class MesaTable:
+    """Tabla columnar de mesas (una fila por mesa con código).
+
+    Columnar mesa table (one row per mesa with a code). Numeric columns are
+    ``float64`` with ``NaN`` where the source field is missing, so ``None``
+    checks become ``np.isnan`` masks.
+
+    English:
+        Built from ``collect_all_mesas`` in the same order, skipping mesas
+        without a code, exactly like the per-mesa rules do.
+    """
+
+    mesas: Tuple[dict, ...]
+    codes: Tuple[str, ...]
+    departments: Tuple[str, ...]
+    valid_votes: np.ndarray
+    null_votes: np.ndarray
+    blank_votes: np.ndarray
+    total_votes: np.ndarray
+    registered_voters: np.ndarray
+    candidate_sum: np.ndarray
+    has_candidates: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def _nan_array(values: Iterable[Optional[int]]) -> np.ndarray:
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+
+class SnapshotColumns:
+    """Columnas extraídas una sola vez de un snapshot.
+
+    Columns extracted once from one snapshot. Values are computed lazily on
+    first access (or eagerly via ``prepare``) and cached for the lifetime of
+    the object, which the batch API shares between consecutive pairs.
+    """
+
+    def __init__(self, data: Optional[dict]) -> None:
+        self.data = data
+        self._values: Dict[str, Any] = {}
+
+    # ── columnas compartidas / shared columns ───────────────────────────
+
+    def shared(self, name: str, compute: Callable[[Any], Any]) -> Any:
+        """Valor memoizado de un extractor de ``common`` (copia defensiva)."""
+        if name not in self._values:
+            self._values[name] = compute(self.data)
+        return _detach(self._values[name])
+
+    # ── columnas NumPy / NumPy columns ──────────────────────────────────
+
+    @property
+    def candidate_vector(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """(claves, votos int64) en el orden de ``extract_candidate_votes``."""
+        if "candidate_vector" not in self._values:
+            candidates = extract_candidate_votes(self.data)
+            keys = tuple(candidates)
+            votes = np.array([int(candidates[key]["votes"]) for key in keys], dtype=np.int64)
+            self._values["candidate_vector"] = (keys, votes)
+        return self._values["candidate_vector"]
+
+    @property
+    def department_totals(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """(departamentos, total de votos float64 con NaN) por entrada."""
+        if "department_totals" not in self._values:
+            entries = extract_department_entries(self.data)
+            names = tuple(
+                str(entry.get("department") or entry.get("departamento") or entry.get("nombre") or "")
+                for entry in entries
+            )
+            totals = _nan_array(extract_total_votes(entry) for entry in entries)
+            self._values["department_totals"] = (names, totals)
+        return self._values["department_totals"]
+
+    @property
+    def mesa_table(self) -> MesaTable:
+        """Tabla columnar de mesas. / Columnar mesa table."""
+        if "mesa_table" not in self._values:
+            from centinel.core.mesa_forensics import mesa_candidate_votes
+
+            rows: List[Tuple[dict, str, Dict[str, Optional[int]], Dict[str, int]]] = []
+            for mesa in collect_all_mesas(self.data):
+                code = extract_mesa_code(mesa)
+                if not code:
+                    continue
+                rows.append((mesa, code, extract_mesa_vote_breakdown(mesa), mesa_candidate_votes(mesa)))
+            self._values["mesa_table"] = MesaTable(
+                mesas=tuple(row[0] for row in rows),
+                codes=tuple(row[1] for row in rows),
+                departments=tuple(str(row[0].get("_departamento") or "") for row in rows),
+                valid_votes=_nan_array(row[2].get("valid_votes") for row in rows),
+                null_votes=_nan_array(row[2].get("null_votes") for row in rows),
+                blank_votes=_nan_array(row[2].get("blank_votes") for row in rows),
+                total_votes=_nan_array(row[2].get("total_votes") for row in rows),
+                registered_voters=_nan_array(row[2].get("registered_voters") for row in rows),
+                candidate_sum=np.array([sum(row[3].values()) for row in rows], dtype=np.int64),
+                has_candidates=np.array([bool(row[3]) for row in rows], dtype=bool),
+            )
+        return self._values["mesa_table"]
+
+    def prepare(self, columns: Iterable[str]) -> None:
+        """Pre-extrae las columnas pedidas. / Pre-extract the requested columns."""
+        if self.data is None:
+            return
+        with frame_scope(RuleFrame(self, None)):
+            for column in columns:
+                try:
+                    if column in ARRAY_COLUMNS:
+                        getattr(self, column)
+                    elif column in SHARED_COLUMNS:
+                        _SHARED_EXTRACTORS[column](self.data)
+                except Exception:  # noqa: BLE001
+                    # Left unmemoized: the rule that reads it raises the same
+                    # error and the engine logs it per rule, as before.
+                    continue
+
+
+class RuleFrame:
+    """Par (actual, previo) de columnas sobre el que corren las reglas.
+
+    (current, previous) column pair the rules run against. ``mesa_index``
+    is the engine's persistent fingerprint index; ``current_source`` and
+    ``previous_source`` are optional tokens identifying each snapshot so
+    the index can be reused across processes. ``mesa_index_lock`` is the
+    engine's lock guarding that shared index: a rule abandoned after a
+    timeout may still be updating it while the next frame starts.
+    """
+
+    def __init__(
+        self,
+        current: SnapshotColumns,
+        previous: Optional[SnapshotColumns],
+        *,
+        mesa_index: Optional["MesaFingerprintIndex"] = None,
+        mesa_index_lock: Optional[threading.Lock] = None,
+        current_source: Optional[str] = None,
+        previous_source: Optional[str] = None,
+    ) -> None:
+        self.current = current
+        self.previous = previous
+        self.mesa_index = mesa_index
+        self.mesa_index_lock = mesa_index_lock if mesa_index_lock is not None else threading.Lock()
+        self.current_source = current_source
+        self.previous_source = previous_source
+        self._mesa_changes: Optional["MesaChangeSet"] = None
+        self._mesa_lock = threading.Lock()
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        current_data: dict,
+        previous_data: Optional[dict],
+        **kwargs: Any,
+    ) -> "RuleFrame":
+        """Construye un frame nuevo para un par de snapshots."""
+        return cls(
+            SnapshotColumns(current_data),
+            SnapshotColumns(previous_data) if previous_data is not None else None,
+            **kwargs,
+        )
+
+    @property
+    def mesa_changes(self) -> Optional["MesaChangeSet"]:
+        """Mesas nuevas/eliminadas/modificadas (``None`` sin snapshot previo).
+
+        English:
+            Added/removed/modified mesas (``None`` without a previous
+            snapshot), computed once per frame through ``mesa_index``.
+        """
+        if self.previous is None:
+            return None
+        with self._mesa_lock:
+            if self._mesa_changes is None:
+                from centinel.core.mesa_forensics import MesaFingerprintIndex
+
+                index = self.mesa_index if self.mesa_index is not None else MesaFingerprintIndex()
+                # _mesa_lock computes the change set once per frame; the
+                # engine lock serializes frames over the shared index.
+                with self.mesa_index_lock:
+                    self._mesa_changes = index.changes(
+                        self.previous.data,
+                        self.current.data,
+                        previous_source=self.previous_source,
+                        current_source=self.current_source,
+                    )
+            return self._mesa_changes
+
+    def prepare(self, columns: Iterable[str]) -> None:
+        """Pre-extrae las columnas pedidas en ambos snapshots."""
+        wanted = tuple(columns)
+        self.current.prepare(wanted)
+        if self.previous is not None:
+            self.previous.prepare(wanted)
+            if "mesa_changes" in wanted and self.previous.data is not None:
+                try:
+                    self.mesa_changes
+                except Exception:  # noqa: BLE001
+                    # Same contract as the snapshot columns: the rule that
+                    # reads it raises again and the engine logs it.
+                    pass
+
+    def members(self) -> Tuple[SnapshotColumns, ...]:
+        return (self.current,) if self.previous is None else (self.current, self.previous)
+
+
+@contextmanager
+def frame_scope(frame: RuleFrame) -> Iterator[RuleFrame]:
+    """Activa ``frame`` para los extractores de ``common`` en este contexto."""
+    token = common._ACTIVE_COLUMNS.set(frame.members())
+    frame_token = _ACTIVE_FRAME.set(frame)
+    try:
+        yield frame
+    finally:
+        _ACTIVE_FRAME.reset(frame_token)
+        common._ACTIVE_COLUMNS.reset(token)
+
+
+def columns_for(data: dict) -> SnapshotColumns:
+    """Columnas del frame activo para ``data`` (o unas nuevas fuera de frame).
+
+    Rules call this to reach the NumPy columns; outside an engine run it
+    simply builds standalone columns so a rule can still be called directly.
+    """
+    for columns in common._ACTIVE_COLUMNS.get():
+        if columns.data is data:
+            return columns
+    return SnapshotColumns(data)
+
+
+def mesa_changes_for(current_data: dict, previous_data: Optional[dict]) -> Optional["MesaChangeSet"]:
+    """Conjunto de cambios de mesas del frame activo para este par.
+
+    English:
+        Mesa change set of the active frame for this pair, so every mesa
+        rule shares one incremental diff. Outside an engine run (or for a
+        different pair) it diffs the two snapshots directly. ``None``
+        without a previous snapshot.
+    """
+    if previous_data is None:
+        return None
+    frame = _ACTIVE_FRAME.get()
+    if (
+        frame is not None
+        and frame.current.data is current_data
+        and frame.previous is not None
+        and frame.previous.data is previous_data
+    ):
+        return frame.mesa_changes
+    from centinel.core.mesa_forensics import MesaFingerprintIndex
+
+    return MesaFingerprintIndex().changes(previous_data, current_data)
+
+
+def _detach(value: Any) -> Any:
+    # Cached values are shared between rules; hand out fresh containers so
+    # a rule mutating its result cannot leak into the next rule.
+    if isinstance(value, dict):
+        return {key: dict(item) if isinstance(item, dict) else item for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+_SHARED_EXTRACTORS: Dict[str, Callable[[Any], Any]] = {
+    "department": common.extract_department,
+    "timestamp": common.parse_timestamp,
+    "candidate_votes": common.extract_candidate_votes,
+    "total_votes": common.extract_total_votes,
+    "vote_breakdown": common.extract_vote_breakdown,
+    "actas_mesas_counts": common.extract_actas_mesas_counts,
+    "inconsistency_data": common.extract_inconsistency_data,
+    "porcentaje_escrutado": common.extract_porcentaje_escrutado,
+    "registered_voters": common.extract_registered_voters,
+    "mesas": common.extract_mesas,
+    "department_entries": common.extract_department_entries,
+    "all_mesas": common.collect_all_mesas,
+}
@@ -80,10 +80,42 @@ Notes:
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from dateutil import parser
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Columnas del `RuleFrame` activo (ver `columnar.py`). Vacío fuera de una
+# ejecución del motor: los extractores se comportan exactamente como antes.
+# Columns of the active `RuleFrame` (see `columnar.py`). Empty outside an
+# engine run: the extractors behave exactly as before.
+_ACTIVE_COLUMNS: ContextVar[Tuple[Any, ...]] = ContextVar("centinel_rule_columns", default=())
+
+
+def _shared_column(column: str) -> Callable[[_F], _F]:
+    """Memoiza un extractor de nivel snapshot dentro del frame activo.
+
+    English:
+        Memoize a snapshot-level extractor inside the active frame. The
+        cache is keyed by object identity against the frame's snapshots,
+        so nested dicts (mesas, departments) are never served from it.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(data: Any) -> Any:
+            for columns in _ACTIVE_COLUMNS.get():
+                if columns.data is data:
+                    return columns.shared(column, func)
+            return func(data)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
 
 def safe_int(value: object, default: int = 0) -> int:
     """Convierte a entero con fallback seguro. (Convert to integer with a safe fallback.)"""
@@ -115,12 +147,14 @@ def safe_float_or_none(value: object) -> Optional[float]:
         return None
 
 
+@_shared_column("department")
 def extract_department(data: dict) -> str:
     """Extrae el departamento o retorna un valor por defecto. (Extract the department or return a default value.)"""
     meta = data.get("meta") or data.get("metadata") or {}
     return data.get("departamento") or data.get("dep") or data.get("department") or meta.get("department") or "NACIONAL"
 
 
+@_shared_column("timestamp")
 def parse_timestamp(data: dict) -> Optional[object]:
     """Parsea un timestamp desde varias claves conocidas. (Parse a timestamp from known keys.)"""
     raw_ts = data.get("timestamp") or data.get("timestamp_utc") or data.get("fecha")
@@ -145,6 +179,7 @@ def extract_candidates(data: dict) -> List[dict]:
     return []
 
 
+@_shared_column("candidate_votes")
 def extract_candidate_votes(data: dict) -> Dict[str, Dict[str, object]]:
     """Construye un mapa de votos por candidato. (Build a candidate vote map.)"""
     candidates = {}
@@ -184,6 +219,7 @@ def extract_candidate_votes(data: dict) -> Dict[str, Dict[str, object]]:
     return candidates
 
 
+@_shared_column("total_votes")
 def extract_total_votes(data: dict) -> Optional[int]:
     """Extrae el total de votos desde claves conocidas. (Extract total votes from known keys.)"""
     totals = data.get("totals") or {}
@@ -199,6 +235,7 @@ def extract_total_votes(data: dict) -> Optional[int]:
     )
 
 
+@_shared_column("vote_breakdown")
 def extract_vote_breakdown(data: dict) -> Dict[str, Optional[int]]:
     """Extrae el desglose de votos válidos/nulos/blancos. (Extract the breakdown of valid/null/blank votes.)"""
     totals = data.get("totals") or {}
@@ -229,6 +266,7 @@ def extract_vote_breakdown(data: dict) -> Dict[str, Optional[int]]:
     }
 
 
+@_shared_column("actas_mesas_counts")
 def extract_actas_mesas_counts(data: dict) -> Dict[str, Optional[int]]:
     """Extrae conteos de actas y mesas. (Extract tally sheet and table counts.)"""
     actas = data.get("actas") or {}
@@ -259,6 +297,7 @@ def extract_actas_mesas_counts(data: dict) -> Dict[str, Optional[int]]:
     }
 
 
+@_shared_column("inconsistency_data")
 def extract_inconsistency_data(data: dict) -> Dict[str, Optional[int]]:
     """Extrae conteos de actas inconsistentes y divulgadas desde cualquier formato CNE.
 
@@ -301,6 +340,7 @@ def extract_inconsistency_data(data: dict) -> Dict[str, Optional[int]]:
     }
 
 
+@_shared_column("porcentaje_escrutado")
 def extract_porcentaje_escrutado(data: dict) -> Optional[float]:
     """Extrae el porcentaje de escrutinio cuando existe. (Extract the scrutiny percentage when available.)"""
     porcentaje = data.get("porcentaje_escrutado") or data.get("porcentaje") or data.get("porcentaje_escrutinio")
@@ -310,6 +350,7 @@ def extract_porcentaje_escrutado(data: dict) -> Optional[float]:
     return safe_float_or_none(porcentaje)
 
 
+@_shared_column("registered_voters")
 def extract_registered_voters(data: dict) -> Optional[int]:
     """Extrae el total de electores registrados. (Extract the total registered voters.)"""
     totals = data.get("totals") or {}
@@ -323,6 +364,7 @@ def extract_registered_voters(data: dict) -> Optional[int]:
     )
 
 
+@_shared_column("mesas")
 def extract_mesas(data: dict) -> List[dict]:
     """Extrae la lista de mesas desde llaves conocidas. (Extract the list of polling tables from known keys.)"""
     mesas = data.get("mesas") or data.get("tables") or data.get("actas") or []
@@ -372,6 +414,7 @@ def extract_mesa_vote_breakdown(mesa: dict) -> Dict[str, Optional[int]]:
     }
 
 
+@_shared_column("department_entries")
 def extract_department_entries(data: dict) -> List[dict]:
     """Extrae entradas por departamento desde claves conocidas. (Extract department-level entries from known keys.)"""
     for key in ("departments", "departamentos", "by_department", "por_departamento"):
@@ -394,6 +437,7 @@ def extract_numeric_list(values: Iterable[object]) -> List[int]:
     return numbers
 
 
+@_shared_column("all_mesas")
 def collect_all_mesas(data: dict) -> List[dict]:
     """Recolecta TODAS las mesas: raíz y anidadas en departamentos.
 
@@ -67,6 +67,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Calcula correlación Pearson entre participación y voto líder.",
     config_key="participation_vote_correlation",
+    columns=("mesas",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -88,6 +88,7 @@ def _extract_department_candidate_shares(entry: dict) -> Dict[str, float]:
     severity="CRITICAL",
     description="Calcula CV de % voto por partido entre departamentos.",
     config_key="geographic_dispersion",
+    columns=("candidate_votes", "department_entries"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -241,6 +241,14 @@ def _compute_zscores(series: pd.Series) -> pd.Series:
     severity="CRITICAL",
     description=("Detecta deltas negativos, Benford por departamento, z-score y reversión."),
     config_key="granular_anomaly",
+    columns=(
+        "department",
+        "timestamp",
+        "candidate_votes",
+        "total_votes",
+        "registered_voters",
+        "department_entries",
+    ),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
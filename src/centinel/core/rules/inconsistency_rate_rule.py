@@ -64,6 +64,7 @@ from centinel.core.rules.registry import rule
         "Calibrado con datos reales Honduras 2025 (baseline observado: 14.3%)."
     ),
     config_key="inconsistency_rate",
+    columns=("inconsistency_data",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -174,6 +174,7 @@ def _top_two_candidates(
     severity="High",
     description="Detecta cambios irreversibles en liderazgos electorales.",
     config_key="irreversibility",
+    columns=("department", "timestamp", "candidate_votes", "total_votes", "registered_voters"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -149,6 +149,7 @@ def _aggregate_mesas(
     severity="Medium",
     description="Evalúa la convergencia de proporciones por mesa hacia el promedio global.",
     config_key="large_numbers_convergence",
+    columns=("department",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
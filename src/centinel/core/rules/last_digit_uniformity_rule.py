@@ -57,11 +57,10 @@ from typing import List, Optional
 import numpy as np
 from scipy.stats import chisquare
 
+from centinel.core.rules.columnar import columns_for
 from centinel.core.rules.common import (
-    extract_candidate_votes,
     extract_department,
     extract_total_votes,
-    extract_numeric_list,
 )
 from centinel.core.rules.registry import rule
 
@@ -86,6 +85,7 @@ def _last_digit(number: int) -> Optional[int]:
     severity="CRITICAL",
     description="Prueba chi-cuadrado sobre últimos dígitos 0-9.",
     config_key="last_digit_uniformity",
+    columns=("department", "candidate_vector", "total_votes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -122,24 +122,21 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
 
     alerts: List[dict] = []
     department = extract_department(current_data)
-    candidate_votes = extract_numeric_list(
-        candidate.get("votes") for candidate in extract_candidate_votes(current_data).values()
-    )
+    _keys, candidate_vector = columns_for(current_data).candidate_vector
     total_votes = extract_total_votes(current_data)
     if total_votes is not None:
-        candidate_votes.append(total_votes)
+        candidate_vector = np.append(candidate_vector, np.int64(total_votes))
 
     min_samples = int(config.get("min_samples", 20))
-    if len(candidate_votes) < min_samples:
+    if candidate_vector.size < min_samples:
         return alerts
 
-    digits = [
-        digit for digit in (_last_digit(value) for value in candidate_votes) if digit is not None
-    ]
-    if len(digits) < min_samples:
+    # Negative counts have no meaningful last digit (see `_last_digit`).
+    digits = candidate_vector[candidate_vector >= 0] % 10
+    if digits.size < min_samples:
         return alerts
 
-    observed_counts = np.array([digits.count(d) for d in range(10)], dtype=float)
+    observed_counts = np.bincount(digits, minlength=10).astype(float)
     total = observed_counts.sum()
     if total == 0:
         return alerts
@@ -167,7 +164,7 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
             ),
             "justification": (
                 "Chi-cuadrado sobre últimos dígitos (0-9) en votos. "
-                f"muestras={len(digits)}, pvalue={chi_result.pvalue:.4f}."
+                f"muestras={digits.size}, pvalue={chi_result.pvalue:.4f}."
             ),
         }
     )
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from centinel.core.mesa_forensics import index_mesas
+from centinel.core.rules.columnar import mesa_changes_for
 from centinel.core.rules.common import extract_porcentaje_escrutado
 from centinel.core.rules.registry import rule
 
@@ -34,6 +34,7 @@ from centinel.core.rules.registry import rule
     severity="WARNING",
     description="Registros que el JSON introduce tarde y/o en lotes grandes con el escrutinio casi cerrado.",
     config_key="late_mesa",
+    columns=("porcentaje_escrutado", "mesa_changes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """Detecta mesas nuevas que llegan tarde y/o en lote grande.
@@ -50,12 +51,11 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     if not previous_data:
         return []
 
-    previous_index = index_mesas(previous_data)
-    current_index = index_mesas(current_data)
-    if not current_index:
+    changes = mesa_changes_for(current_data, previous_data)
+    if changes is None or not changes.current_count:
         return []
 
-    new_codes = sorted(set(current_index) - set(previous_index))
+    new_codes = sorted(changes.added)
     if not new_codes:
         return []
 
@@ -26,13 +26,10 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from centinel.core.mesa_forensics import mesa_candidate_votes
-from centinel.core.rules.common import (
-    collect_all_mesas,
-    extract_mesa_code,
-    extract_mesa_vote_breakdown,
-    safe_int_or_none,
-)
+import numpy as np
+
+from centinel.core.rules.columnar import columns_for
+from centinel.core.rules.common import safe_int_or_none
 from centinel.core.rules.registry import rule
 
 
@@ -41,6 +38,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Chequeos de coherencia interna aplicados a cada registro del JSON publicado.",
     config_key="mesa_impossibility",
+    columns=("mesa_table",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """Aplica chequeos de imposibilidad por mesa.
@@ -51,50 +49,51 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     del previous_data
     max_listed = int((config or {}).get("max_listed", 25))
 
+    table = columns_for(current_data).mesa_table
+    if not len(table):
+        return []
+
+    valid = table.valid_votes
+    null_v = table.null_votes
+    blank = table.blank_votes
+    total = table.total_votes
+    # `extract_mesa_vote_breakdown` no lee `inscritos`/`padron` a nivel
+    # de registro (donde el JSON del CNE los coloca). Se compensa aquí
+    # sin tocar el helper compartido para no arriesgar regresiones.
+    registered = table.registered_voters.copy()
+    for row in np.flatnonzero(np.isnan(registered)):
+        mesa = table.mesas[row]
+        fallback = safe_int_or_none(mesa.get("inscritos") or mesa.get("padron"))
+        if fallback is not None:
+            registered[row] = fallback
+
+    # Vectorized checks over the whole mesa table; NaN marks a missing field.
+    emitted = np.where(np.isnan(total), valid, total)
+    with np.errstate(invalid="ignore"):
+        over_registered = ~np.isnan(registered) & (registered >= 0) & ~np.isnan(emitted) & (emitted > registered)
+        over_valid = ~np.isnan(valid) & table.has_candidates & (table.candidate_sum > valid)
+        parts_sum = valid + null_v + blank
+        complete = ~(np.isnan(valid) | np.isnan(null_v) | np.isnan(blank) | np.isnan(total))
+        unbalanced = complete & (parts_sum != total)
+
     violations: List[dict] = []
-    for mesa in collect_all_mesas(current_data):
-        code = extract_mesa_code(mesa)
-        if not code:
-            continue
-        breakdown = extract_mesa_vote_breakdown(mesa)
-        candidate_votes = mesa_candidate_votes(mesa)
-
-        valid = breakdown.get("valid_votes")
-        null_v = breakdown.get("null_votes")
-        blank = breakdown.get("blank_votes")
-        total = breakdown.get("total_votes")
-        # `extract_mesa_vote_breakdown` no lee `inscritos`/`padron` a nivel
-        # de registro (donde el JSON del CNE los coloca). Se compensa aquí
-        # sin tocar el helper compartido para no arriesgar regresiones.
-        registered = breakdown.get("registered_voters")
-        if registered is None:
-            registered = safe_int_or_none(mesa.get("inscritos") or mesa.get("padron"))
+    for row in np.flatnonzero(over_registered | over_valid | unbalanced):
         reasons: List[str] = []
-
-        if registered is not None and registered >= 0:
-            emitted = total if total is not None else valid
-            if emitted is not None and emitted > registered:
-                reasons.append(f"votos ({emitted}) > inscritos ({registered})")
-
-        if valid is not None and candidate_votes:
-            cand_sum = sum(candidate_votes.values())
-            if cand_sum > valid:
-                reasons.append(f"suma candidatos ({cand_sum}) > votos válidos ({valid})")
-
-        if valid is not None and null_v is not None and blank is not None and total is not None:
-            if valid + null_v + blank != total:
-                reasons.append(
-                    f"válidos+nulos+blancos ({valid + null_v + blank}) != total ({total})"
-                )
-
-        if reasons:
-            violations.append(
-                {
-                    "codigo_mesa": code,
-                    "departamento": str(mesa.get("_departamento") or ""),
-                    "motivos": reasons,
-                }
+        if over_registered[row]:
+            reasons.append(f"votos ({int(emitted[row])}) > inscritos ({int(registered[row])})")
+        if over_valid[row]:
+            reasons.append(
+                f"suma candidatos ({int(table.candidate_sum[row])}) > votos válidos ({int(valid[row])})"
             )
+        if unbalanced[row]:
+            reasons.append(f"válidos+nulos+blancos ({int(parts_sum[row])}) != total ({int(total[row])})")
+        violations.append(
+            {
+                "codigo_mesa": table.codes[row],
+                "departamento": table.departments[row],
+                "motivos": reasons,
+            }
+        )
 
     if not violations:
         return []
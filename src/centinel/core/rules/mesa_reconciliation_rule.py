@@ -30,9 +30,9 @@ from typing import List, Optional
 
 from centinel.core.mesa_forensics import (
     candidate_delta,
-    index_mesas,
     primary_beneficiary,
 )
+from centinel.core.rules.columnar import mesa_changes_for
 from centinel.core.rules.registry import rule
 
 
@@ -41,6 +41,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Detecta registros del JSON ya publicados que cambian de valor en una publicación posterior.",
     config_key="mesa_reconciliation",
+    columns=("mesa_changes",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """Compara huellas por mesa entre snapshot anterior y actual.
@@ -48,6 +49,8 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     English:
         Compare per-table fingerprints between previous and current
         snapshots; flag tables whose votes were altered after publication.
+        Only the tables whose fingerprint changed (from the engine's
+        incremental mesa index) are rebuilt into alert entries.
     """
     max_listed = int((config or {}).get("max_listed", 25))
 
@@ -55,20 +58,14 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     if not previous_data:
         return alerts
 
-    previous_index = index_mesas(previous_data)
-    current_index = index_mesas(current_data)
-    if not previous_index or not current_index:
+    changes = mesa_changes_for(current_data, previous_data)
+    if changes is None or not changes.previous_count or not changes.current_count:
         return alerts
 
+    # La desaparición de mesas la cubre mesas_diff_rule; aquí solo interesan
+    # las mesas presentes que mutaron (orden del snapshot previo).
     changed: List[dict] = []
-    for code, prev in previous_index.items():
-        curr = current_index.get(code)
-        if curr is None:
-            # La desaparición de mesas la cubre mesas_diff_rule; aquí
-            # solo interesan las mesas presentes que mutaron.
-            continue
-        if curr["fingerprint"] == prev["fingerprint"]:
-            continue
+    for code, prev, curr in changes.modified():
         delta = candidate_delta(prev["candidate_votes"], curr["candidate_votes"])
         changed.append(
             {
@@ -52,7 +52,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from centinel.core.rules.common import extract_mesa_code, extract_mesas
+from centinel.core.rules.columnar import mesa_changes_for
 from centinel.core.rules.registry import rule
 
 
@@ -61,6 +61,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Compara sets de mesas entre snapshots.",
     config_key="mesas_diff",
+    columns=("mesa_changes",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -81,7 +82,8 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
         Compares polling tables between consecutive snapshots.
 
         If new tables appear or existing ones disappear without explanation,
-        a CRITICAL alert is generated.
+        a CRITICAL alert is generated. Only root-level tables are compared;
+        the code sets come from the engine's incremental mesa index.
 
     Args:
         current_data: Current CNE JSON snapshot.
@@ -97,17 +99,12 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     if not previous_data:
         return alerts
 
-    current_codes = {
-        code for code in (extract_mesa_code(m) for m in extract_mesas(current_data)) if code
-    }
-    previous_codes = {
-        code for code in (extract_mesa_code(m) for m in extract_mesas(previous_data)) if code
-    }
-    if not current_codes or not previous_codes:
+    changes = mesa_changes_for(current_data, previous_data)
+    if changes is None or not changes.current_root_count or not changes.previous_root_count:
         return alerts
 
-    missing = sorted(previous_codes - current_codes)
-    added = sorted(current_codes - previous_codes)
+    missing = changes.root_missing()
+    added = changes.root_added()
 
     if not missing and not added:
         return alerts
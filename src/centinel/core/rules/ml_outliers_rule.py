@@ -11,6 +11,7 @@ la navegación, mantenimiento y auditoría técnica.
 
 Componentes detectados:
   - _HistoryStore
+  - _RollingMad
   - _get_store
   - apply
 
@@ -25,6 +26,7 @@ navigation, maintenance, and technical auditability.
 
 Detected components:
   - _HistoryStore
+  - _RollingMad
   - _get_store
   - apply
 
@@ -54,10 +56,15 @@ Notes:
 
 from __future__ import annotations
 
+import atexit
+import bisect
 import logging
 import os
 import sqlite3
-from typing import List, Optional
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from centinel.core.rules.common import extract_department, extract_total_votes
 from centinel.core.rules.registry import rule
@@ -65,75 +72,278 @@ from centinel.core.rules.registry import rule
 logger = logging.getLogger(__name__)
 
 _DEFAULT_DB_PATH = "reports/ml_outliers_history.db"
+_DEFAULT_FLUSH_EVERY = 16
+_DEFAULT_FLUSH_SECONDS = 5.0
+# Valores retenidos para reintento si el disco falla. / Values kept for retry.
+_MAX_PENDING = 10_000
+
+# Constante de consistencia de la MAD con la desviación estándar normal.
+# Consistency constant relating MAD to the normal standard deviation.
+_MAD_SCALE = 0.6745
+# Equivalente para la desviación media absoluta (fallback si MAD == 0).
+# Same for the mean absolute deviation (fallback when MAD == 0).
+_MEANAD_SCALE = 0.7979
 
 
 class _HistoryStore:
     """SQLite-backed history store for ML outlier detection.
 
     Replaces the previous in-memory ``_HISTORY`` dict so that data
-    survives process restarts.
+    survives process restarts. Each department's history is read from disk
+    once and then kept in memory; appends are buffered and written in
+    batches of ``flush_every`` or once the oldest pending value is
+    ``flush_seconds`` old (and on ``flush``/``close``/interpreter exit), so
+    a hard kill loses at most that window. Sequence numbers are assigned
+    inside the flush transaction from the on-disk ``MAX(seq)``, so several
+    processes can share one history file. A failed flush keeps the batch
+    (bounded by ``_MAX_PENDING``) for the next attempt and logs it.
 
     Almacén de historial respaldado por SQLite para detección de outliers ML.
     Reemplaza el diccionario en memoria ``_HISTORY`` para que los datos
-    sobrevivan reinicios del proceso.
+    sobrevivan reinicios del proceso. El historial de cada departamento se
+    lee del disco una sola vez; las escrituras se agrupan en lotes y la
+    secuencia se asigna dentro de la transacción de escritura.
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        flush_every: int = _DEFAULT_FLUSH_EVERY,
+        flush_seconds: float = _DEFAULT_FLUSH_SECONDS,
+    ) -> None:
         os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-        self._conn = sqlite3.connect(db_path)
-        self._conn.execute("""
+        # Rules may run on worker threads (`rules.parallel_enabled`); the
+        # connection is shared and every access goes through `_lock`.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            """
             CREATE TABLE IF NOT EXISTS ml_history (
                 department TEXT NOT NULL,
                 seq INTEGER NOT NULL,
                 value REAL NOT NULL,
                 PRIMARY KEY (department, seq)
             )
-            """)
+            """
+        )
         self._conn.commit()
+        self.flush_every = max(1, int(flush_every))
+        self.flush_seconds = max(0.0, float(flush_seconds))
+        self._history: Dict[str, Deque[float]] = {}
+        self._max_history: Dict[str, int] = {}
+        self._pending: List[Tuple[str, float]] = []
+        self._pending_since = 0.0
+
+    def _load(self, department: str, max_history: int) -> Deque[float]:
+        history = self._history.get(department)
+        if history is not None and history.maxlen == max_history:
+            return history
+        if history is None:
+            rows = self._conn.execute(
+                "SELECT value FROM ml_history WHERE department = ? ORDER BY seq DESC LIMIT ?",
+                (department, max_history),
+            ).fetchall()
+            history = deque((row[0] for row in reversed(rows)), maxlen=max_history)
+        else:
+            history = deque(history, maxlen=max_history)
+        self._history[department] = history
+        self._max_history[department] = max_history
+        return history
 
     def append(self, department: str, value: float, max_history: int) -> List[float]:
         """Append a value and return the trimmed history for *department*."""
-        cursor = self._conn.execute(
-            "SELECT COALESCE(MAX(seq), -1) FROM ml_history WHERE department = ?",
-            (department,),
-        )
-        next_seq = cursor.fetchone()[0] + 1
-
-        self._conn.execute(
-            "INSERT INTO ml_history (department, seq, value) VALUES (?, ?, ?)",
-            (department, next_seq, value),
-        )
-
-        # Trim old entries beyond max_history
-        self._conn.execute(
-            """
-            DELETE FROM ml_history
-            WHERE department = ? AND seq <= (
-                SELECT MAX(seq) - ? FROM ml_history WHERE department = ?
+        with self._lock:
+            return list(self._record_locked(department, value, max_history))
+
+    def record(self, department: str, value: float, max_history: int) -> None:
+        """Como ``append`` pero sin copiar el historial (costo constante)."""
+        with self._lock:
+            self._record_locked(department, value, max_history)
+
+    def _record_locked(self, department: str, value: float, max_history: int) -> Deque[float]:
+        history = self._load(department, max_history)
+        history.append(value)
+        now = time.monotonic()
+        if not self._pending:
+            self._pending_since = now
+        self._pending.append((department, value))
+        if len(self._pending) >= self.flush_every or now - self._pending_since >= self.flush_seconds:
+            self._flush_locked()
+        return history
+
+    def history(self, department: str, max_history: int) -> List[float]:
+        """Historial actual en memoria (incluye escrituras pendientes)."""
+        with self._lock:
+            return list(self._load(department, max_history))
+
+    def flush(self) -> None:
+        """Escribe en disco las entradas pendientes en una sola transacción."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        by_department: Dict[str, List[float]] = {}
+        for department, value in self._pending:
+            by_department.setdefault(department, []).append(value)
+        try:
+            with self._conn:
+                # IMMEDIATE takes the write lock before MAX(seq) is read, so
+                # another process sharing the file cannot claim the same seq.
+                self._conn.execute("BEGIN IMMEDIATE")
+                for department, values in by_department.items():
+                    next_seq = self._conn.execute(
+                        "SELECT COALESCE(MAX(seq), -1) + 1 FROM ml_history WHERE department = ?",
+                        (department,),
+                    ).fetchone()[0]
+                    self._conn.executemany(
+                        "INSERT INTO ml_history (department, seq, value) VALUES (?, ?, ?)",
+                        [(department, next_seq + offset, value) for offset, value in enumerate(values)],
+                    )
+                    # Trim old entries beyond max_history.
+                    self._conn.execute(
+                        "DELETE FROM ml_history WHERE department = ? AND seq < ?",
+                        (department, next_seq + len(values) - self._max_history[department]),
+                    )
+        except sqlite3.Error as exc:
+            dropped = max(0, len(self._pending) - _MAX_PENDING)
+            if dropped:
+                del self._pending[:dropped]
+            logger.warning(
+                "ml_history_flush_failed pending=%d dropped=%d error=%s",
+                len(self._pending),
+                dropped,
+                exc,
             )
-            """,
-            (department, max_history, department),
-        )
-        self._conn.commit()
-
-        rows = self._conn.execute(
-            "SELECT value FROM ml_history WHERE department = ? ORDER BY seq",
-            (department,),
-        ).fetchall()
-        return [r[0] for r in rows]
+            return
+        self._pending.clear()
 
     def close(self) -> None:
-        self._conn.close()
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
 
 
-_store: Optional[_HistoryStore] = None
+class _RollingMad:
+    """Detector robusto en streaming: z-score sobre mediana y MAD móviles.
 
+    Keeps the last ``window`` values of one department both in arrival
+    order and sorted, so each update costs O(window) regardless of how long
+    the history is. The current point is scored against the window *before*
+    it is added (robust z = 0.6745 * (x - median) / MAD).
+    """
 
-def _get_store(db_path: str) -> _HistoryStore:
-    global _store
-    if _store is None:
-        _store = _HistoryStore(db_path)
-    return _store
+    def __init__(self, window: int, seed: Optional[List[float]] = None) -> None:
+        self.window = max(3, int(window))
+        self._values: Deque[float] = deque()
+        self._sorted: List[float] = []
+        self.updates = 0
+        for value in (seed or [])[-self.window :]:
+            self._push(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _push(self, value: float) -> None:
+        if len(self._values) == self.window:
+            oldest = self._values.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._values.append(value)
+        bisect.insort(self._sorted, value)
+
+    def score(self, value: float) -> Optional[float]:
+        """Z-score robusto de ``value`` frente a la ventana (None si vacía)."""
+        if not self._sorted:
+            return None
+        median = _median(self._sorted)
+        deviations = sorted(abs(item - median) for item in self._sorted)
+        mad = _median(deviations)
+        if mad > 0:
+            return _MAD_SCALE * (value - median) / mad
+        mean_ad = sum(deviations) / len(deviations)
+        if mean_ad > 0:
+            return _MEANAD_SCALE * (value - median) / mean_ad
+        # Flat window: any departure is infinitely far from it.
+        return 0.0 if value == median else float("inf") if value > median else float("-inf")
+
+    def update(self, value: float) -> Optional[float]:
+        """Puntúa ``value`` y lo incorpora a la ventana."""
+        z_score = self.score(value)
+        self._push(value)
+        self.updates += 1
+        return z_score
+
+    def values(self) -> List[float]:
+        return list(self._values)
+
+
+def _median(ordered: List[float]) -> float:
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+
+_stores: Dict[str, _HistoryStore] = {}
+_detectors: Dict[Tuple[str, str], _RollingMad] = {}
+_store_lock = threading.Lock()
+_isolation_forest: Any = None
+
+
+def _get_store(
+    db_path: str,
+    flush_every: int = _DEFAULT_FLUSH_EVERY,
+    flush_seconds: float = _DEFAULT_FLUSH_SECONDS,
+) -> _HistoryStore:
+    with _store_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = _stores[db_path] = _HistoryStore(db_path, flush_every=flush_every, flush_seconds=flush_seconds)
+        return store
+
+
+def _get_detector(db_path: str, department: str, window: int, store: _HistoryStore, max_history: int) -> _RollingMad:
+    key = (db_path, department)
+    with _store_lock:
+        detector = _detectors.get(key)
+        if detector is None or detector.window != max(3, int(window)):
+            # Warm start from the persisted history so restarts keep state.
+            detector = _detectors[key] = _RollingMad(window, store.history(department, max_history))
+        return detector
+
+
+def _isolation_forest_cls() -> Any:
+    """Importa ``IsolationForest`` una sola vez (None si falta sklearn)."""
+    global _isolation_forest
+    if _isolation_forest is None:
+        try:
+            from sklearn.ensemble import IsolationForest
+        except ModuleNotFoundError:
+            logger.warning("sklearn_missing rule=ml_outliers")
+            _isolation_forest = False
+        else:
+            _isolation_forest = IsolationForest
+    return _isolation_forest or None
+
+
+def _isolation_forest_flags_last(values: List[float], contamination: float) -> Optional[bool]:
+    model_cls = _isolation_forest_cls()
+    if model_cls is None:
+        return None
+    model = model_cls(contamination=contamination, random_state=42)
+    points = [[value] for value in values]
+    model.fit(points)
+    return bool(model.predict(points)[-1] == -1)
+
+
+@atexit.register
+def _flush_stores() -> None:
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except sqlite3.Error:  # pragma: no cover - interpreter shutdown
+            pass
 
 
 @rule(
@@ -141,6 +351,7 @@ def _get_store(db_path: str) -> _HistoryStore:
     severity="Medium",
     description="Detecta outliers estadísticos en cambios relativos de votos con ML.",
     config_key="ml_outliers",
+    columns=("department", "total_votes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -156,6 +367,14 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
     model flags abnormal jumps; if the current point is an outlier, an ML anomaly
     alert is emitted.)
 
+    Con ``mode: streaming`` el modelo se mantiene entre llamadas: un z-score
+    robusto sobre mediana/MAD móviles (costo constante por snapshot) decide
+    la alerta y el Isolation Forest solo se reentrena cada
+    ``validator_interval`` snapshots como validador. (With ``mode: streaming``
+    a rolling median/MAD robust z-score keeps per-department state and
+    decides the alert at constant cost per snapshot; Isolation Forest only
+    refits every ``validator_interval`` snapshots as a validator.)
+
     Args:
         current_data: Snapshot JSON actual del CNE. (Current CNE JSON snapshot.)
         previous_data: Snapshot JSON anterior (None en el primer snapshot). (Previous JSON snapshot (None for the first snapshot).)
@@ -180,25 +399,24 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
 
     max_history = int(config.get("max_history", 200))
     db_path = config.get("history_db_path", _DEFAULT_DB_PATH)
-    store = _get_store(db_path)
-    history = store.append(department, relative_change_pct, max_history)
-
+    store = _get_store(
+        db_path,
+        int(config.get("history_flush_every", _DEFAULT_FLUSH_EVERY)),
+        float(config.get("history_flush_seconds", _DEFAULT_FLUSH_SECONDS)),
+    )
     min_samples = int(config.get("min_samples", 5))
-    if len(history) < min_samples:
-        return alerts
-
     contamination = float(config.get("contamination", 0.1))
-    try:
-        from sklearn.ensemble import IsolationForest
-    except ModuleNotFoundError:
-        logger.warning("sklearn_missing rule=ml_outliers")
+
+    if str(config.get("mode", "isolation_forest")).lower() == "streaming":
+        return _apply_streaming(
+            config, store, db_path, department, relative_change_pct, max_history, min_samples, contamination
+        )
+
+    history = store.append(department, relative_change_pct, max_history)
+    if len(history) < min_samples:
         return alerts
 
-    model = IsolationForest(contamination=contamination, random_state=42)
-    values = [[value] for value in history]
-    model.fit(values)
-    predictions = model.predict(values)
-    if predictions[-1] == -1:
+    if _isolation_forest_flags_last(history, contamination):
         alerts.append(
             {
                 "type": "Outlier Estadístico ML",
@@ -213,3 +431,55 @@ def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> Li
         )
 
     return alerts
+
+
+def _apply_streaming(
+    config: dict,
+    store: _HistoryStore,
+    db_path: str,
+    department: str,
+    relative_change_pct: float,
+    max_history: int,
+    min_samples: int,
+    contamination: float,
+) -> List[dict]:
+    """Modo streaming: MAD móvil por departamento + validador periódico.
+
+    English:
+        Streaming mode: per-department rolling MAD plus a periodic
+        Isolation Forest validator over the detector window.
+    """
+    window = int(config.get("streaming_window", 50))
+    threshold = float(config.get("robust_z_threshold", 3.5))
+    validator_interval = int(config.get("validator_interval", 25))
+
+    detector = _get_detector(db_path, department, window, store, max_history)
+    enough = len(detector) >= min_samples
+    z_score = detector.update(relative_change_pct)
+    store.record(department, relative_change_pct, max_history)
+    if not enough or z_score is None:
+        return []
+
+    flagged = abs(z_score) > threshold
+    validated: Optional[bool] = None
+    if validator_interval > 0 and detector.updates % validator_interval == 0:
+        validated = _isolation_forest_flags_last(detector.values(), contamination)
+    if not flagged and not validated:
+        return []
+
+    method = "MAD móvil" if flagged else "Isolation Forest (validador)"
+    justification = (
+        f"{method} detectó un cambio relativo atípico. "
+        f"delta_pct={relative_change_pct:.2f}%, z_robusto={z_score:.2f}, "
+        f"umbral={threshold}, ventana={len(detector)}."
+    )
+    if validated is not None:
+        justification += f" Validador Isolation Forest: {'outlier' if validated else 'normal'}."
+    return [
+        {
+            "type": "Outlier Estadístico ML",
+            "severity": "Medium",
+            "department": department,
+            "justification": justification,
+        }
+    ]
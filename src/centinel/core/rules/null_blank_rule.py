@@ -64,6 +64,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Detecta porcentajes anómalos de votos nulos+blancos.",
     config_key="null_blank_votes",
+    columns=("department", "vote_breakdown"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
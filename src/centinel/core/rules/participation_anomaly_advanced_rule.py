@@ -80,6 +80,7 @@ def _normalize_ratio(value: float) -> float:
     severity="CRITICAL",
     description="Detecta participación fuera de rango y desviaciones >3σ.",
     config_key="participation_anomaly_advanced",
+    columns=("department", "total_votes", "registered_voters"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
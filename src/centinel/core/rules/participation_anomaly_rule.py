@@ -89,6 +89,7 @@ def _calculate_scrutiny_percentage(current_data: dict) -> Optional[float]:
     severity="High",
     description="Detecta anomalías de participación y escrutinio entre snapshots.",
     config_key="participation_anomaly",
+    columns=("department", "actas_mesas_counts", "porcentaje_escrutado"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
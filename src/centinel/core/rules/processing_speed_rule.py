@@ -65,6 +65,7 @@ from centinel.core.rules.registry import rule
     severity="High",
     description="Evalúa velocidad de procesamiento de actas en intervalos cortos.",
     config_key="processing_speed",
+    columns=("department", "timestamp", "actas_mesas_counts"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
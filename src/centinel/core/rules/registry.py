@@ -55,7 +55,7 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
 RuleFunc = Callable[[dict, Optional[dict], dict], List[dict]]
 
@@ -72,15 +72,27 @@ class RuleDefinition:
     description: str
     config_key: str
     func: RuleFunc
+    # Columnas de `columnar.py` que la regla lee (pre-extraídas por el motor).
+    # `columnar.py` columns the rule reads (pre-extracted by the engine).
+    columns: Tuple[str, ...] = ()
 
 
 _RULE_REGISTRY: List[RuleDefinition] = []
 
 
-def rule(*, name: str, severity: str, description: str, config_key: str) -> Callable:
+def rule(
+    *,
+    name: str,
+    severity: str,
+    description: str,
+    config_key: str,
+    columns: Iterable[str] = (),
+) -> Callable:
     """Decorador para registrar reglas con metadatos.
 
-    Decorator to register rules with metadata.
+    Decorator to register rules with metadata. ``columns`` declares which
+    shared columns (see ``columnar.COLUMNS``) the rule reads so the engine
+    can pre-extract them once per snapshot.
     """
 
     def decorator(func: RuleFunc) -> RuleFunc:
@@ -96,6 +108,7 @@ def rule(*, name: str, severity: str, description: str, config_key: str) -> Call
                 description=description,
                 config_key=config_key,
                 func=func,
+                columns=tuple(columns),
             )
         )
         return func
@@ -103,6 +103,7 @@ def _runs_test(sequence: List[int]) -> float:
     severity="CRITICAL",
     description="Aplica runs test sobre secuencia ordenada de mesas.",
     config_key="runs_test",
+    columns=("mesas",),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
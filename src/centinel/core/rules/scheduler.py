@@ -0,0 +1,180 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/rules/scheduler.py`.
+Ejecución concurrente de reglas con presupuesto de tiempo por regla. Cada
+regla corre en su propio hilo (como máximo `workers` a la vez); el reloj de
+su presupuesto arranca cuando la regla empieza, no cuando se encola. Una
+regla que agota su presupuesto se reporta como `timeout` y su hilo queda
+abandonado (daemon) sin bloquear al resto del ciclo.
+
+Componentes detectados:
+  - RuleOutcome
+  - run_sequentially
+  - run_concurrently
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/rules/scheduler.py`.
+Concurrent rule execution with a per-rule wall-clock budget. Each rule runs
+on its own thread (at most `workers` at a time); its budget clock starts
+when the rule starts, not when it is queued. A rule that exhausts its
+budget is reported as `timeout` and its thread is abandoned (daemon)
+without holding up the rest of the cycle.
+
+Detected components:
+  - RuleOutcome
+  - run_sequentially
+  - run_concurrently
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Scheduler Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# (índice, función, presupuesto en segundos o None)
+# (index, callable, budget in seconds or None)
+RuleTask = Tuple[int, Callable[[], Any], Optional[float]]
+
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    """Resultado de una regla ejecutada por el planificador.
+
+    Outcome of one rule run by the scheduler. ``status`` is ``ok``,
+    ``error`` or ``timeout``; ``duration_ms`` is the measured wall-clock
+    time (the budget itself for a timeout).
+    """
+
+    status: str
+    value: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+def run_sequentially(tasks: Sequence[RuleTask]) -> Dict[int, RuleOutcome]:
+    """Ejecuta ``tasks`` en orden en el hilo actual, midiendo su latencia.
+
+    English:
+        Run ``tasks`` in order on the calling thread, timing each one.
+        Budgets are not enforced here: nothing can interrupt the caller.
+    """
+    outcomes: Dict[int, RuleOutcome] = {}
+    for index, func, _budget in tasks:
+        outcomes[index] = _timed(func)
+    return outcomes
+
+
+def run_concurrently(tasks: Sequence[RuleTask], workers: int) -> Dict[int, RuleOutcome]:
+    """Ejecuta ``tasks`` con a lo sumo ``workers`` hilos simultáneos.
+
+    Cada tarea corre dentro de una copia del contexto del llamador, de modo
+    que las ``ContextVar`` activas (p. ej. el frame columnar) siguen
+    visibles en el hilo. Devuelve los resultados indexados por el índice de
+    cada tarea; el orden de fusión lo decide el llamador.
+
+    English:
+        Run ``tasks`` on at most ``workers`` concurrent threads. Each task
+        runs inside a copy of the caller's context so active ``ContextVar``
+        values (e.g. the columnar frame) remain visible. Returns outcomes
+        keyed by task index; the caller decides the merge order.
+    """
+    workers = max(1, int(workers))
+    pending = deque(tasks)
+    done: "queue.Queue[Tuple[int, RuleOutcome]]" = queue.Queue()
+    # index -> (start time, budget)
+    running: Dict[int, Tuple[float, Optional[float]]] = {}
+    outcomes: Dict[int, RuleOutcome] = {}
+
+    def _start(index: int, func: Callable[[], Any], budget: Optional[float]) -> None:
+        context = contextvars.copy_context()
+
+        def _target() -> None:
+            done.put((index, context.run(_timed, func)))
+
+        running[index] = (time.perf_counter(), budget)
+        threading.Thread(target=_target, name=f"centinel-rule-{index}", daemon=True).start()
+
+    while pending or running:
+        while pending and len(running) < workers:
+            _start(*pending.popleft())
+
+        wait = _seconds_to_next_deadline(running)
+        try:
+            index, outcome = done.get(timeout=wait)
+        except queue.Empty:
+            pass
+        else:
+            if index in running:
+                del running[index]
+                outcomes[index] = outcome
+
+        now = time.perf_counter()
+        for index, (started, budget) in list(running.items()):
+            if budget is not None and now - started >= budget:
+                # The thread cannot be interrupted; it is left to finish in
+                # the background and its late result is discarded.
+                del running[index]
+                outcomes[index] = RuleOutcome(
+                    "timeout",
+                    error=f"timeout after {budget:g}s",
+                    duration_ms=round(budget * 1000.0, 3),
+                )
+
+    return outcomes
+
+
+def _seconds_to_next_deadline(running: Dict[int, Tuple[float, Optional[float]]]) -> Optional[float]:
+    deadlines: List[float] = [started + budget for started, budget in running.values() if budget is not None]
+    if not deadlines:
+        return None
+    return max(0.0, min(deadlines) - time.perf_counter())
+
+
+def _timed(func: Callable[[], Any]) -> RuleOutcome:
+    started = time.perf_counter()
+    try:
+        value = func()
+    except Exception as exc:  # noqa: BLE001
+        return RuleOutcome("error", error=str(exc), duration_ms=_elapsed_ms(started))
+    return RuleOutcome("ok", value=value, duration_ms=_elapsed_ms(started))
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000.0, 3)
@@ -62,6 +62,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Detecta cambios >5% en 10 minutos.",
     config_key="snapshot_jump",
+    columns=("timestamp", "total_votes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -67,6 +67,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Valida válidos+nulos+blancos vs total y suma candidatos vs válidos.",
     config_key="table_consistency",
+    columns=("department", "mesas"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
@@ -86,6 +86,7 @@ def _compute_percentages(votes: Dict[str, Dict[str, object]]) -> Dict[str, float
     severity="High",
     description="Detecta cambios de tendencia en votos por candidato entre snapshots.",
     config_key="trend_shift",
+    columns=("department", "timestamp", "candidate_votes"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
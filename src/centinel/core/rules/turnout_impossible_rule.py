@@ -65,6 +65,7 @@ from centinel.core.rules.registry import rule
     severity="CRITICAL",
     description="Detecta turnout <0% o >100% respecto al padrón.",
     config_key="turnout_impossible",
+    columns=("department", "total_votes", "registered_voters"),
 )
 def apply(current_data: dict, previous_data: Optional[dict], config: dict) -> List[dict]:
     """
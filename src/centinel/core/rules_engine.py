@@ -52,13 +52,15 @@ Notes:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence
 
 # ── Importar TODAS las reglas para que se auto-registren ────────────────
 # Import ALL rules so they self-register via @rule decorator.
@@ -88,11 +90,28 @@ from centinel.core.rules import (  # noqa: F401
     trend_shift_rule,
     turnout_impossible_rule,
 )
+from centinel import tracing
+from centinel.core.canonical_json import canonical_bytes
 from centinel.core.hashchain import compute_hash
+from centinel.core.mesa_forensics import MesaFingerprintIndex
+from centinel.core.verification_cursor import (
+    DEFAULT_FULL_REVERIFY_SECONDS,
+    load_cursor,
+    record_progress,
+    resolve_resume_point,
+)
+from centinel.core.rules.columnar import RuleFrame, SnapshotColumns, frame_scope
 from centinel.core.rules.registry import RuleDefinition, list_rules
+from centinel.core.rules.scheduler import RuleOutcome, run_concurrently, run_sequentially
 
 logger = logging.getLogger(__name__)
 
+HASHCHAIN_CURSOR_SCOPE = "rules_hashchain"
+
+# Hilos por defecto con `rules.parallel_enabled`. / Default threads when
+# `rules.parallel_enabled` is set.
+DEFAULT_PARALLEL_WORKERS = 4
+
 RULE_CONFIG_ALIASES: dict[str, str] = {
     "benford": "benford_first_digit",
     # "benford_law" removed: reads its own config section (min_samples, deviation_pct, chi_square_threshold)
@@ -117,6 +136,12 @@ RESEARCH_RULE_KEYS: set[str] = {
 }
 
 
+def _hashchain_entries_digest(entries: list[dict]) -> str:
+    """Digest de las entradas del índice hashchain ya verificadas."""
+    canonical = json.dumps(entries, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 @dataclass(frozen=True)
 class RulesEngineResult:
     """Resultado agregado de la ejecución de reglas.
@@ -141,14 +166,31 @@ class RulesEngine:
     chain, and generate reports.
     """
 
-    def __init__(self, config: dict, log_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        config: dict,
+        log_path: Optional[Path] = None,
+        mesa_index_path: Optional[Path] = None,
+    ) -> None:
         """Inicializa el motor con configuración de reglas y logging opcional.
 
+        ``mesa_index_path`` persiste el índice de huellas de mesas entre
+        procesos; sin él, el índice vive solo en memoria.
+
         English:
             Initialize the engine with rule configuration and optional logging.
+            ``mesa_index_path`` persists the mesa fingerprint index across
+            processes; without it the index lives in memory only.
         """
         self.config = config
         self.log_path = log_path
+        self.mesa_index_path = Path(mesa_index_path) if mesa_index_path else None
+        self.mesa_index = (
+            MesaFingerprintIndex.load(self.mesa_index_path) if self.mesa_index_path else MesaFingerprintIndex()
+        )
+        # Guards the shared index across frames: rules abandoned after a
+        # timeout can still be updating it when the next frame starts.
+        self._mesa_index_lock = threading.Lock()
 
     # ── helpers ──────────────────────────────────────────────────────────
 
@@ -193,11 +235,29 @@ class RulesEngine:
     # ── hashchain verification ───────────────────────────────────────────
 
     @staticmethod
-    def verify_hashchain(normalized_dir: Path, hashchain_path: Path) -> list[dict]:
+    def verify_hashchain(
+        normalized_dir: Path,
+        hashchain_path: Path,
+        *,
+        cursor_path: Optional[Path] = None,
+        full: bool = False,
+        full_interval_seconds: Optional[float] = DEFAULT_FULL_REVERIFY_SECONDS,
+    ) -> list[dict]:
         """Verifica la integridad de la cadena de hashes de snapshots.
 
+        Con ``cursor_path`` solo se re-hashean los snapshots posteriores al
+        cursor firmado, siempre que los archivos y las entradas del índice
+        ya verificados no hayan cambiado; ``full=True`` o una última pasada
+        completa más antigua que ``full_interval_seconds`` (``None``
+        desactiva el vencimiento) fuerzan la pasada completa.
+
         English:
-            Verify snapshot hash-chain integrity.
+            Verify snapshot hash-chain integrity. With ``cursor_path`` only
+            snapshots after the signed cursor are re-hashed, provided the
+            already-verified files and index entries are unchanged;
+            ``full=True`` or a last full pass older than
+            ``full_interval_seconds`` (``None`` disables it) force a pass
+            from genesis.
         """
         # Punto de extensión futura para reglas avanzadas validadas por UPNFM
         # Actualmente usa solo rules.yaml básicas
@@ -208,12 +268,23 @@ class RulesEngine:
         except (json.JSONDecodeError, OSError):
             return alerts
 
-        previous_hash: Optional[str] = None
-        for entry in entries:
-            snapshot_name = entry.get("snapshot")
-            if not snapshot_name:
-                continue
-            snapshot_path = normalized_dir / f"{snapshot_name}.json"
+        chained = [entry for entry in entries if entry.get("snapshot")]
+        snapshot_paths = [normalized_dir / f"{entry['snapshot']}.json" for entry in chained]
+
+        resume = None
+        if cursor_path is not None and not full:
+            resume = resolve_resume_point(
+                load_cursor(cursor_path, scope=HASHCHAIN_CURSOR_SCOPE),
+                snapshot_paths,
+                root=normalized_dir,
+                full_interval_seconds=full_interval_seconds,
+                prefix_context=lambda index: _hashchain_entries_digest(chained[: index + 1]),
+            )
+        start_index = resume.index + 1 if resume is not None else 0
+        previous_hash: Optional[str] = resume.last_hash if resume is not None else None
+
+        for entry, snapshot_path in zip(chained[start_index:], snapshot_paths[start_index:]):
+            snapshot_name = entry["snapshot"]
             if not snapshot_path.exists():
                 alerts.append(
                     {
@@ -257,6 +328,18 @@ class RulesEngine:
                     }
                 )
             previous_hash = expected_hash or previous_hash
+
+        if cursor_path is not None and not alerts and previous_hash:
+            record_progress(
+                cursor_path,
+                resume,
+                scope=HASHCHAIN_CURSOR_SCOPE,
+                paths=snapshot_paths,
+                last_hash=previous_hash,
+                first_hash=chained[0].get("hash"),
+                root=normalized_dir,
+                context_digest=_hashchain_entries_digest(chained),
+            )
         return alerts
 
     # ── report helpers ───────────────────────────────────────────────────
@@ -268,7 +351,7 @@ class RulesEngine:
         English:
             Compute the canonical SHA-256 hash of a snapshot payload.
         """
-        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        canonical = canonical_bytes(payload, compact=False)
         current_hash = hashlib.sha256(canonical).hexdigest()
 
         return current_hash
@@ -308,6 +391,22 @@ class RulesEngine:
         )
         return report_path
 
+    def _save_mesa_index(self) -> None:
+        """Persiste el índice de mesas si cambió (errores solo se registran).
+
+        English:
+            Persist the mesa index when it changed; failures are logged only.
+        """
+        if self.mesa_index_path is None:
+            return
+        with self._mesa_index_lock:
+            if not self.mesa_index.dirty:
+                return
+            try:
+                self.mesa_index.save(self.mesa_index_path)
+            except OSError as exc:
+                logger.warning("mesa_index_save_failed path=%s error=%s", self.mesa_index_path, exc)
+
     # ── punto de entrada principal ───────────────────────────────────────
 
     def run(
@@ -315,26 +414,110 @@ class RulesEngine:
         current_data: dict,
         previous_data: Optional[dict],
         snapshot_id: Optional[str] = None,
+        *,
+        current_source: Optional[str] = None,
+        previous_source: Optional[str] = None,
     ) -> RulesEngineResult:
         """Ejecuta todas las reglas registradas sobre el snapshot actual.
 
         Acumula alertas, destaca severidades críticas y puede pausar snapshots
-        cuando existen alertas críticas.
+        cuando existen alertas críticas. ``current_source``/``previous_source``
+        identifican cada snapshot (p. ej. ruta+tamaño+mtime) para que el índice
+        de mesas persistido se reutilice entre procesos.
 
         English:
             Run all registered rules against the current snapshot.
 
             Accumulates alerts, highlights critical severities, and can signal
-            snapshot pause when critical alerts exist.
+            snapshot pause when critical alerts exist. ``current_source`` /
+            ``previous_source`` identify each snapshot (e.g. path+size+mtime)
+            so the persisted mesa index is reused across processes.
         """
         # Punto de extensión futura para reglas avanzadas validadas por UPNFM
         # Actualmente usa solo rules.yaml básicas
         # Mantener compatibilidad total
+        frame = RuleFrame.from_snapshots(
+            current_data,
+            previous_data,
+            mesa_index=self.mesa_index,
+            mesa_index_lock=self._mesa_index_lock,
+            current_source=current_source,
+            previous_source=previous_source,
+        )
+        return self._run_frame(frame, snapshot_id)
+
+    def run_batch(
+        self,
+        snapshots: Sequence[dict],
+        snapshot_ids: Optional[Sequence[Optional[str]]] = None,
+        previous_data: Optional[dict] = None,
+    ) -> list[RulesEngineResult]:
+        """Evalúa una secuencia ordenada de snapshots en una sola pasada.
+
+        Cada snapshot se compara con el anterior de la secuencia (el primero
+        con ``previous_data``). Las columnas de cada snapshot se extraen una
+        sola vez y se reutilizan en los dos pares en que participa. Produce
+        exactamente las mismas alertas que llamar ``run`` en bucle.
+
+        English:
+            Evaluate an ordered sequence of snapshots in one pass. Each
+            snapshot is paired with its predecessor (the first one with
+            ``previous_data``); per-snapshot columns are extracted once and
+            shared by both pairs it belongs to. Alerts are identical to
+            calling ``run`` in a loop.
+        """
+        if snapshot_ids is not None and len(snapshot_ids) != len(snapshots):
+            raise ValueError("snapshot_ids must match snapshots length")
+        ids: Sequence[Optional[str]] = snapshot_ids if snapshot_ids is not None else [None] * len(snapshots)
+        return [result for _snapshot_id, result in self.iter_run(zip(ids, snapshots), previous_data)]
+
+    def iter_run(
+        self,
+        items: Iterable[tuple[Optional[str], dict]],
+        previous_data: Optional[dict] = None,
+    ) -> Iterator[tuple[Optional[str], RulesEngineResult]]:
+        """Versión perezosa de ``run_batch`` para flujos de snapshots.
+
+        Consume pares ``(snapshot_id, snapshot)`` uno a uno y solo retiene
+        las columnas del snapshot anterior, por lo que la memoria no crece
+        con la longitud del flujo.
+
+        English:
+            Lazy ``run_batch`` for snapshot streams. Consumes
+            ``(snapshot_id, snapshot)`` items one at a time and keeps only
+            the previous snapshot's columns, so memory stays flat however
+            long the stream is.
+        """
+        previous = SnapshotColumns(previous_data) if previous_data is not None else None
+        for snapshot_id, current_data in items:
+            current = SnapshotColumns(current_data)
+            frame = RuleFrame(current, previous, mesa_index=self.mesa_index, mesa_index_lock=self._mesa_index_lock)
+            yield snapshot_id, self._run_frame(frame, snapshot_id)
+            previous = current
+
+    def _run_frame(self, frame: RuleFrame, snapshot_id: Optional[str]) -> RulesEngineResult:
+        """Ejecuta las reglas habilitadas sobre un frame columnar.
+
+        English:
+            Run the enabled rules against one columnar frame, after
+            pre-extracting the union of the columns they declare.
+        """
         alerts: list[dict] = []
         critical_alerts: list[dict] = []
-
-        for rule in list_rules():
-            if not self._rule_enabled(rule):
+        rules = list_rules()
+        enabled = [index for index, rule in enumerate(rules) if self._rule_enabled(rule)]
+        frame.prepare(column for index in enabled for column in rules[index].columns)
+
+        with frame_scope(frame):
+            outcomes = self._execute_rules(rules, enabled, frame)
+        self._save_mesa_index()
+
+        # Fusión en orden de registro: el reporte no depende de qué regla
+        # terminó primero. / Merge in registry order so reports stay
+        # deterministic regardless of completion order.
+        for index, rule in enumerate(rules):
+            outcome = outcomes.get(index)
+            if outcome is None:
                 self._log_rule_event(
                     rule,
                     snapshot_id,
@@ -349,25 +532,31 @@ class RulesEngine:
                 )
                 continue
 
-            rule_config = self._get_rule_config(rule)
-            try:
-                rule_alerts = rule.func(current_data, previous_data, rule_config) or []
-            except Exception as exc:  # noqa: BLE001
+            tracing.record_span(
+                f"rule:{rule.config_key}",
+                outcome.duration_ms,
+                status=outcome.status,
+                alerts=len(outcome.value or []) if outcome.status == "ok" else 0,
+            )
+            if outcome.status != "ok":
                 self._log_rule_event(
                     rule,
                     snapshot_id,
-                    status="error",
+                    status=outcome.status,
                     alerts=[],
-                    error=str(exc),
+                    error=outcome.error,
+                    duration_ms=outcome.duration_ms,
                 )
                 logger.error(
-                    "rule_error rule=%s snapshot_id=%s error=%s",
+                    "rule_%s rule=%s snapshot_id=%s error=%s",
+                    outcome.status,
                     rule.name,
                     snapshot_id,
-                    str(exc),
+                    outcome.error,
                 )
                 continue
 
+            rule_alerts = outcome.value or []
             for alert in rule_alerts:
                 alert.setdefault("rule", rule.name)
                 alerts.append(alert)
@@ -380,19 +569,22 @@ class RulesEngine:
                 snapshot_id,
                 status="ok",
                 alerts=rule_alerts,
+                duration_ms=outcome.duration_ms,
             )
             if rule_alerts:
                 logger.warning(
-                    "rule_alerts rule=%s snapshot_id=%s alerts_count=%d",
+                    "rule_alerts rule=%s snapshot_id=%s alerts_count=%d duration_ms=%.1f",
                     rule.name,
                     snapshot_id,
                     len(rule_alerts),
+                    outcome.duration_ms,
                 )
             else:
                 logger.info(
-                    "rule_ok rule=%s snapshot_id=%s",
+                    "rule_ok rule=%s snapshot_id=%s duration_ms=%.1f",
                     rule.name,
                     snapshot_id,
+                    outcome.duration_ms,
                 )
 
         return RulesEngineResult(
@@ -401,6 +593,61 @@ class RulesEngine:
             pause_snapshots=bool(critical_alerts),
         )
 
+    def _rule_budget(self, rule: RuleDefinition) -> Optional[float]:
+        """Presupuesto de tiempo de una regla en segundos (None = sin límite).
+
+        English:
+            Wall-clock budget for one rule in seconds: the rule's own
+            ``timeout_seconds`` or the global ``rules.rule_timeout_seconds``.
+            Missing or non-positive values mean no budget.
+        """
+        budget = self._get_rule_config(rule).get("timeout_seconds")
+        if budget is None:
+            budget = self.config.get("rules", {}).get("rule_timeout_seconds")
+        try:
+            budget = float(budget)
+        except (TypeError, ValueError):
+            return None
+        return budget if budget > 0 else None
+
+    def _execute_rules(
+        self,
+        rules: list[RuleDefinition],
+        enabled: list[int],
+        frame: RuleFrame,
+    ) -> dict[int, RuleOutcome]:
+        """Ejecuta las reglas habilitadas, en serie o sobre hilos.
+
+        Con ``rules.parallel_enabled`` las reglas independientes corren a la
+        vez en hasta ``rules.parallel_workers`` hilos. Si alguna regla tiene
+        presupuesto, también en modo serie se usa un hilo por regla para
+        poder abandonarla al vencer su tiempo.
+
+        English:
+            Run the enabled rules serially or on threads. With
+            ``rules.parallel_enabled`` independent rules run concurrently on
+            up to ``rules.parallel_workers`` threads. When any rule has a
+            budget, serial mode also runs each rule on a thread so it can be
+            abandoned once its time is up.
+        """
+        rules_config = self.config.get("rules", {})
+        current_data = frame.current.data
+        previous_data = frame.previous.data if frame.previous is not None else None
+        tasks = [
+            (
+                index,
+                functools.partial(rules[index].func, current_data, previous_data, self._get_rule_config(rules[index])),
+                self._rule_budget(rules[index]),
+            )
+            for index in enabled
+        ]
+        if rules_config.get("parallel_enabled", False):
+            workers = int(rules_config.get("parallel_workers") or DEFAULT_PARALLEL_WORKERS)
+            return run_concurrently(tasks, workers)
+        if any(budget is not None for _index, _func, budget in tasks):
+            return run_concurrently(tasks, 1)
+        return run_sequentially(tasks)
+
     def _log_rule_event(
         self,
         rule: RuleDefinition,
@@ -408,11 +655,13 @@ class RulesEngine:
         status: str,
         alerts: list[dict],
         error: Optional[str] = None,
+        duration_ms: Optional[float] = None,
     ) -> None:
         """Registra en disco el resultado de ejecutar una regla.
 
         English:
-            Persist the result of a rule execution to disk.
+            Persist the result of a rule execution to disk, including its
+            wall-clock latency when it ran.
         """
         if not self.log_path:
             return
@@ -436,6 +685,8 @@ class RulesEngine:
                 for alert in alerts
             ],
         }
+        if duration_ms is not None:
+            event["duration_ms"] = duration_ms
         if error:
             event["error"] = error
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
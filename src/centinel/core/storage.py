@@ -9,6 +9,11 @@ Archivo: `src/centinel/core/storage.py`.
 Este módulo forma parte de Centinel Engine y está documentado para facilitar
 la navegación, mantenimiento y auditoría técnica.
 
+Cada `store_snapshot` también agrega una fila tipada al almacén columnar
+compañero (`ColumnarSeriesStore`) para que el análisis de series lea sin
+parsear JSON; SQLite sigue siendo la fuente de verdad. El anclaje externo
+se encola (`anchor_queue`) y un worker lo hace por lotes Merkle.
+
 Componentes detectados:
   - LocalSnapshotStore
 
@@ -21,6 +26,11 @@ File: `src/centinel/core/storage.py`.
 This module is part of Centinel Engine and is documented to improve
 navigation, maintenance, and technical auditability.
 
+Every `store_snapshot` also appends a typed row to the companion columnar
+store (`ColumnarSeriesStore`) so series analysis reads without parsing
+JSON; SQLite remains the source of truth. External anchoring is queued
+(`anchor_queue`) and done in Merkle batches by a background worker.
+
 Detected components:
   - LocalSnapshotStore
 
@@ -53,14 +63,23 @@ import json
 import logging
 import re
 import sqlite3
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
-from centinel.core.blockchain import publish_cid_to_chain, publish_hash_to_chain
+from centinel.core.anchor_queue import (
+    DEFAULT_ANCHOR_BATCH_SIZE,
+    DEFAULT_ANCHOR_INTERVAL_SECONDS,
+    AnchorLeaf,
+    AnchorWorker,
+    ChainAnchorBackend,
+)
+from centinel.core.columnar_store import ColumnarSeriesStore, DepartmentSeries
 from centinel.core.hashchain import compute_hash
-from centinel.core.ipfs import upload_snapshot_to_ipfs
 from centinel.core.models import Snapshot
 from centinel.core.normalize import snapshot_to_canonical_json
+from centinel.core.transparency import compute_merkle_root
 
 logger = logging.getLogger(__name__)
 
@@ -72,30 +91,63 @@ class LocalSnapshotStore:
         Manages SQLite storage for local snapshots.
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        columnar_dir: Optional[str] = None,
+        anchor_backend: Optional[Any] = None,
+        anchor_interval_seconds: float = DEFAULT_ANCHOR_INTERVAL_SECONDS,
+    ) -> None:
         """Inicializa la conexión SQLite y la tabla índice.
 
         Args:
             db_path (str): Ruta del archivo SQLite.
+            columnar_dir (Optional[str]): Raíz del almacén columnar; por
+                defecto `<db>_columns` junto a la base (sin almacén para
+                `:memory:`).
+            anchor_backend (Optional[Any]): Backend de anclaje externo; por
+                defecto `ChainAnchorBackend` (blockchain/IPFS según config).
+            anchor_interval_seconds (float): Intervalo del worker de anclaje.
 
         English:
             Initializes the SQLite connection and index table.
 
         Args:
             db_path (str): Path to the SQLite file.
+            columnar_dir (Optional[str]): Columnar store root; defaults to
+                `<db>_columns` next to the database (none for `:memory:`).
+            anchor_backend (Optional[Any]): External anchor backend; defaults
+                to `ChainAnchorBackend` (blockchain/IPFS as configured).
+            anchor_interval_seconds (float): Anchor worker interval.
         """
         self.db_path = db_path
-        self._connection = sqlite3.connect(db_path)
+        # The anchor worker shares this connection; `_lock` serializes writes.
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
         self._connection.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
         self._ensure_index_table()
+        self.anchor_backend = anchor_backend if anchor_backend is not None else ChainAnchorBackend()
+        self._anchor_worker: Optional[AnchorWorker] = (
+            AnchorWorker(self.anchor_pending, anchor_interval_seconds) if self.anchor_backend.enabled else None
+        )
+        if columnar_dir is None and db_path != ":memory:":
+            db_file = Path(db_path)
+            columnar_dir = str(db_file.with_name(f"{db_file.stem}_columns"))
+        self.columnar = ColumnarSeriesStore(columnar_dir) if columnar_dir else None
 
     def close(self) -> None:
-        """Cierra la conexión a la base de datos.
+        """Detiene el worker de anclaje y cierra la conexión.
+
+        Lo pendiente de anclar queda en `anchor_queue` para el próximo proceso.
 
         English:
-            Closes the database connection.
+            Stops the anchor worker and closes the database connection.
+            Pending anchors stay in `anchor_queue` for the next process.
         """
-        self._connection.close()
+        if self._anchor_worker is not None:
+            self._anchor_worker.stop()
+        with self._lock:
+            self._connection.close()
 
     def store_snapshot(self, snapshot: Snapshot, previous_hash: Optional[str] = None) -> str:
         """Guarda un snapshot y actualiza su hash en la cadena.
@@ -123,25 +175,15 @@ class LocalSnapshotStore:
         except (json.JSONDecodeError, TypeError) as exc:
             raise ValueError(f"canonical_json generation produced invalid JSON: {exc}") from exc
         snapshot_hash = compute_hash(canonical_json, previous_hash=previous_hash)
+        # External anchoring (blockchain/IPFS) happens later, in batches, on
+        # the anchor worker: tx_hash/ipfs_cid are filled in when it confirms.
         tx_hash = None
         ipfs_cid = None
         ipfs_tx_hash = None
-        try:
-            tx_hash = publish_hash_to_chain(snapshot_hash) or None
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("blockchain_publish_failed error=%s", exc)
-        try:
-            ipfs_cid = upload_snapshot_to_ipfs(json.loads(canonical_json)) or None
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("ipfs_upload_failed error=%s", exc)
-        if ipfs_cid:
-            try:
-                ipfs_tx_hash = publish_cid_to_chain(ipfs_cid) or None
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("ipfs_blockchain_publish_failed error=%s", exc)
         department_code = snapshot.meta.department_code
         table_name = self._department_table_name(department_code)
-        self._ensure_department_table(table_name)
+        with self._lock:
+            self._ensure_department_table(table_name)
 
         candidates_json = json.dumps(
             [candidate.__dict__ for candidate in snapshot.candidates],
@@ -151,7 +193,8 @@ class LocalSnapshotStore:
 
         totals = snapshot.totals
         self._assert_safe_identifier(table_name, "table_name")
-        with self._connection:
+        enqueue = self.anchor_backend is not None and self.anchor_backend.enabled
+        with self._lock, self._connection:
             self._connection.execute(
                 f"""
                 INSERT OR REPLACE INTO {table_name} (
@@ -212,9 +255,188 @@ class LocalSnapshotStore:
                     ipfs_tx_hash,
                 ),
             )
+            if enqueue:
+                self._connection.execute(
+                    """
+                    INSERT INTO anchor_queue (department_code, timestamp_utc, table_name, hash, enqueued_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        department_code,
+                        snapshot.meta.timestamp_utc,
+                        table_name,
+                        snapshot_hash,
+                        datetime.now(timezone.utc).isoformat(),
+                    ),
+                )
+
+        if enqueue and self._anchor_worker is not None:
+            self._anchor_worker.start()
+
+        if self.columnar is not None:
+            try:
+                self.columnar.append(snapshot)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("columnar_append_failed department=%s error=%s", department_code, exc)
 
         return snapshot_hash
 
+    def load_department_series(self, department_code: str) -> Optional[DepartmentSeries]:
+        """Carga la serie columnar de un departamento sin parsear JSON.
+
+        Args:
+            department_code (str): Código de departamento.
+
+        Returns:
+            Optional[DepartmentSeries]: Serie memory-mapped, o None si el
+            almacén columnar está deshabilitado.
+
+        English:
+            Loads a department's columnar series without parsing JSON.
+
+        Args:
+            department_code (str): Department code.
+
+        Returns:
+            Optional[DepartmentSeries]: Memory-mapped series, or None when
+            the columnar store is disabled.
+        """
+        if self.columnar is None:
+            return None
+        return self.columnar.load_series(department_code)
+
+    def anchor_pending(self, max_batch: int = DEFAULT_ANCHOR_BATCH_SIZE) -> int:
+        """Ancla un lote de hashes pendientes bajo una sola raíz Merkle.
+
+        Toma hasta `max_batch` entradas de `anchor_queue` en orden de
+        encolado, calcula su raíz con `compute_merkle_root`, la ancla con el
+        backend (fuera del lock) y escribe `tx_hash`/`ipfs_cid`/`ipfs_tx_hash`
+        y `anchor_root` en las filas. Si el backend falla, el lote queda
+        pendiente para el siguiente intervalo.
+
+        Returns:
+            int: Cantidad de snapshots anclados.
+
+        English:
+            Anchor one batch of pending hashes under a single Merkle root.
+            Takes up to `max_batch` queue entries in enqueue order, anchors
+            their root through the backend (outside the lock) and writes the
+            receipt back to the rows. On backend failure the batch stays
+            pending for the next interval.
+
+        Returns:
+            int: Number of snapshots anchored.
+        """
+        if self.anchor_backend is None:
+            return 0
+        with self._lock:
+            queued = self._connection.execute(
+                """
+                SELECT id, department_code, timestamp_utc, table_name, hash
+                FROM anchor_queue
+                ORDER BY id
+                LIMIT ?
+                """,
+                (max(1, int(max_batch)),),
+            ).fetchall()
+            leaves = [self._anchor_leaf(row) for row in queued]
+        if not queued:
+            return 0
+
+        merkle_root = compute_merkle_root([leaf.hash for leaf in leaves])
+        try:
+            receipt = self.anchor_backend.anchor(merkle_root, leaves)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("anchor_batch_failed size=%s error=%s", len(leaves), exc)
+            return 0
+
+        anchored_at = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO anchor_batches (
+                    merkle_root, leaf_count, leaves_json, backend, tx_hash, ipfs_cid, ipfs_tx_hash, anchored_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    merkle_root,
+                    len(leaves),
+                    json.dumps([leaf.hash for leaf in leaves]),
+                    receipt.backend,
+                    receipt.tx_hash,
+                    receipt.ipfs_cid,
+                    receipt.ipfs_tx_hash,
+                    anchored_at,
+                ),
+            )
+            for row in queued:
+                table_name = self._assert_safe_identifier(row["table_name"], "table_name")
+                values = (receipt.tx_hash, receipt.ipfs_cid, receipt.ipfs_tx_hash, merkle_root)
+                # Matching on hash skips rows replaced since they were queued.
+                self._connection.execute(
+                    f"""
+                    UPDATE {table_name}
+                    SET tx_hash = ?, ipfs_cid = ?, ipfs_tx_hash = ?, anchor_root = ?
+                    WHERE timestamp_utc = ? AND hash = ?
+                    """,  # nosec B608 - validated by _assert_safe_identifier.
+                    (*values, row["timestamp_utc"], row["hash"]),
+                )
+                self._connection.execute(
+                    """
+                    UPDATE snapshot_index
+                    SET tx_hash = ?, ipfs_cid = ?, ipfs_tx_hash = ?, anchor_root = ?
+                    WHERE department_code = ? AND timestamp_utc = ? AND hash = ?
+                    """,
+                    (*values, row["department_code"], row["timestamp_utc"], row["hash"]),
+                )
+            self._connection.executemany(
+                "DELETE FROM anchor_queue WHERE id = ?",
+                [(row["id"],) for row in queued],
+            )
+        logger.info("anchor_batch_ok size=%s root=%s backend=%s", len(leaves), merkle_root, receipt.backend)
+        return len(leaves)
+
+    def flush_anchors(self, max_batch: int = DEFAULT_ANCHOR_BATCH_SIZE) -> int:
+        """Ancla todo lo pendiente ahora, lote por lote.
+
+        English:
+            Anchor everything pending now, batch by batch.
+        """
+        total = 0
+        while True:
+            anchored = self.anchor_pending(max_batch)
+            if not anchored:
+                return total
+            total += anchored
+
+    def pending_anchor_count(self) -> int:
+        """Cantidad de snapshots en espera de anclaje.
+
+        English:
+            Number of snapshots waiting to be anchored.
+        """
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM anchor_queue").fetchone()[0])
+
+    def _anchor_leaf(self, row: sqlite3.Row) -> AnchorLeaf:
+        """Construye la hoja de anclaje leyendo el JSON canónico de la fila.
+
+        English:
+            Build the anchor leaf, reading the row's canonical JSON.
+        """
+        table_name = self._assert_safe_identifier(row["table_name"], "table_name")
+        stored = self._connection.execute(
+            f"SELECT canonical_json FROM {table_name} WHERE timestamp_utc = ?",  # nosec B608 - validated by _assert_safe_identifier.
+            (row["timestamp_utc"],),
+        ).fetchone()
+        return AnchorLeaf(
+            department_code=row["department_code"],
+            timestamp_utc=row["timestamp_utc"],
+            hash=row["hash"],
+            canonical_json=stored["canonical_json"] if stored else "null",
+        )
+
     def get_index_entries(self, department_code: Optional[str] = None) -> List[Dict[str, Any]]:
         """Devuelve el índice de snapshots, filtrado por departamento si aplica.
 
@@ -283,6 +505,7 @@ class LocalSnapshotStore:
                     "tx_hash": row["tx_hash"],
                     "ipfs_cid": row["ipfs_cid"],
                     "ipfs_tx_hash": row["ipfs_tx_hash"],
+                    "anchor_root": row["anchor_root"],
                 }
             )
         Path(output_path).write_text(json.dumps(payload, ensure_ascii=False, indent=2))
@@ -316,6 +539,7 @@ class LocalSnapshotStore:
             "tx_hash",
             "ipfs_cid",
             "ipfs_tx_hash",
+            "anchor_root",
         ]
         with Path(output_path).open("w", newline="", encoding="utf-8") as csv_file:
             writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
@@ -351,7 +575,8 @@ class LocalSnapshotStore:
                 candidates_json,
                 tx_hash,
                 ipfs_cid,
-                ipfs_tx_hash
+                ipfs_tx_hash,
+                anchor_root
             FROM {table_name}
             ORDER BY timestamp_utc
             """,  # nosec B608 - validated by _assert_safe_identifier.
@@ -379,6 +604,30 @@ class LocalSnapshotStore:
         self._ensure_column("snapshot_index", "tx_hash", "TEXT")
         self._ensure_column("snapshot_index", "ipfs_cid", "TEXT")
         self._ensure_column("snapshot_index", "ipfs_tx_hash", "TEXT")
+        self._ensure_column("snapshot_index", "anchor_root", "TEXT")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS anchor_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                department_code TEXT NOT NULL,
+                timestamp_utc TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                enqueued_at TEXT NOT NULL
+            )
+            """)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS anchor_batches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                merkle_root TEXT NOT NULL,
+                leaf_count INTEGER NOT NULL,
+                leaves_json TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                tx_hash TEXT,
+                ipfs_cid TEXT,
+                ipfs_tx_hash TEXT,
+                anchored_at TEXT NOT NULL
+            )
+            """)
 
     def _ensure_department_table(self, table_name: str) -> None:
         """Crea la tabla de snapshots de un departamento si falta.
@@ -418,6 +667,7 @@ class LocalSnapshotStore:
         self._ensure_column(table_name, "tx_hash", "TEXT")
         self._ensure_column(table_name, "ipfs_cid", "TEXT")
         self._ensure_column(table_name, "ipfs_tx_hash", "TEXT")
+        self._ensure_column(table_name, "anchor_root", "TEXT")
 
     _TABLE_NAME_RE = re.compile(r"^[A-Za-z0-9_]+$")
 
@@ -17,6 +17,12 @@ no infrastructure, and no organization to operate:
      — only if the optional `opentimestamps` package is installed
      (graceful degradation otherwise).
 
+The chain's Merkle tree is kept by an append-only `MerkleAccumulator`
+whose leaves are tracked in `transparency_leaves.jsonl` next to the log:
+each checkpoint only reads metadata for snapshots it has not seen, the
+root costs O(1), and the same tree answers inclusion and consistency
+proofs for any checkpoint size (served publicly under `/proofs`).
+
 Even without OpenTimestamps the log is valuable: committed to a public
 Git repository it inherits Git/GitHub's external, operator-independent
 timestamps. A single person with zero budget can run this.
@@ -31,16 +37,20 @@ import hashlib
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..hasher import collect_snapshot_metadata
+from ..hasher import _load_snapshot_meta, collect_snapshot_metadata
+from .merkle import MERKLE_CONSTRUCTION, ConsistencyProof, InclusionProof, MerkleAccumulator
+from .verification_cursor import FileIdentity
 
 _LOGGER = logging.getLogger("centinel.transparency")
 
 _DEFAULT_LOG_DIR = Path("data") / "transparency"
 _LOG_FILENAME = "transparency_log.jsonl"
+_LEAVES_FILENAME = "transparency_leaves.jsonl"
 
 
 def _sha256_hex(data: bytes) -> str:
@@ -54,39 +64,170 @@ def compute_merkle_root(leaf_hashes: List[str]) -> Optional[str]:
     (standard Bitcoin-style construction) so the root is deterministic
     and independently reproducible by any auditor.
     """
-    if not leaf_hashes:
-        return None
-    level = [bytes.fromhex(h) for h in leaf_hashes]
-    if len(level) == 1:
-        return level[0].hex()
-    while len(level) > 1:
-        if len(level) % 2 == 1:
-            level.append(level[-1])
-        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
-    return level[0].hex()
+    return MerkleAccumulator.from_leaves(leaf_hashes).root
 
 
 def _resolve_log_dir() -> Path:
     return _DEFAULT_LOG_DIR
 
 
-def build_transparency_checkpoint(snapshot_root: Path) -> Dict[str, Any]:
+class _TrackedChain:
+    """Accumulator plus the snapshot dirs (and hash.txt identities) behind its leaves."""
+
+    def __init__(self) -> None:
+        self.accumulator = MerkleAccumulator()
+        self.paths: List[str] = []
+        self.identities: List[str] = []
+        self.last_timestamp: Optional[str] = None
+
+
+_TRACKED_CHAINS: Dict[Path, _TrackedChain] = {}
+_TRACKED_LOCK = threading.Lock()
+
+
+def _leaf_record(snapshot_root: Path, meta: Any) -> Dict[str, str]:
+    return {
+        "path": meta.snapshot_dir.relative_to(snapshot_root).as_posix(),
+        "hash": meta.expected_hash,
+        "timestamp": meta.timestamp.isoformat(),
+        "identity": FileIdentity.of(meta.snapshot_dir / "hash.txt").token(),
+    }
+
+
+def _track(chain: _TrackedChain, record: Dict[str, str]) -> None:
+    chain.accumulator.append(record["hash"])
+    chain.paths.append(record["path"])
+    chain.identities.append(record["identity"])
+    chain.last_timestamp = record["timestamp"]
+
+
+def _read_leaves(leaves_path: Path) -> Optional[_TrackedChain]:
+    if not leaves_path.exists():
+        return None
+    chain = _TrackedChain()
+    try:
+        for raw in leaves_path.read_text(encoding="utf-8").splitlines():
+            if raw.strip():
+                _track(chain, json.loads(raw))
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        _LOGGER.warning("transparency_leaves_unreadable path=%s error=%s", leaves_path, exc)
+        return None
+    return chain
+
+
+def _write_lines(path: Path, records: List[Dict[str, str]], *, mode: str) -> None:
+    with open(path, mode, encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def _prefix_unchanged(snapshot_root: Path, chain: _TrackedChain, present: set) -> bool:
+    """True if every tracked snapshot still exists with the same hash.txt identity (stat only)."""
+    for path, identity in zip(chain.paths, chain.identities):
+        if path not in present:
+            return False
+        try:
+            if FileIdentity.of(snapshot_root / path / "hash.txt").token() != identity:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def sync_chain_accumulator(
+    snapshot_root: Path,
+    *,
+    log_dir: Optional[Path] = None,
+    persist: bool = True,
+) -> MerkleAccumulator:
+    """Bring the chain's Merkle accumulator up to date and return it.
+
+    Only snapshots not yet tracked have their metadata read; they are
+    appended in timestamp order. If a tracked snapshot disappeared, its
+    `hash.txt` changed (stat identity), or a new snapshot sorts before the
+    last tracked one, the chain is no longer an append-only extension and
+    the accumulator is rebuilt from scratch — same leaves, same order as
+    `collect_snapshot_metadata`. With ``persist`` the tracked leaves live in
+    an append-only `transparency_leaves.jsonl` under ``log_dir``.
+
+    Bilingüe: actualiza el acumulador Merkle leyendo solo snapshots nuevos;
+    si el prefijo cambió, lo reconstruye completo.
+    """
+    target_dir = log_dir or _resolve_log_dir()
+    leaves_path = target_dir / _LEAVES_FILENAME
+    cache_key = leaves_path.resolve() if persist else snapshot_root.resolve()
+    with _TRACKED_LOCK:
+        chain = _TRACKED_CHAINS.get(cache_key)
+        if chain is None and persist:
+            chain = _read_leaves(leaves_path)
+        present = {
+            meta_path.parent.relative_to(snapshot_root).as_posix()
+            for meta_path in snapshot_root.rglob("snapshot.metadata.json")
+        }
+
+        new_records: List[Dict[str, str]] = []
+        if chain is not None and _prefix_unchanged(snapshot_root, chain, present):
+            known = set(chain.paths)
+            fresh = sorted(
+                (_load_snapshot_meta(snapshot_root / path) for path in present - known),
+                key=lambda meta: meta.timestamp,
+            )
+            new_records = [_leaf_record(snapshot_root, meta) for meta in fresh]
+            if new_records and chain.last_timestamp is not None:
+                if datetime.fromisoformat(new_records[0]["timestamp"]) < datetime.fromisoformat(chain.last_timestamp):
+                    chain = None
+        else:
+            chain = None
+
+        if chain is None:
+            if cache_key in _TRACKED_CHAINS or (persist and leaves_path.exists()):
+                _LOGGER.warning("transparency_leaves_prefix_changed rebuilding path=%s", snapshot_root)
+            chain = _TrackedChain()
+            records = [_leaf_record(snapshot_root, meta) for meta in collect_snapshot_metadata(snapshot_root)]
+            for record in records:
+                _track(chain, record)
+            if persist:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = leaves_path.with_name(f"{leaves_path.name}.tmp")
+                _write_lines(tmp_path, records, mode="w")
+                tmp_path.replace(leaves_path)
+        elif new_records:
+            for record in new_records:
+                _track(chain, record)
+            if persist:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                _write_lines(leaves_path, new_records, mode="a")
+
+        _TRACKED_CHAINS[cache_key] = chain
+        return chain.accumulator
+
+
+def build_transparency_checkpoint(
+    snapshot_root: Path,
+    *,
+    accumulator: Optional[MerkleAccumulator] = None,
+) -> Dict[str, Any]:
     """Build a checkpoint summarizing the entire chain at this moment.
 
     The checkpoint is deterministic: same chain state produces the same
     merkle_root, so independent mirrors can be compared for divergence.
+    Pass an up-to-date ``accumulator`` (see `sync_chain_accumulator`) to
+    avoid rebuilding the tree from every snapshot.
     """
-    entries = collect_snapshot_metadata(snapshot_root)
-    leaf_hashes = [e.expected_hash for e in entries]
-    merkle_root = compute_merkle_root(leaf_hashes)
+    if accumulator is None:
+        accumulator = MerkleAccumulator.from_leaves(e.expected_hash for e in collect_snapshot_metadata(snapshot_root))
+    size = accumulator.size
     return {
         "version": 1,
         "created_at_utc": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
-        "chain_length": len(entries),
-        "first_hash": leaf_hashes[0] if leaf_hashes else None,
-        "last_hash": leaf_hashes[-1] if leaf_hashes else None,
-        "merkle_root": merkle_root,
+        "chain_length": size,
+        "first_hash": accumulator.leaf(0) if size else None,
+        "last_hash": accumulator.leaf(size - 1) if size else None,
+        "merkle_root": accumulator.root,
         "merkle_algorithm": "sha256",
+        "merkle_construction": MERKLE_CONSTRUCTION,
     }
 
 
@@ -164,7 +305,8 @@ def append_transparency_checkpoint(
     target_dir.mkdir(parents=True, exist_ok=True)
     log_path = target_dir / _LOG_FILENAME
 
-    checkpoint = build_transparency_checkpoint(snapshot_root)
+    accumulator = sync_chain_accumulator(snapshot_root, log_dir=target_dir)
+    checkpoint = build_transparency_checkpoint(snapshot_root, accumulator=accumulator)
     checkpoint = _maybe_sign(checkpoint)
     checkpoint = _maybe_opentimestamps(checkpoint)
     checkpoint["checkpoint_digest"] = _checkpoint_digest(checkpoint)
@@ -205,3 +347,68 @@ def read_transparency_log(log_dir: Optional[Path] = None) -> List[Dict[str, Any]
         except json.JSONDecodeError:
             _LOGGER.warning("transparency_log_corrupt_line skipped")
     return out
+
+
+def latest_checkpoint(log: List[Dict[str, Any]], *, prefer_signed: bool = True) -> Optional[Dict[str, Any]]:
+    """Return the newest checkpoint, preferring operator-signed ones.
+
+    With ``prefer_signed`` an unsigned tail (signing key missing or failed)
+    is skipped in favour of the newest signed checkpoint; if nothing was
+    ever signed the newest checkpoint is returned as-is.
+    """
+    if prefer_signed:
+        for checkpoint in reversed(log):
+            if checkpoint.get("operator_signature"):
+                return checkpoint
+    return log[-1] if log else None
+
+
+def _checkpoint_tree_size(accumulator: MerkleAccumulator, checkpoint: Dict[str, Any]) -> int:
+    """Size of ``checkpoint`` after checking the live tree reproduces its root."""
+    size = int(checkpoint.get("chain_length") or 0)
+    if size > accumulator.size or accumulator.root_at(size) != checkpoint.get("merkle_root"):
+        raise ValueError("checkpoint_root_mismatch")
+    return size
+
+
+def checkpoint_inclusion_proof(
+    accumulator: MerkleAccumulator,
+    checkpoint: Dict[str, Any],
+    snapshot_hash: str,
+) -> InclusionProof:
+    """Inclusion proof of ``snapshot_hash`` against a logged checkpoint.
+
+    Raises ``ValueError`` if the live chain no longer reproduces the
+    checkpoint's root (a rewrite since it was logged) and ``LookupError``
+    if the snapshot is unknown or was captured after the checkpoint.
+
+    Bilingüe: prueba de inclusión compacta (O(log n) hashes) de un snapshot
+    contra un checkpoint publicado.
+    """
+    size = _checkpoint_tree_size(accumulator, checkpoint)
+    leaf_index = accumulator.index_of(snapshot_hash)
+    if leaf_index is None:
+        raise LookupError("hash_not_found_in_chain")
+    if leaf_index >= size:
+        raise LookupError("hash_not_yet_checkpointed")
+    return accumulator.inclusion_proof(leaf_index, size)
+
+
+def checkpoint_consistency_proof(
+    accumulator: MerkleAccumulator,
+    old_checkpoint: Dict[str, Any],
+    new_checkpoint: Dict[str, Any],
+) -> ConsistencyProof:
+    """Consistency proof that ``new_checkpoint`` extends ``old_checkpoint``.
+
+    Raises ``ValueError`` if either root is not reproduced by the live
+    chain or if ``old_checkpoint`` is larger than ``new_checkpoint``.
+
+    Bilingüe: prueba de que un checkpoint extiende a otro sin reescribir
+    hojas previas.
+    """
+    old_size = _checkpoint_tree_size(accumulator, old_checkpoint)
+    new_size = _checkpoint_tree_size(accumulator, new_checkpoint)
+    if old_size > new_size:
+        raise ValueError("checkpoint_order_invalid")
+    return accumulator.consistency_proof(old_size, new_size)
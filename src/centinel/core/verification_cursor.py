@@ -0,0 +1,424 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/core/verification_cursor.py`.
+Cursor de verificación incremental para cadenas de hashes. Registra el
+último eslabón verificado (índice, hash e identidad de archivo: tamaño,
+mtime, inodo, ctime) junto con un digest de identidad de todo el prefijo, firmado
+con HMAC-SHA256. Las corridas siguientes verifican solo los eslabones
+nuevos; cualquier cambio en el prefijo, un cursor manipulado o el
+vencimiento del intervalo de re-verificación completa fuerzan una
+verificación desde el génesis.
+
+Componentes detectados:
+  - FileIdentity
+  - VerificationCursor
+  - identity_digest
+  - load_cursor
+  - save_cursor
+  - resolve_resume_point
+  - advance_cursor
+  - record_progress
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/core/verification_cursor.py`.
+Incremental verification cursor for hash chains. Records the last verified
+link (index, hash and file identity: size, mtime, inode, ctime) plus an identity
+digest over the whole verified prefix, signed with HMAC-SHA256. Later runs
+only verify new links; any change in the prefix, a tampered cursor or an
+expired full re-verification interval forces verification from genesis.
+
+Detected components:
+  - FileIdentity
+  - VerificationCursor
+  - identity_digest
+  - load_cursor
+  - save_cursor
+  - resolve_resume_point
+  - advance_cursor
+  - record_progress
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Verification Cursor Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from centinel.core.canonical_json import canonical_bytes
+
+logger = logging.getLogger(__name__)
+
+CURSOR_VERSION = 1
+# Periodic full re-hash even when the cursor prefix is intact (custody.full_reverify_hours).
+DEFAULT_FULL_REVERIFY_SECONDS = 24 * 3600.0
+_CURSOR_SECRET_FILENAME = ".verification_cursor_secret"
+_WARNED_SECRET_PATHS: set = set()
+
+
+def _resolve_cursor_hmac_key(cursor_path: Path) -> bytes:
+    """Resuelve la clave HMAC del cursor. / Resolve the cursor HMAC key.
+
+    Priority: ``CENTINEL_STATE_HMAC_KEY`` (>=16 chars, shared with the
+    circuit breaker state) else a local 0600 secret created next to the
+    cursor. A forged cursor would let an attacker skip re-verification of
+    a rewritten prefix, so the MAC is checked before any link is trusted.
+
+    The local secret only catches corruption and naive edits: whoever can
+    rewrite the cursor can usually read that file too and re-sign it. Real
+    tamper resistance requires ``CENTINEL_STATE_HMAC_KEY``, provisioned
+    outside the state directory; the fallback logs a warning once per path.
+    """
+    env_key = os.getenv("CENTINEL_STATE_HMAC_KEY", "").strip()
+    if len(env_key) >= 16:
+        return env_key.encode("utf-8")
+    secret_path = cursor_path.parent / _CURSOR_SECRET_FILENAME
+    if secret_path not in _WARNED_SECRET_PATHS:
+        _WARNED_SECRET_PATHS.add(secret_path)
+        logger.warning(
+            "verification_cursor_local_secret path=%s — set CENTINEL_STATE_HMAC_KEY for tamper resistance",
+            secret_path,
+        )
+    existing = _read_secret(secret_path)
+    if existing:
+        return existing
+    generated = hashlib.sha256(os.urandom(32)).hexdigest()
+    try:
+        secret_path.parent.mkdir(parents=True, exist_ok=True)
+        # Created 0600 atomically: never readable by others, even briefly.
+        fd = os.open(secret_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process won the race; use its secret once it is written.
+        return _read_secret(secret_path) or generated.encode("utf-8")
+    except OSError:
+        return generated.encode("utf-8")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(generated)
+    except OSError:
+        pass
+    return generated.encode("utf-8")
+
+
+def _read_secret(secret_path: Path) -> Optional[bytes]:
+    try:
+        existing = secret_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return existing.encode("utf-8") if existing else None
+
+
+def _canonical(payload: Dict[str, Any]) -> bytes:
+    return canonical_bytes(payload)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class FileIdentity:
+    """Identidad de un archivo de la cadena. / Identity of a chain file.
+
+    ``ctime_ns`` complements size/mtime/inode: it cannot be set from user
+    space, so an in-place rewrite that restores size and mtime still
+    changes the identity.
+    """
+
+    name: str
+    size: int
+    mtime_ns: int
+    inode: int
+    ctime_ns: int
+
+    @classmethod
+    def of(cls, path: Path, root: Optional[Path] = None) -> "FileIdentity":
+        """Lee la identidad vía ``stat`` (sin leer contenido). / Read identity via ``stat`` (no content read)."""
+        stat = path.stat()
+        name = path.name
+        if root is not None:
+            try:
+                name = path.relative_to(root).as_posix()
+            except ValueError:
+                pass
+        return cls(
+            name=name,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            ctime_ns=stat.st_ctime_ns,
+        )
+
+    def token(self) -> str:
+        return f"{self.name}|{self.size}|{self.mtime_ns}|{self.inode}|{self.ctime_ns}"
+
+
+@dataclass(frozen=True)
+class VerificationCursor:
+    """Último punto verificado de una cadena. / Last verified point of a chain.
+
+    ``index`` is the zero-based position of the last verified link in the
+    caller's ordering; ``prefix_digest`` covers the identities of every
+    file up to and including it. ``context_digest`` is an optional
+    caller-defined digest of prefix state that file identities do not
+    cover (e.g. the entries of a JSON chain index).
+    """
+
+    scope: str
+    index: int
+    last_hash: str
+    tip: FileIdentity
+    prefix_digest: str
+    verified_at: str
+    full_verified_at: str
+    first_hash: Optional[str] = None
+    context_digest: Optional[str] = None
+    version: int = CURSOR_VERSION
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa el cursor. / Serialize the cursor."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "VerificationCursor":
+        """Reconstruye el cursor. / Rebuild the cursor."""
+        data = dict(payload)
+        data["tip"] = FileIdentity(**data["tip"])
+        return cls(**data)
+
+
+# ---------------------------------------------------------------------------
+# Lógica principal / Core logic
+# ---------------------------------------------------------------------------
+def identity_digest(paths: Sequence[Path], root: Optional[Path] = None) -> str:
+    """Digest SHA-256 de las identidades de ``paths`` (solo ``stat``).
+
+    English: SHA-256 over the identities of ``paths`` (``stat`` only). Any
+    replaced, resized, touched or reordered file changes the digest.
+    """
+    hasher = hashlib.sha256()
+    for path in paths:
+        hasher.update(FileIdentity.of(path, root).token().encode("utf-8"))
+        hasher.update(b"\n")
+    return hasher.hexdigest()
+
+
+def load_cursor(path: Path, *, scope: str) -> Optional[VerificationCursor]:
+    """Carga un cursor verificado por MAC; ``None`` fuerza verificación completa.
+
+    English:
+        Load a MAC-verified cursor. Missing, unreadable, foreign-scope or
+        outdated cursors return ``None``. A MAC mismatch is logged as
+        CRITICAL and also returns ``None``: the tampered cursor is ignored
+        and the caller re-verifies from genesis (fail-closed).
+    """
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("verification_cursor_unreadable path=%s error=%s", path, exc)
+        return None
+    if not isinstance(raw, dict) or not isinstance(raw.get("cursor"), dict):
+        logger.warning("verification_cursor_invalid path=%s reason=envelope", path)
+        return None
+
+    payload = raw["cursor"]
+    expected = hmac.new(_resolve_cursor_hmac_key(path), _canonical(payload), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, str(raw.get("mac", ""))):
+        logger.critical("verification_cursor_TAMPERED path=%s — MAC mismatch, forcing full verification", path)
+        return None
+    try:
+        cursor = VerificationCursor.from_dict(payload)
+    except (KeyError, TypeError) as exc:
+        logger.warning("verification_cursor_invalid path=%s error=%s", path, exc)
+        return None
+    if cursor.scope != scope or cursor.version != CURSOR_VERSION:
+        logger.info("verification_cursor_ignored path=%s scope=%s version=%s", path, cursor.scope, cursor.version)
+        return None
+    return cursor
+
+
+def save_cursor(path: Path, cursor: VerificationCursor) -> None:
+    """Persiste el cursor firmado de forma atómica. / Atomically persist the signed cursor."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = cursor.to_dict()
+    envelope = {
+        "mac_algorithm": "HMAC-SHA256",
+        "mac": hmac.new(_resolve_cursor_hmac_key(path), _canonical(payload), hashlib.sha256).hexdigest(),
+        "cursor": payload,
+    }
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(envelope, handle, ensure_ascii=False, indent=2)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def resolve_resume_point(
+    cursor: Optional[VerificationCursor],
+    paths: Sequence[Path],
+    *,
+    root: Optional[Path] = None,
+    full_interval_seconds: Optional[float] = None,
+    now: Optional[datetime] = None,
+    prefix_context: Optional[Callable[[int], str]] = None,
+) -> Optional[VerificationCursor]:
+    """Devuelve el cursor si el prefijo que cubre sigue intacto; si no, ``None``.
+
+    English:
+        Return ``cursor`` when the prefix it covers is unchanged in
+        ``paths`` (same tip identity, same prefix digest) and the periodic
+        full re-verification is not due; otherwise ``None`` so the caller
+        verifies from genesis. Only ``stat`` calls are made, no hashing.
+        ``prefix_context(index)`` recomputes the caller's ``context_digest``
+        for the prefix ending at ``index``.
+    """
+    if cursor is None:
+        return None
+    if full_interval_seconds is not None:
+        try:
+            last_full = datetime.fromisoformat(cursor.full_verified_at)
+        except ValueError:
+            return None
+        if ((now or _utcnow()) - last_full).total_seconds() >= full_interval_seconds:
+            logger.info("verification_cursor_full_due scope=%s last_full=%s", cursor.scope, cursor.full_verified_at)
+            return None
+    if cursor.index >= len(paths):
+        logger.warning("verification_cursor_stale scope=%s reason=chain_shorter index=%d", cursor.scope, cursor.index)
+        return None
+    try:
+        tip_identity = FileIdentity.of(paths[cursor.index], root)
+        prefix_digest = identity_digest(paths[: cursor.index + 1], root)
+    except OSError as exc:
+        logger.warning("verification_cursor_stale scope=%s reason=stat_error error=%s", cursor.scope, exc)
+        return None
+    if tip_identity != cursor.tip or not hmac.compare_digest(prefix_digest, cursor.prefix_digest):
+        logger.warning("verification_cursor_stale scope=%s reason=prefix_changed index=%d", cursor.scope, cursor.index)
+        return None
+    if prefix_context is not None and prefix_context(cursor.index) != cursor.context_digest:
+        logger.warning("verification_cursor_stale scope=%s reason=context_changed index=%d", cursor.scope, cursor.index)
+        return None
+    return cursor
+
+
+def advance_cursor(
+    previous: Optional[VerificationCursor],
+    *,
+    scope: str,
+    paths: Sequence[Path],
+    index: int,
+    last_hash: str,
+    first_hash: Optional[str],
+    full: bool,
+    root: Optional[Path] = None,
+    context_digest: Optional[str] = None,
+) -> VerificationCursor:
+    """Construye el cursor tras verificar hasta ``index`` inclusive.
+
+    English: Build the cursor after verifying up to ``index`` inclusive.
+    ``full`` marks a pass that started at genesis and resets the periodic
+    full re-verification clock.
+    """
+    now_iso = _utcnow().isoformat()
+    full_verified_at = now_iso if full or previous is None else previous.full_verified_at
+    return VerificationCursor(
+        scope=scope,
+        index=index,
+        last_hash=last_hash,
+        tip=FileIdentity.of(paths[index], root),
+        prefix_digest=identity_digest(paths[: index + 1], root),
+        verified_at=now_iso,
+        full_verified_at=full_verified_at,
+        first_hash=first_hash,
+        context_digest=context_digest,
+    )
+
+
+def record_progress(
+    cursor_path: Path,
+    previous: Optional[VerificationCursor],
+    *,
+    scope: str,
+    paths: Sequence[Path],
+    last_hash: str,
+    first_hash: Optional[str],
+    root: Optional[Path] = None,
+    context_digest: Optional[str] = None,
+) -> Optional[VerificationCursor]:
+    """Avanza el cursor al último eslabón de ``paths`` y lo persiste.
+
+    English:
+        Advance the cursor to the last entry of ``paths`` and persist it.
+        ``previous`` is the resume cursor used by this pass (``None`` for a
+        pass from genesis). Persistence errors are logged and swallowed:
+        losing the cursor only costs a full verification next time.
+    """
+    if not paths:
+        return None
+    try:
+        cursor = advance_cursor(
+            previous,
+            scope=scope,
+            paths=paths,
+            index=len(paths) - 1,
+            last_hash=last_hash,
+            first_hash=first_hash,
+            full=previous is None,
+            root=root,
+            context_digest=context_digest,
+        )
+        save_cursor(cursor_path, cursor)
+    except OSError as exc:
+        logger.warning("verification_cursor_save_failed path=%s error=%s", cursor_path, exc)
+        return None
+    return cursor
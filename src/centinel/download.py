@@ -307,12 +307,22 @@ def _build_tls_context() -> ssl.SSLContext:
     return context
 
 
-def build_client() -> httpx.AsyncClient:
+def build_client(
+    *,
+    timeout_seconds: float = 30.0,
+    limits: Optional[httpx.Limits] = None,
+) -> httpx.AsyncClient:
     """Construye un cliente HTTP con timeout global.
 
-    English: Build an HTTP client with a global timeout.
+    English: Build an HTTP client with a global timeout. ``limits`` bounds
+    the keep-alive pool when the client is shared by concurrent captures.
     """
-    return httpx.AsyncClient(timeout=httpx.Timeout(30.0), verify=_build_tls_context())
+    kwargs = {"limits": limits} if limits is not None else {}
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout_seconds),
+        verify=_build_tls_context(),
+        **kwargs,
+    )
 
 
 async def download_and_hash(
@@ -91,9 +91,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Mapping
 
+import httpx
 import requests
 import yaml
-from tenacity import Retrying, retry_if_exception_type
+from tenacity import AsyncRetrying, Retrying, retry_if_exception_type
 
 structlog = None
 if importlib.util.find_spec("structlog"):
@@ -470,7 +471,7 @@ def _build_failed_payload(
     }
 
 
-def _extract_response_text(response: requests.Response | None, limit: int) -> str | None:
+def _extract_response_text(response: requests.Response | httpx.Response | None, limit: int) -> str | None:
     """Safely extract a bounded response body for logs."""
     if response is None:
         return None
@@ -535,30 +536,51 @@ def _perform_request(
         policy = retry_config.policy_for_exception(exc)
         raise RetryableExceptionError(str(exc), policy, context=context) from exc
 
-    if response.status_code >= 400:
-        policy = retry_config.policy_for_status(response.status_code)
-        if policy.action == "alert_only" and alert_hook:
-            alert_hook(
-                "retry_alert",
-                {
-                    "status_code": response.status_code,
-                    "url": url,
-                    "context": context,
-                },
-            )
-        response_text = _extract_response_text(response, retry_config.log_payload_bytes)
-        if policy.max_attempts <= 1 or policy.action == "fail_fast":
-            raise NonRetryableStatusError(response.status_code, response_text)
-        raise RetryableStatusError(
-            response.status_code,
-            policy,
-            response_text=response_text,
-            context=context,
-        )
-
+    _raise_for_retry_status(
+        response,
+        url,
+        retry_config=retry_config,
+        context=context,
+        alert_hook=alert_hook,
+    )
     return response
 
 
+def _raise_for_retry_status(
+    response: requests.Response | httpx.Response,
+    url: str,
+    *,
+    retry_config: RetryConfig,
+    context: dict[str, Any],
+    alert_hook: Callable[[str, dict[str, Any]], None] | None,
+) -> None:
+    """Map HTTP error statuses to retryable or non-retryable errors.
+
+    English: Shared by the requests (sync) and httpx (async) transports.
+    """
+    if response.status_code < 400:
+        return
+    policy = retry_config.policy_for_status(response.status_code)
+    if policy.action == "alert_only" and alert_hook:
+        alert_hook(
+            "retry_alert",
+            {
+                "status_code": response.status_code,
+                "url": url,
+                "context": context,
+            },
+        )
+    response_text = _extract_response_text(response, retry_config.log_payload_bytes)
+    if policy.max_attempts <= 1 or policy.action == "fail_fast":
+        raise NonRetryableStatusError(response.status_code, response_text)
+    raise RetryableStatusError(
+        response.status_code,
+        policy,
+        response_text=response_text,
+        context=context,
+    )
+
+
 def _request_with_retry(
     session: requests.Session,
     url: str,
@@ -604,58 +626,208 @@ def _request_with_retry(
                 elapsed = time.monotonic() - start
                 payload = None
                 if parse_json:
-                    try:
-                        payload = response.json()
-                    except (json.JSONDecodeError, ValueError) as exc:
-                        policy = retry_config.policy_for_exception(exc)
-                        response_text = _extract_response_text(
-                            response, retry_config.log_payload_bytes
-                        )
-                        logger.warning(
-                            "json_parse_error",
-                            url=url,
-                            error=str(exc),
-                            response_text=response_text,
-                            context=context,
-                        )
-                        raise RetryableParsingError(
-                            "json_parse_error",
-                            policy,
-                            response_text=response_text,
-                            context=context,
-                        ) from exc
-                success_fields: dict[str, Any] = {
-                    "url": url,
-                    "status_code": response.status_code,
-                    "elapsed_seconds": round(elapsed, 3),
-                    "context": context,
-                }
-                if parse_json and payload is not None:
-                    success_fields["payload_type"] = type(payload).__name__
-                logger.info("request_success", **success_fields)
+                    payload = _parse_json_payload(
+                        response,
+                        url,
+                        retry_config=retry_config,
+                        logger=logger,
+                        context=context,
+                    )
+                _log_request_success(logger, response, url, elapsed, payload, context)
                 return response, payload
     except Exception as exc:
-        status_code = getattr(exc, "status_code", None)
-        response_text = getattr(exc, "response_text", None)
-        attempts = getattr(retrying, "statistics", {}).get("attempt_number", 0)
-        logger.error(
-            "request_failed",
+        _record_request_failure(logger, retry_config, retrying, url, exc, context)
+        raise
+
+
+def _parse_json_payload(
+    response: requests.Response | httpx.Response,
+    url: str,
+    *,
+    retry_config: RetryConfig,
+    logger: StructuredLogger,
+    context: dict[str, Any],
+) -> Any:
+    """Parse a JSON body, mapping decode failures to a retryable error."""
+    try:
+        return response.json()
+    except (json.JSONDecodeError, ValueError) as exc:
+        policy = retry_config.policy_for_exception(exc)
+        response_text = _extract_response_text(response, retry_config.log_payload_bytes)
+        logger.warning(
+            "json_parse_error",
             url=url,
-            status_code=status_code,
-            attempts=attempts or 1,
             error=str(exc),
+            response_text=response_text,
             context=context,
         )
-        failed_payload = _build_failed_payload(
-            url=url,
-            method="GET",
-            attempts=attempts or 1,
-            error=str(exc),
-            status_code=status_code,
+        raise RetryableParsingError(
+            "json_parse_error",
+            policy,
             response_text=response_text,
             context=context,
-        )
-        _write_failed_request(retry_config, failed_payload)
+        ) from exc
+
+
+def _log_request_success(
+    logger: StructuredLogger,
+    response: requests.Response | httpx.Response,
+    url: str,
+    elapsed: float,
+    payload: Any | None,
+    context: dict[str, Any],
+) -> None:
+    """Emit the ``request_success`` event shared by both transports."""
+    success_fields: dict[str, Any] = {
+        "url": url,
+        "status_code": response.status_code,
+        "elapsed_seconds": round(elapsed, 3),
+        "context": context,
+    }
+    if payload is not None:
+        success_fields["payload_type"] = type(payload).__name__
+    logger.info("request_success", **success_fields)
+
+
+def _record_request_failure(
+    logger: StructuredLogger,
+    retry_config: RetryConfig,
+    retrying: Any,
+    url: str,
+    exc: BaseException,
+    context: dict[str, Any],
+) -> None:
+    """Log a definitive failure and append it to the failed-requests JSONL."""
+    status_code = getattr(exc, "status_code", None)
+    response_text = getattr(exc, "response_text", None)
+    attempts = getattr(retrying, "statistics", {}).get("attempt_number", 0)
+    logger.error(
+        "request_failed",
+        url=url,
+        status_code=status_code,
+        attempts=attempts or 1,
+        error=str(exc),
+        context=context,
+    )
+    failed_payload = _build_failed_payload(
+        url=url,
+        method="GET",
+        attempts=attempts or 1,
+        error=str(exc),
+        status_code=status_code,
+        response_text=response_text,
+        context=context,
+    )
+    _write_failed_request(retry_config, failed_payload)
+
+
+# ES: Las excepciones de httpx se mapean a los nombres de requests para que
+#     ``per_exception`` en retry_config.yaml aplique igual a ambos transportes.
+# EN: httpx exceptions are mapped to requests' names so ``per_exception`` in
+#     retry_config.yaml applies identically to both transports.
+_HTTPX_EXCEPTION_ALIASES: dict[str, str] = {
+    "ConnectError": "ConnectionError",
+    "ConnectTimeout": "ConnectionError",
+    "RemoteProtocolError": "ConnectionError",
+    "ReadError": "ConnectionError",
+    "PoolTimeout": "ReadTimeout",
+    "WriteTimeout": "ReadTimeout",
+}
+
+
+def _policy_for_httpx_exception(retry_config: RetryConfig, exc: httpx.HTTPError) -> RetryPolicy:
+    """Resolve the retry policy for an httpx transport error."""
+    name = exc.__class__.__name__
+    if "SSL" in str(exc) or "CERTIFICATE" in str(exc).upper():
+        name = "SSLError"
+    name = _HTTPX_EXCEPTION_ALIASES.get(name, name)
+    return retry_config.per_exception.get(name, retry_config.default_policy)
+
+
+async def _perform_async_request(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: dict[str, str] | None,
+    timeout: float,
+    retry_config: RetryConfig,
+    context: dict[str, Any],
+    alert_hook: Callable[[str, dict[str, Any]], None] | None,
+) -> httpx.Response:
+    """Perform a single async GET and map failures to retryable errors."""
+    try:
+        response = await client.get(url, headers=headers, timeout=timeout)
+    except httpx.HTTPError as exc:
+        policy = _policy_for_httpx_exception(retry_config, exc)
+        raise RetryableExceptionError(str(exc), policy, context=context) from exc
+    _raise_for_retry_status(
+        response,
+        url,
+        retry_config=retry_config,
+        context=context,
+        alert_hook=alert_hook,
+    )
+    return response
+
+
+async def async_request_json_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    retry_config: RetryConfig,
+    timeout: float | None = None,
+    headers: dict[str, str] | None = None,
+    logger: StructuredLogger | None = None,
+    context: dict[str, Any] | None = None,
+    alert_hook: Callable[[str, dict[str, Any]], None] | None = None,
+) -> tuple[httpx.Response, Any]:
+    """Async counterpart of :func:`request_json_with_retry` over httpx.
+
+    English: Same retry policies, logging and failed-request journal as the
+    sync path; backoff sleeps yield to the event loop instead of blocking.
+    """
+    logger = logger or StructuredLogger("centinel.downloader")
+    context = context or {}
+    timeout = timeout or retry_config.timeout_seconds
+    retrying = AsyncRetrying(
+        retry=retry_if_exception_type(RetryableError),
+        wait=PolicyWait(),
+        stop=PolicyStop(),
+        before_sleep=lambda state: _log_before_sleep(logger, state),
+        reraise=True,
+    )
+
+    try:
+        async for attempt in retrying:
+            with attempt:
+                logger.info(
+                    "request_attempt",
+                    attempt=attempt.retry_state.attempt_number,
+                    url=url,
+                    context=context,
+                )
+                start = time.monotonic()
+                response = await _perform_async_request(
+                    client,
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    retry_config=retry_config,
+                    context=context,
+                    alert_hook=alert_hook,
+                )
+                elapsed = time.monotonic() - start
+                payload = _parse_json_payload(
+                    response,
+                    url,
+                    retry_config=retry_config,
+                    logger=logger,
+                    context=context,
+                )
+                _log_request_success(logger, response, url, elapsed, payload, context)
+                return response, payload
+    except Exception as exc:
+        _record_request_failure(logger, retry_config, retrying, url, exc, context)
         raise
 
 
@@ -28,6 +28,7 @@ _SWARM_PATHS: frozenset[str] = frozenset({
     "/api/swarm/status",
     "/api/swarm/connect",
     "/hashchain/verify",
+    "/proofs/",
     "/api/health",
     "/api/summaries",
     "/api/national-snapshot",
@@ -10,13 +10,17 @@ bootstrap layers tried in parallel:
   3. DNS-over-HTTPS TXT records (Cloudflare)
   4. mDNS UDP multicast on local network
   5. Hardcoded project bootstrap seeds
+
+All peer traffic goes through one pooled, keep-alive httpx.AsyncClient
+owned by the engine. Broadcasts fan out concurrently (bounded by a
+semaphore, each peer capped by a deadline) so a round costs about one peer
+RTT, and per-peer latency/failure stats bias which peers are picked next.
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
 import os
 import random
@@ -28,10 +32,12 @@ from collections import OrderedDict, deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import httpx
 
+from centinel.core import canonical_json
+
 logger = logging.getLogger("centinel.federation.gossip")
 
 _REPO_ROOT = Path(__file__).resolve().parents[4]
@@ -63,6 +69,13 @@ _FINDING_RATE_LIMIT = 20       # max findings broadcast per minute per node
 _FINDING_RATE_WINDOW = 60.0    # sliding window in seconds
 _BROADCAST_SEVERITIES = {"HIGH", "CRITICAL"}
 _LRU_PUBKEY_CACHE_SIZE = 10_000
+_BROADCAST_TARGETS = 10        # peers per broadcast round
+_BROADCAST_CONCURRENCY = 10    # in-flight requests per engine
+_PEER_DEADLINE = 8.0           # seconds, hard cap per peer request
+_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0)
+_PEER_LATENCY_ALPHA = 0.3      # EWMA weight of the newest latency sample
+_PEER_FAILURE_COOLDOWN = 300.0  # seconds a peer sits out after repeated failures
+_PEER_MAX_CONSECUTIVE_FAILURES = 3
 
 
 # ── Data structures ───────────────────────────────────────────────────────────
@@ -91,7 +104,7 @@ class NodePayload:
         """Serialise deterministically for signing/verification (excludes signature)."""
         d = asdict(self)
         d.pop("signature", None)
-        return json.dumps(d, sort_keys=True, separators=(",", ":")).encode()
+        return canonical_json.canonical_bytes(d, ensure_ascii=True)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -128,7 +141,7 @@ class FindingPayload:
         d = asdict(self)
         d.pop("signature", None)
         d.pop("ttl_hops", None)  # transport field, not part of the signed payload
-        return json.dumps(d, sort_keys=True, separators=(",", ":")).encode()
+        return canonical_json.canonical_bytes(d, ensure_ascii=True)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -164,7 +177,7 @@ class ScrapeResultPayload:
     def canonical_bytes(self) -> bytes:
         d = asdict(self)
         d.pop("signature", None)
-        return json.dumps(d, sort_keys=True, separators=(",", ":")).encode()
+        return canonical_json.canonical_bytes(d, ensure_ascii=True)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -407,6 +420,49 @@ class _LRUPubkeyCache:
             return len(self._store)
 
 
+@dataclass
+class _PeerStats:
+    """Per-peer latency/failure record used to bias peer selection."""
+
+    latency_ewma: Optional[float] = None  # seconds
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+
+    def record_success(self, latency: float) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += _PEER_LATENCY_ALPHA * (latency - self.latency_ewma)
+
+    def record_failure(self, now: float) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= _PEER_MAX_CONSECUTIVE_FAILURES:
+            self.cooldown_until = now + _PEER_FAILURE_COOLDOWN
+
+    def weight(self, now: float) -> float:
+        """Selection weight: fast, healthy peers high; cooling-down peers ~0."""
+        if self.cooldown_until > now:
+            return 1e-6
+        # Unmeasured peers get a middling latency so they still get probed.
+        latency = self.latency_ewma if self.latency_ewma is not None else _PEER_DEADLINE / 8
+        return 0.5 ** self.consecutive_failures / (latency + 0.05)
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
 # ── Gossip Engine ─────────────────────────────────────────────────────────────
 
 
@@ -416,6 +472,10 @@ class GossipEngine:
     Each active node periodically broadcasts its own NodePayload to known
     peers. Received payloads are verified and fanned out to _FAN_OUT random
     peers, achieving O(log N) convergence.
+
+    Peer requests share one pooled keep-alive client (``transport`` lets
+    tests inject an ``httpx.MockTransport``); at most ``max_concurrency``
+    are in flight and each is capped at ``peer_deadline`` seconds.
     """
 
     def __init__(
@@ -426,6 +486,9 @@ class GossipEngine:
         max_peers: int = 100,
         anomaly_log: Optional[object] = None,
         attack_log: Optional[object] = None,
+        max_concurrency: int = _BROADCAST_CONCURRENCY,
+        peer_deadline: float = _PEER_DEADLINE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         self.country_code = country_code.upper()
         self.my_url = my_url
@@ -437,6 +500,14 @@ class GossipEngine:
             self.my_url = None
         self.broadcast_interval = broadcast_interval
         self.max_peers = max_peers
+        self.peer_deadline = peer_deadline
+
+        # Pooled HTTP client (created lazily inside the running loop) and
+        # per-peer stats keyed by base URL.
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._peer_stats: dict[str, _PeerStats] = {}
 
         # Federation finding logs (optional — gossip still works without them)
         self._anomaly_log = anomaly_log  # FederationAnomalyLog
@@ -506,8 +577,7 @@ class GossipEngine:
         seen: set[str] = set()
         unique_urls = [u for u in peer_urls if not (u in seen or seen.add(u))]  # type: ignore[func-returns-value]
 
-        for url in unique_urls:
-            await self._fetch_checkpoint(url)
+        await asyncio.gather(*(self._fetch_checkpoint(url) for url in unique_urls))
 
         self._running = True
         self._task = asyncio.create_task(self._loop())
@@ -520,8 +590,15 @@ class GossipEngine:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self.aclose()
         logger.info("gossip_stop node_id=%s peers=%d", self._node_id, len(self._peers))
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (reopened on the next request)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     # ── public API ─────────────────────────────────────────────────────────────
 
     async def receive_attestation(self, payload_dict: dict) -> bool:
@@ -555,9 +632,9 @@ class GossipEngine:
             node_id, payload.chain_length, payload.merkle_root,
         )
 
-        # Fan-out to 2 random peers (exclude sender)
+        # Fan-out to _FAN_OUT peers (exclude sender)
         candidates = [u for nid, u in self._peers.items() if nid != node_id]
-        for url in random.sample(candidates, min(_FAN_OUT, len(candidates))):
+        for url in self._pick_peers(candidates, _FAN_OUT):
             asyncio.create_task(self._push_payload(url, payload))
 
         return True
@@ -587,15 +664,8 @@ class GossipEngine:
         self._store_finding(finding, source="local")
 
         # Fan-out to peers
-        targets = list(self._peers.values())
-        random.shuffle(targets)
-        targets = targets[:10]
-
-        acks = 0
-        for url in targets:
-            ok = await self._push_finding(url, finding)
-            if ok:
-                acks += 1
+        targets = self._pick_peers(list(self._peers.values()), _BROADCAST_TARGETS)
+        acks = await self._fan_out(targets, lambda url: self._push_finding(url, finding))
 
         logger.info(
             "finding_broadcast sent=%d acked=%d rule=%s severity=%s",
@@ -662,7 +732,7 @@ class GossipEngine:
         if finding.ttl_hops > 0:
             fwd = FindingPayload(**{**asdict(finding), "ttl_hops": finding.ttl_hops - 1})
             candidates = [u for nid, u in self._peers.items() if nid != finding.node_id]
-            for url in random.sample(candidates, min(_FAN_OUT, len(candidates))):
+            for url in self._pick_peers(candidates, _FAN_OUT):
                 asyncio.create_task(self._push_finding(url, fwd))
         else:
             logger.debug("finding_ttl_expired finding_id=%s — stored locally, no fan-out", finding.finding_id)
@@ -718,6 +788,7 @@ class GossipEngine:
             "consensus_epoch": consensus_epoch,
             "consensus_reached": local_reached,
             "consensus_scope": "local_50_peer_view",
+            "peer_health": {url: stats.to_dict() for url, stats in self._peer_stats.items()},
             "last_broadcast_utc": (
                 datetime.fromtimestamp(self._last_broadcast, tz=timezone.utc).isoformat()
                 if self._last_broadcast else None
@@ -782,12 +853,11 @@ class GossipEngine:
         with self._scrape_lock:
             self._scrape_registry[source_id] = result
 
-        targets = list(self._peers.values())
-        random.shuffle(targets)
-        for url in targets[:_FAN_OUT * 2]:
+        targets = self._pick_peers(list(self._peers.values()), _FAN_OUT * 2)
+        for url in targets:
             asyncio.create_task(self._push_scrape_result(url, result))
 
-        logger.info("scrape_result_broadcast source=%s peers=%d", source_id, min(len(targets), _FAN_OUT * 2))
+        logger.info("scrape_result_broadcast source=%s peers=%d", source_id, len(targets))
 
     async def receive_scrape_result(self, payload_dict: dict) -> bool:
         """Accept a ScrapeResultPayload from a peer, verify signature, and fan out."""
@@ -822,7 +892,7 @@ class GossipEngine:
         )
 
         candidates = [u for nid, u in self._peers.items() if nid != result.node_id]
-        for url in random.sample(candidates, min(_FAN_OUT, len(candidates))):
+        for url in self._pick_peers(candidates, _FAN_OUT):
             asyncio.create_task(self._push_scrape_result(url, result))
 
         return True
@@ -843,15 +913,8 @@ class GossipEngine:
         attestation = self.build_my_attestation()
         payload = NodePayload.from_dict(attestation)
 
-        targets = list(self._peers.values())
-        random.shuffle(targets)
-        targets = targets[:10]
-
-        acks = 0
-        for url in targets:
-            ok = await self._push_payload(url, payload)
-            if ok:
-                acks += 1
+        targets = self._pick_peers(list(self._peers.values()), _BROADCAST_TARGETS)
+        acks = await self._fan_out(targets, lambda url: self._push_payload(url, payload))
 
         self._last_broadcast = time.time()
         logger.info(
@@ -860,51 +923,112 @@ class GossipEngine:
         )
         return acks
 
+    # ── peer transport ─────────────────────────────────────────────────────────
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.peer_deadline),
+                limits=_POOL_LIMITS,
+                transport=self._transport,
+            )
+        return self._client
+
+    def _stats_for(self, base_url: str) -> _PeerStats:
+        stats = self._peer_stats.get(base_url)
+        if stats is None:
+            if len(self._peer_stats) >= self.max_peers * 4:
+                live = set(self._peers.values())
+                for url in [u for u in self._peer_stats if u not in live]:
+                    del self._peer_stats[url]
+            stats = self._peer_stats[base_url] = _PeerStats()
+        return stats
+
+    def _pick_peers(self, candidates: list[str], k: int) -> list[str]:
+        """Weighted random sample of ``k`` peers without replacement.
+
+        Uses Efraimidis-Spirakis keys (``u ** (1 / weight)``): fast, healthy
+        peers are preferred, slow ones are still picked now and then, and
+        peers cooling down after repeated failures only fill leftover slots.
+        """
+        now = time.monotonic()
+        keyed = []
+        for url in dict.fromkeys(candidates):
+            stats = self._peer_stats.get(url.rstrip("/"))
+            weight = stats.weight(now) if stats is not None else _PeerStats().weight(now)
+            keyed.append((random.random() ** (1.0 / weight), url))
+        keyed.sort(key=lambda item: item[0], reverse=True)
+        return [url for _, url in keyed[:k]]
+
+    async def _fan_out(self, targets: list[str], send: Callable[[str], Awaitable[bool]]) -> int:
+        """Run ``send(url)`` for every target concurrently; returns ACK count."""
+        if not targets:
+            return 0
+        results = await asyncio.gather(*(send(url) for url in targets))
+        return sum(1 for ok in results if ok)
+
+    async def _request(
+        self,
+        method: str,
+        base_url: str,
+        path: str,
+        body: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send one request to a peer over the pooled client.
+
+        Bounded by the engine semaphore and by the per-peer deadline; the
+        outcome (latency, or failure on errors and non-200 answers) feeds
+        the peer's stats. Raises on transport errors and timeouts.
+        """
+        url = base_url.rstrip("/")
+        stats = self._stats_for(url)
+        deadline = min(timeout or self.peer_deadline, self.peer_deadline)
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(
+                    self._get_client().request(method, f"{url}{path}", json=body, timeout=deadline),
+                    timeout=deadline,
+                )
+            except Exception:
+                stats.record_failure(time.monotonic())
+                raise
+        if response.status_code == 200:
+            stats.record_success(time.monotonic() - started)
+        else:
+            stats.record_failure(time.monotonic())
+        return response
+
     async def _push_payload(self, base_url: str, payload: NodePayload) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=8.0) as client:
-                r = await client.post(
-                    f"{base_url}/api/swarm/attest",
-                    json=payload.to_dict(),
-                    headers={"Content-Type": "application/json"},
-                )
-                return r.status_code == 200
+            r = await self._request("POST", base_url, "/api/swarm/attest", payload.to_dict())
+            return r.status_code == 200
         except Exception as exc:
             logger.debug("gossip_push_failed url=%s error=%s", base_url, exc)
             return False
 
     async def _push_finding(self, base_url: str, finding: FindingPayload) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=8.0) as client:
-                r = await client.post(
-                    f"{base_url}/api/swarm/finding",
-                    json=finding.to_dict(),
-                    headers={"Content-Type": "application/json"},
-                )
-                return r.status_code == 200
+            r = await self._request("POST", base_url, "/api/swarm/finding", finding.to_dict())
+            return r.status_code == 200
         except Exception as exc:
             logger.debug("finding_push_failed url=%s error=%s", base_url, exc)
             return False
 
     async def _push_scrape_result(self, base_url: str, result: ScrapeResultPayload) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                r = await client.post(
-                    f"{base_url}/api/swarm/scrape_result",
-                    json=result.to_dict(),
-                    headers={"Content-Type": "application/json"},
-                )
-                return r.status_code == 200
+            r = await self._request("POST", base_url, "/api/swarm/scrape_result", result.to_dict(), timeout=5.0)
+            return r.status_code == 200
         except Exception as exc:
             logger.debug("scrape_result_push_failed url=%s error=%s", base_url, exc)
             return False
 
     async def _fetch_checkpoint(self, base_url: str) -> None:
         try:
-            async with httpx.AsyncClient(timeout=8.0) as client:
-                r = await client.get(f"{base_url.rstrip('/')}/api/checkpoint")
-                if r.status_code == 200:
-                    await self.receive_attestation(r.json())
+            r = await self._request("GET", base_url, "/api/checkpoint")
+            if r.status_code == 200:
+                await self.receive_attestation(r.json())
         except Exception as exc:
             logger.debug("gossip_fetch_checkpoint_failed url=%s error=%s", base_url, exc)
 
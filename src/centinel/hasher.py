@@ -17,6 +17,10 @@ Componentes detectados:
   - _parse_timestamp
   - _load_snapshot_entry
   - collect_snapshot_entries
+  - _sidecar_identity_digest
+  - _evaluate_snapshot
+  - _iter_snapshot_outcomes
+  - _parallel_snapshot_outcomes
   - verify_hashchain_from_snapshots
 
 Notas:
@@ -36,6 +40,10 @@ Detected components:
   - _parse_timestamp
   - _load_snapshot_entry
   - collect_snapshot_entries
+  - _sidecar_identity_digest
+  - _evaluate_snapshot
+  - _iter_snapshot_outcomes
+  - _parallel_snapshot_outcomes
   - verify_hashchain_from_snapshots
 
 Notes:
@@ -65,16 +73,24 @@ Notes:
 from __future__ import annotations
 
 import json
+import math
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .download import chained_hash
 from .core.custody import verify_hash_record_signature
+from .core.verification_cursor import identity_digest, load_cursor, record_progress, resolve_resume_point
 
-_SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
+SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
+SNAPSHOT_CURSOR_SCOPE = "snapshot_chain"
+# Below this many snapshots the pool start-up costs more than it saves.
+_PARALLEL_MIN_SNAPSHOTS = 256
+_SEGMENTS_PER_WORKER = 4
 
 
 def _validate_hash_format(value: str, field_name: str) -> None:
@@ -89,7 +105,7 @@ def _validate_hash_format(value: str, field_name: str) -> None:
     truncados) para que un intento de manipulacion sea un error de
     integridad detectable y no un crash criptografico aguas abajo.
     """
-    if not isinstance(value, str) or not _SHA256_HEX_RE.match(value):
+    if not isinstance(value, str) or not SHA256_HEX_RE.match(value):
         raise ValueError(f"invalid_hash_format field={field_name} value={value!r}")
 
 
@@ -126,9 +142,7 @@ def ensure_snapshot_metadata(
 
 def canonical_metadata_bytes(metadata: Dict[str, Any]) -> bytes:
     """Serialize metadata canonically for hashing. (Serializa metadatos en forma canónica para hashing.)"""
-    return json.dumps(metadata, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode(
-        "utf-8"
-    )
+    return json.dumps(metadata, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 def compute_snapshot_hash(
@@ -275,7 +289,151 @@ def collect_snapshot_entries(snapshot_root: Path) -> List[SnapshotEntry]:
     return sorted(entries, key=lambda entry: entry.timestamp)
 
 
-def verify_hashchain_from_snapshots(snapshot_root: Path) -> Dict[str, Any]:
+def _sidecar_identity_digest(snapshot_dirs: List[Path], snapshot_root: Path) -> str:
+    """Identity digest of metadata + hash sidecars (stat only, no reads)."""
+    sidecars: List[Path] = []
+    for snapshot_dir in snapshot_dirs:
+        sidecars.append(snapshot_dir / "snapshot.metadata.json")
+        sidecars.append(snapshot_dir / "hash.txt")
+    return identity_digest(sidecars, snapshot_root)
+
+
+@dataclass(frozen=True)
+class _SnapshotOutcome:
+    """Per-snapshot verdict computed against ``assumed_previous``.
+
+    Pool workers do not know the running hash at a segment head: they assume
+    the snapshot's own ``metadata.previous_hash`` (or report ``pending``
+    when it has none). The merge re-evaluates any outcome whose assumption
+    differs from the real running hash, so results match a sequential pass.
+    """
+
+    index: int
+    status: str  # ok | pending | raised | previous_mismatch | compute_error | hash_mismatch
+    assumed_previous: Optional[str] = None
+    computed_hash: Optional[str] = None
+    expected_hash: Optional[str] = None
+    expected_previous: Optional[str] = None
+    signature_valid: Optional[bool] = None
+
+
+def _evaluate_snapshot(index: int, snapshot_dir: Path, previous_hash: Optional[str]) -> _SnapshotOutcome:
+    """Verify one snapshot against the running ``previous_hash``."""
+    entry = _load_snapshot_entry(snapshot_dir)
+    expected_previous = entry.previous_hash
+
+    if expected_previous and previous_hash and expected_previous != previous_hash:
+        return _SnapshotOutcome(index, "previous_mismatch", previous_hash, expected_previous=expected_previous)
+
+    try:
+        computed_hash = compute_snapshot_hash(
+            entry.content,
+            entry.metadata,
+            previous_hash,
+        )
+    except ValueError:
+        return _SnapshotOutcome(index, "compute_error", previous_hash)
+
+    if computed_hash != entry.expected_hash:
+        return _SnapshotOutcome(
+            index,
+            "hash_mismatch",
+            previous_hash,
+            computed_hash=computed_hash,
+            expected_hash=entry.expected_hash,
+        )
+
+    signature_valid: Optional[bool] = None
+    metadata_file = entry.snapshot_dir / "snapshot.metadata.json"
+    if metadata_file.exists():
+        try:
+            metadata_obj = json.loads(metadata_file.read_text(encoding="utf-8"))
+            if "operator_signature" in metadata_obj:
+                signature_valid = verify_hash_record_signature(metadata_obj)
+        except Exception:
+            # Non-fatal: ignore failures reading/parsing signature
+            pass
+    return _SnapshotOutcome(index, "ok", previous_hash, computed_hash=computed_hash, signature_valid=signature_valid)
+
+
+def _iter_snapshot_outcomes(
+    snapshot_dirs: List[Path],
+    start_index: int,
+    previous_hash: Optional[str],
+    previous_known: bool,
+) -> Iterator[_SnapshotOutcome]:
+    """Walk a segment in order, stopping at the first break."""
+    for offset, snapshot_dir in enumerate(snapshot_dirs):
+        index = start_index + offset
+        if not previous_known:
+            try:
+                previous_hash = _load_snapshot_meta(snapshot_dir).previous_hash
+            except ValueError:
+                yield _SnapshotOutcome(index, "raised")
+                return
+            if previous_hash is None:
+                yield _SnapshotOutcome(index, "pending")
+                return
+        try:
+            outcome = _evaluate_snapshot(index, snapshot_dir, previous_hash)
+        except ValueError:
+            # Surfaced by the merge, which re-loads in the caller's process.
+            yield _SnapshotOutcome(index, "raised")
+            return
+        yield outcome
+        if outcome.status != "ok":
+            return
+        previous_hash, previous_known = outcome.computed_hash, True
+
+
+def _verify_snapshot_segment(paths: List[str], start_index: int) -> List[_SnapshotOutcome]:
+    """Pool worker: verify a segment without knowing its predecessor."""
+    return list(_iter_snapshot_outcomes([Path(p) for p in paths], start_index, None, False))
+
+
+def _parallel_snapshot_outcomes(
+    snapshot_dirs: List[Path], start_index: int, workers: int
+) -> Iterator[_SnapshotOutcome]:
+    """Verify segments in a process pool and yield outcomes in chain order.
+
+    A worker stops at its first non-ok outcome; the merge re-evaluates that
+    snapshot and, if it turns out fine, continues sequentially until the
+    next segment's outcomes are reached.
+    """
+    remaining = snapshot_dirs[start_index:]
+    segment_size = max(1, math.ceil(len(remaining) / (workers * _SEGMENTS_PER_WORKER)))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        offsets = list(range(0, len(remaining), segment_size))
+        futures = [
+            pool.submit(
+                _verify_snapshot_segment,
+                [str(path) for path in remaining[offset : offset + segment_size]],
+                start_index + offset,
+            )
+            for offset in offsets
+        ]
+        for offset, future in zip(offsets, futures):
+            segment_end = start_index + min(offset + segment_size, len(remaining))
+            produced = future.result()
+            yield from produced
+            next_index = produced[-1].index + 1 if produced else start_index + offset
+            # Worker stopped early: hand out placeholders so the merge
+            # re-evaluates the rest of the segment in order.
+            for index in range(next_index, segment_end):
+                yield _SnapshotOutcome(index, "pending")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def verify_hashchain_from_snapshots(
+    snapshot_root: Path,
+    *,
+    cursor_path: Optional[Path] = None,
+    full: bool = False,
+    full_interval_seconds: Optional[float] = None,
+    workers: int = 1,
+) -> Dict[str, Any]:
     """Verify chained hashes from a snapshot directory.
 
     Strict semantics: stops at the first integrity violation and reports the
@@ -293,6 +451,19 @@ def verify_hashchain_from_snapshots(snapshot_root: Path) -> Dict[str, Any]:
             or None if the chain is fully valid.
         broken_at_path: str|None — filesystem path of the first failing snapshot.
         errors: list[str] — at most one error describing the break point.
+        resumed_from: int|None — first index re-hashed when resuming from
+            the verification cursor, or None for a pass from genesis.
+
+    With ``cursor_path`` the pass is incremental: payloads up to the signed
+    cursor are not re-read as long as their files (payload, metadata and
+    hash sidecars) keep the same size/mtime/inode/ctime. Timestamp sanity still
+    runs over the whole chain from metadata. ``full=True`` or an expired
+    ``full_interval_seconds`` re-hash from genesis.
+
+    ``workers > 1`` (``0`` = all cores) splits the chain into segments
+    verified in a process pool; segment heads are re-checked against the
+    real running hash while merging, so every field (including
+    ``broken_at``) matches the sequential pass.
 
     Semantica estricta: detiene la verificacion ante la primera violacion de
     integridad y reporta el punto exacto de ruptura. Una cadena rota es
@@ -308,7 +479,9 @@ def verify_hashchain_from_snapshots(snapshot_root: Path) -> Dict[str, Any]:
     # behavior (payload-present dirs, timestamp-ordered): pure endurance
     # optimization, integrity semantics unchanged.
     raw_dirs = [p.parent for p in snapshot_root.rglob("snapshot.raw")]
-    ordered_dirs = sorted(raw_dirs, key=lambda d: _load_snapshot_meta(d).timestamp)
+    ordered_metas = sorted((_load_snapshot_meta(d) for d in raw_dirs), key=lambda m: m.timestamp)
+    ordered_dirs = [meta.snapshot_dir for meta in ordered_metas]
+    raw_paths = [snapshot_dir / "snapshot.raw" for snapshot_dir in ordered_dirs]
     total_count = len(ordered_dirs)
     errors: List[str] = []
     signature_failures: List[str] = []
@@ -329,83 +502,110 @@ def verify_hashchain_from_snapshots(snapshot_root: Path) -> Dict[str, Any]:
     timestamp_anomalies: List[Dict[str, Any]] = []
     previous_timestamp: Optional[datetime] = None
 
-    for idx, snapshot_dir in enumerate(ordered_dirs):
-        entry = _load_snapshot_entry(snapshot_dir)
-        entry_ts = entry.timestamp
-        if entry_ts.tzinfo is None:
-            entry_ts = entry_ts.replace(tzinfo=timezone.utc)
-        if (entry_ts - now_utc).total_seconds() > _FUTURE_TOLERANCE_SECONDS:
-            timestamp_anomalies.append(
-                {
-                    "index": idx,
-                    "snapshot": entry.snapshot_dir.name,
-                    "kind": "future_timestamp",
-                    "detail": f"timestamp {entry_ts.isoformat()} is ahead of "
-                    f"verification time {now_utc.isoformat()}",
-                }
-            )
-        if previous_timestamp is not None and entry_ts < previous_timestamp:
-            timestamp_anomalies.append(
-                {
-                    "index": idx,
-                    "snapshot": entry.snapshot_dir.name,
-                    "kind": "non_monotonic_vs_chain_predecessor",
-                    "detail": f"timestamp {entry_ts.isoformat()} precedes "
-                    f"chain predecessor {previous_timestamp.isoformat()}",
-                }
-            )
-        previous_timestamp = entry_ts
-
-        expected_previous = entry.previous_hash
-
-        if expected_previous and previous_hash and expected_previous != previous_hash:
-            broken_at = idx
-            broken_at_path = str(entry.snapshot_dir)
-            errors.append(
-                f"previous_hash_mismatch path={entry.snapshot_dir} "
-                f"expected={expected_previous} actual={previous_hash}"
-            )
-            break
-
-        try:
-            computed_hash = compute_snapshot_hash(
-                entry.content,
-                entry.metadata,
-                previous_hash,
-            )
-        except ValueError:
-            broken_at = idx
-            broken_at_path = str(entry.snapshot_dir)
-            errors.append(f"hash_compute_error path={entry.snapshot_dir.name}")
-            break
-
-        if computed_hash != entry.expected_hash:
-            broken_at = idx
-            broken_at_path = str(entry.snapshot_dir)
-            errors.append(
-                f"hash_mismatch path={entry.snapshot_dir} "
-                f"expected={entry.expected_hash} computed={computed_hash}"
-            )
-            break
-
-        # Verify signature if present (non-fatal failure)
-        metadata_file = entry.snapshot_dir / "snapshot.metadata.json"
-        if metadata_file.exists():
-            try:
-                metadata_content = metadata_file.read_text(encoding="utf-8")
-                metadata_obj = json.loads(metadata_content)
-                if "operator_signature" in metadata_obj:
-                    if not verify_hash_record_signature(metadata_obj):
-                        signature_failures.append(
-                            f"invalid_signature index={idx} path={entry.snapshot_dir.name}"
-                        )
-            except Exception:
-                # Non-fatal: ignore failures reading/parsing signature
-                pass
-
-        previous_hash = computed_hash
-        last_valid_hash = computed_hash
-        verified_count += 1
+    resume = None
+    if cursor_path is not None and not full:
+        resume = resolve_resume_point(
+            load_cursor(cursor_path, scope=SNAPSHOT_CURSOR_SCOPE),
+            raw_paths,
+            root=snapshot_root,
+            full_interval_seconds=full_interval_seconds,
+            prefix_context=lambda index: _sidecar_identity_digest(ordered_dirs[: index + 1], snapshot_root),
+        )
+    start_index = resume.index + 1 if resume is not None else 0
+    if resume is not None:
+        previous_hash = last_valid_hash = resume.last_hash
+        verified_count = start_index
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers > 1 and total_count - start_index >= _PARALLEL_MIN_SNAPSHOTS:
+        outcomes = _parallel_snapshot_outcomes(ordered_dirs, start_index, workers)
+    else:
+        outcomes = _iter_snapshot_outcomes(ordered_dirs[start_index:], start_index, previous_hash, True)
+
+    try:
+        for idx, meta in enumerate(ordered_metas):
+            # Timestamp sanity runs from metadata; payloads are only read
+            # (and hashed) from the cursor onwards.
+            entry_ts = meta.timestamp
+            if entry_ts.tzinfo is None:
+                entry_ts = entry_ts.replace(tzinfo=timezone.utc)
+            if (entry_ts - now_utc).total_seconds() > _FUTURE_TOLERANCE_SECONDS:
+                timestamp_anomalies.append(
+                    {
+                        "index": idx,
+                        "snapshot": meta.snapshot_dir.name,
+                        "kind": "future_timestamp",
+                        "detail": f"timestamp {entry_ts.isoformat()} is ahead of "
+                        f"verification time {now_utc.isoformat()}",
+                    }
+                )
+            if previous_timestamp is not None and entry_ts < previous_timestamp:
+                timestamp_anomalies.append(
+                    {
+                        "index": idx,
+                        "snapshot": meta.snapshot_dir.name,
+                        "kind": "non_monotonic_vs_chain_predecessor",
+                        "detail": f"timestamp {entry_ts.isoformat()} precedes "
+                        f"chain predecessor {previous_timestamp.isoformat()}",
+                    }
+                )
+            previous_timestamp = entry_ts
+            if idx < start_index:
+                continue
+
+            outcome = next(outcomes)
+            if outcome.status in ("pending", "raised") or outcome.assumed_previous != previous_hash:
+                # Worker guessed the predecessor (segment head) or hit a load
+                # error: re-check here with the real running hash.
+                outcome = _evaluate_snapshot(idx, meta.snapshot_dir, previous_hash)
+            snapshot_dir = meta.snapshot_dir
+
+            if outcome.status == "previous_mismatch":
+                broken_at = idx
+                broken_at_path = str(snapshot_dir)
+                errors.append(
+                    f"previous_hash_mismatch path={snapshot_dir} "
+                    f"expected={outcome.expected_previous} actual={previous_hash}"
+                )
+                break
+
+            if outcome.status == "compute_error":
+                broken_at = idx
+                broken_at_path = str(snapshot_dir)
+                errors.append(f"hash_compute_error path={snapshot_dir.name}")
+                break
+
+            if outcome.status == "hash_mismatch":
+                broken_at = idx
+                broken_at_path = str(snapshot_dir)
+                errors.append(
+                    f"hash_mismatch path={snapshot_dir} "
+                    f"expected={outcome.expected_hash} computed={outcome.computed_hash}"
+                )
+                break
+
+            # Verify signature if present (non-fatal failure)
+            if outcome.signature_valid is False:
+                signature_failures.append(f"invalid_signature index={idx} path={snapshot_dir.name}")
+
+            previous_hash = outcome.computed_hash
+            last_valid_hash = outcome.computed_hash
+            verified_count += 1
+    finally:
+        outcomes.close()
+
+    if cursor_path is not None and not errors and not signature_failures and last_valid_hash:
+        record_progress(
+            cursor_path,
+            resume,
+            scope=SNAPSHOT_CURSOR_SCOPE,
+            paths=raw_paths,
+            last_hash=last_valid_hash,
+            first_hash=ordered_metas[0].expected_hash,
+            root=snapshot_root,
+            context_digest=_sidecar_identity_digest(ordered_dirs, snapshot_root),
+        )
 
     return {
         "valid": not errors,
@@ -418,4 +618,5 @@ def verify_hashchain_from_snapshots(snapshot_root: Path) -> Dict[str, Any]:
         "errors": errors,
         "signature_failures": signature_failures,
         "timestamp_anomalies": timestamp_anomalies,
+        "resumed_from": start_index if resume is not None else None,
     }
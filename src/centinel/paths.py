@@ -66,9 +66,12 @@ Notes:
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 # Raíces por defecto (relativas al root del proyecto).
 # Default roots (relative to project root).
 DEFAULT_DATA_ROOT = Path("data")
@@ -178,34 +181,121 @@ def iter_all_source_dirs(
     )
 
 
+def _open_catalog(data_root: Path, *, hash_root: Path | None = None):
+    """Catálogo indexado de snapshots si existe; ``None`` si no.
+
+    Indexed snapshot catalog when present, else ``None`` (callers then glob
+    the directories as before). With ``hash_root`` the catalog is only used
+    if it indexes that exact hash tree.
+    """
+    from centinel.snapshot_catalog import open_catalog
+
+    try:
+        catalog = open_catalog(data_root=data_root, hash_root=hash_root or DEFAULT_HASH_ROOT)
+        if catalog is not None and hash_root is not None and not catalog.serves_hash_root(hash_root):
+            return None
+        return catalog
+    except Exception:  # noqa: BLE001 - a broken catalog must never hide evidence
+        return None
+
+
+def _newest(paths: list[Path], limit: int | None) -> list[Path]:
+    if limit is None:
+        return paths
+    return paths[-limit:] if limit > 0 else []
+
+
+def _reconcile(catalogued: list[Path] | None, on_disk: list[Path], limit: int | None, kind: str) -> list[Path]:
+    """Orden del catálogo solo si lista exactamente los archivos en disco.
+
+    Use the catalog's capture order only when it lists exactly the files on
+    disk (``catalogued`` includes rows whose file is gone); any extra or
+    missing file means evidence the catalog never saw, so the disk listing
+    sorted by mtime is returned instead.
+    """
+    if catalogued is not None:
+        if set(catalogued) == set(on_disk):
+            return _newest(catalogued, limit)
+        logger.warning(
+            "snapshot_catalog_disk_mismatch kind=%s catalogued=%d on_disk=%d", kind, len(catalogued), len(on_disk)
+        )
+    return _newest(sorted(on_disk, key=lambda p: p.stat().st_mtime), limit)
+
+
 def iter_all_snapshots(
     *,
     data_root: Path = DEFAULT_DATA_ROOT,
     pattern: str = "snapshot_*.json",
+    source_id: str | None = None,
+    limit: int | None = None,
+    exhaustive: bool = False,
 ) -> list[Path]:
-    """Lista todos los snapshots de todas las fuentes, ordenados por mtime.
-
-    List all snapshots from all sources, sorted by mtime.
+    """Lista los snapshots de todas las fuentes, en orden de captura.
+
+    List snapshots from all sources, oldest first. When the snapshot catalog
+    exists (``data_root/snapshot_catalog.sqlite3``) the order is its capture
+    sequence and ``source_id`` / ``limit`` (newest ``limit`` entries) are
+    answered from its indexes; otherwise the directories are globbed and
+    sorted by mtime. ``exhaustive=True`` (verification paths) always lists
+    the directories and trusts the catalog only for ordering, when it
+    matches the files on disk exactly.
     """
+    catalog = _open_catalog(data_root) if pattern == "snapshot_*.json" else None
+    catalogued: list[Path] | None = None
+    if catalog is not None:
+        try:
+            if not exhaustive:
+                return catalog.snapshot_paths(source_id=source_id, limit=limit)
+            catalogued = [entry.snapshot_path for entry in catalog.entries(source_id=source_id)]
+        except Exception:  # noqa: BLE001
+            catalogued = None
+    if source_id is not None:
+        source_dirs = [snapshot_dir_for_source(source_id, data_root=data_root)]
+    else:
+        source_dirs = iter_all_source_dirs(data_root=data_root)
     results: list[Path] = []
-    for source_dir in iter_all_source_dirs(data_root=data_root):
+    for source_dir in source_dirs:
         results.extend(source_dir.glob(pattern))
-    return sorted(results, key=lambda p: p.stat().st_mtime)
+    return _reconcile(catalogued, results, limit, "snapshot")
 
 
 def iter_all_hashes(
     *,
     hash_root: Path = DEFAULT_HASH_ROOT,
     pattern: str = "snapshot_*.sha256",
+    source_id: str | None = None,
+    limit: int | None = None,
+    data_root: Path | None = None,
+    exhaustive: bool = False,
 ) -> list[Path]:
-    """Lista todos los hashes de todas las fuentes, ordenados por mtime.
-
-    List all hashes from all sources, sorted by mtime.
+    """Lista los hash records de todas las fuentes, en orden de captura.
+
+    List hash records from all sources, oldest first. The catalog is looked
+    up in ``data_root`` (default: the ``data/`` sibling of ``hash_root``)
+    and used only if it indexes this ``hash_root``; otherwise the
+    directories are globbed and sorted by mtime. Custody verification
+    passes ``exhaustive=True`` so records written outside the catalog (or
+    missing from disk) are never skipped; see ``iter_all_snapshots``.
     """
+    catalog_root = data_root if data_root is not None else hash_root.parent / DEFAULT_DATA_ROOT.name
+    catalog = _open_catalog(catalog_root, hash_root=hash_root) if pattern == "snapshot_*.sha256" else None
+    catalogued: list[Path] | None = None
+    if catalog is not None:
+        try:
+            if not exhaustive:
+                return catalog.hash_paths(source_id=source_id, limit=limit)
+            catalogued = [
+                entry.hash_path for entry in catalog.entries(source_id=source_id) if entry.hash_path is not None
+            ]
+        except Exception:  # noqa: BLE001
+            catalogued = None
     results: list[Path] = []
-    if not hash_root.exists():
-        return results
-    for source_dir in sorted(hash_root.iterdir()):
-        if source_dir.is_dir():
-            results.extend(source_dir.glob(pattern))
-    return sorted(results, key=lambda p: p.stat().st_mtime)
+    if hash_root.exists():
+        if source_id is not None:
+            source_dirs = [hash_dir_for_source(source_id, hash_root=hash_root)]
+        else:
+            source_dirs = sorted(hash_root.iterdir())
+        for source_dir in source_dirs:
+            if source_dir.is_dir():
+                results.extend(source_dir.glob(pattern))
+    return _reconcile(catalogued, results, limit, "hash")
@@ -0,0 +1,512 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/profiling.py`.
+Perfilador por muestreo de reloj de pared, bajo demanda y sin reiniciar el
+nodo. Un hilo lee `sys._current_frames()` cada `interval` segundos y
+acumula las pilas de todos los hilos; el resultado se escribe en
+`reports/` como pilas colapsadas (flamegraph.pl, speedscope) o como JSON
+de speedscope.
+
+- `start_timed_profile`: perfila el proceso actual durante N segundos
+  (usado por la API).
+- `request_cycle_profile` + `CycleProfiler`: la API deja una solicitud en
+  disco y el loop de polling perfila los próximos K ciclos del pipeline.
+
+Componentes detectados:
+  - SamplingProfiler
+  - TimedProfile
+  - start_timed_profile
+  - active_timed_profile
+  - request_cycle_profile
+  - read_cycle_request
+  - CycleProfiler
+  - list_profiles
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/profiling.py`.
+On-demand wall-clock sampling profiler that needs no restart. A thread
+reads `sys._current_frames()` every `interval` seconds and accumulates
+the stacks of every thread; the result is written under `reports/` as
+collapsed stacks (flamegraph.pl, speedscope) or speedscope JSON.
+
+- `start_timed_profile`: profile the current process for N seconds (used
+  by the API).
+- `request_cycle_profile` + `CycleProfiler`: the API drops a request on
+  disk and the polling loop profiles the next K pipeline cycles.
+
+Detected components:
+  - SamplingProfiler
+  - TimedProfile
+  - start_timed_profile
+  - active_timed_profile
+  - request_cycle_profile
+  - read_cycle_request
+  - CycleProfiler
+  - list_profiles
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Profiling Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FORMATS = ("collapsed", "speedscope")
+DEFAULT_PROFILE_DIR = Path("reports")
+DEFAULT_REQUEST_PATH = DEFAULT_PROFILE_DIR / "profile_request.json"
+DEFAULT_INTERVAL_SECONDS = 0.01
+MAX_PROFILE_SECONDS = 600.0
+MAX_PROFILE_CYCLES = 20
+MAX_STACK_DEPTH = 128
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    """Muestreador de pilas por reloj de pared (todos los hilos).
+
+    English:
+        Wall-clock stack sampler over every thread but its own. ``start``
+        and ``stop`` may alternate: samples accumulate across sessions, so a
+        profile can skip the idle time between pipeline cycles. Each sample
+        is weighted by the real time elapsed since the previous one.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL_SECONDS, *, name: str = "centinel") -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.interval = interval
+        self.name = name
+        self.samples = 0
+        self.elapsed_seconds = 0.0
+        self._weights: Dict[Tuple[str, Stack], float] = {}
+        self._counts: Counter = Counter()
+        self._frame_names: Dict[Any, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Inicia (o reanuda) el muestreo en un hilo daemon.
+
+        English:
+            Start (or resume) sampling on a daemon thread.
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="centinel-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Pausa el muestreo; las muestras se conservan.
+
+        English:
+            Pause sampling; collected samples are kept.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        previous = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            self.sample(weight=now - previous, exclude=(own_id,))
+            previous = now
+
+    def sample(self, weight: Optional[float] = None, exclude: Tuple[int, ...] = ()) -> None:
+        """Toma una muestra de todos los hilos (también usable sin hilo).
+
+        English:
+            Take one sample of every thread (also usable without the thread).
+        """
+        weight = self.interval if weight is None else weight
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id in exclude:
+                    continue
+                key = (names.get(thread_id, f"thread-{thread_id}"), self._stack(frame))
+                self._weights[key] = self._weights.get(key, 0.0) + weight
+                self._counts[key] += 1
+            self.samples += 1
+            self.elapsed_seconds += weight
+
+    def _stack(self, frame: Any) -> Stack:
+        stack: List[str] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            label = self._frame_names.get(code)
+            if label is None:
+                label = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                self._frame_names[code] = label
+            stack.append(label)
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+    def collapsed(self) -> str:
+        """Pilas colapsadas: ``hilo;raíz;...;hoja <muestras>`` por línea.
+
+        English:
+            Collapsed stacks: ``thread;root;...;leaf <samples>`` per line.
+        """
+        with self._lock:
+            items = sorted(self._counts.items())
+        return "".join(f"{';'.join((thread, *stack)).replace(' ', '_')} {count}\n" for (thread, stack), count in items)
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Documento speedscope: un perfil muestreado por hilo, en segundos.
+
+        English:
+            Speedscope document: one sampled profile per thread, in seconds.
+        """
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[str, int] = {}
+        per_thread: Dict[str, Dict[str, List[Any]]] = {}
+        with self._lock:
+            items = sorted(self._weights.items())
+        for (thread, stack), weight in items:
+            indices = []
+            for label in stack:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append(_speedscope_frame(label))
+                indices.append(frame_index[label])
+            profile = per_thread.setdefault(thread, {"samples": [], "weights": []})
+            profile["samples"].append(indices)
+            profile["weights"].append(round(weight, 6))
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": self.name,
+            "exporter": "centinel.profiling",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(sum(profile["weights"]), 6),
+                    "samples": profile["samples"],
+                    "weights": profile["weights"],
+                }
+                for thread, profile in per_thread.items()
+            ],
+        }
+
+    def write(self, output_dir: str | Path, fmt: str = "collapsed", label: str = "profile") -> Path:
+        """Escribe el perfil en ``output_dir`` y devuelve la ruta.
+
+        English:
+            Write the profile under ``output_dir`` and return its path.
+        """
+        if fmt not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {fmt}")
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if fmt == "collapsed":
+            path = output_dir / f"profile_{label}_{stamp}.collapsed.txt"
+            content = self.collapsed()
+        else:
+            path = output_dir / f"profile_{label}_{stamp}.speedscope.json"
+            content = json.dumps(self.speedscope(), ensure_ascii=False)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+        logger.info(
+            "profile_written path=%s format=%s samples=%d seconds=%.2f",
+            path,
+            fmt,
+            self.samples,
+            self.elapsed_seconds,
+        )
+        return path
+
+
+def _short_path(filename: str) -> str:
+    try:
+        return os.path.relpath(filename)
+    except ValueError:
+        return filename
+
+
+def _speedscope_frame(label: str) -> Dict[str, Any]:
+    name, _, location = label.partition(" (")
+    file_name, _, line = location.rstrip(")").rpartition(":")
+    frame: Dict[str, Any] = {"name": name, "file": file_name}
+    if line.isdigit():
+        frame["line"] = int(line)
+    return frame
+
+
+def _validate(fmt: str, interval: float) -> None:
+    if fmt not in PROFILE_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(PROFILE_FORMATS)}")
+    if not 0.001 <= interval <= 1.0:
+        raise ValueError("interval must be between 0.001 and 1.0 seconds")
+
+
+@dataclass
+class TimedProfile:
+    """Perfil de duración fija que corre en segundo plano.
+
+    English:
+        Fixed-duration profile running in the background. ``output`` is set
+        once the file is written; ``error`` if writing failed.
+    """
+
+    seconds: float
+    fmt: str
+    interval: float
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    output: Optional[str] = None
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "format": self.fmt,
+            "interval": self.interval,
+            "started_at": self.started_at,
+            "running": not self.done.is_set(),
+            "output": self.output,
+            "error": self.error,
+        }
+
+
+_active_timed: Optional[TimedProfile] = None
+_timed_lock = threading.Lock()
+
+
+def active_timed_profile() -> Optional[TimedProfile]:
+    """Último perfil temporizado lanzado en este proceso, si hay.
+
+    English:
+        Last timed profile started in this process, if any.
+    """
+    return _active_timed
+
+
+def start_timed_profile(
+    seconds: float,
+    *,
+    fmt: str = "collapsed",
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    output_dir: str | Path = DEFAULT_PROFILE_DIR,
+) -> TimedProfile:
+    """Perfila este proceso ``seconds`` segundos sin bloquear al llamador.
+
+    English:
+        Profile this process for ``seconds`` without blocking the caller.
+        Only one timed profile runs at a time: ``RuntimeError`` otherwise.
+    """
+    global _active_timed
+    _validate(fmt, interval)
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise ValueError(f"seconds must be in (0, {MAX_PROFILE_SECONDS:.0f}]")
+    with _timed_lock:
+        if _active_timed is not None and not _active_timed.done.is_set():
+            raise RuntimeError("a timed profile is already running")
+        profile = TimedProfile(seconds=seconds, fmt=fmt, interval=interval)
+        _active_timed = profile
+
+    def _run() -> None:
+        profiler = SamplingProfiler(interval, name=f"centinel {seconds:g}s")
+        profiler.start()
+        try:
+            time.sleep(seconds)
+        finally:
+            profiler.stop()
+        try:
+            profile.output = str(profiler.write(output_dir, fmt, label="timed"))
+        except OSError as exc:
+            profile.error = str(exc)
+            logger.warning("profile_write_failed error=%s", exc)
+        finally:
+            profile.done.set()
+
+    threading.Thread(target=_run, name="centinel-profile-timer", daemon=True).start()
+    logger.warning("profile_started seconds=%s format=%s interval=%s", seconds, fmt, interval)
+    return profile
+
+
+def request_cycle_profile(
+    cycles: int,
+    *,
+    fmt: str = "collapsed",
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    request_path: str | Path = DEFAULT_REQUEST_PATH,
+) -> Dict[str, Any]:
+    """Pide al loop de polling que perfile sus próximos ``cycles`` ciclos.
+
+    English:
+        Ask the polling loop (another process) to profile its next
+        ``cycles`` pipeline cycles by writing a request file it polls.
+    """
+    _validate(fmt, interval)
+    if not 1 <= cycles <= MAX_PROFILE_CYCLES:
+        raise ValueError(f"cycles must be between 1 and {MAX_PROFILE_CYCLES}")
+    request = {
+        "cycles": int(cycles),
+        "format": fmt,
+        "interval": interval,
+        "requested_at": datetime.now(timezone.utc).isoformat(),
+    }
+    request_path = Path(request_path)
+    request_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = request_path.with_suffix(request_path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(request, indent=2), encoding="utf-8")
+    tmp_path.replace(request_path)
+    logger.warning("profile_cycles_requested cycles=%d format=%s", cycles, fmt)
+    return request
+
+
+def read_cycle_request(request_path: str | Path = DEFAULT_REQUEST_PATH) -> Optional[Dict[str, Any]]:
+    """Lee una solicitud de perfil por ciclos; ``None`` si no hay o es inválida.
+
+    English:
+        Read a pending cycle-profile request; ``None`` if absent or invalid.
+    """
+    try:
+        request = json.loads(Path(request_path).read_text(encoding="utf-8"))
+        _validate(str(request["format"]), float(request["interval"]))
+        if int(request["cycles"]) < 1:
+            raise ValueError("cycles must be >= 1")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("profile_request_invalid path=%s error=%s", request_path, exc)
+        return None
+    return request
+
+
+class CycleProfiler:
+    """Perfila los próximos K ciclos cuando la API lo solicita.
+
+    English:
+        Profiles the next K cycles when the API asks for it. Wrap each
+        cycle in ``cycle()``: the request file is checked on entry,
+        sampling only runs inside cycles (not during the polling sleep),
+        and after the K-th cycle the profile is written and the request
+        removed. Without a request the wrapper only stats one file.
+    """
+
+    def __init__(
+        self,
+        request_path: str | Path = DEFAULT_REQUEST_PATH,
+        output_dir: str | Path = DEFAULT_PROFILE_DIR,
+    ) -> None:
+        self.request_path = Path(request_path)
+        self.output_dir = Path(output_dir)
+        self._profiler: Optional[SamplingProfiler] = None
+        self._request: Optional[Dict[str, Any]] = None
+        self._done = 0
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        if self._profiler is None and self.request_path.exists():
+            self._request = read_cycle_request(self.request_path)
+            if self._request is None:
+                self.request_path.unlink(missing_ok=True)
+            else:
+                cycles = int(self._request["cycles"])
+                self._profiler = SamplingProfiler(float(self._request["interval"]), name=f"centinel {cycles} cycle(s)")
+                self._done = 0
+                logger.warning("profile_cycles_started cycles=%d", cycles)
+        if self._profiler is None:
+            yield
+            return
+        self._profiler.start()
+        try:
+            yield
+        finally:
+            self._profiler.stop()
+            self._done += 1
+            if self._done >= int(self._request["cycles"]):
+                self._finish()
+
+    def _finish(self) -> Optional[Path]:
+        profiler, request = self._profiler, self._request
+        self._profiler = None
+        self._request = None
+        path = None
+        try:
+            path = profiler.write(self.output_dir, str(request["format"]), label="cycles")
+        except OSError as exc:
+            logger.warning("profile_write_failed error=%s", exc)
+        self.request_path.unlink(missing_ok=True)
+        return path
+
+
+def list_profiles(output_dir: str | Path = DEFAULT_PROFILE_DIR, limit: int = 20) -> List[Dict[str, Any]]:
+    """Perfiles escritos en ``output_dir``, del más reciente al más antiguo.
+
+    English:
+        Profiles written under ``output_dir``, newest first.
+    """
+    paths = sorted(
+        (
+            path
+            for path in Path(output_dir).glob("profile_*")
+            if path.name.endswith((".collapsed.txt", ".speedscope.json"))
+        ),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    return [{"name": path.name, "bytes": path.stat().st_size} for path in paths[:limit]]
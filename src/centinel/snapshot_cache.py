@@ -0,0 +1,339 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/snapshot_cache.py`.
+Caché de snapshots JSON ya parseados, compartida por todo el proceso. El
+mismo snapshot lo leen en un ciclo `compute_content_hash`,
+`should_normalize`, la normalización, el análisis, la API, la exportación
+estática y el publicador forense; con la caché se lee y parsea una sola vez.
+
+- Clave: (ruta, tamaño, mtime_ns); además, el sha256 del contenido permite
+  reutilizar el parseo si el archivo se reescribe con los mismos bytes.
+- Desalojo LRU acotado por memoria estimada (tamaño profundo del objeto
+  parseado), `CENTINEL_SNAPSHOT_CACHE_MB` (256 por defecto).
+- Devuelve vistas de solo lectura (`FrozenDict`/`FrozenList`, subclases de
+  dict/list): siguen siendo serializables y pasan `isinstance`, pero
+  mutarlas lanza `TypeError`. `thaw` entrega una copia mutable.
+
+Componentes detectados:
+  - FrozenDict
+  - FrozenList
+  - thaw
+  - SnapshotCache
+  - get_snapshot_cache
+  - load_snapshot
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/snapshot_cache.py`.
+Process-wide cache of parsed JSON snapshots. Within one cycle the same
+snapshot is read by `compute_content_hash`, `should_normalize`,
+normalization, analysis, the API, the static export and the forensics
+publisher; with the cache it is read and parsed once.
+
+- Key: (path, size, mtime_ns); the content sha256 additionally lets a file
+  rewritten with identical bytes reuse the existing parse.
+- LRU eviction bounded by estimated memory (deep size of the parsed
+  object), `CENTINEL_SNAPSHOT_CACHE_MB` (256 by default).
+- Returns read-only views (`FrozenDict`/`FrozenList`, dict/list
+  subclasses): still serializable and `isinstance`-compatible, but
+  mutating them raises `TypeError`. `thaw` returns a mutable copy.
+
+Detected components:
+  - FrozenDict
+  - FrozenList
+  - thaw
+  - SnapshotCache
+  - get_snapshot_cache
+  - load_snapshot
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Snapshot Cache Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MB = 256
+
+
+def _readonly(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"{type(self).__name__} is a read-only snapshot view; use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Vista de solo lectura de un objeto JSON cacheado.
+
+    English:
+        Read-only view of a cached JSON object. ``copy``/``deepcopy``
+        return plain mutable containers.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple:
+        return (FrozenDict, (dict(self),))
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Vista de solo lectura de un arreglo JSON cacheado.
+
+    English:
+        Read-only view of a cached JSON array.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self) -> tuple:
+        return (FrozenList, (list(self),))
+
+    def copy(self) -> list:
+        return list(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return thaw(self)
+
+
+def _freeze(value: Any) -> Tuple[Any, int]:
+    """Congela un valor JSON y estima su tamaño profundo en bytes."""
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        items = {}
+        for key, item in value.items():
+            frozen, item_size = _freeze(item)
+            items[key] = frozen
+            size += sys.getsizeof(key) + item_size
+        return FrozenDict(items), size
+    if isinstance(value, list):
+        size = sys.getsizeof(value)
+        items = []
+        for item in value:
+            frozen, item_size = _freeze(item)
+            items.append(frozen)
+            size += item_size
+        return FrozenList(items), size
+    return value, sys.getsizeof(value)
+
+
+def thaw(value: Any) -> Any:
+    """Copia mutable (dict/list normales) de una vista congelada.
+
+    English:
+        Mutable (plain dict/list) deep copy of a frozen view.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class _Entry:
+    sha256: str
+    payload: Any
+    nbytes: int
+
+
+class SnapshotCache:
+    """Caché LRU de snapshots parseados, acotada por memoria.
+
+    English:
+        LRU cache of parsed snapshots bounded by memory. Thread-safe;
+        parsing happens outside the lock, so two threads racing on the
+        same new file may both parse it once.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], _Entry]" = OrderedDict()
+        self._by_hash: Dict[str, Tuple[str, int, int]] = {}
+        # At most one cached version per path: its current key.
+        self._by_path: Dict[str, Tuple[str, int, int]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: str | Path) -> Any:
+        """Devuelve el snapshot parseado (vista de solo lectura).
+
+        English:
+            Return the parsed snapshot as a read-only view. Raises like
+            ``json.loads(path.read_text("utf-8"))`` would (``OSError``,
+            ``UnicodeDecodeError``, ``json.JSONDecodeError``).
+        """
+        path = Path(path)
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.payload
+
+        raw = path.read_bytes()
+        # A write between stat() and read_bytes() would pin the new bytes
+        # under the old key; such a read is returned but never cached.
+        after = path.stat()
+        stable = (after.st_size, after.st_mtime_ns) == key[1:] and len(raw) == stat.st_size
+        sha256 = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            previous_key = self._by_hash.get(sha256)
+            previous = self._entries.get(previous_key) if previous_key else None
+            if previous is not None:
+                # Same bytes under a new stat key: reuse the parse.
+                self.hits += 1
+                if stable:
+                    self._store(key, _Entry(sha256, previous.payload, previous.nbytes))
+                return previous.payload
+
+        payload, nbytes = _freeze(json.loads(raw.decode("utf-8")))
+        with self._lock:
+            self.misses += 1
+            if stable:
+                self._store(key, _Entry(sha256, payload, nbytes))
+        return payload
+
+    def _store(self, key: Tuple[str, int, int], entry: _Entry) -> None:
+        # Drop the cached version of the same path (stale or this one).
+        current = self._by_path.get(key[0])
+        if current is not None:
+            self._drop(current)
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._by_hash[entry.sha256] = key
+        self._by_path[key[0]] = key
+        self._bytes += entry.nbytes
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: Tuple[str, int, int]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+        if self._by_hash.get(entry.sha256) == key:
+            del self._by_hash[entry.sha256]
+        if self._by_path.get(key[0]) == key:
+            del self._by_path[key[0]]
+
+    def invalidate(self, path: str | Path) -> None:
+        """Olvida todas las versiones cacheadas de ``path``.
+
+        English:
+            Forget every cached version of ``path``.
+        """
+        resolved = str(Path(path).resolve())
+        with self._lock:
+            key = self._by_path.get(resolved)
+            if key is not None:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_hash.clear()
+            self._by_path.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_cache: Optional[SnapshotCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_snapshot_cache() -> SnapshotCache:
+    """Caché compartida del proceso (``CENTINEL_SNAPSHOT_CACHE_MB``).
+
+    English:
+        Process-wide shared cache, sized by ``CENTINEL_SNAPSHOT_CACHE_MB``.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            raw = os.getenv("CENTINEL_SNAPSHOT_CACHE_MB", "").strip()
+            try:
+                megabytes = float(raw) if raw else DEFAULT_CACHE_MB
+            except ValueError:
+                logger.warning("snapshot_cache_invalid_size value=%s default=%s", raw, DEFAULT_CACHE_MB)
+                megabytes = DEFAULT_CACHE_MB
+            _cache = SnapshotCache(max(1, int(megabytes * 1024 * 1024)))
+        return _cache
+
+
+def load_snapshot(path: str | Path) -> Any:
+    """Atajo: ``get_snapshot_cache().load(path)``.
+
+    English:
+        Shortcut for ``get_snapshot_cache().load(path)``.
+    """
+    return get_snapshot_cache().load(path)
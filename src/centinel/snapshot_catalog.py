@@ -0,0 +1,469 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/snapshot_catalog.py`.
+Catálogo SQLite de solo-anexado de los snapshots capturados. Cada captura
+registra, en el momento de escribirse, la fuente, el timestamp de captura,
+las rutas del snapshot y de su hash record, el hash de contenido, el hash
+encadenado y el tamaño. Las consultas "últimos N" y "todos los de la
+fuente X" usan índices en lugar de recorrer `data/snapshots/*` y ordenar
+por mtime. Si el catálogo falta o se corrompe, `rebuild` lo reconstruye
+desde disco.
+
+Componentes detectados:
+  - CATALOG_FILENAME
+  - CatalogEntry
+  - SnapshotCatalog
+  - open_catalog
+  - record_snapshot
+  - main
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/snapshot_catalog.py`.
+Append-only SQLite catalog of captured snapshots. Each capture records, at
+write time, the source, capture timestamp, snapshot and hash-record paths,
+content hash, chained hash and size. "Latest N" and "all for source X"
+lookups use indexes instead of walking `data/snapshots/*` and sorting by
+mtime. If the catalog is missing or corrupt, `rebuild` recovers it from
+disk.
+
+Detected components:
+  - CATALOG_FILENAME
+  - CatalogEntry
+  - SnapshotCatalog
+  - open_catalog
+  - record_snapshot
+  - main
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Snapshot Catalog Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Sequence
+
+from centinel.paths import DEFAULT_DATA_ROOT, DEFAULT_HASH_ROOT, SNAPSHOTS_SUBDIR
+
+logger = logging.getLogger("centinel.snapshot_catalog")
+
+# Archivo del catálogo dentro de data_root. / Catalog file inside data_root.
+CATALOG_FILENAME = "snapshot_catalog.sqlite3"
+
+_SNAPSHOT_GLOB = "snapshot_*.json"
+_FILENAME_TS = re.compile(r"snapshot_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})")
+
+# (db_path, hash_root) pairs whose schema and meta were set up by this
+# process; ``record`` runs the DDL once per catalog instead of per insert.
+_SCHEMA_READY: set[tuple[str, str]] = set()
+_SCHEMA_LOCK = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq           INTEGER PRIMARY KEY AUTOINCREMENT,
+    captured_at   TEXT NOT NULL,
+    source_id     TEXT NOT NULL,
+    snapshot_path TEXT NOT NULL UNIQUE,
+    hash_path     TEXT,
+    content_hash  TEXT,
+    chained_hash  TEXT,
+    size_bytes    INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_source_seq ON snapshots(source_id, seq);
+CREATE INDEX IF NOT EXISTS idx_snapshots_captured_at ON snapshots(captured_at);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Fila del catálogo con rutas ya resueltas.
+
+    Catalog row with resolved paths. ``seq`` is the append position (the
+    capture order across all sources) and, with ``size_bytes``, locates the
+    snapshot inside the capture stream.
+    """
+
+    seq: int
+    captured_at: str
+    source_id: str
+    snapshot_path: Path
+    hash_path: Optional[Path]
+    content_hash: Optional[str]
+    chained_hash: Optional[str]
+    size_bytes: Optional[int]
+
+
+def _resolved(path: Path) -> str:
+    return str(Path(path).resolve())
+
+
+def _filename_timestamp(path: Path) -> Optional[str]:
+    match = _FILENAME_TS.match(path.name)
+    if not match:
+        return None
+    try:
+        parsed = datetime.strptime(match.group(1), "%Y-%m-%d_%H-%M-%S")
+    except ValueError:
+        return None
+    return parsed.isoformat()
+
+
+class SnapshotCatalog:
+    """Catálogo indexado de snapshots respaldado por SQLite (WAL).
+
+    Indexed snapshot catalog backed by SQLite in WAL mode. Snapshot paths
+    are stored relative to ``data_root`` and hash paths relative to
+    ``hash_root`` so the tree can be moved without invalidating the index.
+    Rows are only ever appended; ``rebuild`` replaces the whole table.
+    """
+
+    def __init__(
+        self,
+        data_root: Path = DEFAULT_DATA_ROOT,
+        hash_root: Path = DEFAULT_HASH_ROOT,
+    ) -> None:
+        self.data_root = Path(data_root)
+        self.hash_root = Path(hash_root)
+        self.db_path = self.data_root / CATALOG_FILENAME
+
+    # ── DB helpers ────────────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _schema_key(self) -> tuple[str, str]:
+        return _resolved(self.db_path), _resolved(self.hash_root)
+
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(_SCHEMA)
+        conn.execute(
+            "INSERT OR REPLACE INTO catalog_meta(key, value) VALUES ('hash_root', ?)",
+            (_resolved(self.hash_root),),
+        )
+        conn.commit()
+        with _SCHEMA_LOCK:
+            _SCHEMA_READY.add(self._schema_key())
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        with _SCHEMA_LOCK:
+            ready = self._schema_key() in _SCHEMA_READY
+        if not ready:
+            self._init_db(conn)
+
+    def exists(self) -> bool:
+        """True si el archivo del catálogo existe. / True if the catalog file exists."""
+        return self.db_path.is_file()
+
+    def serves_hash_root(self, hash_root: Path) -> bool:
+        """True si el catálogo indexa ``hash_root``. / True if the catalog indexes ``hash_root``."""
+        if not self.exists():
+            return False
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'hash_root'").fetchone()
+        finally:
+            conn.close()
+        return row is not None and row["value"] == _resolved(hash_root)
+
+    def _to_entry(self, row: sqlite3.Row) -> CatalogEntry:
+        hash_path = row["hash_path"]
+        return CatalogEntry(
+            seq=int(row["seq"]),
+            captured_at=row["captured_at"],
+            source_id=row["source_id"],
+            snapshot_path=self.data_root / row["snapshot_path"],
+            hash_path=self.hash_root / hash_path if hash_path else None,
+            content_hash=row["content_hash"],
+            chained_hash=row["chained_hash"],
+            size_bytes=row["size_bytes"],
+        )
+
+    def _relative(self, path: Path, root: Path) -> str:
+        try:
+            return Path(path).relative_to(root).as_posix()
+        except ValueError:
+            return Path(path).resolve().relative_to(root.resolve()).as_posix()
+
+    # ── Escritura / Writes ────────────────────────────────────────────────────
+
+    def record(
+        self,
+        *,
+        source_id: str,
+        snapshot_path: Path,
+        hash_path: Optional[Path],
+        content_hash: Optional[str],
+        chained_hash: Optional[str],
+        size_bytes: Optional[int],
+        captured_at: Optional[str] = None,
+    ) -> None:
+        """Anexa una captura al catálogo. / Append one capture to the catalog.
+
+        A catalog created by this call is first back-filled from disk so
+        snapshots captured before the catalog existed keep their place in
+        the ordering.
+        """
+        fresh = not self.exists()
+        if fresh:
+            self.data_root.mkdir(parents=True, exist_ok=True)
+            self.rebuild()
+        conn = self._connect()
+        try:
+            if not fresh:
+                self._ensure_schema(conn)
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO snapshots
+                    (captured_at, source_id, snapshot_path, hash_path,
+                     content_hash, chained_hash, size_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    captured_at or datetime.now(timezone.utc).isoformat(),
+                    source_id,
+                    self._relative(snapshot_path, self.data_root),
+                    self._relative(hash_path, self.hash_root) if hash_path else None,
+                    content_hash,
+                    chained_hash,
+                    size_bytes,
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def rebuild(self) -> int:
+        """Reconstruye el catálogo desde disco. / Rebuild the catalog from disk.
+
+        Snapshots are ordered by the timestamp in their filename, then by
+        mtime, then by name; content and chained hashes are read from the
+        matching hash record when it exists. Returns the number of rows.
+        """
+        found: list[tuple[str, float, str, Path]] = []
+        snapshots_base = self.data_root / SNAPSHOTS_SUBDIR
+        if snapshots_base.is_dir():
+            for source_dir in snapshots_base.iterdir():
+                if not source_dir.is_dir():
+                    continue
+                for snapshot in source_dir.glob(_SNAPSHOT_GLOB):
+                    try:
+                        mtime = snapshot.stat().st_mtime
+                    except OSError:
+                        continue
+                    stamp = _filename_timestamp(snapshot) or ""
+                    found.append((stamp, mtime, snapshot.name, snapshot))
+        found.sort(key=lambda item: item[:3])
+
+        rows = []
+        for _stamp, mtime, _name, snapshot in found:
+            source_id = snapshot.parent.name
+            hash_file = self.hash_root / source_id / f"{snapshot.stem}.sha256"
+            content_hash = chained_hash = None
+            if hash_file.is_file():
+                try:
+                    record = json.loads(hash_file.read_text(encoding="utf-8"))
+                    content_hash = record.get("hash")
+                    chained_hash = record.get("chained_hash")
+                except (OSError, ValueError, AttributeError):
+                    logger.warning("snapshot_catalog_hash_unreadable path=%s", hash_file)
+            # ES: el nombre lleva hora local; captured_at se guarda en UTC.
+            # EN: filenames carry local time; captured_at is stored in UTC.
+            captured_at = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+            rows.append(
+                (
+                    captured_at,
+                    source_id,
+                    self._relative(snapshot, self.data_root),
+                    self._relative(hash_file, self.hash_root) if hash_file.is_file() else None,
+                    content_hash,
+                    chained_hash,
+                    snapshot.stat().st_size,
+                )
+            )
+
+        self.data_root.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("DROP TABLE IF EXISTS snapshots")
+            self._init_db(conn)
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO snapshots
+                    (captured_at, source_id, snapshot_path, hash_path,
+                     content_hash, chained_hash, size_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info("snapshot_catalog_rebuilt rows=%d path=%s", len(rows), self.db_path)
+        return len(rows)
+
+    # ── Lectura / Reads ───────────────────────────────────────────────────────
+
+    def _query(self, sql: str, params: Sequence[object]) -> list[CatalogEntry]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        finally:
+            conn.close()
+        return [self._to_entry(row) for row in rows]
+
+    def entries(self, *, source_id: Optional[str] = None, limit: Optional[int] = None) -> list[CatalogEntry]:
+        """Entradas en orden de captura (ascendente). / Entries in capture order (ascending).
+
+        With ``limit`` only the newest ``limit`` entries are returned, still
+        oldest first, using the primary-key (or source/seq) index.
+        """
+        where = "WHERE source_id = ?" if source_id is not None else ""
+        params: list[object] = [source_id] if source_id is not None else []
+        if limit is None:
+            return self._query(f"SELECT * FROM snapshots {where} ORDER BY seq ASC", params)
+        if limit <= 0:
+            return []
+        newest = self._query(f"SELECT * FROM snapshots {where} ORDER BY seq DESC LIMIT ?", [*params, limit])
+        return list(reversed(newest))
+
+    def latest(self, n: int = 1, *, source_id: Optional[str] = None) -> list[CatalogEntry]:
+        """Últimas ``n`` capturas, la más reciente primero. / Latest ``n`` captures, newest first."""
+        return list(reversed(self.entries(source_id=source_id, limit=n)))
+
+    def count(self, *, source_id: Optional[str] = None) -> int:
+        """Número de capturas catalogadas. / Number of catalogued captures."""
+        conn = self._connect()
+        try:
+            if source_id is None:
+                row = conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) FROM snapshots WHERE source_id = ?", (source_id,)).fetchone()
+        finally:
+            conn.close()
+        return int(row[0])
+
+    def snapshot_paths(self, *, source_id: Optional[str] = None, limit: Optional[int] = None) -> list[Path]:
+        """Rutas de snapshot existentes, en orden de captura. / Existing snapshot paths in capture order."""
+        paths = [entry.snapshot_path for entry in self.entries(source_id=source_id, limit=limit)]
+        return [path for path in paths if path.is_file()]
+
+    def hash_paths(self, *, source_id: Optional[str] = None, limit: Optional[int] = None) -> list[Path]:
+        """Rutas de hash record existentes, en orden de captura. / Existing hash-record paths in capture order."""
+        entries = self.entries(source_id=source_id, limit=limit)
+        return [entry.hash_path for entry in entries if entry.hash_path is not None and entry.hash_path.is_file()]
+
+
+def open_catalog(
+    *,
+    data_root: Path = DEFAULT_DATA_ROOT,
+    hash_root: Path = DEFAULT_HASH_ROOT,
+) -> Optional[SnapshotCatalog]:
+    """Abre el catálogo si existe; ``None`` si no. / Open the catalog if present, else ``None``.
+
+    Callers fall back to directory globbing when this returns ``None``.
+    """
+    catalog = SnapshotCatalog(data_root=data_root, hash_root=hash_root)
+    return catalog if catalog.exists() else None
+
+
+def record_snapshot(
+    *,
+    source_id: str,
+    snapshot_path: Path,
+    hash_path: Optional[Path],
+    content_hash: Optional[str],
+    chained_hash: Optional[str],
+    size_bytes: Optional[int],
+    data_root: Path,
+    hash_root: Path,
+) -> bool:
+    """Registra una captura sin interrumpir la escritura de evidencia.
+
+    Record a capture without ever failing the evidence write: the snapshot
+    and its hash record are already on disk, and ``rebuild`` can recover
+    any row lost here. Returns True when the row was written.
+    """
+    try:
+        SnapshotCatalog(data_root=data_root, hash_root=hash_root).record(
+            source_id=source_id,
+            snapshot_path=snapshot_path,
+            hash_path=hash_path,
+            content_hash=content_hash,
+            chained_hash=chained_hash,
+            size_bytes=size_bytes,
+        )
+        return True
+    except (OSError, sqlite3.Error, ValueError) as exc:
+        logger.warning("snapshot_catalog_record_failed path=%s error=%s", snapshot_path, exc)
+        return False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """CLI: ``python -m centinel.snapshot_catalog rebuild``."""
+    parser = argparse.ArgumentParser(description="Snapshot catalog maintenance")
+    parser.add_argument("command", choices=["rebuild", "stats"])
+    parser.add_argument("--data-root", type=Path, default=DEFAULT_DATA_ROOT)
+    parser.add_argument("--hash-root", type=Path, default=DEFAULT_HASH_ROOT)
+    args = parser.parse_args(argv)
+
+    catalog = SnapshotCatalog(data_root=args.data_root, hash_root=args.hash_root)
+    if args.command == "rebuild":
+        rows = catalog.rebuild()
+        print(f"snapshot catalog rebuilt: {rows} snapshots -> {catalog.db_path}")
+        return 0
+    if not catalog.exists():
+        print(f"no snapshot catalog at {catalog.db_path}")
+        return 1
+    latest = catalog.latest(1)
+    print(f"snapshots: {catalog.count()}")
+    print(f"latest: {latest[0].snapshot_path if latest else '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,7 +16,7 @@ Design / Diseño:
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
 import re
 from datetime import datetime, timezone
@@ -26,6 +26,7 @@ from typing import Any, Optional
 import yaml
 
 from auditor.inconsistent_acts import Anomaly, InconsistentActsTracker
+from centinel.snapshot_cache import load_snapshot
 
 from . import github_sync
 
@@ -304,32 +305,89 @@ def build_endpoint_health_block(endpoints_yaml_path: Optional[Path] = None) -> d
     }
 
 
-def _load_tracker(snapshot_paths: list[Path]) -> tuple[InconsistentActsTracker, list[datetime]]:
-    """Feed ordered snapshots into a fresh tracker; return it with timestamps.
+def _covered_digest(pairs: list[tuple[datetime, Path]]) -> str:
+    """SHA-256 over the ordered file names a checkpoint covers."""
+    digest = hashlib.sha256()
+    for _ts, path in pairs:
+        digest.update(path.name.encode("utf-8") + b"\n")
+    return digest.hexdigest()
 
-    Alimenta snapshots ordenados a un tracker nuevo; lo devuelve con marcas.
+
+def _load_tracker(
+    snapshot_paths: list[Path],
+    checkpoint_path: Optional[Path] = None,
+) -> tuple[InconsistentActsTracker, list[datetime]]:
+    """Feed ordered snapshots into a tracker; return it with timestamps.
+
+    With ``checkpoint_path`` the tracker resumes from its last checkpoint and
+    only parses snapshots newer than it; the result is identical to a full
+    rebuild. The checkpoint records a digest of the file names it covers, so
+    a snapshot that shows up behind it (late arrival) or a covered file that
+    was deleted or replaced forces a full rebuild. A snapshot that fails to
+    load is never covered: the checkpoint stops just before it and the next
+    run retries it.
+
+    Alimenta snapshots ordenados a un tracker; lo devuelve con marcas. Con
+    ``checkpoint_path`` retoma desde el último checkpoint y solo parsea los
+    snapshots más nuevos; los que fallan se reintentan en la siguiente corrida.
     """
-    tracker = InconsistentActsTracker()
-    timestamps: list[datetime] = []
     pairs: list[tuple[datetime, Path]] = []
     for path in snapshot_paths:
         ts = parse_snapshot_timestamp(path)
         if ts is None:
             continue
         pairs.append((ts, path))
+    pairs.sort(key=lambda item: item[0])
 
-    for ts, path in sorted(pairs, key=lambda item: item[0]):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
-            logger.warning("forensics_snapshot_unreadable path=%s error=%s", path, exc)
-            continue
+    tracker = InconsistentActsTracker()
+    resume_from = 0
+    if checkpoint_path is not None:
+        watermark = tracker.load_checkpoint(checkpoint_path)
+        if watermark:
+            last_ts = watermark.get("last_timestamp")
+            covered = sum(1 for ts, _ in pairs if last_ts is not None and ts <= last_ts)
+            if covered == watermark.get("covered") and _covered_digest(pairs[:covered]) == watermark.get(
+                "files_digest"
+            ):
+                resume_from = covered
+            else:
+                logger.info("forensics_checkpoint_stale path=%s", checkpoint_path)
+                tracker = InconsistentActsTracker()
+
+    def _save_checkpoint(covered: int) -> None:
         try:
-            tracker.load_snapshot(payload, ts)
-            timestamps.append(ts)
-        except (KeyError, ValueError, TypeError) as exc:
-            logger.warning("forensics_snapshot_skipped path=%s error=%s", path, exc)
+            tracker.save_checkpoint(
+                checkpoint_path,
+                watermark={
+                    "last_timestamp": pairs[covered - 1][0],
+                    "covered": covered,
+                    "files_digest": _covered_digest(pairs[:covered]),
+                },
+            )
+        except OSError as exc:
+            logger.warning("forensics_checkpoint_write_failed path=%s error=%s", checkpoint_path, exc)
 
+    first_failure: Optional[int] = None
+    for index, (ts, path) in enumerate(pairs[resume_from:], start=resume_from):
+        try:
+            payload = load_snapshot(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("forensics_snapshot_unreadable path=%s error=%s", path, exc)
+        else:
+            try:
+                tracker.load_snapshot(payload, ts)
+                continue
+            except (KeyError, ValueError, TypeError) as exc:
+                logger.warning("forensics_snapshot_skipped path=%s error=%s", path, exc)
+        if first_failure is None:
+            first_failure = index
+            if checkpoint_path is not None and resume_from < index:
+                _save_checkpoint(index)
+
+    if checkpoint_path is not None and first_failure is None and resume_from < len(pairs):
+        _save_checkpoint(len(pairs))
+
+    timestamps = [snapshot.timestamp for snapshot in tracker.snapshots]
     return tracker, timestamps
 
 
@@ -344,19 +402,21 @@ def run_and_publish(
     dept_code: Optional[str] = None,
     endpoints_yaml_path: Optional[Path] = None,
     extra_meta: Optional[dict] = None,
+    checkpoint_path: Optional[Path] = None,
 ) -> Optional[int]:
     """Run forensics over snapshots and publish to Supabase. Always non-fatal.
 
     Ejecuta forenses sobre los snapshots y publica a Supabase. No fatal.
 
-    Returns the inserted snapshot row id (or None).
+    ``checkpoint_path`` enables the resumable tracker state (see
+    ``_load_tracker``). Returns the inserted snapshot row id (or None).
     """
     if not github_sync.is_configured():
         logger.info("forensics_publish_skipped github_sync_not_configured")
         return None
 
     try:
-        tracker, timestamps = _load_tracker(snapshot_paths)
+        tracker, timestamps = _load_tracker(snapshot_paths, checkpoint_path)
         forensics = build_forensics_block(tracker)
         coverage = build_coverage(timestamps, target_cadence_minutes=target_cadence_minutes)
         anomalies: list[Anomaly] = tracker.detect_anomalies()
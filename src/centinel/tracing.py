@@ -0,0 +1,384 @@
+"""
+======================== ÍNDICE / INDEX ========================
+1. Descripción general / Overview
+2. Componentes principales / Main components
+3. Notas de mantenimiento / Maintenance notes
+
+======================== ESPAÑOL ========================
+Archivo: `src/centinel/tracing.py`.
+Capa de trazas liviana para el pipeline: spans con inicio/fin, anidamiento
+y atributos, sin dependencias externas. El span activo vive en un
+`ContextVar`, así los spans hijos se cuelgan solos del stage en curso
+(también desde tareas asyncio). Un span raíz (`start_trace`) escribe al
+cerrarse un registro JSON por ciclo en `TraceLog`, un archivo JSONL local
+que conserva solo los últimos `max_records` ciclos. Sin traza activa,
+`span`/`record_span` no registran nada.
+
+Componentes detectados:
+  - Span
+  - TraceLog
+  - current_span
+  - start_trace
+  - start_span
+  - span
+  - record_span
+  - summarize_trace
+  - format_trace_summary
+  - default_trace_path
+
+Notas:
+- Mantener esta cabecera sincronizada con cambios estructurales del archivo.
+- Priorizar claridad operativa y trazabilidad del comportamiento.
+
+======================== ENGLISH ========================
+File: `src/centinel/tracing.py`.
+Lightweight tracing layer for the pipeline: spans with start/end, nesting
+and attributes, no external dependencies. The active span lives in a
+`ContextVar`, so child spans attach themselves to the running stage (from
+asyncio tasks too). A root span (`start_trace`) writes one JSON record per
+cycle to `TraceLog` when it ends: a local JSONL file that keeps only the
+last `max_records` cycles. With no active trace, `span`/`record_span`
+record nothing.
+
+Detected components:
+  - Span
+  - TraceLog
+  - current_span
+  - start_trace
+  - start_span
+  - span
+  - record_span
+  - summarize_trace
+  - format_trace_summary
+  - default_trace_path
+
+Notes:
+- Keep this header in sync with structural changes in the file.
+- Prioritize operational clarity and behavior traceability.
+"""
+
+# Tracing Module
+# AUTO-DOC-INDEX
+#
+# ES: Índice rápido
+#   1) Propósito del módulo
+#   2) Componentes principales
+#   3) Puntos de extensión
+#
+# EN: Quick index
+#   1) Module purpose
+#   2) Main components
+#   3) Extension points
+#
+# Secciones / Sections:
+#   - Configuración / Configuration
+#   - Lógica principal / Core logic
+#   - Integraciones / Integrations
+
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_PATH = Path("logs") / "pipeline_traces.jsonl"
+DEFAULT_MAX_RECORDS = 500
+TRACE_RECORD_VERSION = 1
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("centinel_current_span", default=None)
+# Children may be appended from rule threads or asyncio tasks.
+_tree_lock = threading.Lock()
+
+
+def default_trace_path() -> Path:
+    """Ruta del registro de trazas (``CENTINEL_TRACE_PATH`` o ``logs/``).
+
+    English:
+        Trace log path: ``CENTINEL_TRACE_PATH`` or the default under ``logs/``.
+    """
+    override = os.getenv("CENTINEL_TRACE_PATH", "").strip()
+    return Path(override) if override else DEFAULT_TRACE_PATH
+
+
+@dataclass
+class Span:
+    """Un tramo temporizado con atributos e hijos.
+
+    English:
+        One timed section with attributes and children. ``end`` is
+        idempotent; ending a root span closes any child left open (marked
+        ``aborted``) and writes the cycle record to its ``sink``.
+    """
+
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    parent: Optional["Span"] = field(default=None, repr=False)
+    sink: Optional["TraceLog"] = field(default=None, repr=False)
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    status: str = "ok"
+    children: List["Span"] = field(default_factory=list, repr=False)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+    _duration: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def ended(self) -> bool:
+        return self._duration is not None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self._duration is None else round(self._duration * 1000, 3)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Marca el span como fallido sin cerrarlo.
+
+        English:
+            Mark the span as failed without ending it (handled failures).
+        """
+        self.status = "error"
+        self.attributes["error"] = f"{type(error).__name__}: {error}"[:300]
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Cierra el span y restaura a su padre como span activo.
+
+        English:
+            Close the span and make its parent the active span again.
+        """
+        if self.ended:
+            return
+        self._duration = time.perf_counter() - self._start
+        if error is not None:
+            self.record_error(error)
+        if _current_span.get() is self or self.parent is None:
+            _current_span.set(self.parent)
+        if self.parent is None:
+            self._close_open_children(time.perf_counter())
+            if self.sink is not None:
+                try:
+                    self.sink.append(self.to_record())
+                except OSError as exc:
+                    logger.warning("trace_write_failed path=%s error=%s", self.sink.path, exc)
+
+    def _close_open_children(self, now: float) -> None:
+        for child in self.children:
+            if not child.ended:
+                child._duration = now - child._start
+                child.status = "aborted"
+            child._close_open_children(now)
+
+    def to_dict(self, root_start: Optional[float] = None) -> Dict[str, Any]:
+        root_start = self._start if root_start is None else root_start
+        return {
+            "name": self.name,
+            "offset_ms": round((self._start - root_start) * 1000, 3),
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": dict(self.attributes),
+            "spans": [child.to_dict(root_start) for child in self.children],
+        }
+
+    def to_record(self) -> Dict[str, Any]:
+        """Registro JSON del ciclo completo (solo para spans raíz).
+
+        English:
+            JSON record for the whole cycle (root spans only).
+        """
+        record = {
+            "version": TRACE_RECORD_VERSION,
+            "trace_id": self.attributes.get("trace_id") or uuid.uuid4().hex,
+            "started_at": self.started_at,
+            **self.to_dict(),
+        }
+        record["stages"] = {child.name: child.duration_ms for child in self.children}
+        return record
+
+
+class TraceLog:
+    """Archivo JSONL local con los últimos ``max_records`` ciclos.
+
+    English:
+        Local JSONL file holding the last ``max_records`` cycles. Appends
+        are cheap; once the file doubles its budget it is rewritten
+        atomically with the newest ``max_records`` lines.
+    """
+
+    def __init__(self, path: str | Path | None = None, max_records: int = DEFAULT_MAX_RECORDS) -> None:
+        if max_records <= 0:
+            raise ValueError("max_records must be > 0")
+        self.path = Path(path) if path is not None else default_trace_path()
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._count is None:
+                self._count = len(self._read_lines())
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            self._count += 1
+            if self._count > 2 * self.max_records:
+                keep = self._read_lines()[-self.max_records :]
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                tmp_path.write_text("".join(f"{entry}\n" for entry in keep), encoding="utf-8")
+                tmp_path.replace(self.path)
+                self._count = len(keep)
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Últimos ``limit`` registros, del más reciente al más antiguo.
+
+        English:
+            Last ``limit`` records, newest first. Corrupt lines are skipped.
+        """
+        records: List[Dict[str, Any]] = []
+        for line in reversed(self._read_lines()):
+            if len(records) >= limit:
+                break
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def _read_lines(self) -> List[str]:
+        try:
+            return [line for line in self.path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+def current_span() -> Optional[Span]:
+    """Span activo en el contexto actual, si hay.
+
+    English:
+        Active span in the current context, if any.
+    """
+    return _current_span.get()
+
+
+def start_trace(name: str, *, sink: Optional[TraceLog] = None, **attributes: Any) -> Span:
+    """Abre un span raíz (un ciclo) y lo deja activo.
+
+    English:
+        Open a root span (one cycle) and make it active. Its record goes to
+        ``sink`` when it ends.
+    """
+    root = Span(name=name, attributes={"trace_id": uuid.uuid4().hex, **attributes}, sink=sink)
+    _current_span.set(root)
+    return root
+
+
+def start_span(name: str, *, parent: Optional[Span] = None, **attributes: Any) -> Optional[Span]:
+    """Abre un span hijo del activo (o de ``parent``); ``None`` sin traza.
+
+    English:
+        Open a child of the active span (or of an explicit ``parent``, e.g.
+        the root after a stage raised) and make it active; returns ``None``
+        (and records nothing) outside a trace.
+    """
+    parent = parent or _current_span.get()
+    if parent is None:
+        return None
+    child = Span(name=name, attributes=dict(attributes), parent=parent)
+    with _tree_lock:
+        parent.children.append(child)
+    _current_span.set(child)
+    return child
+
+
+@contextmanager
+def span(name: str, *, parent: Optional[Span] = None, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Context manager sobre ``start_span``; marca ``error`` si hay excepción.
+
+    English:
+        Context manager around ``start_span``; an exception marks the span
+        as ``error`` and propagates.
+    """
+    child = start_span(name, parent=parent, **attributes)
+    try:
+        yield child
+    except BaseException as exc:
+        if child is not None:
+            child.end(error=exc)
+        raise
+    finally:
+        if child is not None:
+            child.end()
+
+
+def record_span(name: str, duration_ms: float, *, status: str = "ok", **attributes: Any) -> None:
+    """Adjunta al span activo un hijo ya medido (p. ej. una regla).
+
+    English:
+        Attach an already-measured child to the active span, e.g. a rule
+        whose latency the engine measured on a worker thread.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = Span(name=name, attributes=dict(attributes), parent=parent, status=status)
+    child._start = time.perf_counter() - duration_ms / 1000
+    child._duration = duration_ms / 1000
+    with _tree_lock:
+        parent.children.append(child)
+
+
+def summarize_trace(record: Dict[str, Any], top: int = 3) -> Dict[str, Any]:
+    """Resumen compacto de un ciclo: duración por stage y sus hijos más lentos.
+
+    English:
+        Compact cycle summary: per-stage duration and its slowest children.
+    """
+    stages = []
+    for stage in record.get("spans", []):
+        children = sorted(stage.get("spans", []), key=lambda item: item.get("duration_ms") or 0, reverse=True)
+        stages.append(
+            {
+                "name": stage.get("name"),
+                "duration_ms": stage.get("duration_ms"),
+                "status": stage.get("status"),
+                "top": [
+                    {"name": child.get("name"), "duration_ms": child.get("duration_ms")} for child in children[:top]
+                ],
+            }
+        )
+    return {
+        "trace_id": record.get("trace_id"),
+        "run_id": (record.get("attributes") or {}).get("run_id"),
+        "started_at": record.get("started_at"),
+        "duration_ms": record.get("duration_ms"),
+        "status": record.get("status"),
+        "stages": stages,
+    }
+
+
+def format_trace_summary(record: Dict[str, Any], top: int = 1) -> str:
+    """Una línea legible: ``analyze=48.0s (rule:ml_outliers=41.0s)``.
+
+    English:
+        One readable line, e.g. ``analyze=48.0s (rule:ml_outliers=41.0s)``.
+    """
+    parts = []
+    for stage in summarize_trace(record, top=top)["stages"]:
+        text = f"{stage['name']}={(stage['duration_ms'] or 0) / 1000:.1f}s"
+        if stage["top"]:
+            inner = ", ".join(f"{child['name']}={(child['duration_ms'] or 0) / 1000:.1f}s" for child in stage["top"])
+            text += f" ({inner})"
+        parts.append(text)
+    return " ".join(parts)
@@ -137,6 +137,7 @@ BOOLEAN_EXACT_KEYS = {
     "auto_anchor_snapshots",
     "verify_on_startup",
     "verify_anchors_on_startup",
+    "incremental_verification",
     "verify_signatures",
     "sign_hash_records",
     "zero_trust",
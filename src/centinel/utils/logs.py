@@ -70,6 +70,8 @@ from typing import Any
 
 import yaml
 
+from centinel.core.canonical_json import canonical_dumps
+
 logger = logging.getLogger("centinel.logs")
 
 # ---------------------------------------------------------------------------
@@ -216,7 +218,7 @@ class HashChainLogger:
         prev = entry.get("prev_hash", _GENESIS_HASH)
         # Canonical JSON: sorted keys, no spaces, UTF-8
         # (JSON canónico: claves ordenadas, sin espacios, UTF-8)
-        canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        canonical = canonical_dumps(entry)
         payload = (prev + canonical).encode("utf-8")
         return hashlib.sha256(payload).hexdigest()
 
@@ -71,6 +71,29 @@ def _build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Snapshot directory root to verify",
     )
+    parser.add_argument(
+        "--cursor",
+        dest="cursor_path",
+        default=None,
+        help="Signed verification cursor; only links after it are re-hashed",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the cursor and re-verify from genesis (cursor is refreshed)",
+    )
+    parser.add_argument(
+        "--full-reverify-hours",
+        type=float,
+        default=24.0,
+        help="Re-verify from genesis when the cursor's last full pass is older than this (0 = never)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for segment-parallel verification (0 = all cores)",
+    )
     return parser
 
 
@@ -80,7 +103,14 @@ def main() -> None:
     args = parser.parse_args()
 
     snapshot_root = Path(args.snapshot_dir)
-    result = verify_hashchain_from_snapshots(snapshot_root)
+    cursor_path = Path(args.cursor_path) if args.cursor_path else None
+    result = verify_hashchain_from_snapshots(
+        snapshot_root,
+        cursor_path=cursor_path,
+        full=args.full,
+        full_interval_seconds=args.full_reverify_hours * 3600 if args.full_reverify_hours > 0 else None,
+        workers=args.workers,
+    )
     print(json.dumps(result, ensure_ascii=False, indent=2))
 
     if not result.get("valid", False):
@@ -14,7 +14,7 @@ Componentes detectados:
   - HealthcheckState
   - get_health_state
   - reset_health_state
-  - _build_health_router
+  - _build_health_router (/health, /health/traces)
   - start_healthchecks_scheduler
   - register_healthchecks
 
@@ -32,7 +32,7 @@ Detected components:
   - HealthcheckState
   - get_health_state
   - reset_health_state
-  - _build_health_router
+  - _build_health_router (/health, /health/traces)
   - start_healthchecks_scheduler
   - register_healthchecks
 
@@ -170,12 +170,14 @@ def reset_health_state() -> None:
 
 
 def _build_health_router():
-    """Crea el router FastAPI con el endpoint de health.
+    """Crea el router FastAPI con los endpoints de health y trazas.
 
     English:
-        Create the FastAPI router with the health endpoint.
+        Create the FastAPI router with the health and traces endpoints.
     """
-    from fastapi import APIRouter
+    from fastapi import APIRouter, Query
+
+    from centinel import tracing
 
     router = APIRouter()
 
@@ -188,6 +190,19 @@ def _build_health_router():
         """
         return {"status": "ok"}
 
+    @router.get("/health/traces")
+    def traces(limit: int = Query(default=5, ge=1, le=100)) -> dict:
+        """Últimos ciclos del pipeline con su desglose de tiempos por stage.
+
+        English:
+            Last pipeline cycles with their per-stage timing breakdown.
+        """
+        records = tracing.TraceLog().recent(limit)
+        return {
+            "cycles": [tracing.summarize_trace(record) for record in records],
+            "latest": records[0] if records else None,
+        }
+
     return router
 
 
@@ -106,6 +106,7 @@ else:
     JSONResponse = None
 from dateutil import parser as date_parser
 
+from centinel import tracing
 from centinel.checkpointing import CheckpointConfig, CheckpointManager
 
 logger = logging.getLogger(__name__)
@@ -555,6 +556,21 @@ def _check_paused_flag() -> dict[str, Any]:
     return {"ok": True, "message": "paused_flag_clear"}
 
 
+def _last_cycle_summary() -> dict[str, Any] | None:
+    """Resumen de tiempos del último ciclo del pipeline (informativo).
+
+    English:
+        Timing summary of the last pipeline cycle; informational only, it
+        never fails the healthcheck.
+    """
+    try:
+        records = tracing.TraceLog().recent(1)
+    except OSError as exc:
+        logger.debug("strict_healthcheck_trace_unavailable error=%s", exc)
+        return None
+    return tracing.summarize_trace(records[0]) if records else None
+
+
 async def is_healthy_strict() -> tuple[bool, dict[str, Any]]:
     """Evalúa un healthcheck estricto con diagnóstico detallado.
 
@@ -620,6 +636,8 @@ async def is_healthy_strict() -> tuple[bool, dict[str, Any]]:
     if not paused_check.get("ok", False):
         diagnostics["failures"].append(paused_check.get("message", "paused_failed"))
 
+    diagnostics["last_cycle"] = await asyncio.to_thread(_last_cycle_summary)
+
     diagnostics["healthy"] = not diagnostics["failures"]
     if diagnostics["healthy"]:
         logger.info(
@@ -0,0 +1,109 @@
+"""Gossip transport: one pooled client, concurrent bounded fan-out with a
+per-peer deadline, and peer stats feeding back into peer selection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import httpx
+
+from centinel.federation import gossip
+
+
+def _finding() -> gossip.FindingPayload:
+    return gossip.FindingPayload(
+        finding_id="f1",
+        node_id="self",
+        country_code="HN",
+        finding_type="rule_violation",
+        severity="HIGH",
+        rule_key="late_mesa",
+        summary="test",
+        snapshot_id="",
+        timestamp_utc="2025-11-30T18:00:00+00:00",
+        signature="",
+    )
+
+
+def _engine(handler, **kwargs) -> gossip.GossipEngine:
+    engine = gossip.GossipEngine("HN", transport=httpx.MockTransport(handler), **kwargs)
+    engine._node_id = "self"
+    engine._peers = {f"n{index}": f"http://peer{index}.test" for index in range(10)}
+    return engine
+
+
+async def test_broadcast_fans_out_concurrently_over_one_pooled_client():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            in_flight -= 1
+        return httpx.Response(200, json={"accepted": True})
+
+    engine = _engine(handler, max_concurrency=4)
+    started = time.monotonic()
+    assert await engine.broadcast_finding(_finding()) == 10
+    elapsed = time.monotonic() - started
+    client = engine._client
+
+    # 10 peers x 100 ms sequentially would be ~1 s; 4 at a time is 3 waves.
+    assert peak == 4
+    assert elapsed < 0.8
+    assert await engine.broadcast_finding(_finding()) == 10
+    assert engine._client is client and not client.is_closed
+    health = engine.get_status()["peer_health"]
+    assert len(health) == 10 and all(entry["successes"] == 2 for entry in health.values())
+
+    await engine.stop()
+    assert client.is_closed and engine._client is None
+
+
+async def test_slow_and_failing_peers_are_bounded_and_recorded():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "peer0.test":
+            await asyncio.sleep(5)
+        if request.url.host == "peer1.test":
+            return httpx.Response(503)
+        if request.url.host == "peer2.test":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    engine = _engine(handler, peer_deadline=0.2)
+    started = time.monotonic()
+    assert await engine.broadcast_finding(_finding()) == 7
+    assert time.monotonic() - started < 1.0
+
+    stats = engine._peer_stats
+    for host in ("peer0", "peer1", "peer2"):
+        assert stats[f"http://{host}.test"].failures == 1
+    assert stats["http://peer3.test"].latency_ewma is not None
+    await engine.aclose()
+
+
+def test_peer_stats_bias_selection():
+    engine = gossip.GossipEngine("HN")
+    urls = [f"http://peer{index}.test" for index in range(4)]
+    now = time.monotonic()
+    for url, latency in zip(urls, (0.01, 0.05, 2.0)):
+        engine._stats_for(url).record_success(latency)
+    for _ in range(gossip._PEER_MAX_CONSECUTIVE_FAILURES):
+        engine._stats_for(urls[3]).record_failure(now)
+
+    random.seed(20)
+    firsts = [engine._pick_peers(urls, 1)[0] for _ in range(500)]
+    assert firsts.count(urls[0]) > firsts.count(urls[1]) > firsts.count(urls[2])
+    # A peer cooling down after repeated failures only fills leftover slots.
+    assert all(urls[3] not in engine._pick_peers(urls, 3) for _ in range(100))
+    assert sorted(engine._pick_peers(urls, 10)) == sorted(urls)
+
+    engine._stats_for(urls[3]).record_success(0.01)
+    assert engine._peer_stats[urls[3]].weight(time.monotonic()) > 1.0
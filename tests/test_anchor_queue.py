@@ -0,0 +1,117 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del anclaje asíncrono por lotes de `LocalSnapshotStore`:
+  - `store_snapshot` confirma en SQLite sin esperar al backend;
+  - un lote se ancla bajo una sola raíz Merkle y el comprobante vuelve a
+    las filas y al índice;
+  - si el backend falla el lote queda pendiente y se reintenta;
+  - el worker en segundo plano drena la cola por intervalo.
+
+======================== ENGLISH ========================
+Batched asynchronous anchoring tests for `LocalSnapshotStore`: local commit
+without waiting on the backend, one Merkle root per batch written back to
+the rows, retry after a backend failure, and the background worker.
+"""
+
+import json
+import threading
+import time
+
+from centinel.core.anchor_queue import AnchorReceipt, LocalAnchorBackend
+from centinel.core.normalize import normalize_snapshot
+from centinel.core.storage import LocalSnapshotStore
+from centinel.core.transparency import compute_merkle_root
+
+
+def _snapshot(hour: int):
+    raw = {
+        "cargo": "presidencial",
+        "departamento": "Cortés",
+        "registered_voters": 5000,
+        "total_votes": 4000 + hour,
+        "valid_votes": 3900 + hour,
+        "null_votes": 50,
+        "blank_votes": 50,
+        "candidates": {"1": 2000 + hour, "2": 1900},
+    }
+    snapshot = normalize_snapshot(raw, "Cortés", f"2025-12-03T{hour:02d}:00:00Z")
+    assert snapshot is not None
+    return snapshot
+
+
+def _rows(store: LocalSnapshotStore) -> list:
+    return [dict(row) for row in store._fetch_department_rows("06")]
+
+
+def test_batch_is_anchored_under_one_merkle_root(tmp_path) -> None:
+    log_path = tmp_path / "anchors.jsonl"
+    store = LocalSnapshotStore(
+        str(tmp_path / "snapshots.db"),
+        anchor_backend=LocalAnchorBackend(log_path),
+        anchor_interval_seconds=3600,
+    )
+    previous = None
+    hashes = []
+    for hour in range(10, 15):
+        previous = store.store_snapshot(_snapshot(hour), previous_hash=previous)
+        hashes.append(previous)
+
+    assert store.pending_anchor_count() == 5
+    assert [row["tx_hash"] for row in _rows(store)] == [None] * 5
+
+    assert store.anchor_pending(max_batch=3) == 3
+    assert store.flush_anchors() == 2
+    rows = _rows(store)
+    index = store.get_index_entries("06")
+    store.close()
+
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["leaves"] for record in records] == [hashes[:3], hashes[3:]]
+    roots = [compute_merkle_root(hashes[:3])] * 3 + [compute_merkle_root(hashes[3:])] * 2
+    assert [row["anchor_root"] for row in rows] == roots
+    assert len({row["tx_hash"] for row in rows}) == 2
+    assert [entry["tx_hash"] for entry in index] == [row["tx_hash"] for row in rows]
+    assert all(row["tx_hash"].startswith("local:") for row in rows)
+
+
+class _GatedBackend:
+    name = "gated"
+    enabled = True
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.fail = True
+        self.calls = 0
+
+    def anchor(self, merkle_root, leaves):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("anchor network down")
+        return AnchorReceipt(backend=self.name, tx_hash=f"0x{merkle_root[:8]}")
+
+
+def test_store_does_not_wait_and_failed_batches_retry(tmp_path) -> None:
+    backend = _GatedBackend()
+    store = LocalSnapshotStore(str(tmp_path / "snapshots.db"), anchor_backend=backend, anchor_interval_seconds=0.05)
+
+    started = time.perf_counter()
+    store.store_snapshot(_snapshot(10))
+    assert time.perf_counter() - started < 1.0
+
+    backend.release.set()
+    deadline = time.monotonic() + 5
+    while backend.calls < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert backend.calls >= 2
+    assert store.pending_anchor_count() == 1
+
+    backend.fail = False
+    deadline = time.monotonic() + 5
+    while store.pending_anchor_count() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    rows = _rows(store)
+    store.close()
+
+    assert rows[0]["tx_hash"] == f"0x{rows[0]['hash'][:8]}"
+    assert rows[0]["anchor_root"] == rows[0]["hash"]
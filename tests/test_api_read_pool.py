@@ -0,0 +1,167 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de la capa de lectura del API público:
+  - conexiones de solo lectura reutilizadas desde un pool;
+  - una sola consulta para el último snapshot de cada departamento;
+  - caché de respuestas invalidada al guardar un snapshot nuevo o al avanzar
+    el catálogo, con las verificaciones de hash en una caché aparte.
+
+======================== ENGLISH ========================
+Public API read layer tests: pooled read-only connections, the batched
+latest-per-department query and the response cache invalidated when a new
+snapshot is stored or the catalog advances, with hash lookups kept in a
+separate cache.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from centinel.api import main
+from centinel.core.normalize import normalize_snapshot
+from centinel.core.storage import LocalSnapshotStore
+
+_RAW = {
+    "resultados": [
+        {"partido": "PARTIDO ALPHA", "candidato": "CANDIDATO ALPHA", "votos": "1,000", "porcentaje": "60.00"},
+        {"partido": "PARTIDO BETA", "candidato": "CANDIDATO BETA", "votos": "500", "porcentaje": "40.00"},
+    ],
+    "estadisticas": {
+        "totalizacion_actas": {"actas_totales": "10", "actas_divulgadas": "8"},
+        "distribucion_votos": {"validos": "1,500", "nulos": "10", "blancos": "5"},
+    },
+}
+
+
+def _store(db_path, department: str, timestamp: str, votes: str = "1,000") -> str:
+    raw = {**_RAW, "resultados": [{**_RAW["resultados"][0], "votos": votes}, _RAW["resultados"][1]]}
+    snapshot = normalize_snapshot(
+        raw, department_name=department.title(), timestamp_utc=timestamp, department_code=department
+    )
+    store = LocalSnapshotStore(str(db_path))
+    try:
+        return store.store_snapshot(snapshot)
+    finally:
+        store.close()
+
+
+@pytest.fixture()
+def api(monkeypatch, tmp_path):
+    db_path = tmp_path / "snapshots.db"
+    monkeypatch.setattr(main, "DB_PATH", db_path)
+    monkeypatch.setattr(main, "ALERTS_JSON", tmp_path / "alerts.json")
+    monkeypatch.setattr(main, "ALERTS_LOG", tmp_path / "alerts.log")
+    monkeypatch.setattr(main, "_DATA_DIR", tmp_path / "no_national")
+    monkeypatch.setattr(main, "_FIXTURE_DIR", tmp_path / "no_fixture")
+    monkeypatch.setattr(main.limiter, "enabled", False)
+    main.invalidate_response_cache()
+    yield db_path
+    main.invalidate_response_cache()
+    main._connection_pool().close()
+
+
+def test_latest_per_department_single_batch(api) -> None:
+    _store(api, "atlantida", "2025-12-01T10:00:00Z", votes="100")
+    latest_hash = _store(api, "atlantida", "2025-12-02T10:00:00Z", votes="200")
+    _store(api, "choluteca", "2025-12-01T12:00:00Z")
+
+    statements: list[str] = []
+    with main.read_connection() as connection:
+        connection.set_trace_callback(statements.append)
+        latest = main.fetch_latest_per_department(connection)
+        connection.set_trace_callback(None)
+
+    assert set(latest) == {"atlantida", "choluteca"}
+    assert latest["atlantida"]["hash"] == latest_hash
+    assert latest["atlantida"]["snapshot"]["total_votes"] is not None
+    # Index lookup + table listing + one UNION ALL across department tables.
+    assert len(statements) == 3
+
+
+def test_pooled_connections_are_read_only_and_reused(api) -> None:
+    _store(api, "atlantida", "2025-12-01T10:00:00Z")
+
+    with main.read_connection() as first:
+        with pytest.raises(sqlite3.OperationalError):
+            first.execute("DELETE FROM snapshot_index")
+    with main.read_connection() as second:
+        assert second is first
+        assert second.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_dashboard_cache_invalidated_by_new_snapshot(api, monkeypatch) -> None:
+    _store(api, "atlantida", "2025-12-01T10:00:00Z")
+    calls: list[int] = []
+    original = main.fetch_latest_per_department
+
+    def _counting(connection):
+        calls.append(1)
+        return original(connection)
+
+    monkeypatch.setattr(main, "fetch_latest_per_department", _counting)
+    client = TestClient(main.app)
+
+    first = client.get("/api/dashboard-data").json()
+    second = client.get("/api/dashboard-data").json()
+    assert len(calls) == 1
+    assert first["departments"] == second["departments"]
+    assert first["departments"]["HN-AT"]["actasEscrutadas"] == 1
+    assert first["departments"]["HN-CH"]["actasEscrutadas"] == 0
+
+    _store(api, "choluteca", "2025-12-01T12:00:00Z")
+    third = client.get("/api/dashboard-data").json()
+    assert len(calls) == 2
+    assert third["departments"]["HN-CH"]["actasEscrutadas"] == 1
+
+    status = client.get("/api/departments/status").json()
+    assert {row["department"]: row["status"] for row in status if row["has_data"]} == {
+        "atlantida": "ok",
+        "choluteca": "ok",
+    }
+
+
+def test_dashboard_cache_follows_catalog_head(api, tmp_path, monkeypatch) -> None:
+    _store(api, "atlantida", "2025-12-01T10:00:00Z")
+    calls: list[int] = []
+    original = main._build_dashboard_data
+
+    def _counting(connection):
+        calls.append(1)
+        return original(connection)
+
+    monkeypatch.setattr(main, "_build_dashboard_data", _counting)
+    client = TestClient(main.app)
+    client.get("/api/dashboard-data")
+    client.get("/api/dashboard-data")
+    assert len(calls) == 1
+
+    catalog = tmp_path / "no_national" / main.CATALOG_FILENAME
+    catalog.parent.mkdir()
+    with sqlite3.connect(catalog) as connection:
+        connection.execute("CREATE TABLE snapshots (id INTEGER PRIMARY KEY)")
+    client.get("/api/dashboard-data")
+    assert len(calls) == 2
+
+
+def test_hashchain_lookups_do_not_evict_dashboard_entries(api, monkeypatch) -> None:
+    _store(api, "atlantida", "2025-12-01T10:00:00Z")
+    monkeypatch.setattr(main, "_HASHCHAIN_CACHE_MAX", 4)
+    calls: list[str] = []
+
+    with main.read_connection() as connection:
+        main._cached_response(("dashboard_data",), connection, lambda: calls.append("dashboard"))
+        for index in range(main._RESPONSE_CACHE_MAX + 8):
+            main._cached_response(
+                ("hashchain_verify", f"{index:064x}"),
+                connection,
+                lambda: calls.append("verify"),
+                cache=main._hashchain_cache,
+                max_entries=main._HASHCHAIN_CACHE_MAX,
+            )
+        main._cached_response(("dashboard_data",), connection, lambda: calls.append("dashboard"))
+
+    assert calls.count("dashboard") == 1
+    assert len(main._hashchain_cache) == 4
@@ -0,0 +1,226 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del modo de captura concurrente de `scripts/download_and_hash.py`:
+  - las descargas corren en paralelo pero el hash chain se encadena en el
+    orden fijo de fuentes (idéntico al modo secuencial);
+  - el límite por host acota las solicitudes simultáneas;
+  - un fallo de red sigue el mismo camino de fallback que el modo secuencial;
+  - el reintento async respeta las políticas de retry_config.
+
+======================== ENGLISH ========================
+Concurrent capture mode tests: parallel fetch with fixed-order chaining,
+per-host concurrency bound, failure/fallback parity with the sequential
+mode, and async retry policies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import pytest
+
+from centinel.downloader import (
+    NonRetryableStatusError,
+    RetryConfig,
+    RetryPolicy,
+    async_request_json_with_retry,
+)
+from scripts import download_and_hash
+
+SOURCES = [
+    {"source_id": "NACIONAL", "endpoint": "https://cne.hn/nacional"},
+    {"source_id": "01_atlantida", "endpoint": "https://cne.hn/dep/01"},
+    {"source_id": "02_choluteca", "endpoint": "https://cne.hn/dep/02"},
+    {"source_id": "03_colon", "endpoint": "https://cne.hn/dep/03"},
+]
+
+
+def _payload_for(url: str) -> dict:
+    return {"timestamp": "2026-01-07T08:30:00+00:00", "source": "CNE", "url": url}
+
+
+@pytest.fixture()
+def capture_env(monkeypatch, tmp_path):
+    """Aísla el ciclo de captura en tmp_path y desactiva red/jitter."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(download_and_hash, "TEMP_DIR", tmp_path / "data" / "temp")
+    monkeypatch.setattr(download_and_hash, "CHECKPOINT_PATH", tmp_path / "checkpoint.json")
+    monkeypatch.setattr(download_and_hash, "BREAKER_STATE_PATH", tmp_path / "breaker.json")
+    monkeypatch.setattr(download_and_hash, "_is_recently_scraped_by_swarm", lambda _sid: False)
+    monkeypatch.setattr(download_and_hash, "_report_scrape_to_swarm", lambda *_a: None)
+    monkeypatch.setattr(download_and_hash, "_validate_real_payload", lambda *_a: True)
+    # Fixed capture timestamp so both modes serialize identical bytes.
+    monkeypatch.setattr(download_and_hash, "datetime", _FrozenDatetime)
+    return tmp_path
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[override]
+        base = datetime(2026, 1, 7, 8, 31, tzinfo=timezone.utc)
+        return base if tz else base.replace(tzinfo=None)
+
+
+def _final_chain_hash(root: Path) -> list[str]:
+    chained = []
+    for source in SOURCES:
+        hash_files = sorted((root / "hashes" / source["source_id"]).glob("*.sha256"))
+        assert len(hash_files) == 1
+        chained.append(json.loads(hash_files[0].read_text(encoding="utf-8"))["chained_hash"])
+    return chained
+
+
+def test_async_capture_chains_in_source_order(capture_env, monkeypatch) -> None:
+    # Reverse completion order: the first source is the slowest to answer.
+    delays = {s["endpoint"]: 0.05 * (len(SOURCES) - i) for i, s in enumerate(SOURCES)}
+    completed: list[str] = []
+
+    async def _fake_fetch(_client, url, **_kwargs):
+        await asyncio.sleep(delays[url])
+        completed.append(url)
+        return httpx.Response(200, request=httpx.Request("GET", url)), _payload_for(url)
+
+    monkeypatch.setattr(download_and_hash, "async_request_json_with_retry", _fake_fetch)
+    config = {"max_sources_per_cycle": 19, "inter_source_jitter_seconds": 0, "capture": {"mode": "async"}}
+    download_and_hash.process_sources(SOURCES, {}, config)
+
+    assert completed == [s["endpoint"] for s in reversed(SOURCES)]
+    async_chain = _final_chain_hash(capture_env)
+
+    # Same payloads through the sequential path must yield the same chain.
+    seq_root = capture_env / "sequential"
+    seq_root.mkdir()
+    monkeypatch.chdir(seq_root)
+    monkeypatch.setattr(download_and_hash, "CHECKPOINT_PATH", seq_root / "checkpoint.json")
+    monkeypatch.setattr(
+        download_and_hash,
+        "request_json_with_retry",
+        lambda _session, url, **_kwargs: (type("R", (), {"url": url})(), _payload_for(url)),
+    )
+    download_and_hash.process_sources(SOURCES, {}, {"inter_source_jitter_seconds": 0})
+
+    assert _final_chain_hash(seq_root) == async_chain
+
+
+def test_async_capture_respects_per_host_limit(capture_env, monkeypatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def _fake_fetch(_client, url, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, request=httpx.Request("GET", url)), _payload_for(url)
+
+    monkeypatch.setattr(download_and_hash, "async_request_json_with_retry", _fake_fetch)
+    config = {
+        "inter_source_jitter_seconds": 0,
+        "capture": {"mode": "async", "per_host_concurrency": 2},
+    }
+    download_and_hash.process_sources(SOURCES, {}, config)
+
+    assert peak == 2
+
+
+def test_async_capture_failure_uses_fallback_path(capture_env, monkeypatch) -> None:
+    failures: list[str] = []
+
+    async def _fake_fetch(_client, url, **_kwargs):
+        if url.endswith("/02"):
+            raise httpx.ConnectError("network down")
+        return httpx.Response(200, request=httpx.Request("GET", url)), _payload_for(url)
+
+    def _record_failure(state, plan, exc, now, **_kwargs):
+        failures.append(plan.source_id)
+        state.had_errors = True
+
+    monkeypatch.setattr(download_and_hash, "async_request_json_with_retry", _fake_fetch)
+    monkeypatch.setattr(download_and_hash, "_commit_fetch_failure", _record_failure)
+    monkeypatch.setenv("CENTINEL_CAPTURE_MODE", "async")
+    download_and_hash.process_sources(SOURCES, {}, {"inter_source_jitter_seconds": 0})
+
+    assert failures == ["02_choluteca"]
+    assert not list((capture_env / "hashes" / "02_choluteca").glob("*.sha256"))
+    # Checkpoint is kept because the cycle had errors.
+    assert (capture_env / "checkpoint.json").exists()
+
+
+def test_async_capture_failures_open_breaker_for_remaining_sources(capture_env, monkeypatch) -> None:
+    fetched: list[str] = []
+    blocked: list[str] = []
+
+    async def _fake_fetch(_client, url, **_kwargs):
+        fetched.append(url)
+        raise httpx.ConnectError("network down")
+
+    def _record_failure(state, plan, exc, now, **_kwargs):
+        state.had_errors = True
+
+    monkeypatch.setattr(download_and_hash, "async_request_json_with_retry", _fake_fetch)
+    monkeypatch.setattr(download_and_hash, "_commit_fetch_failure", _record_failure)
+    monkeypatch.setattr(
+        download_and_hash, "_commit_circuit_open", lambda _state, plan, _now: blocked.append(plan.source_id)
+    )
+    config = {
+        "inter_source_jitter_seconds": 0,
+        "capture": {"mode": "async", "per_host_concurrency": 1},
+        "download_circuit_breaker": {"failure_threshold": 2},
+    }
+    download_and_hash.process_sources(SOURCES, {}, config)
+
+    assert fetched == [s["endpoint"] for s in SOURCES[:2]]
+    assert blocked == [s["source_id"] for s in SOURCES[2:]]
+
+
+async def test_process_sources_rejects_async_mode_inside_running_loop(capture_env) -> None:
+    with pytest.raises(RuntimeError, match="process_sources_async"):
+        download_and_hash.process_sources(SOURCES, {}, {"capture": {"mode": "async"}})
+
+
+def test_resolve_capture_mode_defaults_to_sequential(monkeypatch) -> None:
+    monkeypatch.delenv("CENTINEL_CAPTURE_MODE", raising=False)
+    assert download_and_hash.resolve_capture_mode({}) == "sequential"
+    assert download_and_hash.resolve_capture_mode({"capture": {"mode": "bogus"}}) == "sequential"
+    assert download_and_hash.resolve_capture_mode({"capture": {"mode": "ASYNC"}}) == "async"
+
+
+async def test_async_request_json_with_retry_retries_then_succeeds(tmp_path) -> None:
+    attempts = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, json={"ok": True}, request=request)
+
+    retry_config = RetryConfig(
+        default_policy=RetryPolicy(max_attempts=3, backoff_base=0.0, max_delay=0.0),
+        failed_requests_path=tmp_path / "failed.jsonl",
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        _response, payload = await async_request_json_with_retry(
+            client, "https://cne.hn/nacional", retry_config=retry_config
+        )
+
+    assert payload == {"ok": True}
+    assert attempts == 3
+
+
+async def test_async_request_json_with_retry_fail_fast(tmp_path) -> None:
+    retry_config = RetryConfig(
+        default_policy=RetryPolicy(max_attempts=1),
+        failed_requests_path=tmp_path / "failed.jsonl",
+    )
+    transport = httpx.MockTransport(lambda request: httpx.Response(404, request=request))
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(NonRetryableStatusError):
+            await async_request_json_with_retry(client, "https://cne.hn/x", retry_config=retry_config)
+
+    assert (tmp_path / "failed.jsonl").exists()
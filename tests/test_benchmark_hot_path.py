@@ -0,0 +1,104 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del benchmark de la ruta crítica:
+  - el generador sintético es determinista, acumulativo y normalizable;
+  - `run_benchmark` mide cada subsistema (incluido el JSON canónico) y
+    registra memoria;
+  - `compare_to_baseline` detecta regresiones y omite escalas distintas.
+
+======================== ENGLISH ========================
+Hot-path benchmark tests: deterministic, cumulative synthetic payloads, one
+timed entry per subsystem plus memory, and baseline regression detection.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+
+import pytest
+
+from centinel.core.normalize import normalize_snapshot
+from scripts.benchmark_hot_path import (
+    PRESETS,
+    BenchmarkScale,
+    SyntheticElection,
+    compare_to_baseline,
+    load_rules_config,
+    run_benchmark,
+)
+
+TINY = dataclasses.replace(PRESETS["smoke"], mesas_per_department=8, days=3 / 24, api_requests=2)
+
+
+def test_synthetic_election_is_cumulative_and_normalizable() -> None:
+    scale = BenchmarkScale(departments=3, mesas_per_department=30, candidates=5, days=0.5, cadence_minutes=60)
+    election = SyntheticElection(scale)
+    bodies = list(election)
+
+    assert len(bodies) == scale.snapshots == 36
+    assert bodies == list(SyntheticElection(scale))
+    department = election.departments[0]
+    payloads = [json.loads(body) for name, _step, body in bodies if name == department]
+    processed = [payload["actas"]["procesadas"] for payload in payloads]
+    assert processed == sorted(processed) and processed[-1] == 30
+    last = payloads[-1]
+    assert sum(c["votos"] for c in last["candidatos"]) == last["valid_votes"]
+    assert last["valid_votes"] + last["null_votes"] + last["blank_votes"] == last["total_votes"]
+
+    snapshot = normalize_snapshot(last, department, last["timestamp"])
+    assert snapshot is not None
+    assert snapshot.totals.total_votes == last["total_votes"]
+    assert [c.votes for c in snapshot.candidates] == [c["votos"] for c in last["candidatos"]]
+
+
+def test_run_benchmark_times_every_subsystem(tmp_path) -> None:
+    results = run_benchmark(TINY, tmp_path, config=load_rules_config())
+
+    assert results["totals"]["snapshots"] == TINY.snapshots
+    subsystems = results["subsystems"]
+    for name in ("capture", "normalize", "rules", "publish"):
+        assert subsystems[name]["calls"] == TINY.snapshots
+        assert 0 < subsystems[name]["p50_ms"] <= subsystems[name]["p95_ms"] <= subsystems[name]["max_ms"]
+    assert subsystems["anchor"]["items"] == TINY.snapshots
+    assert subsystems["hashchain_verify"]["items"] == TINY.snapshots
+    assert subsystems["api_snapshots_latest_cold"]["calls"] == TINY.api_requests
+    assert results["memory"]["rss_samples"][-1]["snapshots"] == TINY.snapshots
+    assert subsystems["canonical_json_fast"]["calls"] == subsystems["canonical_json_stdlib"]["calls"] > 0
+    assert results["canonical_json"]["payload_bytes"] > 0
+    json.dumps(results)
+
+
+@pytest.fixture()
+def baseline() -> dict:
+    return {
+        "scale": dataclasses.asdict(TINY),
+        "subsystems": {
+            "rules": {"mean_ms": 10.0, "p95_ms": 20.0},
+            "capture": {"mean_ms": 0.01, "p95_ms": 0.02},
+        },
+        "memory": {"peak_rss_mb": 200.0},
+    }
+
+
+def test_compare_to_baseline_flags_regressions(baseline) -> None:
+    current = copy.deepcopy(baseline)
+    current["subsystems"]["rules"]["p95_ms"] = 24.0
+    # Tripled but within timer noise: not a regression.
+    current["subsystems"]["capture"]["mean_ms"] = 0.03
+    assert compare_to_baseline(current, baseline)["status"] == "PASS"
+
+    current["subsystems"]["rules"]["p95_ms"] = 30.0
+    current["memory"]["peak_rss_mb"] = 300.0
+    del current["subsystems"]["capture"]
+    report = compare_to_baseline(current, baseline)
+    assert report["status"] == "FAIL"
+    assert {(r["subsystem"], r["metric"]) for r in report["regressions"]} == {
+        ("rules", "p95_ms"),
+        ("memory", "peak_rss_mb"),
+        ("capture", "missing"),
+    }
+
+    current["scale"] = dataclasses.asdict(PRESETS["ci"])
+    assert compare_to_baseline(current, baseline)["status"] == "SKIPPED"
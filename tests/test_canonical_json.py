@@ -0,0 +1,151 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de conformidad del JSON canónico compartido: para un corpus que
+cubre unicode, caracteres de control, DEL, floats límite, enteros grandes,
+estructuras anidadas y vistas congeladas, `canonical_bytes` produce
+exactamente los bytes de `json.dumps(sort_keys=True, ...)` en las tres
+variantes, con cualquier backend (Enum, UUID y `default` incluidos), los
+payloads con null y texto no ASCII no recurren a la stdlib, y las rutas de
+integridad conservan sus hashes históricos.
+
+======================== ENGLISH ========================
+Shared canonical JSON conformance tests: over a corpus of unicode, control
+characters, DEL, edge-case floats, big ints, nested structures and frozen
+views, `canonical_bytes` emits exactly the `json.dumps(sort_keys=True, ...)`
+bytes in all three variants on any backend (Enum, UUID and `default`
+included), payloads with nulls and non-ASCII text skip the stdlib fallback,
+and the integrity paths keep their historical hashes.
+"""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import json
+import random
+import uuid
+
+import pytest
+
+from centinel.core import canonical_json
+from centinel.core.anchoring_payload import canonical_json_bytes
+from centinel.core.rules_engine import RulesEngine
+from centinel.snapshot_cache import _freeze
+
+VARIANTS = [
+    {"ensure_ascii": False, "compact": True},
+    {"ensure_ascii": True, "compact": True},
+    {"ensure_ascii": False, "compact": False},
+]
+
+CORPUS = [
+    {},
+    [],
+    {"b": 1, "a": [1, 2, {"z": None, "y": True, "x": False}]},
+    {"departamento": "Atlántida", "candidato": "José Núñez", "emoji": "\U0001f5f3", "cjk": "選挙"},
+    {"ctrl": "\x00\x01\x1f\t\n\r", "del": "\x7f", "quote": '"\\/', "sep": "  "},
+    {"surrogate_pair": "😀", "bmp_edge": "￿", "nbsp": "\xa0"},
+    {"floats": [0.1, 1.5, -0.0, 100.0, 1e15, 1e16, 1.2345678901234567e16, 1e-4, 1e-05, 9.999e-5, 5e-324]},
+    {"floats": [1.7976931348623157e308, -2.5e-300, 45.67, 99.99]},
+    {"special": [float("nan"), float("inf"), float("-inf")]},
+    {"ints": [0, -1, 2**53 + 1, 2**63 - 1, -(2**63), 2**64 - 1, 2**64, -(2**64), 10**30]},
+    {"keys": {"é": 1, "e": 2, "E": 3, "": 4, "10": 5, "9": 6, "\U0001f600": 7}},
+    {"int_keys": {10: "a", 9: "b", 1: "c"}},
+    {"text_like_tokens": ["null", "1e5", "0.00001", "NaN", ":null,", "x1E5"], "null_votes": None},
+    {"nested": [[[[{"deep": [[[]]]}]]]]},
+    "plain string",
+    12345,
+    None,
+]
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.35:
+        return rng.choice(
+            [
+                "".join(chr(rng.choice([rng.randrange(0x20, 0x7F), rng.randrange(0x80, 0x800)])) for _ in range(4)),
+                rng.randrange(-(10**6), 10**6),
+                rng.random() * 10.0 ** rng.randrange(-8, 20),
+                round(rng.random() * 100, 2),
+                True,
+                None,
+            ]
+        )
+    if roll < 0.7:
+        return {f"k{rng.randrange(50)}ñ": _random_value(rng, depth + 1) for _ in range(rng.randrange(5))}
+    return [_random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+
+
+@pytest.mark.parametrize("variant", VARIANTS, ids=["compact-utf8", "compact-ascii", "default-separators"])
+def test_canonical_bytes_match_stdlib_reference(variant) -> None:
+    rng = random.Random(19)
+    corpus = CORPUS + [_random_value(rng) for _ in range(300)] + [_freeze(item)[0] for item in CORPUS]
+    for obj in corpus:
+        expected = json.dumps(
+            obj,
+            sort_keys=True,
+            ensure_ascii=variant["ensure_ascii"],
+            separators=(",", ":") if variant["compact"] else None,
+        ).encode("utf-8")
+        assert canonical_json.canonical_bytes(obj, **variant) == expected
+        assert canonical_json.stdlib_canonical_bytes(obj, **variant) == expected
+        assert canonical_json.canonical_dumps(obj, **variant) == expected.decode("utf-8")
+
+
+def test_unsupported_inputs_fail_like_json() -> None:
+    for obj in ({"when": object()}, {"mixed": {1: "a", "b": 2}}):
+        with pytest.raises(TypeError):
+            json.dumps(obj, sort_keys=True)
+        with pytest.raises(TypeError):
+            canonical_json.canonical_bytes(obj)
+    assert canonical_json.canonical_bytes({"v": {1, 2}}, default=sorted) == b'{"v":[1,2]}'
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Level(str, enum.Enum):
+    HIGH = "high"
+
+
+def test_enum_and_uuid_follow_json_semantics() -> None:
+    token = uuid.UUID(int=7)
+    for obj in ({"color": _Color.RED}, {"id": token}):
+        with pytest.raises(TypeError):
+            json.dumps(obj)
+        with pytest.raises(TypeError):
+            canonical_json.canonical_bytes(obj)
+    for obj in ({"color": _Color.RED, "id": token}, {"level": _Level.HIGH, "n": None}):
+        expected = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        assert canonical_json.canonical_bytes(obj, default=str) == expected.encode("utf-8")
+    assert canonical_json.canonical_bytes({"level": _Level.HIGH}) == b'{"level":"high"}'
+
+
+def test_nulls_and_non_ascii_are_served_without_stdlib_fallback(monkeypatch) -> None:
+    if canonical_json.BACKEND != "orjson":
+        pytest.skip("orjson backend not active")
+    payload = {"departamento": "Cortés", "observaciones": None, "votos": [1, 2.5, None]}
+    expected = canonical_json.stdlib_canonical_bytes(payload)
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("stdlib fallback used")
+
+    monkeypatch.setattr(canonical_json, "stdlib_canonical_bytes", _unexpected)
+    assert canonical_json.canonical_bytes(payload) == expected
+
+
+def test_integrity_paths_keep_historical_hashes(monkeypatch) -> None:
+    payload = {"departamento": "Colón", "votos": [1, 2], "porcentaje": 12.5}
+    assert canonical_json_bytes(payload) == json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    expected_snapshot_hash = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    assert RulesEngine.snapshot_hash(payload) == expected_snapshot_hash
+
+    monkeypatch.setattr(canonical_json, "BACKEND", "json")
+    assert canonical_json_bytes(payload) == canonical_json.stdlib_canonical_bytes(payload)
+    assert canonical_json.canonical_sha256(payload, compact=False) == expected_snapshot_hash
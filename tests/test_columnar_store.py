@@ -0,0 +1,117 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del almacén columnar de series temporales:
+  - `store_snapshot` llena columnas tipadas que coinciden con SQLite y se
+    leen como `memmap` sin parsear JSON;
+  - las particiones por día se unen en orden, con candidatos nuevos
+    rellenados como `MISSING` y timestamps repetidos deduplicados;
+  - una escritura interrumpida se repara en el siguiente append;
+  - identificadores distintos nunca comparten columna.
+
+======================== ENGLISH ========================
+Columnar time-series store tests: typed columns filled by `store_snapshot`,
+multi-day merge with backfilled candidates and duplicate timestamps,
+repair of an interrupted append, and collision-free column names.
+"""
+
+import dataclasses
+import json
+
+import numpy as np
+
+from centinel.core.columnar_store import MISSING, ColumnarSeriesStore
+from centinel.core.models import CandidateResult
+from centinel.core.normalize import normalize_snapshot
+from centinel.core.storage import LocalSnapshotStore
+
+
+def _snapshot(timestamp: str, votes: dict, department: str = "Atlántida"):
+    raw = {
+        "cargo": "presidencial",
+        "departamento": department,
+        "registered_voters": 10_000,
+        "total_votes": sum(votes.values()) + 20,
+        "valid_votes": sum(votes.values()),
+        "null_votes": 12,
+        "blank_votes": 8,
+        "candidates": votes,
+    }
+    snapshot = normalize_snapshot(raw, department, timestamp)
+    assert snapshot is not None
+    return snapshot
+
+
+def test_store_snapshot_fills_memory_mapped_columns(tmp_path) -> None:
+    store = LocalSnapshotStore(str(tmp_path / "snapshots.db"))
+    for hour, base in ((17, 400), (18, 450), (19, 520)):
+        store.store_snapshot(_snapshot(f"2025-12-03T{hour}:00:00Z", {"1": base, "2": base // 2}))
+
+    series = store.load_department_series("01")
+    rows = list(store._fetch_department_rows("01"))
+    store.close()
+
+    assert (tmp_path / "snapshots_columns").is_dir()
+    assert len(series) == 3
+    assert isinstance(series.totals["total_votes"], np.memmap)
+    assert series.timestamps[0] == np.datetime64("2025-12-03T17:00:00", "us")
+    assert series.totals["total_votes"].tolist() == [row["total_votes"] for row in rows]
+    from_json = [{f"slot_{c['slot']}": c["votes"] for c in json.loads(row["candidates_json"])} for row in rows]
+    assert set(series.candidates) == set(from_json[0])
+    for column, values in series.candidates.items():
+        assert values.tolist() == [votes[column] for votes in from_json]
+    assert series.candidates["slot_1"].tolist() == [400, 450, 520]
+
+
+def test_series_merges_days_backfills_and_dedups(tmp_path) -> None:
+    store = ColumnarSeriesStore(tmp_path / "columns")
+    late = _snapshot("2025-12-04T01:00:00Z", {"1": 300, "2": 200})
+    late = dataclasses.replace(
+        late, candidates=[*late.candidates, CandidateResult(slot=11, votes=50, candidate_id="X-11")]
+    )
+    store.append(late)
+    store.append(_snapshot("2025-12-03T23:00:00Z", {"1": 100, "2": 90}))
+    store.append(_snapshot("2025-12-03T22:00:00Z", {"1": 80, "2": 70}))
+    store.append(_snapshot("2025-12-03T23:00:00Z", {"1": 110, "2": 95}))
+
+    series = store.load_series("01")
+
+    assert series.timestamps.astype("datetime64[h]").astype(str).tolist() == [
+        "2025-12-03T22",
+        "2025-12-03T23",
+        "2025-12-04T01",
+    ]
+    assert series.candidates["slot_1"].tolist() == [80, 110, 300]
+    assert series.candidates["cand_X-11"].tolist() == [MISSING, MISSING, 50]
+    assert len(store.load_series("01", start_day="2025-12-04")) == 1
+    assert len(store.load_series("99")) == 0
+
+
+def test_interrupted_append_is_repaired(tmp_path) -> None:
+    store = ColumnarSeriesStore(tmp_path / "columns")
+    store.append(_snapshot("2025-12-03T17:00:00Z", {"1": 400}))
+    partition = next((tmp_path / "columns").glob("dept=*/day=*"))
+    # Simulate a crash after a value column was written but before the
+    # timestamp commit marker.
+    with (partition / "total_votes.i64").open("ab") as handle:
+        handle.write(np.array([999_999], dtype="<i8").tobytes())
+
+    assert store.load_series("01").totals["total_votes"].tolist() == [420]
+    store.append(_snapshot("2025-12-03T18:00:00Z", {"1": 500}))
+    assert store.load_series("01").totals["total_votes"].tolist() == [420, 520]
+
+
+def test_distinct_names_never_share_a_column(tmp_path) -> None:
+    store = ColumnarSeriesStore(tmp_path / "columns")
+    snapshot = _snapshot("2025-12-03T17:00:00Z", {"1": 400})
+    snapshot = dataclasses.replace(
+        snapshot,
+        candidates=[
+            CandidateResult(slot=1, votes=10, candidate_id="a.b"),
+            CandidateResult(slot=2, votes=20, candidate_id="a_b"),
+        ],
+    )
+    store.append(snapshot)
+
+    candidates = store.load_series("01").candidates
+    assert candidates["cand_a_2eb"].tolist() == [10]
+    assert candidates["cand_a_5fb"].tolist() == [20]
@@ -289,7 +289,8 @@ def test_run_pipeline_resumes_from_checkpoint(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(run_pipeline, "run_command", _record_command)
     monkeypatch.setattr(run_pipeline, "_anchor_snapshot", lambda *_args, **_kwargs: None)
 
-    config = {"alerts": {}, "arbitrum": {"enabled": False}}
+    # Subprocess stage runner so every stage goes through run_command.
+    config = {"alerts": {}, "arbitrum": {"enabled": False}, "stage_runner": {"mode": "subprocess"}}
     run_pipeline.run_pipeline(config)
 
     assert not any("download_and_hash.py" in command for command in commands)
@@ -143,3 +143,127 @@ def test_run_and_publish_emits_coverage_alerts(monkeypatch, tmp_path: Path) -> N
     )
 
     assert any(a["kind"] == "capture_gap" for a in alerts)
+
+
+def _write_series(snap_dir: Path, base: datetime, steps: range) -> list[Path]:
+    paths = []
+    for i in steps:
+        ts = base + timedelta(minutes=5 * i)
+        path = snap_dir / ts.strftime("snapshot_%Y-%m-%d_%H-%M-%S.json")
+        inconsistentes = 2773 - 35 * i if i % 3 else 2773 - 35 * (i - 1)
+        votos = {"CANDIDATO_A": f"{1_000_000 + 420 * i:,}", "CANDIDATO_B": f"{1_010_000 + 310 * i:,}"}
+        path.write_text(json.dumps(_cne_snapshot(f"{inconsistentes:,}", votos)), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_load_tracker_resumes_from_checkpoint(monkeypatch, tmp_path: Path) -> None:
+    """Resuming from the checkpoint must match a full rebuild and parse only new files.
+
+    Retomar desde el checkpoint debe igualar la reconstrucción completa y
+    parsear solo los archivos nuevos.
+    """
+    monkeypatch.chdir(tmp_path)
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    base = datetime(2025, 12, 3, 12, 0, tzinfo=timezone.utc)
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+
+    first = _write_series(snap_dir, base, range(0, 8))
+    fp._load_tracker(first, checkpoint)
+    paths = first + _write_series(snap_dir, base, range(8, 14))
+
+    loaded: list[datetime] = []
+    original = fp.InconsistentActsTracker.load_snapshot
+
+    def _counting(self, payload, ts):
+        loaded.append(ts)
+        return original(self, payload, ts)
+
+    monkeypatch.setattr(fp.InconsistentActsTracker, "load_snapshot", _counting)
+    resumed, resumed_ts = fp._load_tracker(paths, checkpoint)
+    assert loaded == [base + timedelta(minutes=5 * i) for i in range(8, 14)]
+
+    full, full_ts = fp._load_tracker(paths)
+    assert resumed_ts == full_ts
+    assert resumed.events == full.events
+    assert fp.build_forensics_block(resumed) == fp.build_forensics_block(full)
+
+    def _report(tracker) -> list[str]:
+        return [line for line in tracker.generate_forensic_report().splitlines() if not line.startswith("Generated at")]
+
+    assert _report(resumed) == _report(full)
+
+
+def test_load_tracker_rebuilds_on_late_snapshot(monkeypatch, tmp_path: Path) -> None:
+    """A snapshot older than the checkpoint forces a full rebuild.
+
+    Un snapshot más antiguo que el checkpoint fuerza la reconstrucción completa.
+    """
+    monkeypatch.chdir(tmp_path)
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    base = datetime(2025, 12, 3, 12, 0, tzinfo=timezone.utc)
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+
+    on_time = _write_series(snap_dir, base, range(0, 10, 2))
+    fp._load_tracker(on_time, checkpoint)
+    paths = sorted(on_time + _write_series(snap_dir, base, range(1, 10, 2)))
+
+    resumed, _ = fp._load_tracker(paths, checkpoint)
+    full, _ = fp._load_tracker(paths)
+    assert len(resumed.snapshots) == 10
+    assert resumed.events == full.events
+
+
+def test_load_tracker_rebuilds_when_covered_file_replaced(monkeypatch, tmp_path: Path) -> None:
+    """Deleting one covered snapshot and adding another at the same count is detected.
+
+    Borrar un snapshot cubierto y agregar otro con el mismo total se detecta.
+    """
+    monkeypatch.chdir(tmp_path)
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    base = datetime(2025, 12, 3, 12, 0, tzinfo=timezone.utc)
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+
+    paths = _write_series(snap_dir, base, range(0, 10, 2))
+    fp._load_tracker(paths, checkpoint)
+    paths[1].unlink()
+    paths = sorted(paths[:1] + paths[2:] + _write_series(snap_dir, base, [3]))
+
+    resumed, _ = fp._load_tracker(paths, checkpoint)
+    full, _ = fp._load_tracker(paths)
+    assert len(resumed.snapshots) == 5
+    assert resumed.events == full.events
+
+
+def test_load_tracker_retries_failed_snapshot(monkeypatch, tmp_path: Path) -> None:
+    """A snapshot that failed to load is not covered by the checkpoint.
+
+    Un snapshot que no se pudo cargar no queda cubierto por el checkpoint.
+    """
+    monkeypatch.chdir(tmp_path)
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    base = datetime(2025, 12, 3, 12, 0, tzinfo=timezone.utc)
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+
+    paths = _write_series(snap_dir, base, range(0, 6))
+    good = paths[3].read_text(encoding="utf-8")
+    paths[3].write_text("{truncated", encoding="utf-8")
+    broken, _ = fp._load_tracker(paths, checkpoint)
+    assert len(broken.snapshots) == 5
+
+    paths[3].write_text(good, encoding="utf-8")
+    loaded: list[datetime] = []
+    original = fp.InconsistentActsTracker.load_snapshot
+
+    def _counting(self, payload, ts):
+        loaded.append(ts)
+        return original(self, payload, ts)
+
+    monkeypatch.setattr(fp.InconsistentActsTracker, "load_snapshot", _counting)
+    resumed, _ = fp._load_tracker(paths, checkpoint)
+    assert loaded == [base + timedelta(minutes=5 * i) for i in range(3, 6)]
+    assert len(resumed.snapshots) == 6
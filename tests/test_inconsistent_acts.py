@@ -6,9 +6,13 @@ Pruebas para el rastreador forense de actas inconsistentes.
 from __future__ import annotations
 
 import json
+import random
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import pytest
+
 from auditor.inconsistent_acts import InconsistentActsTracker
 
 
@@ -579,3 +583,109 @@ def test_real_cne_schema_with_thousands_separators(tmp_path: Path) -> None:
     assert tracker.snapshots[1].candidate_votes["CANDIDATO_B"] == 1298835
     # Must not raise even though votes regress for some candidates.
     tracker.detect_anomalies()
+
+
+def test_checkpoint_round_trip_and_rejects_tampering(tmp_path: Path) -> None:
+    """Checkpoint restores identical state; tampered or foreign checkpoints are ignored.
+
+    El checkpoint restaura el estado idéntico; uno alterado o ajeno se ignora.
+    """
+    base = datetime(2025, 11, 30, 23, 0, tzinfo=timezone.utc)
+    tracker = InconsistentActsTracker(config_path=tmp_path / "inconsistent_key.json", high_inconsistent_threshold=100)
+    for step in range(7):
+        payload = _build_payload(
+            inconsistent_count=2773 - 40 * step, votes={"a": 1000 + 90 * step, "b": 900 + 60 * step}
+        )
+        tracker.load_snapshot(payload, base + timedelta(minutes=5 * step))
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+    tracker.save_checkpoint(checkpoint, watermark={"last_timestamp": base, "covered": 7})
+
+    restored = InconsistentActsTracker(config_path=tmp_path / "other_key.json", high_inconsistent_threshold=100)
+    assert restored.load_checkpoint(checkpoint) == {"last_timestamp": base, "covered": 7}
+    for field in ("snapshots", "events", "normal_votes", "special_scrutiny_votes", "injection_history"):
+        assert getattr(restored, field) == getattr(tracker, field)
+    assert restored.detected_inconsistent_key == "totals.actasInconsistentes"
+
+    # Different thresholds shape a different state: the checkpoint must not apply.
+    assert InconsistentActsTracker(config_path=tmp_path / "k.json").load_checkpoint(checkpoint) is None
+
+    envelope = json.loads(checkpoint.read_text(encoding="utf-8"))
+    envelope["state"]["special_scrutiny_votes"]["a"] += 1
+    checkpoint.write_text(json.dumps(envelope), encoding="utf-8")
+    untouched = InconsistentActsTracker(config_path=tmp_path / "k2.json", high_inconsistent_threshold=100)
+    assert untouched.load_checkpoint(checkpoint) is None
+    assert untouched.snapshots == []
+
+
+def _assert_close(left: object, right: object) -> None:
+    """Compare nested results, allowing float rounding between summation orders."""
+    if isinstance(left, dict):
+        assert isinstance(right, dict) and left.keys() == right.keys()
+        for key in left:
+            _assert_close(left[key], right[key])
+    elif isinstance(left, (list, tuple)):
+        assert len(left) == len(right)
+        for left_item, right_item in zip(left, right):
+            _assert_close(left_item, right_item)
+    elif isinstance(left, float) and not isinstance(left, bool):
+        assert left == pytest.approx(right, rel=1e-9, abs=1e-9)
+    else:
+        assert left == right
+
+
+def test_running_accumulators_match_full_recompute(tmp_path: Path) -> None:
+    """Accumulator-backed detectors agree with the full-recompute validation mode.
+
+    Los detectores con acumuladores coinciden con el modo de recálculo completo,
+    también tras restaurar desde un checkpoint.
+    """
+    rng = random.Random(7)
+    base = datetime(2025, 11, 30, 23, 0, tzinfo=timezone.utc)
+    fast = InconsistentActsTracker(config_path=tmp_path / "fast_key.json", stagnation_cycles_threshold=3)
+    full = InconsistentActsTracker(
+        config_path=tmp_path / "full_key.json", stagnation_cycles_threshold=3, recompute_statistics=True
+    )
+
+    def results(tracker: InconsistentActsTracker) -> list:
+        return [
+            [asdict(anomaly) for anomaly in tracker.detect_anomalies()],
+            tracker.run_statistical_tests(),
+            tracker.detect_progressive_injection(),
+            tracker.run_injection_statistical_tests([120.0, 80.0, 150.0, 90.0]),
+        ]
+
+    inconsistent, votes, minutes = 2800, {"a": 10000, "b": 9000, "c": 4000}, 0
+    for step in range(60):
+        phase = step % 12
+        if step < 8:
+            # Low, constant deltas under a high backlog: progressive injection.
+            resolved, increments = 2, {"a": 380, "b": 10, "c": 0}
+        else:
+            resolved = 320 if phase == 4 else (0 if phase < 4 else rng.randint(0, 30))
+            increments = {name: rng.randint(0, 900) for name in votes}
+            if step == 33:
+                increments["c"] = 40000
+        inconsistent = max(inconsistent - resolved, 0)
+        votes = {name: value + increments[name] for name, value in votes.items()}
+        minutes += 45 if step % 17 == 16 else 5
+        payload = _build_payload(inconsistent_count=inconsistent, votes=votes)
+        for tracker in (fast, full):
+            tracker.load_snapshot(payload, base + timedelta(minutes=minutes))
+        if step == 7:
+            assert full.detect_progressive_injection() is not None
+            _assert_close(results(fast), results(full))
+
+    expected = results(full)
+    assert {anomaly["kind"] for anomaly in expected[0]} >= {
+        "vote_outlier_3sigma",
+        "hold_and_release",
+        "blackout_with_trend_shift",
+        "benford_deviation",
+    }
+    _assert_close(results(fast), expected)
+
+    checkpoint = tmp_path / "tracker_checkpoint.json"
+    fast.save_checkpoint(checkpoint)
+    restored = InconsistentActsTracker(config_path=tmp_path / "restored_key.json", stagnation_cycles_threshold=3)
+    assert restored.load_checkpoint(checkpoint) is not None
+    _assert_close(results(restored), expected)
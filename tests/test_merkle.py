@@ -0,0 +1,126 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del acumulador Merkle append-only y del log de transparencia:
+  - la raíz incremental coincide con la construcción por niveles para
+    cualquier tamaño, también para tamaños anteriores;
+  - las pruebas de inclusión y consistencia verifican y fallan ante
+    alteraciones;
+  - `sync_chain_accumulator` solo lee metadatos nuevos y reconstruye si un
+    snapshot ya registrado cambia.
+
+======================== ENGLISH ========================
+Append-only Merkle accumulator and transparency log tests: incremental
+roots match the level-by-level construction for every size (current and
+earlier), inclusion/consistency proofs verify and reject tampering, and
+`sync_chain_accumulator` reads only new metadata and rebuilds when a
+tracked snapshot changes.
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from centinel.core import transparency
+from centinel.core.merkle import MerkleAccumulator, verify_consistency, verify_inclusion
+
+
+def _leaves(count: int) -> list[str]:
+    return [hashlib.sha256(f"leaf-{index}".encode()).hexdigest() for index in range(count)]
+
+
+def _reference_root(leaf_hashes: list[str]) -> str | None:
+    if not leaf_hashes:
+        return None
+    level = [bytes.fromhex(value) for value in leaf_hashes]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def test_incremental_root_matches_level_construction() -> None:
+    leaves = _leaves(37)
+    accumulator = MerkleAccumulator()
+    for count, leaf in enumerate(leaves, start=1):
+        assert accumulator.append(leaf) == count - 1
+        assert accumulator.root == _reference_root(leaves[:count])
+    assert [accumulator.root_at(size) for size in range(38)] == [_reference_root(leaves[:size]) for size in range(38)]
+    assert transparency.compute_merkle_root(leaves) == _reference_root(leaves)
+    assert accumulator.frontier() == [accumulator.root_at(32), _reference_root(leaves[32:36]), leaves[36]]
+
+
+@pytest.mark.parametrize("tree_size", [1, 2, 5, 8, 13, 33])
+def test_inclusion_proofs_verify_and_reject_tampering(tree_size: int) -> None:
+    leaves = _leaves(40)
+    accumulator = MerkleAccumulator.from_leaves(leaves)
+    for index in range(tree_size):
+        proof = accumulator.inclusion_proof(index, tree_size)
+        assert proof.root == _reference_root(leaves[:tree_size])
+        assert len(proof.audit_path) <= (tree_size - 1).bit_length()
+        assert verify_inclusion(proof.leaf_hash, index, tree_size, proof.audit_path, proof.root)
+        assert not verify_inclusion(leaves[39], index, tree_size, proof.audit_path, proof.root)
+        if proof.audit_path:
+            assert not verify_inclusion(proof.leaf_hash, index, tree_size, proof.audit_path[:-1], proof.root)
+    assert accumulator.index_of(leaves[3].upper()) == 3
+    with pytest.raises(IndexError):
+        accumulator.inclusion_proof(tree_size, tree_size)
+
+
+def test_consistency_proofs_between_every_pair_of_sizes() -> None:
+    leaves = _leaves(21)
+    accumulator = MerkleAccumulator.from_leaves(leaves)
+    forged = MerkleAccumulator.from_leaves(leaves[:20] + [leaves[0]]).root
+    for new_size in range(22):
+        for old_size in range(new_size + 1):
+            proof = accumulator.consistency_proof(old_size, new_size)
+            fields = (proof.old_frontier, proof.right_path)
+            assert verify_consistency(old_size, new_size, proof.old_root, proof.new_root, *fields)
+            if 0 < old_size < new_size == 21:
+                assert not verify_consistency(old_size, new_size, proof.old_root, forged, *fields)
+                assert not verify_consistency(old_size, new_size, proof.new_root, proof.new_root, *fields)
+
+
+def _write_snapshot(root, index: int) -> None:
+    snapshot_dir = root / f"snap_{index:03d}"
+    snapshot_dir.mkdir(parents=True)
+    metadata = {"timestamp_utc": f"2026-01-01T{index // 60:02d}:{index % 60:02d}:00+00:00"}
+    (snapshot_dir / "snapshot.metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    digest = hashlib.sha256(f"snapshot-{index}".encode()).hexdigest()
+    (snapshot_dir / "hash.txt").write_text(f"{digest}\n", encoding="utf-8")
+
+
+def test_transparency_log_tracks_only_new_snapshots(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("CENTINEL_DISABLE_OPENTIMESTAMPS", "1")
+    monkeypatch.setattr(transparency, "_TRACKED_CHAINS", {})
+    snapshot_root = tmp_path / "snapshots"
+    log_dir = tmp_path / "transparency"
+    loaded: list = []
+    real_load = transparency._load_snapshot_meta
+    monkeypatch.setattr(transparency, "_load_snapshot_meta", lambda path: loaded.append(path) or real_load(path))
+
+    for index in range(5):
+        _write_snapshot(snapshot_root, index)
+    first = transparency.append_transparency_checkpoint(snapshot_root, log_dir=log_dir)
+    for index in range(5, 8):
+        _write_snapshot(snapshot_root, index)
+    loaded.clear()
+    second = transparency.append_transparency_checkpoint(snapshot_root, log_dir=log_dir)
+
+    assert len(loaded) == 3
+    full = transparency.build_transparency_checkpoint(snapshot_root)
+    assert (second["chain_length"], second["merkle_root"]) == (8, full["merkle_root"])
+    assert first["merkle_root"] == transparency.compute_merkle_root(
+        [line["hash"] for line in map(json.loads, (log_dir / "transparency_leaves.jsonl").read_text().splitlines())][:5]
+    )
+
+    # A fresh process resumes from the leaves file; a rewritten hash.txt forces a rebuild.
+    monkeypatch.setattr(transparency, "_TRACKED_CHAINS", {})
+    hash_path = snapshot_root / "snap_002" / "hash.txt"
+    hash_path.write_text(hashlib.sha256(b"forged").hexdigest() + "\n", encoding="utf-8")
+    os.utime(hash_path, ns=(1, 1))
+    rebuilt = transparency.sync_chain_accumulator(snapshot_root, log_dir=log_dir)
+    assert rebuilt.root == transparency.build_transparency_checkpoint(snapshot_root)["merkle_root"]
+    assert rebuilt.root != second["merkle_root"]
@@ -6,12 +6,14 @@ especial). Vectores:
   - reconciliación entre fases (mesa alterada post-publicación);
   - imposibilidad aritmética por mesa individual;
   - aparición tardía / lote grande con escrutinio casi cerrado;
-  - degradación con gracia ante payload solo-agregado.
+  - degradación con gracia ante payload solo-agregado;
+  - índice incremental de huellas (cambios, persistencia, motor).
 
 ======================== ENGLISH ========================
 Per-table forensics tests covering indexing/fingerprint, cross-phase
-reconciliation, per-table impossibility, late appearance, and graceful
-degradation on aggregate-only payloads.
+reconciliation, per-table impossibility, late appearance, graceful
+degradation on aggregate-only payloads, and the incremental fingerprint
+index (change sets, persistence, engine reuse).
 """
 
 from __future__ import annotations
@@ -20,7 +22,9 @@ import copy
 
 import pytest
 
+from centinel.core import mesa_forensics
 from centinel.core.mesa_forensics import (
+    MesaFingerprintIndex,
     candidate_delta,
     index_mesas,
     mesa_candidate_votes,
@@ -31,8 +35,10 @@ from centinel.core.rules import (
     late_mesa_rule,
     mesa_impossibility_rule,
     mesa_reconciliation_rule,
+    mesas_diff_rule,
 )
 from centinel.core.rules.common import collect_all_mesas
+from centinel.core.rules_engine import RulesEngine
 
 
 @pytest.fixture()
@@ -212,3 +218,120 @@ def test_all_rules_degrade_on_aggregate_only_payload():
     assert mesa_reconciliation_rule.apply(aggregate, aggregate, {}) == []
     assert mesa_impossibility_rule.apply(aggregate, None, {}) == []
     assert late_mesa_rule.apply(aggregate, aggregate, {}) == []
+
+
+def _series(base: dict, rounds: int) -> list:
+    """Snapshots consecutivos: en cada ronda muta una mesa y aparece otra."""
+    snapshots = [base]
+    for step in range(rounds):
+        nxt = copy.deepcopy(snapshots[-1])
+        mesas = nxt["departamentos"][0]["mesas"]
+        mesas[step]["candidatos"]["A"] += 7
+        mesas.append({"codigo_mesa": f"NEW-{step}", "candidatos": {"A": 1, "B": 1}})
+        snapshots.append(nxt)
+    return snapshots
+
+
+def test_fingerprint_index_change_set_matches_full_reindex(cne_payload):
+    previous = copy.deepcopy(cne_payload)
+    previous["mesas"] = [{"codigo_mesa": "RT-1", "candidatos": {"A": 1}}]
+    current = copy.deepcopy(previous)
+    current["departamentos"][0]["mesas"][1]["candidatos"]["B"] += 3
+    del current["departamentos"][1]
+    current["mesas"] = [{"codigo_mesa": "RT-2", "candidatos": {"A": 2}}]
+
+    changes = MesaFingerprintIndex().changes(previous, current)
+    old, new = index_mesas(previous), index_mesas(current)
+    assert set(changes.added) == set(new) - set(old) == {"RT-2"}
+    assert set(changes.removed) == set(old) - set(new) == {"OL-N01", "RT-1"}
+    assert [code for code, _prev, _curr in changes.modified()] == ["CO-N02"]
+    _code, prev, curr = next(changes.modified())
+    assert (prev["candidate_votes"], curr["candidate_votes"]) == (
+        old["CO-N02"]["candidate_votes"],
+        new["CO-N02"]["candidate_votes"],
+    )
+    assert changes.root_missing() == ["RT-1"] and changes.root_added() == ["RT-2"]
+    assert (changes.previous_count, changes.current_count) == (len(old), len(new))
+    assert MesaFingerprintIndex().changes(current, current).is_empty
+
+
+def test_fingerprint_index_persists_across_processes(tmp_path, cne_payload, monkeypatch):
+    first, second, third = _series(cne_payload, 2)
+    path = tmp_path / "mesa_index.json"
+    index = MesaFingerprintIndex()
+    index.changes(first, second, previous_source="s1", current_source="s2")
+    assert index.dirty
+    index.save(path)
+    assert not index.dirty
+
+    loaded = MesaFingerprintIndex.load(path)
+    assert loaded.source == "s2" and len(loaded) == len(index)
+
+    def _no_rebuild(*_args, **_kwargs):
+        raise AssertionError("a synced index must not be rebuilt")
+
+    monkeypatch.setattr(loaded, "rebuild", _no_rebuild)
+    changes = loaded.changes(second, third, previous_source="s2", current_source="s3")
+    assert set(changes.added) == {"NEW-1"}
+    assert [code for code, _prev, _curr in changes.modified()] == ["CO-N02"]
+
+    path.write_text("{broken", encoding="utf-8")
+    assert len(MesaFingerprintIndex.load(path)) == 0
+
+
+def test_engine_builds_records_only_for_changed_mesas(tmp_path, cne_payload, monkeypatch):
+    base = copy.deepcopy(cne_payload)
+    base["departamentos"][0]["mesas"] += [
+        {"codigo_mesa": f"BK-{i:03d}", "candidatos": {"A": 10, "B": 10}} for i in range(200)
+    ]
+    snapshots = _series(base, 3)
+    calls = []
+    original = mesa_forensics._index_record
+    monkeypatch.setattr(
+        mesa_forensics, "_index_record", lambda *args: calls.append(1) or original(*args)
+    )
+
+    engine = RulesEngine({}, mesa_index_path=tmp_path / "mesa_index.json")
+    results = []
+    for snapshot_id, result in engine.iter_run(((str(i), s) for i, s in enumerate(snapshots[1:])), snapshots[0]):
+        results.append((len(calls), result))
+        calls.clear()
+
+    # First pair rebuilds the index from the previous snapshot; afterwards
+    # only the mutated mesa and the new one are extracted per snapshot.
+    assert results[0][0] == len(index_mesas(snapshots[0])) + 2
+    assert [count for count, _result in results[1:]] == [2, 2]
+    assert (tmp_path / "mesa_index.json").exists()
+
+    for (_count, result), (previous, current) in zip(results, zip(snapshots, snapshots[1:])):
+        for module in (mesa_reconciliation_rule, late_mesa_rule, mesas_diff_rule):
+            expected = module.apply(copy.deepcopy(current), copy.deepcopy(previous), {})
+            got = [alert for alert in result.alerts if alert.get("type") in {a["type"] for a in expected}]
+            assert [alert["value"] for alert in got] == [alert["value"] for alert in expected]
+
+
+def test_engine_touches_shared_index_only_under_engine_lock(tmp_path, cne_payload, monkeypatch):
+    snapshots = _series(copy.deepcopy(cne_payload), 3)
+    engine = RulesEngine({}, mesa_index_path=tmp_path / "mesa_index.json")
+    index, lock = engine.mesa_index, engine._mesa_index_lock
+    held = []
+
+    def _spy(name):
+        original = getattr(index, name)
+
+        def _call(*args, **kwargs):
+            held.append((name, lock.locked()))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(index, name, _call)
+
+    _spy("changes")
+    _spy("save")
+
+    list(engine.iter_run(((str(i), s) for i, s in enumerate(snapshots[1:])), snapshots[0]))
+    engine.run(snapshots[0], snapshots[-1])
+
+    # A rule abandoned after a timeout may still be inside ``changes`` when
+    # the next frame starts; every frame of the engine waits on one lock.
+    assert {name for name, _locked in held} == {"changes", "save"}
+    assert all(locked for _name, locked in held)
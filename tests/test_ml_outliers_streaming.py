@@ -0,0 +1,180 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de `ml_outliers_rule`:
+  - el historial se escribe en lotes (por tamaño o antigüedad), se recorta
+    en disco, admite varios procesos sobre el mismo archivo y reintenta los
+    lotes que fallan;
+  - el modo streaming (MAD móvil) detecta un salto sin reentrenar el
+    Isolation Forest en cada snapshot, que queda como validador periódico;
+  - el estado del detector se recupera del historial persistido.
+
+======================== ENGLISH ========================
+ml_outliers tests: batched history writes (by size or age) shared safely
+across processes and retried after a failed flush, the streaming rolling-MAD mode
+with a periodic Isolation Forest validator, and warm start from disk.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from centinel.core.rules import ml_outliers_rule
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setattr(ml_outliers_rule, "_stores", {})
+    monkeypatch.setattr(ml_outliers_rule, "_detectors", {})
+    yield
+    for store in ml_outliers_rule._stores.values():
+        store.close()
+
+
+def _series(changes_pct: list[float], start: int = 100_000) -> list[dict]:
+    snapshots = [{"departamento": "Cortés", "total_votes": start}]
+    total = float(start)
+    for change in changes_pct:
+        total *= 1 + change / 100
+        snapshots.append({"departamento": "Cortés", "total_votes": int(round(total))})
+    return snapshots
+
+
+def _run(snapshots: list[dict], config: dict) -> list[list[dict]]:
+    return [ml_outliers_rule.apply(current, previous, config) for previous, current in zip(snapshots, snapshots[1:])]
+
+
+def _rows(db_path) -> int:
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM ml_history").fetchone()[0]
+
+
+def test_history_writes_are_batched_and_trimmed(tmp_path) -> None:
+    db_path = str(tmp_path / "history.db")
+    store = ml_outliers_rule._HistoryStore(db_path, flush_every=4)
+
+    for value in range(3):
+        store.append("Cortés", float(value), max_history=3)
+    assert _rows(db_path) == 0
+
+    assert store.append("Cortés", 3.0, max_history=3) == [1.0, 2.0, 3.0]
+    assert _rows(db_path) == 3
+
+    store.append("Cortés", 4.0, max_history=3)
+    store.close()
+    reopened = ml_outliers_rule._HistoryStore(db_path)
+    assert reopened.history("Cortés", max_history=3) == [2.0, 3.0, 4.0]
+    assert reopened.append("Cortés", 5.0, max_history=3) == [3.0, 4.0, 5.0]
+    reopened.close()
+
+
+def test_history_file_shared_by_two_processes(tmp_path) -> None:
+    db_path = str(tmp_path / "history.db")
+    first = ml_outliers_rule._HistoryStore(db_path, flush_every=2)
+    second = ml_outliers_rule._HistoryStore(db_path, flush_every=2)
+    for value in range(4):
+        first.record("Cortés", float(value), max_history=10)
+        second.record("Cortés", float(100 + value), max_history=10)
+    first.close()
+    second.close()
+
+    with sqlite3.connect(db_path) as connection:
+        values = [row[0] for row in connection.execute("SELECT value FROM ml_history ORDER BY seq")]
+    assert values == [0.0, 1.0, 100.0, 101.0, 2.0, 3.0, 102.0, 103.0]
+
+
+class _FailingConnection:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self.failures = 1
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __enter__(self):
+        return self._connection.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._connection.__exit__(*exc_info)
+
+    def execute(self, sql, *args):
+        if sql == "BEGIN IMMEDIATE" and self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return self._connection.execute(sql, *args)
+
+
+def test_failed_flush_is_logged_and_retried(tmp_path, caplog) -> None:
+    db_path = str(tmp_path / "history.db")
+    store = ml_outliers_rule._HistoryStore(db_path, flush_every=2)
+    store._conn = _FailingConnection(store._conn)
+
+    store.record("Cortés", 1.0, max_history=10)
+    store.record("Cortés", 2.0, max_history=10)
+    assert "ml_history_flush_failed pending=2" in caplog.text
+    assert _rows(db_path) == 0
+
+    store.record("Cortés", 3.0, max_history=10)
+    assert _rows(db_path) == 3
+    store.close()
+
+
+def test_pending_batch_flushed_once_stale(tmp_path, monkeypatch) -> None:
+    db_path = str(tmp_path / "history.db")
+    clock = iter([0.0, 1.0, 6.0])
+    monkeypatch.setattr(ml_outliers_rule.time, "monotonic", lambda: next(clock))
+    store = ml_outliers_rule._HistoryStore(db_path, flush_every=100, flush_seconds=5.0)
+
+    store.record("Cortés", 1.0, max_history=10)
+    store.record("Cortés", 2.0, max_history=10)
+    assert _rows(db_path) == 0
+    store.record("Cortés", 3.0, max_history=10)
+    assert _rows(db_path) == 3
+    store.close()
+
+
+def test_streaming_flags_jump_and_validates_periodically(tmp_path, monkeypatch) -> None:
+    fits: list[int] = []
+
+    def _counting_validator(values, contamination):
+        fits.append(len(values))
+        return False
+
+    monkeypatch.setattr(ml_outliers_rule, "_isolation_forest_flags_last", _counting_validator)
+    changes = [1.0 + 0.05 * (step % 4) for step in range(20)] + [30.0]
+    config = {
+        "mode": "streaming",
+        "history_db_path": str(tmp_path / "history.db"),
+        "validator_interval": 10,
+        "streaming_window": 8,
+    }
+
+    results = _run(_series(changes), config)
+
+    assert all(not alerts for alerts in results[:-1])
+    assert len(results[-1]) == 1
+    assert results[-1][0]["justification"].startswith("MAD móvil detectó")
+    # Isolation Forest only refits every `validator_interval` snapshots and
+    # only on the bounded detector window.
+    assert fits == [8, 8]
+
+
+def test_isolation_forest_mode_still_flags_jump(tmp_path) -> None:
+    changes = [1.0 + 0.05 * (step % 4) for step in range(12)] + [30.0]
+    results = _run(_series(changes), {"history_db_path": str(tmp_path / "history.db"), "contamination": 0.1})
+
+    assert results[-1] and results[-1][0]["justification"].startswith("Isolation Forest detectó")
+
+
+def test_streaming_detector_warm_starts_from_disk(tmp_path, monkeypatch) -> None:
+    config = {"mode": "streaming", "history_db_path": str(tmp_path / "history.db"), "history_flush_every": 1}
+    _run(_series([1.0, 1.1, 0.9, 1.0, 1.05, 0.95]), config)
+    ml_outliers_rule._stores.pop(config["history_db_path"]).close()
+    monkeypatch.setattr(ml_outliers_rule, "_detectors", {})
+
+    # A fresh process only sees the jump; the persisted history makes it
+    # stand out immediately.
+    alerts = _run(_series([25.0]), config)
+
+    assert alerts[0] and "z_robusto=" in alerts[0][0]["justification"]
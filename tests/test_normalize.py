@@ -12,6 +12,9 @@ la navegación, mantenimiento y auditoría técnica.
 Componentes detectados:
   - test_normalization_is_deterministic
   - test_normalization_parses_nested_totals_and_candidates
+  - test_sanitized_copy_matches_json_round_trip
+  - test_compiled_field_map_matches_alias_lookup
+  - test_normalize_many_matches_single_calls
 
 Notas:
 - Mantener esta cabecera sincronizada con cambios estructurales del archivo.
@@ -25,13 +28,22 @@ navigation, maintenance, and technical auditability.
 Detected components:
   - test_normalization_is_deterministic
   - test_normalization_parses_nested_totals_and_candidates
+  - test_sanitized_copy_matches_json_round_trip
+  - test_compiled_field_map_matches_alias_lookup
+  - test_normalize_many_matches_single_calls
 
 Notes:
 - Keep this header in sync with structural changes in the file.
 - Prioritize operational clarity and behavior traceability.
 """
 
-from centinel.core.normalize import normalize_snapshot, snapshot_to_canonical_json
+import json
+from collections import OrderedDict
+
+import pytest
+
+from centinel.core import normalize
+from centinel.core.normalize import normalize_many, normalize_snapshot, snapshot_to_canonical_json
 
 
 def test_normalization_is_deterministic():
@@ -123,3 +135,81 @@ def test_normalization_parses_nested_totals_and_candidates():
     assert snapshot.totals.total_votes == 1000
     assert snapshot.candidates[0].name == "Alice"
     assert snapshot.candidates[1].votes == 350
+
+
+def test_sanitized_copy_matches_json_round_trip():
+    """Español: la copia en una pasada equivale a json + depuración de claves.
+
+    English: the one-pass copy equals the json round trip plus key scrub,
+    and payloads only json can convert still go through it.
+    """
+    payload = {
+        "resultados": [{"votos": "1,000", "DNI": "0801", "extra": [1, 2.5, None, True]}],
+        "estadisticas": {"distribucion_votos": {"validos": 10}},
+        "Telefono": "555",
+        "meta": OrderedDict(nested={"datos_personales": {"x": 1}, "ok": "sí"}),
+    }
+    expected = normalize._drop_disallowed_keys(json.loads(json.dumps(payload, ensure_ascii=False)))
+    assert normalize._sanitize_raw_payload(payload) == expected
+    assert normalize._sanitize_raw_payload(json.dumps(payload)) == expected
+
+    converted = {"resultados": ({"votos": 1},), 7: "siete"}
+    assert normalize._sanitize_raw_payload(converted) == {"resultados": [{"votos": 1}], "7": "siete"}
+    with pytest.raises(ValueError):
+        normalize._sanitize_raw_payload({"resultados": [object()]})
+    with pytest.raises(ValueError):
+        normalize._sanitize_raw_payload({"estadisticas": []})
+
+
+def test_compiled_field_map_matches_alias_lookup():
+    """Español: los accesos compilados equivalen a `_first_value`.
+
+    English: compiled accessors match `_first_value` / candidate-root
+    lookup, and identical maps share one compilation.
+    """
+    field_map = {
+        "totals": {"valid_votes": ["missing", "meta.totals.validos", "validos"]},
+        "candidate_roots": ["nada", "resultados"],
+    }
+    payloads = [
+        {"meta": {"totals": {"validos": "5"}}, "validos": 9, "resultados": {"candidatos": [{"votos": 1}]}},
+        {"meta": "plano", "validos": 9, "resultados": [{"votos": 2}]},
+        {"meta": {"totals": None}, "estadisticas": {"distribucion_votos": {"nulos": "3"}}},
+    ]
+    compiled = normalize.compile_field_map(field_map)
+    assert normalize.compile_field_map(json.loads(json.dumps(field_map))) is compiled
+    for payload in payloads:
+        assert compiled.totals["valid_votes"](payload) == normalize._first_value(
+            payload, field_map["totals"]["valid_votes"]
+        )
+        assert compiled.totals["null_votes"](payload) == normalize._first_value(
+            payload, normalize.DEFAULT_TOTALS_FIELDS["null_votes"]
+        )
+        assert compiled.candidates_root(payload) == normalize._extract_candidates_root(
+            payload, field_map["candidate_roots"]
+        )
+    # El alias recordado ("validos") no adelanta a uno anterior presente.
+    # The remembered alias ("validos") never overtakes an earlier present one.
+    assert compiled.totals["valid_votes"](payloads[0]) == "5"
+
+
+def test_normalize_many_matches_single_calls():
+    """Español: el lote produce lo mismo que llamadas individuales.
+
+    English: the batch yields the same snapshots as individual calls,
+    keeps ``None`` for invalid payloads aligned, and rejects mismatched
+    timestamp lists.
+    """
+    raws = [
+        {"cargo": "presidencial", "departamento": "Cortés", "total_votes": 10 * step, "candidates": {"1": step}}
+        for step in range(1, 4)
+    ]
+    raws.insert(1, {"sin": "estructura"})
+    timestamps = [f"2025-12-03T1{index}:00:00Z" for index in range(len(raws))]
+
+    batch = normalize_many(raws, "Cortés", timestamps)
+    single = [normalize_snapshot(raw, "Cortés", timestamp) for raw, timestamp in zip(raws, timestamps)]
+    assert batch[1] is None and single[1] is None
+    assert [snapshot_to_canonical_json(s) for s in batch if s] == [snapshot_to_canonical_json(s) for s in single if s]
+    with pytest.raises(ValueError):
+        normalize_many(raws, "Cortés", timestamps[:-1])
@@ -0,0 +1,142 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de la verificación paralela por segmentos: `verify_chain` y
+`verify_hashchain_from_snapshots` con `workers > 1` deben devolver
+exactamente el mismo resultado que la pasada secuencial, incluido el
+índice `broken_at`, también cuando un eslabón depende del segmento
+anterior o hay errores de lectura intermedios.
+
+======================== ENGLISH ========================
+Segment-parallel verification parity tests: identical results (including
+`broken_at`) to the sequential pass, across segment boundaries, links that
+chain off the previous segment and intermediate read errors.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from centinel import hasher
+from centinel.core import custody
+from centinel.core.custody import _compute_expected_hash, verify_chain
+from centinel.hasher import compute_snapshot_hash, verify_hashchain_from_snapshots
+
+LINKS = 40
+
+
+@pytest.fixture(autouse=True)
+def _small_segments(monkeypatch):
+    # Force the pool path and many segment boundaries on tiny chains.
+    monkeypatch.setattr(custody, "_PARALLEL_MIN_LINKS", 0)
+    monkeypatch.setattr(hasher, "_PARALLEL_MIN_SNAPSHOTS", 0)
+
+
+def _build_custody_chain(hash_root: Path, count: int = LINKS) -> None:
+    previous = None
+    for index in range(count):
+        data_payload = {"hash": f"data_{index}", "index": index}
+        data_bytes = json.dumps(data_payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()
+        chained = _compute_expected_hash(previous, data_bytes)
+        record = {**data_payload, "chained_hash": chained}
+        # Every third link relies on the running hash instead of storing it.
+        if previous and index % 3:
+            record["previous_hash"] = previous
+        path = hash_root / "cne" / f"snapshot_{index:03d}.sha256"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+        os.utime(path, ns=(1_700_000_000_000_000_000 + index * 1_000_000_000,) * 2)
+        previous = chained
+
+
+def _rewrite(path: Path, mutate) -> None:
+    stat = path.stat()
+    record = json.loads(path.read_text(encoding="utf-8"))
+    mutate(record)
+    path.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_parallel_verify_chain_matches_sequential(tmp_path) -> None:
+    _build_custody_chain(tmp_path)
+
+    sequential = verify_chain(tmp_path)
+    parallel = verify_chain(tmp_path, workers=3)
+
+    assert sequential.valid is True
+    assert parallel == sequential
+
+
+@pytest.mark.parametrize("broken_index", [0, 9, 21, LINKS - 1])
+def test_parallel_verify_chain_reports_same_break(tmp_path, broken_index) -> None:
+    _build_custody_chain(tmp_path)
+    _rewrite(
+        tmp_path / "cne" / f"snapshot_{broken_index:03d}.sha256",
+        lambda record: record.update(hash="forged"),
+    )
+
+    sequential = verify_chain(tmp_path)
+    parallel = verify_chain(tmp_path, workers=3)
+
+    assert sequential.broken_at == broken_index
+    assert parallel == sequential
+
+
+def test_parallel_verify_chain_read_errors_match(tmp_path) -> None:
+    _build_custody_chain(tmp_path)
+    victim = tmp_path / "cne" / "snapshot_012.sha256"
+    stat = victim.stat()
+    victim.write_text("{corrupted", encoding="utf-8")
+    os.utime(victim, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    sequential = verify_chain(tmp_path)
+    parallel = verify_chain(tmp_path, workers=3)
+
+    assert any(error.startswith("read_error index=12") for error in sequential.errors)
+    assert parallel == sequential
+
+
+def _build_snapshot_chain(root: Path, count: int = LINKS) -> None:
+    previous = None
+    for index in range(count):
+        snapshot_dir = root / f"snap_{index:03d}"
+        snapshot_dir.mkdir(parents=True)
+        content = f"payload-{index}".encode("utf-8")
+        metadata = {
+            "timestamp_utc": f"2026-01-01T{index // 60:02d}:{index % 60:02d}:00+00:00",
+            "source_url": "https://cne.hn",
+        }
+        # Some snapshots omit metadata.previous_hash (legacy captures).
+        if previous and index % 7:
+            metadata["previous_hash"] = previous
+        digest = compute_snapshot_hash(content, metadata, previous)
+        (snapshot_dir / "snapshot.raw").write_bytes(content)
+        (snapshot_dir / "snapshot.metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+        (snapshot_dir / "hash.txt").write_text(f"{digest}\n", encoding="utf-8")
+        previous = digest
+
+
+def test_parallel_snapshot_chain_matches_sequential(tmp_path) -> None:
+    _build_snapshot_chain(tmp_path)
+
+    sequential = verify_hashchain_from_snapshots(tmp_path)
+    parallel = verify_hashchain_from_snapshots(tmp_path, workers=3)
+
+    assert sequential["valid"] is True
+    assert sequential["verified_count"] == LINKS
+    assert parallel == sequential
+
+
+@pytest.mark.parametrize("broken_index", [0, 14, 27])
+def test_parallel_snapshot_chain_reports_same_break(tmp_path, broken_index) -> None:
+    _build_snapshot_chain(tmp_path)
+    (tmp_path / f"snap_{broken_index:03d}" / "snapshot.raw").write_bytes(b"tampered")
+
+    sequential = verify_hashchain_from_snapshots(tmp_path)
+    parallel = verify_hashchain_from_snapshots(tmp_path, workers=3)
+
+    assert sequential["broken_at"] == broken_index
+    assert parallel == sequential
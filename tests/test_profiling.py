@@ -0,0 +1,112 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del perfilador por muestreo bajo demanda:
+  - el muestreador captura las pilas de otros hilos y exporta pilas
+    colapsadas y JSON de speedscope;
+  - `CycleProfiler` perfila exactamente los K ciclos solicitados;
+  - las rutas `/api/profiling/*` son opt-in y exigen un seed de admin.
+
+======================== ENGLISH ========================
+On-demand sampling profiler tests: cross-thread stack capture with
+collapsed and speedscope export, K-cycle profiling driven by a request
+file, and opt-in, seed-gated `/api/profiling/*` routes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from centinel import profiling
+
+
+def _busy_worker(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+def test_sampler_exports_collapsed_and_speedscope(tmp_path) -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_worker, args=(stop,), name="busy")
+    worker.start()
+    profiler = profiling.SamplingProfiler(interval=0.002)
+    profiler.start()
+    time.sleep(0.2)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert profiler.samples > 0
+    busy_lines = [line for line in profiler.collapsed().splitlines() if line.startswith("busy;")]
+    assert busy_lines and any("_busy_worker" in line for line in busy_lines)
+    assert all(" " not in line.rsplit(" ", 1)[0] for line in busy_lines)
+
+    document = json.loads(profiler.write(tmp_path, "speedscope").read_text(encoding="utf-8"))
+    frames = document["shared"]["frames"]
+    [busy] = [profile for profile in document["profiles"] if profile["name"] == "busy"]
+    assert len(busy["samples"]) == len(busy["weights"])
+    assert all(0 <= index < len(frames) for sample in busy["samples"] for index in sample)
+    assert "_busy_worker" in {frames[index]["name"] for sample in busy["samples"] for index in sample}
+    assert busy["endValue"] > 0
+
+
+def test_cycle_profiler_profiles_requested_cycles(tmp_path) -> None:
+    request_path = tmp_path / "profile_request.json"
+    cycle_profiler = profiling.CycleProfiler(request_path=request_path, output_dir=tmp_path)
+    with cycle_profiler.cycle():
+        pass
+    assert profiling.list_profiles(tmp_path) == []
+
+    profiling.request_cycle_profile(2, fmt="collapsed", interval=0.002, request_path=request_path)
+    for _ in range(2):
+        with cycle_profiler.cycle():
+            time.sleep(0.05)
+    with cycle_profiler.cycle():
+        pass
+
+    [written] = profiling.list_profiles(tmp_path)
+    assert written["name"].startswith("profile_cycles_") and written["name"].endswith(".collapsed.txt")
+    assert not request_path.exists()
+
+
+def test_profiling_routes_are_opt_in_and_seed_gated(tmp_path, monkeypatch) -> None:
+    from centinel.api.routes import profiling as profiling_routes
+    from centinel.api.routes import setup as setup_routes
+
+    access_path = tmp_path / "access.json"
+    monkeypatch.setattr(setup_routes, "SEED1_ITERS", 1000)
+    digest = hashlib.pbkdf2_hmac("sha256", b"correct-seed", setup_routes.SEED1_SALT.encode(), 1000).hex()
+    access_path.write_text(json.dumps({"seeds": {"S1-A": digest}}), encoding="utf-8")
+    monkeypatch.setattr(setup_routes, "_ACCESS_JSON", access_path)
+    monkeypatch.setattr(profiling_routes, "_PROFILE_DIR", tmp_path / "reports")
+    monkeypatch.setattr(profiling_routes, "_REQUEST_PATH", tmp_path / "reports" / "profile_request.json")
+
+    app = FastAPI()
+    app.include_router(profiling_routes.router)
+    client = TestClient(app)
+    admin = {"seed_label": "S1-A", "seed_value": "correct-seed"}
+
+    monkeypatch.delenv("CENTINEL_PROFILING_ENABLED", raising=False)
+    assert client.post("/api/profiling/status", json=admin).status_code == 404
+
+    monkeypatch.setenv("CENTINEL_PROFILING_ENABLED", "1")
+    assert client.post("/api/profiling/status", json={**admin, "seed_value": "wrong"}).status_code == 401
+
+    started = client.post("/api/profiling/sample", json={**admin, "seconds": 0.2, "interval_ms": 2})
+    assert started.status_code == 200 and started.json()["running"] is True
+    assert client.post("/api/profiling/sample", json={**admin, "seconds": 0.2}).status_code == 409
+    profiling.active_timed_profile().done.wait(5)
+
+    requested = client.post("/api/profiling/cycles", json={**admin, "cycles": 3, "format": "speedscope"})
+    assert requested.status_code == 200
+    assert client.post("/api/profiling/cycles", json={**admin, "format": "pprof"}).status_code == 400
+
+    status = client.post("/api/profiling/status", json=admin).json()
+    assert status["timed"]["output"].endswith(".collapsed.txt")
+    assert status["cycles_request"]["cycles"] == 3
+    assert [entry["name"] for entry in status["profiles"]] == [status["timed"]["output"].rsplit("/", 1)[-1]]
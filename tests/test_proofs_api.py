@@ -0,0 +1,164 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de los endpoints `/proofs`:
+  - la prueba de inclusión es O(log n), apunta al último checkpoint firmado
+    y se verifica offline con `scripts/verify_snapshot_bundle.py`;
+  - la prueba de consistencia entre checkpoints fijados por digest es
+    inmutable (Cache-Control/ETag, 304) y detecta alteraciones; por
+    chain_length no lo es;
+  - log y acumulador se cachean juntos: un checkpoint nuevo es demostrable
+    en cuanto vence la caché;
+  - snapshots posteriores al checkpoint o un checkpoint que ya no se
+    reproduce devuelven 404/409.
+
+======================== ENGLISH ========================
+`/proofs` endpoint tests: O(log n) inclusion proofs against the latest
+signed checkpoint verified offline by `scripts/verify_snapshot_bundle.py`,
+immutable consistency proofs between digest-pinned checkpoints
+(Cache-Control, ETag, 304) that reject tampering (chain_length references
+are not immutable), log and accumulator cached together so a new
+checkpoint is provable as soon as the cache expires, and 404/409 for
+uncheckpointed snapshots or checkpoints the live chain no longer
+reproduces.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from centinel.api import audit, main, middleware
+from centinel.api.routes import proofs
+from centinel.core import transparency
+from centinel.core.custody import generate_operator_keypair
+
+
+def _write_snapshot(root: Path, index: int) -> str:
+    snapshot_dir = root / f"snap_{index:03d}"
+    snapshot_dir.mkdir(parents=True)
+    metadata = {"timestamp_utc": f"2026-01-01T{index // 60:02d}:{index % 60:02d}:00+00:00"}
+    (snapshot_dir / "snapshot.metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    digest = hashlib.sha256(f"snapshot-{index}".encode()).hexdigest()
+    (snapshot_dir / "hash.txt").write_text(f"{digest}\n", encoding="utf-8")
+    return digest
+
+
+@pytest.fixture()
+def chain(monkeypatch, tmp_path):
+    snapshot_root = tmp_path / "snapshots"
+    log_dir = tmp_path / "transparency"
+    generate_operator_keypair(key_dir=tmp_path, operator_id="test-op")
+    monkeypatch.setenv("CENTINEL_OPERATOR_KEY_PATH", str(tmp_path / "operator_private.pem"))
+    monkeypatch.setenv("CENTINEL_DISABLE_OPENTIMESTAMPS", "1")
+    monkeypatch.setattr(transparency, "_DEFAULT_LOG_DIR", log_dir)
+    monkeypatch.setattr(transparency, "_TRACKED_CHAINS", {})
+    monkeypatch.setattr(proofs, "resolve_snapshot_root", lambda: snapshot_root)
+    # The zero-trust limiter's per-IP window is shared by every TestClient.
+    monkeypatch.setattr(middleware._SlidingWindowLimiter, "is_allowed", lambda self, ip: True)
+    audit._cache_store.clear()
+
+    hashes = [_write_snapshot(snapshot_root, index) for index in range(13)]
+    first = transparency.append_transparency_checkpoint(snapshot_root, log_dir=log_dir)
+    hashes += [_write_snapshot(snapshot_root, index) for index in range(13, 21)]
+    second = transparency.append_transparency_checkpoint(snapshot_root, log_dir=log_dir)
+    hashes.append(_write_snapshot(snapshot_root, 21))
+    yield TestClient(main.app), hashes, first, second
+    audit._cache_store.clear()
+
+
+def _run_verifier(tmp_path: Path, flag: str, payload: dict) -> subprocess.CompletedProcess:
+    proof_path = tmp_path / "proof.json"
+    proof_path.write_text(json.dumps(payload), encoding="utf-8")
+    return subprocess.run(
+        [sys.executable, "scripts/verify_snapshot_bundle.py", flag, str(proof_path), "--require-signature"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_inclusion_proof_against_latest_signed_checkpoint(chain, tmp_path) -> None:
+    client, hashes, _, second = chain
+    response = client.get(f"/proofs/{hashes[5]}")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["checkpoint"]["checkpoint_digest"] == second["checkpoint_digest"]
+    assert payload["proof"]["tree_size"] == 21
+    assert len(payload["proof"]["audit_path"]) <= 5
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = client.get(f"/proofs/{hashes[5]}", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+    assert "verification=PASS" in _run_verifier(tmp_path, "--inclusion-proof", payload).stdout
+    payload["proof"]["audit_path"][0] = hashes[0]
+    failed = _run_verifier(tmp_path, "--inclusion-proof", payload)
+    assert failed.returncode == 1 and "invalid_inclusion_proof" in failed.stdout
+
+    assert client.get(f"/proofs/{hashes[21]}").json()["detail"] == "hash_not_yet_checkpointed"
+    assert client.get(f"/proofs/{'0' * 64}").status_code == 404
+    assert client.get("/proofs/not-a-hash").status_code == 400
+
+    pinned = client.get(f"/proofs/{hashes[5]}", params={"checkpoint": second["checkpoint_digest"]})
+    assert "immutable" in pinned.headers["cache-control"]
+    by_length = client.get(f"/proofs/{hashes[5]}", params={"checkpoint": "21"})
+    assert "immutable" not in by_length.headers["cache-control"]
+
+
+def test_consistency_proof_between_pinned_checkpoints(chain, tmp_path) -> None:
+    client, _, first, second = chain
+    response = client.get(
+        "/proofs/consistency",
+        params={"from": first["checkpoint_digest"], "to": second["checkpoint_digest"]},
+    )
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    by_length = client.get(
+        "/proofs/consistency",
+        params={"from": first["checkpoint_digest"], "to": str(second["chain_length"])},
+    )
+    assert by_length.json() == response.json()
+    assert "immutable" not in by_length.headers["cache-control"]
+    payload = response.json()
+    assert (payload["proof"]["old_size"], payload["proof"]["new_size"]) == (13, 21)
+    assert "verification=PASS" in _run_verifier(tmp_path, "--consistency-proof", payload).stdout
+
+    payload["to_checkpoint"]["merkle_root"] = payload["proof"]["old_root"]
+    failed = _run_verifier(tmp_path, "--consistency-proof", payload)
+    assert "to_checkpoint_digest_mismatch" in failed.stdout
+    assert "consistency_checkpoint_mismatch" in failed.stdout
+
+    backwards = client.get("/proofs/consistency", params={"from": "21", "to": "13"})
+    assert backwards.status_code == 409
+    assert client.get("/proofs/consistency", params={"from": "7"}).status_code == 404
+
+
+def test_rewritten_snapshot_makes_checkpoint_unprovable(chain) -> None:
+    client, hashes, _, _ = chain
+    snapshot_root = proofs.resolve_snapshot_root()
+    (snapshot_root / "snap_003" / "hash.txt").write_text(hashlib.sha256(b"forged").hexdigest() + "\n", encoding="utf-8")
+    audit._cache_store.clear()
+    transparency._TRACKED_CHAINS.clear()
+    response = client.get(f"/proofs/{hashes[5]}")
+    assert response.status_code == 409
+    assert response.json()["detail"] == "checkpoint_root_mismatch"
+
+
+def test_new_checkpoint_is_provable_once_the_cache_expires(chain) -> None:
+    client, hashes, _, second = chain
+    assert client.get(f"/proofs/{hashes[5]}").status_code == 200
+    snapshot_root = proofs.resolve_snapshot_root()
+    third = transparency.append_transparency_checkpoint(snapshot_root, log_dir=transparency._DEFAULT_LOG_DIR)
+    for key, (_stamp, value) in list(audit._cache_store.items()):
+        audit._cache_store[key] = (float("-inf"), value)
+
+    response = client.get("/proofs/consistency", params={"from": second["checkpoint_digest"]})
+    assert response.status_code == 200
+    assert response.json()["to_checkpoint"]["checkpoint_digest"] == third["checkpoint_digest"]
+    assert client.get(f"/proofs/{hashes[21]}").json()["proof"]["tree_size"] == 22
@@ -0,0 +1,124 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del replay en streaming:
+  - `stream_parsed` entrega en orden y nunca tiene más de `lookahead`
+    archivos en vuelo;
+  - `run_replay` alimenta RulesEngine e InconsistentActsTracker snapshot a
+    snapshot y reporta throughput;
+  - `calibrate_2025` ordena por el timestamp del nombre y omite JSON rotos.
+
+======================== ENGLISH ========================
+Streaming replay tests: ordered bounded-lookahead parsing, the end-to-end
+streaming replay, and calibrate_2025's streamed snapshot loading.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+
+from scripts import calibrate_2025, replay_2025
+from scripts.replay_stream import ThroughputMeter, stream_parsed
+
+
+def _write_cne_snapshots(data_dir: Path, count: int = 4) -> list[Path]:
+    data_dir.mkdir(parents=True)
+    paths = []
+    for index in range(count):
+        alpha, beta = 1000 + 150 * index, 500 + 90 * index
+        raw = {
+            "timestamp": f"2025-12-01T1{index}:00:00Z",
+            "resultados": [
+                {"partido": "PARTIDO ALPHA", "candidato": "CANDIDATO ALPHA", "votos": f"{alpha:,}"},
+                {"partido": "PARTIDO BETA", "candidato": "CANDIDATO BETA", "votos": f"{beta:,}"},
+            ],
+            "estadisticas": {
+                "totalizacion_actas": {"actas_totales": "100", "actas_divulgadas": str(10 + index)},
+                "distribucion_votos": {"validos": f"{alpha + beta:,}", "nulos": "10", "blancos": "5"},
+                "estado_actas_divulgadas": {"actas_correctas": str(8 + index), "actas_inconsistentes": "2"},
+            },
+        }
+        path = data_dir / f"snapshot_{index:02d}.json"
+        path.write_text(json.dumps(raw), encoding="utf-8")
+        paths.append(path)
+    (data_dir / "snapshot_99.json").write_text(json.dumps({"not": "cne"}), encoding="utf-8")
+    return paths
+
+
+def test_stream_parsed_is_ordered_and_bounded() -> None:
+    lock = threading.Lock()
+    state = {"started": 0, "consumed": 0, "max_ahead": 0}
+
+    def _parse(path: Path) -> str:
+        with lock:
+            state["started"] += 1
+            state["max_ahead"] = max(state["max_ahead"], state["started"] - state["consumed"])
+        # Later files finish first: output order must not depend on it.
+        time.sleep(0.001 * (10 - int(path.stem) % 10))
+        return path.stem
+
+    paths = [Path(f"{index:03d}") for index in range(40)]
+    seen = []
+    for path, value in stream_parsed(paths, _parse, workers=3, lookahead=5):
+        with lock:
+            state["consumed"] += 1
+        seen.append(value)
+
+    assert seen == [path.stem for path in paths]
+    assert state["max_ahead"] <= 5
+
+
+def test_run_replay_streams_into_engine_and_tracker(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    progress = io.StringIO()
+    fixtures = _write_cne_snapshots(tmp_path / "raw")
+
+    outputs = replay_2025.run_replay(
+        data_dir=tmp_path / "raw",
+        output_dir=tmp_path / "replay",
+        analysis_dir=tmp_path / "analysis",
+        report_path=tmp_path / "reports" / "replay.json",
+        department="Francisco Morazán",
+        year=2025,
+        workers=2,
+        lookahead=2,
+        config={"rules": {}},
+        meter=ThroughputMeter(label="test", every=1, stream=progress),
+    )
+
+    # The invalid payload is skipped, the rest flows through in order.
+    assert sorted(p.name for p in outputs.normalized_dir.glob("*.json")) == [p.name for p in fixtures]
+    report = json.loads(outputs.report_file.read_text(encoding="utf-8"))
+    assert [d["to_snapshot"] for d in report["diffs"]] == [p.name for p in fixtures[1:]]
+    assert report["diffs"] == replay_2025.build_snapshot_diffs(outputs.normalized_dir, workers=1)
+    assert report["throughput"]["snapshots"] == len(fixtures)
+
+    lines = [json.loads(line) for line in outputs.alerts_file.read_text(encoding="utf-8").splitlines()]
+    assert [line["snapshot"] for line in lines] == [p.stem for p in fixtures]
+    assert "estado_actas_divulgadas.actas_inconsistentes" in outputs.forensic_file.read_text(encoding="utf-8")
+    assert (tmp_path / "analysis" / "rules_log.jsonl").exists()
+    assert (tmp_path / "config" / "inconsistent_key.json").exists()
+    assert "snapshots/s" in progress.getvalue()
+
+
+def test_calibrate_streams_in_timestamp_order(tmp_path) -> None:
+    def _write(stamp: str, payload) -> None:
+        name = f"HN.PRESIDENTE.00-TODOS.000-TODOS {stamp}.json"
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        (tmp_path / name).write_text(text, encoding="utf-8")
+
+    base = {"estadisticas": {"totalizacion_actas": {"actas_totales": "100", "actas_divulgadas": "10"}}}
+    _write("2025-12-01 10_00_00", base)
+    _write("2025-12-01 09_00_00", base)
+    _write("2025-12-01 11_00_00", "{broken")
+    (tmp_path / "HN.PRESIDENTE.other.json").write_text("{}", encoding="utf-8")
+
+    meter = ThroughputMeter(stream=io.StringIO())
+    metrics = list(calibrate_2025.iter_metrics(tmp_path, workers=2, meter=meter))
+
+    assert [m["file"][-24:-5] for m in metrics] == ["2025-12-01 09_00_00", "2025-12-01 10_00_00"]
+    assert meter.count == 2
+    assert [s["file"] for s in calibrate_2025.load_snapshots(tmp_path)] == [m["file"] for m in metrics]
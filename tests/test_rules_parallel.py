@@ -0,0 +1,92 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de la ejecución paralela de reglas:
+  - el modo paralelo produce las mismas alertas, en orden de registro, que
+    el modo serie aunque las reglas terminen en otro orden;
+  - una regla que agota su presupuesto se registra como `timeout` sin
+    frenar al resto;
+  - la latencia por regla queda en el log de reglas.
+
+======================== ENGLISH ========================
+Parallel rule execution tests: registry-order merge parity with the serial
+mode, per-rule timeout outcome and per-rule latency in the rule log.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from centinel.core.rules.common import extract_department
+from centinel.core.rules.registry import RuleDefinition
+from centinel.core.rules_engine import RulesEngine
+
+
+def _make_rule(tag: str, delay: float, gate: Optional[threading.Event] = None) -> RuleDefinition:
+    def _rule(current: dict, previous: Optional[dict], config: dict) -> List[dict]:
+        if gate is not None:
+            gate.wait(delay)
+        else:
+            time.sleep(delay)
+        # Reads through the columnar frame from a worker thread.
+        return [{"type": tag, "severity": "HIGH", "value": extract_department(current)}]
+
+    return RuleDefinition(name=tag, severity="HIGH", description=tag, config_key=tag, func=_rule)
+
+
+@pytest.fixture()
+def rules(monkeypatch):
+    registered: List[RuleDefinition] = []
+    monkeypatch.setattr("centinel.core.rules_engine.list_rules", lambda: list(registered))
+    return registered
+
+
+def test_parallel_merge_keeps_registry_order(rules) -> None:
+    rules.extend([_make_rule("slow", 0.2), _make_rule("fast", 0.0), _make_rule("medium", 0.05)])
+    snapshot = {"departamento": "Cortés"}
+
+    serial = RulesEngine({"rules": {}}).run(snapshot, None)
+    parallel = RulesEngine({"rules": {"parallel_enabled": True, "parallel_workers": 3}}).run(snapshot, None)
+
+    assert [alert["rule"] for alert in parallel.alerts] == ["slow", "fast", "medium"]
+    assert parallel.alerts == serial.alerts
+    assert parallel.critical_alerts == serial.critical_alerts
+    assert {alert["value"] for alert in parallel.alerts} == {"Cortés"}
+
+
+def test_rule_budget_times_out_without_blocking(rules, tmp_path) -> None:
+    gate = threading.Event()
+    rules.extend([_make_rule("hung", 30.0, gate), _make_rule("quick", 0.0)])
+    log_path = tmp_path / "rules_log.jsonl"
+    engine = RulesEngine({"rules": {"hung": {"timeout_seconds": 0.1}}}, log_path=log_path)
+
+    started = time.perf_counter()
+    try:
+        result = engine.run({"departamento": "Olancho"}, None, snapshot_id="snap-1")
+    finally:
+        gate.set()
+
+    assert time.perf_counter() - started < 5
+    assert [alert["rule"] for alert in result.alerts] == ["quick"]
+    events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [(event["rule"], event["status"]) for event in events] == [("hung", "timeout"), ("quick", "ok")]
+    assert events[0]["error"] == "timeout after 0.1s"
+    assert events[0]["duration_ms"] == pytest.approx(100.0)
+
+
+def test_rule_log_records_latency(rules, tmp_path) -> None:
+    rules.extend([_make_rule("timed", 0.02), _make_rule("disabled", 0.0)])
+    log_path = tmp_path / "rules_log.jsonl"
+    engine = RulesEngine({"rules": {"disabled": {"enabled": False}}}, log_path=log_path)
+
+    engine.run({"departamento": "Colón"}, None)
+
+    events = {event["rule"]: event for event in map(json.loads, log_path.read_text(encoding="utf-8").splitlines())}
+    assert events["timed"]["status"] == "ok"
+    assert events["timed"]["duration_ms"] >= 20.0
+    assert events["disabled"]["status"] == "skipped"
+    assert "duration_ms" not in events["disabled"]
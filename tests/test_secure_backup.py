@@ -15,6 +15,8 @@ Componentes detectados:
   - TestHashChainCollection
   - TestLocalBackup
   - TestBackupCriticalAssets
+  - TestIncrementalBackup
+  - TestDropboxUpload
   - TestBackupScheduler
 
 Notas:
@@ -32,6 +34,8 @@ Detected components:
   - TestHashChainCollection
   - TestLocalBackup
   - TestBackupCriticalAssets
+  - TestIncrementalBackup
+  - TestDropboxUpload
   - TestBackupScheduler
 
 Notes:
@@ -53,10 +57,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from centinel_engine.secure_backup import (  # noqa: E402
     _compute_sha256,
-    _build_backup_manifest,
+    _build_incremental_manifest,
     _collect_hash_chain_files,
-    _backup_to_local,
+    _store_chunk,
     backup_critical_assets,
+    restore_backup,
+    verify_last_bundle,
     BackupScheduler,
 )
 
@@ -108,16 +114,20 @@ class TestManifest:
 
         Bilingual: Manifiesto contiene campos requeridos.
         """
-        manifest = _build_backup_manifest(
-            ["file1.json", "file2.json"],
-            {"file1.json": "abc123", "file2.json": "def456"},
-            encrypted=True,
+        manifest = _build_incremental_manifest(
+            7,
+            "centinel_backup_00000006_20260101T000000Z.manifest.json",
+            {"file1.json": {"sha256": "abc123", "size": 3, "chunk": "chunks/k/ab/abc123.enc"}},
+            ["file2.json"],
+            "k",
+            full=False,
         )
         assert "timestamp" in manifest
         assert manifest["encrypted"] is True
-        assert manifest["files"] == ["file1.json", "file2.json"]
-        assert manifest["version"] == "1.0"
-        assert manifest["sha256_hashes"]["file1.json"] == "abc123"
+        assert manifest["sequence"] == 7
+        assert manifest["removed"] == ["file2.json"]
+        assert manifest["version"] == "2.0"
+        assert manifest["files"]["file1.json"]["sha256"] == "abc123"
 
 
 # ---------------------------------------------------------------------------
@@ -163,41 +173,38 @@ class TestHashChainCollection:
 
 
 class TestLocalBackup:
-    """Tests for local backup writing / Pruebas de escritura de respaldo local."""
+    """Tests for local chunk storage / Pruebas de almacenamiento local de chunks."""
 
-    def test_writes_backup_file(self, tmp_path: Path) -> None:
-        """Local backup writes encrypted payload and manifest.
+    def test_writes_chunk_file(self, tmp_path: Path) -> None:
+        """A new chunk is written under its content address.
 
-        Bilingual: Respaldo local escribe payload cifrado y manifiesto.
+        Bilingual: Un chunk nuevo se escribe bajo su dirección de contenido.
         """
-        payload = b"encrypted-test-data"
-        manifest = _build_backup_manifest(["test.json"], {"test.json": "abc"}, encrypted=True)
-        result = _backup_to_local(tmp_path, payload, "test_backup.enc", manifest)
-        assert result is True
-        assert (tmp_path / "test_backup.enc").exists()
-        assert (tmp_path / "test_backup.enc.manifest.json").exists()
+        payload = b"exact-content-check"
+        digest = _compute_sha256(payload)
+        relative, written = _store_chunk(tmp_path, payload, digest, "plaintext", None)
+        assert written is True
+        assert relative == f"chunks/plaintext/{digest[:2]}/{digest}.raw"
+        assert (tmp_path / relative).read_bytes() == payload
 
-    def test_backup_content_matches(self, tmp_path: Path) -> None:
-        """Written backup content matches the input payload.
+    def test_existing_chunk_is_not_rewritten(self, tmp_path: Path) -> None:
+        """Storing the same content twice writes a single chunk.
 
-        Bilingual: Contenido del respaldo escrito coincide con el payload de entrada.
+        Bilingual: Guardar el mismo contenido dos veces escribe un solo chunk.
         """
-        payload = b"exact-content-check"
-        manifest = _build_backup_manifest([], {}, encrypted=False)
-        _backup_to_local(tmp_path, payload, "check.enc", manifest)
-        assert (tmp_path / "check.enc").read_bytes() == payload
+        digest = _compute_sha256(b"dedup")
+        _store_chunk(tmp_path, b"dedup", digest, "plaintext", None)
+        assert _store_chunk(tmp_path, b"dedup", digest, "plaintext", None)[1] is False
 
     def test_creates_parent_directories(self, tmp_path: Path) -> None:
-        """Local backup creates nested parent directories.
+        """Chunk storage creates nested parent directories.
 
-        Bilingual: Respaldo local crea directorios padre anidados.
+        Bilingual: El almacenamiento de chunks crea directorios padre anidados.
         """
         deep_dir = tmp_path / "nested" / "deep" / "backups"
-        payload = b"nested-test"
-        manifest = _build_backup_manifest([], {}, encrypted=False)
-        result = _backup_to_local(deep_dir, payload, "nested.enc", manifest)
-        assert result is True
-        assert (deep_dir / "nested.enc").exists()
+        relative, written = _store_chunk(deep_dir, b"nested-test", _compute_sha256(b"nested-test"), "plaintext", None)
+        assert written is True
+        assert (deep_dir / relative).exists()
 
 
 # ---------------------------------------------------------------------------
@@ -265,7 +272,160 @@ class TestBackupCriticalAssets:
 
 
 # ---------------------------------------------------------------------------
-# Test 6: BackupScheduler / Programador de respaldo
+# Test 6: Incremental backup / Respaldo incremental
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalBackup:
+    """Tests for content-addressed incremental backups / Pruebas de respaldos incrementales."""
+
+    @pytest.fixture()
+    def assets(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
+        fernet_module = pytest.importorskip("cryptography.fernet")
+        monkeypatch.setenv("CENTINEL_BACKUP_KEY", fernet_module.Fernet.generate_key().decode("utf-8"))
+        health = tmp_path / "health_state.json"
+        health.write_text(json.dumps({"mode": "normal"}))
+        hash_dir = tmp_path / "hashes"
+        hash_dir.mkdir()
+        (hash_dir / "hash_001.json").write_text(json.dumps({"hash": "a" * 64}))
+        return {
+            "health_state_path": health,
+            "hash_chain_dir": hash_dir,
+            "backup_dir": tmp_path / "backups",
+        }
+
+    def test_second_backup_only_stores_new_files(self, assets: Dict[str, Any]) -> None:
+        """Each backup stores only new or changed files as encrypted chunks.
+
+        Bilingual: Cada respaldo guarda solo archivos nuevos o modificados como chunks cifrados.
+        """
+        first = backup_critical_assets(**assets)
+        assert first["files_backed_up"] == ["health_state.json", "hash_001.json"]
+        assert first["chunks_written"] == 2
+
+        (assets["hash_chain_dir"] / "hash_002.json").write_text(json.dumps({"hash": "b" * 64}))
+        with patch("pathlib.Path.read_bytes", autospec=True, side_effect=Path.read_bytes) as reads:
+            second = backup_critical_assets(**assets)
+        assert second["files_backed_up"] == ["hash_002.json"]
+        assert second["chunks_written"] == 1
+        # Unchanged files are skipped by size/mtime without being read.
+        assert [call.args[0].name for call in reads.call_args_list] == ["hash_002.json"]
+
+        manifest = json.loads((assets["backup_dir"] / second["manifest"]).read_text())
+        assert list(manifest["files"]) == ["hash_002.json"]
+        assert manifest["parent"] == first["manifest"]
+        chunk = (assets["backup_dir"] / manifest["files"]["hash_002.json"]["chunk"]).read_bytes()
+        assert b"bbbb" not in chunk
+
+        unchanged = backup_critical_assets(**assets)
+        assert unchanged["local"] is True
+        assert unchanged["manifest"] is None
+
+    def test_restore_replays_manifest_chain(self, assets: Dict[str, Any], tmp_path: Path) -> None:
+        """Restore rebuilds every backup state, including deletions.
+
+        Bilingual: La restauración reconstruye cada estado, incluidas las eliminaciones.
+        """
+        first = backup_critical_assets(**assets)
+        assets["health_state_path"].write_text(json.dumps({"mode": "critical"}))
+        (assets["hash_chain_dir"] / "hash_001.json").unlink()
+        (assets["hash_chain_dir"] / "hash_002.json").write_text(json.dumps({"hash": "c" * 64}))
+        backup_critical_assets(**assets)
+
+        latest = restore_backup(tmp_path / "restored", backup_dir=assets["backup_dir"])
+        assert latest["errors"] == []
+        assert sorted(latest["restored"]) == ["hash_002.json", "health_state.json"]
+        assert json.loads((tmp_path / "restored" / "health_state.json").read_text()) == {"mode": "critical"}
+
+        older = restore_backup(tmp_path / "older", backup_dir=assets["backup_dir"], manifest_name=first["manifest"])
+        assert sorted(older["restored"]) == ["hash_001.json", "health_state.json"]
+        assert json.loads((tmp_path / "older" / "health_state.json").read_text()) == {"mode": "normal"}
+
+    def test_periodic_full_manifest_bounds_chain(self, assets: Dict[str, Any], tmp_path: Path) -> None:
+        """A periodic full manifest lets restore stop without older manifests.
+
+        Bilingual: Un manifiesto completo periódico permite restaurar sin manifiestos anteriores.
+        """
+        manifests = []
+        for step in range(3):
+            assets["health_state_path"].write_text(json.dumps({"step": step}))
+            manifests.append(backup_critical_assets(**assets, full_manifest_every=3)["manifest"])
+
+        (assets["backup_dir"] / manifests[0]).unlink()
+        (assets["backup_dir"] / manifests[1]).unlink()
+        restored = restore_backup(tmp_path / "restored", backup_dir=assets["backup_dir"])
+        assert restored["errors"] == []
+        assert json.loads((tmp_path / "restored" / "health_state.json").read_text()) == {"step": 2}
+
+    def test_verify_last_bundle_detects_tampering(self, assets: Dict[str, Any]) -> None:
+        """verify_last_bundle() fails when a referenced chunk is altered.
+
+        Bilingual: verify_last_bundle() falla cuando se altera un chunk referenciado.
+        """
+        assert verify_last_bundle(assets["backup_dir"]) is True
+        report = backup_critical_assets(**assets)
+        assert verify_last_bundle(assets["backup_dir"]) is True
+
+        manifest = json.loads((assets["backup_dir"] / report["manifest"]).read_text())
+        chunk = assets["backup_dir"] / manifest["files"]["hash_001.json"]["chunk"]
+        chunk.write_bytes(chunk.read_bytes()[:-4] + b"AAAA")
+        assert verify_last_bundle(assets["backup_dir"]) is False
+
+
+class TestDropboxUpload:
+    """Tests for the persisted Dropbox upload queue / Pruebas de la cola de subida a Dropbox."""
+
+    @pytest.fixture()
+    def assets(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
+        monkeypatch.delenv("CENTINEL_BACKUP_KEY", raising=False)
+        monkeypatch.setenv("CENTINEL_DROPBOX_TOKEN", "token")
+        monkeypatch.setattr("centinel_engine.secure_backup._HAS_DROPBOX", True)
+        health = tmp_path / "health_state.json"
+        health.write_text(json.dumps({"mode": "normal"}))
+        hash_dir = tmp_path / "hashes"
+        hash_dir.mkdir()
+        (hash_dir / "hash_001.json").write_text(json.dumps({"hash": "a" * 64}))
+        return {
+            "health_state_path": health,
+            "hash_chain_dir": hash_dir,
+            "backup_dir": tmp_path / "backups",
+        }
+
+    def test_failed_chunk_is_retried_before_manifest(self, assets: Dict[str, Any]) -> None:
+        """A failed chunk upload holds back the manifest until a later run succeeds.
+
+        Bilingual: Un chunk que falla retiene el manifiesto hasta que una corrida posterior lo sube.
+        """
+        uploaded: list = []
+        failing = {"on": True}
+
+        def _fake_upload(payload: bytes, remote_path: str) -> bool:
+            if failing["on"] and remote_path.endswith(".raw") and b"hash" in payload:
+                return False
+            uploaded.append(remote_path)
+            return True
+
+        with patch("centinel_engine.secure_backup._backup_to_dropbox", side_effect=_fake_upload):
+            first = backup_critical_assets(**assets)
+            assert first["dropbox"] is False
+            assert not any(path.endswith(".manifest.json") for path in uploaded)
+            index = json.loads((assets["backup_dir"] / "backup_index.json").read_text())
+            assert index["pending_uploads"][-1] == first["manifest"]
+            assert len(index["pending_uploads"]) == 2
+
+            failing["on"] = False
+            second = backup_critical_assets(**assets)
+
+        assert second["dropbox"] is True
+        assert second["manifest"] is None
+        assert uploaded[-1] == first["manifest"]
+        assert len(uploaded) == 3
+        index = json.loads((assets["backup_dir"] / "backup_index.json").read_text())
+        assert index["pending_uploads"] == []
+
+
+# ---------------------------------------------------------------------------
+# Test 7: BackupScheduler / Programador de respaldo
 # ---------------------------------------------------------------------------
 
 
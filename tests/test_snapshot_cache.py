@@ -0,0 +1,141 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de la caché compartida de snapshots parseados:
+  - cada snapshot se lee y parsea una sola vez mientras no cambie;
+  - los cambios de contenido invalidan la entrada y los bytes idénticos
+    reutilizan el parseo; cada ruta guarda una sola versión;
+  - las vistas son de solo lectura pero serializables y copiables;
+  - el desalojo LRU respeta el presupuesto de memoria;
+  - una lectura que compite con una escritura no se guarda en caché.
+
+======================== ENGLISH ========================
+Shared parsed-snapshot cache tests: parse once while unchanged,
+invalidation on change and reuse on identical bytes, one cached version
+per path, read-only yet
+serializable views, memory-bounded LRU eviction, and reads racing a write
+left uncached.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from centinel.snapshot_cache import FrozenDict, SnapshotCache, thaw
+
+
+def _write(path, payload, mtime_ns=None) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_snapshot_parsed_once_until_it_changes(tmp_path) -> None:
+    cache = SnapshotCache()
+    path = tmp_path / "snapshot.json"
+    _write(path, {"resultados": [{"votos": "1,000"}]}, mtime_ns=1_000_000_000)
+
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+
+    # Rewritten with the same bytes: new stat key, same parse.
+    _write(path, {"resultados": [{"votos": "1,000"}]}, mtime_ns=2_000_000_000)
+    assert cache.load(path) is first
+    assert cache.stats()["entries"] == 1
+
+    _write(path, {"resultados": [{"votos": "2,000"}]}, mtime_ns=3_000_000_000)
+    second = cache.load(path)
+    assert second["resultados"][0]["votos"] == "2,000"
+    assert cache.stats()["misses"] == 2 and cache.stats()["entries"] == 1
+
+    path.write_text("{broken", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        cache.load(path)
+
+
+def test_each_path_keeps_one_version_and_invalidates_directly(tmp_path) -> None:
+    cache = SnapshotCache()
+    paths = [tmp_path / f"snapshot_{index}.json" for index in range(3)]
+    for version in range(4):
+        for index, path in enumerate(paths):
+            _write(path, {"dep": index, "version": version}, mtime_ns=(version + 1) * 1_000_000_000)
+            assert cache.load(path)["version"] == version
+    assert cache.stats()["entries"] == 3
+
+    cache.invalidate(paths[1])
+    assert cache.stats()["entries"] == 2
+    assert cache.load(paths[1])["version"] == 3
+    assert cache.stats()["misses"] == 13
+
+
+def test_views_are_read_only_but_behave_like_json(tmp_path) -> None:
+    cache = SnapshotCache()
+    path = tmp_path / "snapshot.json"
+    payload = {"estadisticas": {"validos": 10}, "resultados": [{"partido": "A"}]}
+    _write(path, payload)
+    view = cache.load(path)
+
+    assert isinstance(view, dict) and isinstance(view["resultados"], list)
+    assert json.loads(json.dumps(view, sort_keys=True)) == payload
+    with pytest.raises(TypeError):
+        view["nuevo"] = 1
+    with pytest.raises(TypeError):
+        view["estadisticas"].update(validos=0)
+    with pytest.raises(TypeError):
+        view["resultados"].append({})
+
+    mutable = copy.deepcopy(view)
+    mutable["resultados"].append({"partido": "B"})
+    assert type(mutable) is dict and thaw(view) == payload
+    assert len(view["resultados"]) == 1
+    assert isinstance(pickle.loads(pickle.dumps(view)), FrozenDict)
+
+
+def test_lru_eviction_respects_memory_budget(tmp_path) -> None:
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"snapshot_{index}.json"
+        _write(path, {"index": index, "blob": "x" * 2000})
+        paths.append(path)
+    probe = SnapshotCache()
+    probe.load(paths[0])
+    entry_bytes = probe.stats()["bytes"]
+
+    cache = SnapshotCache(max_bytes=int(entry_bytes * 2.5))
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])  # refresh: paths[1] is now least recently used
+    cache.load(paths[2])
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert stats["bytes"] <= cache.max_bytes
+    cache.load(paths[0])
+    assert cache.stats()["misses"] == 3
+    cache.load(paths[1])
+    assert cache.stats()["misses"] == 4
+
+
+def test_read_racing_a_write_is_not_cached(tmp_path, monkeypatch) -> None:
+    cache = SnapshotCache()
+    path = tmp_path / "snapshot.json"
+    _write(path, {"votos": "1,000"}, mtime_ns=1_000_000_000)
+    original = type(path).read_bytes
+
+    def _racing_read(self):
+        # The writer lands between stat() and read_bytes().
+        _write(self, {"votos": "2,000"}, mtime_ns=2_000_000_000)
+        return original(self)
+
+    monkeypatch.setattr(type(path), "read_bytes", _racing_read)
+    assert cache.load(path)["votos"] == "2,000"
+    assert cache.stats()["entries"] == 0
+    monkeypatch.undo()
+
+    assert cache.load(path)["votos"] == "2,000"
+    assert cache.stats()["entries"] == 1
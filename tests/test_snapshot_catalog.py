@@ -0,0 +1,182 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del catálogo indexado de snapshots:
+  - `_persist_snapshot_payload` registra cada captura al escribirla;
+  - iter_all_snapshots / iter_all_hashes responden "últimos N" y "por fuente"
+    desde el catálogo, en orden de captura;
+  - un catálogo nuevo incorpora los snapshots previos y `rebuild` lo
+    recupera desde disco;
+  - sin catálogo (o para otro árbol de hashes) se mantiene el glob por mtime;
+  - el modo exhaustivo (verificación de custodia) lista el disco y detecta
+    archivos fuera del catálogo.
+
+======================== ENGLISH ========================
+Indexed snapshot catalog tests: write-time recording, indexed latest-N and
+per-source lookups, back-fill and rebuild from disk, the glob fallback and
+the exhaustive (custody) listing that never trusts the catalog alone.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from centinel.paths import ensure_source_dirs, iter_all_hashes, iter_all_snapshots
+from centinel.snapshot_catalog import CATALOG_FILENAME, SnapshotCatalog, main, open_catalog
+from scripts import download_and_hash
+
+
+class _SteppingDatetime(datetime):
+    """Avanza un segundo por llamada para nombres de archivo únicos."""
+
+    current = datetime(2026, 1, 7, 8, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[override]
+        cls.current += timedelta(seconds=1)
+        return cls.current if tz is None else cls.current.replace(tzinfo=tz)
+
+
+@pytest.fixture()
+def capture_roots(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(download_and_hash, "datetime", _SteppingDatetime)
+    monkeypatch.setattr(download_and_hash, "sign_hash_record", lambda record: record)
+    monkeypatch.setattr(download_and_hash, "trigger_post_hash_backup", lambda *_a: None)
+    return Path("data"), Path("hashes")
+
+
+def _capture(roots, source_id: str, index: int, previous: str = "0" * 64) -> str:
+    data_dir, hash_dir = ensure_source_dirs(source_id, data_root=roots[0], hash_root=roots[1])
+    chained, _current, _path = download_and_hash._persist_snapshot_payload(
+        {"source": source_id, "index": index},
+        source_id=source_id,
+        data_dir=data_dir,
+        hash_dir=hash_dir,
+        previous_hash=previous,
+    )
+    return chained
+
+
+def _write_legacy_snapshot(data_root: Path, hash_root: Path, source_id: str, stamp: str, mtime: int) -> Path:
+    data_dir, hash_dir = ensure_source_dirs(source_id, data_root=data_root, hash_root=hash_root)
+    snapshot = data_dir / f"snapshot_{stamp}.json"
+    snapshot.write_text(json.dumps({"legacy": stamp}), encoding="utf-8")
+    hash_file = hash_dir / f"snapshot_{stamp}.sha256"
+    hash_file.write_text(json.dumps({"hash": f"h-{stamp}", "chained_hash": f"c-{stamp}"}), encoding="utf-8")
+    for path in (snapshot, hash_file):
+        os.utime(path, (mtime, mtime))
+    return snapshot
+
+
+def test_persist_records_captures_in_order(capture_roots) -> None:
+    data_root, hash_root = capture_roots
+    previous = "0" * 64
+    for index, source_id in enumerate(["NACIONAL", "01_atlantida", "NACIONAL", "02_choluteca"]):
+        previous = _capture(capture_roots, source_id, index, previous)
+
+    catalog = open_catalog(data_root=data_root, hash_root=hash_root)
+    assert catalog is not None
+    assert catalog.count() == 4
+    assert catalog.count(source_id="NACIONAL") == 2
+
+    newest = catalog.latest(1)[0]
+    assert newest.source_id == "02_choluteca"
+    assert newest.chained_hash == previous
+    assert newest.size_bytes == newest.snapshot_path.stat().st_size
+
+    snapshots = iter_all_snapshots(data_root=data_root)
+    assert [p.parent.name for p in snapshots] == ["NACIONAL", "01_atlantida", "NACIONAL", "02_choluteca"]
+    assert iter_all_snapshots(data_root=data_root, limit=2) == snapshots[-2:]
+    assert iter_all_snapshots(data_root=data_root, source_id="NACIONAL") == [snapshots[0], snapshots[2]]
+    hashes = iter_all_hashes(hash_root=hash_root, limit=3)
+    assert [p.stem for p in hashes] == [p.stem for p in snapshots[-3:]]
+
+
+def test_new_catalog_backfills_existing_snapshots(capture_roots) -> None:
+    data_root, hash_root = capture_roots
+    _write_legacy_snapshot(data_root, hash_root, "NACIONAL", "2026-01-06_10-00-00", 1_700_000_000)
+    _write_legacy_snapshot(data_root, hash_root, "01_atlantida", "2026-01-06_11-00-00", 1_700_000_100)
+
+    _capture(capture_roots, "NACIONAL", 0)
+
+    catalog = open_catalog(data_root=data_root, hash_root=hash_root)
+    entries = catalog.entries()
+    assert [entry.snapshot_path.name for entry in entries[:2]] == [
+        "snapshot_2026-01-06_10-00-00.json",
+        "snapshot_2026-01-06_11-00-00.json",
+    ]
+    assert entries[0].content_hash == "h-2026-01-06_10-00-00"
+    assert len(entries) == 3
+
+
+def test_rebuild_recovers_catalog_from_disk(capture_roots, capsys) -> None:
+    data_root, hash_root = capture_roots
+    for index in range(3):
+        _capture(capture_roots, "NACIONAL", index)
+    expected = iter_all_snapshots(data_root=data_root)
+
+    (data_root / CATALOG_FILENAME).unlink()
+    assert open_catalog(data_root=data_root) is None
+
+    assert main(["rebuild", "--data-root", str(data_root), "--hash-root", str(hash_root)]) == 0
+    assert "3 snapshots" in capsys.readouterr().out
+    assert iter_all_snapshots(data_root=data_root) == expected
+    assert [e.seq for e in SnapshotCatalog(data_root, hash_root).entries()] == [1, 2, 3]
+
+
+def test_missing_files_and_foreign_hash_roots(capture_roots, tmp_path) -> None:
+    data_root, hash_root = capture_roots
+    for index in range(2):
+        _capture(capture_roots, "NACIONAL", index)
+    first = iter_all_snapshots(data_root=data_root)[0]
+    first.unlink()
+
+    assert first not in iter_all_snapshots(data_root=data_root)
+
+    # A hash tree the catalog does not index is still globbed by mtime.
+    other_root = tmp_path / "elsewhere" / "hashes"
+    (other_root / "NACIONAL").mkdir(parents=True)
+    (other_root / "NACIONAL" / "snapshot_x.sha256").write_text("{}", encoding="utf-8")
+    assert [p.name for p in iter_all_hashes(hash_root=other_root)] == ["snapshot_x.sha256"]
+
+
+def test_exhaustive_listing_sees_evidence_outside_the_catalog(capture_roots, monkeypatch) -> None:
+    data_root, hash_root = capture_roots
+    init_calls: list[Path] = []
+    real_init = SnapshotCatalog._init_db
+    monkeypatch.setattr(
+        SnapshotCatalog, "_init_db", lambda self, conn: init_calls.append(self.db_path) or real_init(self, conn)
+    )
+    for index in range(3):
+        _capture(capture_roots, "NACIONAL", index)
+    # One DDL pass (the back-fill rebuild), not one per insert.
+    assert len(init_calls) == 1
+
+    catalogued = iter_all_hashes(hash_root=hash_root)
+    assert iter_all_hashes(hash_root=hash_root, exhaustive=True) == catalogued
+
+    stray = hash_root / "NACIONAL" / "snapshot_2026-01-07_09-00-00.sha256"
+    stray.write_text(json.dumps({"hash": "x", "chained_hash": "y"}), encoding="utf-8")
+    assert stray not in iter_all_hashes(hash_root=hash_root)
+    assert stray in iter_all_hashes(hash_root=hash_root, exhaustive=True)
+
+    stray.unlink()
+    catalogued[0].unlink()
+    assert iter_all_hashes(hash_root=hash_root, exhaustive=True) == catalogued[1:]
+    assert len(iter_all_snapshots(data_root=data_root, exhaustive=True)) == 3
+
+
+def test_glob_fallback_without_catalog(tmp_path) -> None:
+    data_root, hash_root = tmp_path / "data", tmp_path / "hashes"
+    newer = _write_legacy_snapshot(data_root, hash_root, "NACIONAL", "2026-01-06_10-00-00", 1_700_000_200)
+    older = _write_legacy_snapshot(data_root, hash_root, "01_atlantida", "2026-01-06_11-00-00", 1_700_000_000)
+
+    assert iter_all_snapshots(data_root=data_root) == [older, newer]
+    assert iter_all_snapshots(data_root=data_root, limit=1) == [newer]
+    assert iter_all_snapshots(data_root=data_root, source_id="01_atlantida") == [older]
+    assert not (data_root / CATALOG_FILENAME).exists()
@@ -0,0 +1,123 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de `scripts/stage_runner.py`:
+  - resolución del modo (env > config > inprocess);
+  - modo subprocess: cada etapa pasa por run_command y el análisis se lee
+    de anomalies_report.json;
+  - modo inprocess: los snapshots normalizados llegan al análisis en memoria
+    y una etapa que falla se reintenta como subproceso;
+  - summarize_findings acepta alertas en memoria.
+
+======================== ENGLISH ========================
+Stage runner tests: mode resolution, subprocess hand-off through
+anomalies_report.json, in-memory hand-off with subprocess fallback, and
+in-memory alerts for summarize_findings.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scripts import analyze_rules, normalize_presidential, summarize_findings
+from scripts.stage_runner import StageRunner, resolve_stage_runner_mode
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], str, dict | None]] = []
+
+    def __call__(self, command, description, env=None):
+        self.calls.append((command, description, env))
+
+    def scripts(self) -> list[str]:
+        return [Path(command[1]).name for command, _desc, _env in self.calls]
+
+
+def test_resolve_stage_runner_mode(monkeypatch) -> None:
+    monkeypatch.delenv("CENTINEL_STAGE_RUNNER", raising=False)
+    assert resolve_stage_runner_mode({}) == "inprocess"
+    assert resolve_stage_runner_mode({"stage_runner": {"mode": "SUBPROCESS"}}) == "subprocess"
+    assert resolve_stage_runner_mode({"stage_runner": {"mode": "bogus"}}) == "inprocess"
+    monkeypatch.setenv("CENTINEL_STAGE_RUNNER", "subprocess")
+    assert resolve_stage_runner_mode({"stage_runner": {"mode": "inprocess"}}) == "subprocess"
+
+
+def test_subprocess_mode_runs_scripts_and_reads_report(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("anomalies_report.json").write_text(json.dumps([{"type": "X"}]), encoding="utf-8")
+    recorder = _Recorder()
+    runner = StageRunner("subprocess", command_runner=recorder)
+
+    runner.download(mock=True, retry_config_path="retry.yaml")
+    assert runner.normalize() == []
+    assert runner.analyze([]) == [{"type": "X"}]
+    runner.report([])
+
+    assert recorder.scripts() == [
+        "download_and_hash.py",
+        "normalize_presidential.py",
+        "analyze_rules.py",
+        "summarize_findings.py",
+    ]
+    download_command, _desc, download_env = recorder.calls[0]
+    assert download_command[-1] == "--mock"
+    assert download_env["RETRY_CONFIG_PATH"] == "retry.yaml"
+    # Idempotent stages keep the original two-argument call shape.
+    assert all(env is None for _cmd, _desc, env in recorder.calls[1:])
+
+
+def test_inprocess_mode_hands_off_in_memory(monkeypatch) -> None:
+    normalized = [(Path("a.json"), {"n": 1}), (Path("b.json"), {"n": 2})]
+    received: dict = {}
+
+    monkeypatch.setattr(normalize_presidential, "normalize_snapshots", lambda: normalized)
+
+    def _fake_analysis(snapshots):
+        received["snapshots"] = snapshots
+        return SimpleNamespace(alerts=[{"type": "Y"}])
+
+    monkeypatch.setattr(analyze_rules, "run_analysis", _fake_analysis)
+    monkeypatch.setattr(summarize_findings, "summarize_findings", lambda alerts: received.setdefault("alerts", alerts))
+    recorder = _Recorder()
+    runner = StageRunner("inprocess", command_runner=recorder)
+
+    alerts = runner.analyze(runner.normalize())
+    runner.report(alerts)
+
+    assert received["snapshots"] == normalized
+    assert alerts == [{"type": "Y"}]
+    assert received["alerts"] == alerts
+    assert recorder.calls == []
+
+
+def test_inprocess_failure_falls_back_to_subprocess(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("anomalies_report.json").write_text("[]", encoding="utf-8")
+
+    def _boom(_snapshots):
+        raise RuntimeError("analysis crashed")
+
+    monkeypatch.setattr(analyze_rules, "run_analysis", _boom)
+    recorder = _Recorder()
+
+    assert StageRunner("inprocess", command_runner=recorder).analyze([]) == []
+    assert recorder.scripts() == ["analyze_rules.py"]
+
+    strict = StageRunner("inprocess", command_runner=recorder, fallback_to_subprocess=False)
+    with pytest.raises(RuntimeError, match="analysis crashed"):
+        strict.analyze([])
+
+
+def test_summarize_findings_uses_in_memory_alerts(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    alerts = [{"from": "a", "to": "b", "alerts": [{"rule": "Z", "description": "en memoria"}]}]
+
+    summarize_findings.summarize_findings(alerts)
+
+    summary = (tmp_path / "reports" / "summary.txt").read_text(encoding="utf-8")
+    assert "- en memoria" in summary
+    assert not (tmp_path / "analysis" / "alerts.json").exists()
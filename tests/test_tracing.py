@@ -0,0 +1,120 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas de la capa de trazas del pipeline:
+  - spans anidados y `record_span` se cuelgan del span activo;
+  - al cerrar la raíz se escribe un registro por ciclo y los spans abiertos
+    quedan como `aborted`;
+  - `TraceLog` conserva solo los últimos ciclos;
+  - el resumen y `/health/traces` muestran el desglose por stage.
+
+======================== ENGLISH ========================
+Pipeline tracing tests: nesting, pre-measured child spans, one record per
+cycle with aborted spans on failure, rolling trim, and the per-stage summary
+exposed by `/health/traces`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from centinel import tracing
+
+
+def test_nested_spans_are_written_as_one_cycle_record(tmp_path) -> None:
+    sink = tracing.TraceLog(tmp_path / "traces.jsonl")
+    root = tracing.start_trace("cycle", sink=sink, run_id="r1")
+    with tracing.span("download"):
+
+        async def fetch(source: str) -> None:
+            with tracing.span(f"source:{source}"):
+                await asyncio.sleep(0)
+
+        async def fetch_all() -> None:
+            await asyncio.gather(fetch("a"), fetch("b"))
+
+        asyncio.run(fetch_all())
+    with tracing.span("analyze") as analyze:
+        analyze.set_attribute("alerts", 2)
+        tracing.record_span("rule:ml_outliers", 41000.0, alerts=2)
+        tracing.record_span("rule:benford_law", 5.0, status="timeout")
+    root.end()
+
+    assert tracing.current_span() is None
+    [record] = sink.recent()
+    assert record["attributes"]["run_id"] == "r1"
+    assert list(record["stages"]) == ["download", "analyze"]
+    download, analyze = record["spans"]
+    assert sorted(child["name"] for child in download["spans"]) == ["source:a", "source:b"]
+    assert analyze["attributes"] == {"alerts": 2}
+    assert [(c["name"], c["status"]) for c in analyze["spans"]] == [
+        ("rule:ml_outliers", "ok"),
+        ("rule:benford_law", "timeout"),
+    ]
+
+    summary = tracing.summarize_trace(record)
+    assert summary["stages"][1]["top"][0] == {"name": "rule:ml_outliers", "duration_ms": 41000.0}
+    assert "(rule:ml_outliers=41.0s)" in tracing.format_trace_summary(record)
+
+
+def test_failed_cycle_marks_error_and_aborts_open_spans(tmp_path) -> None:
+    sink = tracing.TraceLog(tmp_path / "traces.jsonl")
+    root = tracing.start_trace("cycle", sink=sink)
+    tracing.start_span("healthcheck")
+    with pytest.raises(RuntimeError):
+        with tracing.span("download"):
+            raise RuntimeError("network down")
+    with tracing.span("backup_final", parent=root):
+        pass
+    root.end(error=RuntimeError("network down"))
+
+    [record] = sink.recent()
+    assert record["status"] == "error"
+    [health, final] = record["spans"]
+    assert health["status"] == "aborted"
+    assert health["spans"][0]["status"] == "error"
+    assert health["spans"][0]["attributes"]["error"] == "RuntimeError: network down"
+    assert final["name"] == "backup_final" and final["status"] == "ok"
+    assert tracing.current_span() is None
+
+
+def test_spans_are_noops_without_trace() -> None:
+    with tracing.span("orphan") as orphan:
+        tracing.record_span("rule:x", 1.0)
+    assert orphan is None
+    assert tracing.current_span() is None
+
+
+def test_trace_log_keeps_the_latest_records(tmp_path) -> None:
+    sink = tracing.TraceLog(tmp_path / "traces.jsonl", max_records=3)
+    for index in range(10):
+        sink.append({"index": index})
+
+    lines = sink.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) <= 6
+    assert [record["index"] for record in sink.recent(3)] == [9, 8, 7]
+    with sink.path.open("a", encoding="utf-8") as handle:
+        handle.write("{corrupt\n")
+    assert sink.recent(1) == [{"index": 9}]
+
+
+def test_health_traces_endpoint(tmp_path, monkeypatch) -> None:
+    from monitoring.health import _build_health_router
+
+    monkeypatch.setenv("CENTINEL_TRACE_PATH", str(tmp_path / "traces.jsonl"))
+    root = tracing.start_trace("cycle", sink=tracing.TraceLog(), run_id="r2")
+    with tracing.span("analyze"):
+        tracing.record_span("rule:ml_outliers", 12.0)
+    root.end()
+
+    app = FastAPI()
+    app.include_router(_build_health_router())
+    payload = TestClient(app).get("/health/traces", params={"limit": 2}).json()
+    [cycle] = payload["cycles"]
+    assert cycle["run_id"] == "r2"
+    assert cycle["stages"][0]["name"] == "analyze"
+    assert cycle["stages"][0]["top"] == [{"name": "rule:ml_outliers", "duration_ms": 12.0}]
+    assert payload["latest"]["trace_id"] == cycle["trace_id"]
@@ -0,0 +1,260 @@
+"""
+======================== ESPAÑOL ========================
+Pruebas del cursor de verificación incremental:
+  - verify_chain reanuda tras el cursor y solo re-hashea eslabones nuevos;
+  - un cursor manipulado, un prefijo modificado o `full=True` fuerzan la
+    verificación desde el génesis;
+  - run_startup_verification, RulesEngine.verify_hashchain y
+    verify_hashchain_from_snapshots usan el mismo cursor firmado;
+  - sin CENTINEL_STATE_HMAC_KEY, el secreto local se crea 0600 de forma
+    atómica y se emite una advertencia.
+
+======================== ENGLISH ========================
+Incremental verification cursor tests: resume after the cursor, fall back
+to a full pass on tampering/prefix changes, cursor use across the three
+hash-chain verifiers, and the warned, atomically created 0600 fallback
+secret used without CENTINEL_STATE_HMAC_KEY.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from centinel.core import custody, rules_engine, verification_cursor
+from centinel.core.custody import _compute_expected_hash, run_startup_verification, verify_chain
+from centinel.core.hashchain import compute_hash
+from centinel.core.rules_engine import RulesEngine
+from centinel.core.verification_cursor import load_cursor
+from centinel.hasher import compute_snapshot_hash, verify_hashchain_from_snapshots
+
+
+def _append_link(hash_root: Path, index: int, previous: str | None) -> str:
+    data_payload = {"hash": f"data_{index}", "index": index}
+    data_bytes = json.dumps(data_payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    chained = _compute_expected_hash(previous, data_bytes)
+    record = {**data_payload, "chained_hash": chained}
+    if previous:
+        record["previous_hash"] = previous
+    path = hash_root / "cne" / f"snapshot_{index:03d}.sha256"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+    # Deterministic mtime ordering for iter_all_hashes.
+    os.utime(path, ns=(1_700_000_000_000_000_000 + index * 1_000_000_000,) * 2)
+    return chained
+
+
+def _build_chain(hash_root: Path, count: int, previous: str | None = None, start: int = 0) -> str | None:
+    for index in range(start, start + count):
+        previous = _append_link(hash_root, index, previous)
+    return previous
+
+
+@pytest.fixture()
+def hash_calls(monkeypatch):
+    calls: list[int] = []
+    original = custody._compute_expected_hash
+
+    def _counting(previous_hash, data_bytes):
+        calls.append(1)
+        return original(previous_hash, data_bytes)
+
+    monkeypatch.setattr(custody, "_compute_expected_hash", _counting)
+    return calls
+
+
+def test_verify_chain_resumes_after_cursor(tmp_path, hash_calls) -> None:
+    hash_root = tmp_path / "hashes"
+    cursor_path = tmp_path / "cursors" / "custody.json"
+    last = _build_chain(hash_root, 3)
+
+    first = verify_chain(hash_root, cursor_path=cursor_path)
+    assert first.valid and first.resumed_from is None
+    assert load_cursor(cursor_path, scope=custody.CUSTODY_CURSOR_SCOPE).index == 2
+
+    _build_chain(hash_root, 2, previous=last, start=3)
+    hash_calls.clear()
+    second = verify_chain(hash_root, cursor_path=cursor_path)
+
+    assert second.valid is True
+    assert second.resumed_from == 3
+    assert second.verified_links == second.total_links == 5
+    assert len(hash_calls) == 2
+    assert second.first_hash == first.first_hash
+
+
+def test_tampered_cursor_forces_full_pass(tmp_path) -> None:
+    hash_root = tmp_path / "hashes"
+    cursor_path = tmp_path / "cursors" / "custody.json"
+    _build_chain(hash_root, 3)
+    verify_chain(hash_root, cursor_path=cursor_path)
+
+    envelope = json.loads(cursor_path.read_text(encoding="utf-8"))
+    envelope["cursor"]["index"] = 1
+    cursor_path.write_text(json.dumps(envelope), encoding="utf-8")
+
+    result = verify_chain(hash_root, cursor_path=cursor_path)
+    assert result.valid is True
+    assert result.resumed_from is None
+
+
+def test_rewritten_prefix_is_detected(tmp_path) -> None:
+    hash_root = tmp_path / "hashes"
+    cursor_path = tmp_path / "cursors" / "custody.json"
+    _build_chain(hash_root, 3)
+    verify_chain(hash_root, cursor_path=cursor_path)
+
+    victim = hash_root / "cne" / "snapshot_001.sha256"
+    record = json.loads(victim.read_text(encoding="utf-8"))
+    record["hash"] = "forged"
+    stat = victim.stat()
+    victim.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+    os.utime(victim, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    result = verify_chain(hash_root, cursor_path=cursor_path)
+    assert result.resumed_from is None
+    assert result.valid is False
+    assert result.broken_at == 1
+
+
+def test_full_and_periodic_reverification(tmp_path, hash_calls) -> None:
+    hash_root = tmp_path / "hashes"
+    cursor_path = tmp_path / "cursors" / "custody.json"
+    _build_chain(hash_root, 3)
+    verify_chain(hash_root, cursor_path=cursor_path)
+
+    hash_calls.clear()
+    assert verify_chain(hash_root, cursor_path=cursor_path, full=True).resumed_from is None
+    assert len(hash_calls) == 3
+    assert verify_chain(hash_root, cursor_path=cursor_path, full_interval_seconds=0).resumed_from is None
+    assert verify_chain(hash_root, cursor_path=cursor_path, full_interval_seconds=3600).resumed_from == 3
+
+
+def test_startup_verification_uses_cursor(tmp_path) -> None:
+    hash_dir = tmp_path / "hashes"
+    cursor_path = tmp_path / "data" / "verification_cursors" / "custody_chain.json"
+    last = _build_chain(hash_dir, 3)
+    run_startup_verification(hash_dir=hash_dir, anchor_log_dir=tmp_path / "anchors", cursor_path=cursor_path)
+    _build_chain(hash_dir, 1, previous=last, start=3)
+
+    report = run_startup_verification(
+        hash_dir=hash_dir,
+        anchor_log_dir=tmp_path / "anchors",
+        cursor_path=cursor_path,
+    )
+
+    assert report.overall_valid is True
+    assert report.chain_result.resumed_from == 3
+    assert report.chain_result.verified_links == 4
+    assert report.to_dict()["chain"]["resumed_from"] == 3
+
+
+def _write_normalized(normalized_dir: Path, entries: list[dict], name: str, previous: str | None) -> str:
+    canonical = json.dumps({"snapshot": name}, sort_keys=True)
+    (normalized_dir / f"{name}.json").write_text(canonical, encoding="utf-8")
+    digest = compute_hash(canonical, previous)
+    entries.append({"snapshot": name, "hash": digest, "previous_hash": previous})
+    return digest
+
+
+def test_rules_engine_hashchain_cursor(tmp_path, monkeypatch) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir()
+    hashchain_path = tmp_path / "hashchain.json"
+    cursor_path = tmp_path / "cursors" / "rules.json"
+    entries: list[dict] = []
+    previous = None
+    for name in ("s0", "s1"):
+        previous = _write_normalized(normalized_dir, entries, name, previous)
+    hashchain_path.write_text(json.dumps(entries), encoding="utf-8")
+
+    assert RulesEngine.verify_hashchain(normalized_dir, hashchain_path, cursor_path=cursor_path) == []
+    assert load_cursor(cursor_path, scope="rules_hashchain").index == 1
+
+    _write_normalized(normalized_dir, entries, "s2", previous)
+    hashchain_path.write_text(json.dumps(entries), encoding="utf-8")
+    assert RulesEngine.verify_hashchain(normalized_dir, hashchain_path, cursor_path=cursor_path) == []
+    assert load_cursor(cursor_path, scope="rules_hashchain").index == 2
+
+    # An expired full-pass interval re-hashes from genesis even with an intact prefix.
+    calls: list[str] = []
+    real_compute_hash = rules_engine.compute_hash
+    monkeypatch.setattr(rules_engine, "compute_hash", lambda *a: calls.append(a[0]) or real_compute_hash(*a))
+    assert RulesEngine.verify_hashchain(normalized_dir, hashchain_path, cursor_path=cursor_path) == []
+    assert calls == []
+    assert (
+        RulesEngine.verify_hashchain(normalized_dir, hashchain_path, cursor_path=cursor_path, full_interval_seconds=0)
+        == []
+    )
+    assert len(calls) == 3
+
+    # Rewriting an already-verified index entry invalidates the resume point.
+    entries[0]["hash"] = "0" * 64
+    hashchain_path.write_text(json.dumps(entries), encoding="utf-8")
+    alerts = RulesEngine.verify_hashchain(normalized_dir, hashchain_path, cursor_path=cursor_path)
+    assert any(alert["snapshot"] == "s0" for alert in alerts)
+
+
+def _write_snapshot(root: Path, index: int, previous: str | None) -> str:
+    snapshot_dir = root / f"snap_{index:02d}"
+    snapshot_dir.mkdir(parents=True)
+    content = f"payload-{index}".encode("utf-8")
+    metadata = {"timestamp_utc": f"2026-01-01T00:{index:02d}:00+00:00", "source_url": "https://cne.hn"}
+    if previous:
+        metadata["previous_hash"] = previous
+    digest = compute_snapshot_hash(content, metadata, previous)
+    (snapshot_dir / "snapshot.raw").write_bytes(content)
+    (snapshot_dir / "snapshot.metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    (snapshot_dir / "hash.txt").write_text(f"{digest}\n", encoding="utf-8")
+    return digest
+
+
+def test_snapshot_hashchain_cursor(tmp_path) -> None:
+    root = tmp_path / "snapshots"
+    cursor_path = tmp_path / "cursors" / "snapshots.json"
+    previous = None
+    for index in range(3):
+        previous = _write_snapshot(root, index, previous)
+
+    full = verify_hashchain_from_snapshots(root, cursor_path=cursor_path)
+    assert full["valid"] is True and full["resumed_from"] is None
+
+    _write_snapshot(root, 3, previous)
+    incremental = verify_hashchain_from_snapshots(root, cursor_path=cursor_path)
+    assert incremental["valid"] is True
+    assert incremental["resumed_from"] == 3
+    assert incremental["verified_count"] == incremental["count"] == 4
+
+    # Without a cursor the result is identical apart from the resume marker.
+    baseline = verify_hashchain_from_snapshots(root)
+    assert {k: v for k, v in baseline.items() if k != "resumed_from"} == {
+        k: v for k, v in incremental.items() if k != "resumed_from"
+    }
+
+    (root / "snap_01" / "snapshot.raw").write_bytes(b"tampered")
+    tampered = verify_hashchain_from_snapshots(root, cursor_path=cursor_path)
+    assert tampered["resumed_from"] is None
+    assert tampered["broken_at"] == 1
+
+
+def test_local_secret_fallback_is_private_and_warned(tmp_path, monkeypatch, caplog) -> None:
+    monkeypatch.delenv("CENTINEL_STATE_HMAC_KEY", raising=False)
+    monkeypatch.setattr(verification_cursor, "_WARNED_SECRET_PATHS", set())
+    # The file must be born 0600, not chmod-ed afterwards.
+    monkeypatch.setattr(os, "chmod", lambda *args, **kwargs: pytest.fail("secret chmod-ed after creation"))
+    cursor_path = tmp_path / "cursors" / "chain.json"
+
+    with caplog.at_level("WARNING", logger=verification_cursor.__name__):
+        key = verification_cursor._resolve_cursor_hmac_key(cursor_path)
+        assert verification_cursor._resolve_cursor_hmac_key(cursor_path) == key
+    secret_path = cursor_path.parent / ".verification_cursor_secret"
+    assert secret_path.stat().st_mode & 0o777 == 0o600
+    assert [r.message for r in caplog.records].count(
+        f"verification_cursor_local_secret path={secret_path} — set CENTINEL_STATE_HMAC_KEY for tamper resistance"
+    ) == 1
+
+    monkeypatch.setenv("CENTINEL_STATE_HMAC_KEY", "k" * 32)
+    assert verification_cursor._resolve_cursor_hmac_key(cursor_path) == b"k" * 32